@@ -0,0 +1,186 @@
+"""assetmanager.py
+
+One shared place to load images (and animated GIFs) from the `assets/` folder.
+
+If you're new to game-dev:
+- Decoding a PNG from disk and calling `convert()` / `convert_alpha()` is slow.
+  It should happen once, not every time a mini-game or a Player is created.
+- Scaling a big image (the backgrounds are 1536x1024) with `smoothscale` is
+  also slow. If the target size never changes, scale once and keep the result.
+
+This module keeps both kinds of results in a cache:
+- decoded + converted images, keyed by their path inside `assets/`
+- scaled variants, keyed by `(path, size, scale_mode)`
+
+Usage:
+    from assetmanager import ASSETS
+
+    bg = ASSETS.scaled("img/mainmenu.png", (900, 600))   # decoded + scaled once
+    canvas.blit(bg, (0, 0))                               # cheap every frame
+
+Paths are always written with "/" and are relative to the `assets/` folder, so
+the same key works on every platform (and in the pygbag browser build).
+"""
+
+import os
+from pathlib import Path
+
+import pygame
+
+from gifimage import GIFImage
+from scheduler import run_to_end
+
+# Same "best effort" base-dir logic as the rest of the project:
+# `__file__` can be missing in some packaged/browser environments.
+try:
+    BASE_DIR = str(Path(__file__).resolve().parent)
+except:
+    BASE_DIR = str(Path.cwd())
+
+# Things we computed once and keep between runs (font lookups, baked
+# sprites, ...). Safe to delete at any time; it is rebuilt on demand.
+CACHE_DIR = os.path.join(BASE_DIR, ".cache")
+
+# Scale modes:
+# - "smooth" uses `pygame.transform.smoothscale` (nicer, slower)
+# - "fast" uses `pygame.transform.scale` (nearest neighbour, what some mini-games used)
+SCALE_SMOOTH = "smooth"
+SCALE_FAST = "fast"
+
+
+def asset_path(relpath: str) -> str:
+    """Turn "img/mainmenu.png" into an absolute path inside the assets folder."""
+    return os.path.join(BASE_DIR, "assets", *relpath.split("/"))
+
+
+class AssetManager:
+    """Process-wide image cache.
+
+    Everything is loaded lazily (the first time someone asks for it) and then
+    reused. Loading errors are *not* swallowed here: callers keep their own
+    try/except + fallback (placeholder shapes, colored circles, ...), exactly
+    like before.
+    """
+
+    def __init__(self):
+        # relpath -> decoded image (converted to the display format when possible)
+        self._images: dict[str, pygame.Surface] = {}
+        # Paths whose image was decoded before a display existed.
+        # `convert()` needs a display, so we convert those on the next request.
+        self._unconverted: set[str] = set()
+        # (relpath, (w, h), scale_mode) -> scaled copy
+        self._scaled: dict[tuple[str, tuple[int, int], str], pygame.Surface] = {}
+        # (relpath, (w, h) or None) -> GIFImage template with all frames decoded
+        self._gifs: dict[tuple[str, tuple[int, int] | None], GIFImage] = {}
+        # Paths that failed to load. Remembering them means a missing file costs
+        # one disk lookup, not one per frame.
+        self._missing: set[str] = set()
+
+    @staticmethod
+    def _convert(surface: pygame.Surface) -> pygame.Surface:
+        # Opaque images (the 24-bit backgrounds) use `convert()`: blitting them
+        # is faster because pygame can skip per-pixel alpha blending.
+        # Images with transparency (alpha channel or a palette colorkey, like the
+        # character sprites) keep it via `convert_alpha()`.
+        if surface.get_flags() & pygame.SRCALPHA or surface.get_colorkey() is not None:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def image(self, relpath: str) -> pygame.Surface:
+        """Return the decoded (and converted) image at `assets/<relpath>`.
+
+        Raises the usual pygame/OS errors if the file can't be loaded.
+        """
+        surface = self._images.get(relpath)
+        if surface is not None and relpath not in self._unconverted:
+            return surface
+
+        if surface is None:
+            if relpath in self._missing:
+                raise FileNotFoundError(asset_path(relpath))
+            try:
+                surface = self.decode(relpath)
+            except Exception:
+                self._missing.add(relpath)
+                raise
+
+        return self.add_decoded(relpath, surface)
+
+    @staticmethod
+    def decode(relpath: str) -> pygame.Surface:
+        """Read and decode `assets/<relpath>` without caching or converting it.
+
+        This is the slow part of loading an image, and the only part that may
+        run on a worker thread (see preloader.py). Hand the result to
+        `add_decoded` on the main thread.
+        """
+        return pygame.image.load(asset_path(relpath))
+
+    def add_decoded(self, relpath: str, surface: pygame.Surface) -> pygame.Surface:
+        """Store an image decoded by `decode` (converting it if there is a display)."""
+        if pygame.display.get_surface() is not None:
+            surface = self._convert(surface)
+            self._unconverted.discard(relpath)
+            # Scaled copies made from the unconverted image are stale now.
+            for key in [k for k in self._scaled if k[0] == relpath]:
+                del self._scaled[key]
+        else:
+            self._unconverted.add(relpath)
+
+        self._images[relpath] = surface
+        return surface
+
+    def has_image(self, relpath: str) -> bool:
+        """True if `image(relpath)` won't have to touch the disk."""
+        return relpath in self._images
+
+    def scaled(self, relpath: str, size: tuple[int, int], scale_mode: str = SCALE_SMOOTH) -> pygame.Surface:
+        """Return `assets/<relpath>` scaled to `size` (cached per size and mode)."""
+        size = (int(size[0]), int(size[1]))
+        original = self.image(relpath)
+        key = (relpath, size, scale_mode)
+        cached = self._scaled.get(key)
+        if cached is not None:
+            return cached
+
+        if original.get_size() == size:
+            result = original
+        elif scale_mode == SCALE_FAST:
+            result = pygame.transform.scale(original, size)
+        else:
+            result = pygame.transform.smoothscale(original, size)
+
+        self._scaled[key] = result
+        return result
+
+    def gif(self, relpath: str, size: tuple[int, int] | None = None) -> GIFImage:
+        """Return a new `GIFImage` for `assets/<relpath>`.
+
+        The frames are decoded only once; every call returns a fresh GIFImage
+        that shares those frames but has its own animation timer (so two
+        players can each play their own smoke emote).
+        """
+        return run_to_end(self.gif_steps(relpath, size))
+
+    def gif_steps(self, relpath: str, size: tuple[int, int] | None = None):
+        """`gif()` as a scheduler job: decodes a frame per step, returns the GIFImage."""
+        key = (relpath, size)
+        template = self._gifs.get(key)
+        if template is None:
+            template = GIFImage(asset_path(relpath), size=size, load=False)
+            yield from template.load_steps()
+            # Only shared once all frames are in.
+            self._gifs[key] = template
+        return template.clone()
+
+    def clear(self) -> None:
+        """Forget every cached image (useful if the display format changes)."""
+        self._images.clear()
+        self._unconverted.clear()
+        self._scaled.clear()
+        self._gifs.clear()
+        self._missing.clear()
+
+
+# The shared instance every module should use.
+ASSETS = AssetManager()
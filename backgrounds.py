@@ -0,0 +1,108 @@
+"""backgrounds.py
+
+Static background layers (gradients, vignettes) that are drawn once and then
+only blitted.
+
+If you're new to game-dev:
+- A vertical gradient drawn with `pygame.draw.line` is one draw call per row:
+  600 calls for our 900x600 canvas, every frame, for a picture that never
+  changes.
+- A "layer" is an off-screen Surface holding such a picture. Drawing it is a
+  single blit (a fast memory copy).
+
+Layers are baked once per (name, size). If the surface size changes (e.g. a
+mini-game drawn onto a different canvas), the layer is simply baked again;
+otherwise it is reused forever.
+
+Animated effects that only change their *strength* - like the pulsing
+vignette in the slot machine - are baked once at full strength as well, and
+faded with `set_alpha` instead of being redrawn.
+"""
+
+import pygame
+
+from scheduler import run_to_end
+
+# name -> (size, Surface)
+_LAYERS: dict = {}
+
+
+def vertical_gradient(name: str, size: tuple[int, int], color_at) -> pygame.Surface:
+    """A baked gradient; `color_at(y, height)` returns the (r, g, b) of row y.
+
+    `name` identifies the look (one name per scene), so two scenes never
+    share a layer by accident.
+    """
+    entry = _LAYERS.get(name)
+    if entry is not None and entry[0] == size:
+        return entry[1]
+    return run_to_end(vertical_gradient_steps(name, size, color_at))
+
+
+def vertical_gradient_steps(name: str, size: tuple[int, int], color_at, rows_per_step: int = 150):
+    """`vertical_gradient` as a scheduler job, `rows_per_step` rows at a time."""
+    entry = _LAYERS.get(name)
+    if entry is not None and entry[0] == size:
+        return entry[1]
+
+    width, height = size
+    layer = pygame.Surface(size)
+    for y in range(height):
+        pygame.draw.line(layer, color_at(y, height), (0, y), (width, y))
+        if y % rows_per_step == rows_per_step - 1:
+            yield
+    try:
+        layer = layer.convert()
+    except pygame.error:
+        pass  # no display yet
+    _LAYERS[name] = (size, layer)
+    return layer
+
+
+class Vignette:
+    """Dark edges that fade to transparent `depth` pixels into the screen.
+
+    `draw(surface, alpha)` darkens the outermost pixels to `alpha` (0 ..
+    `max_alpha`). The mask is baked once per size at `max_alpha` and scaled
+    down with `set_alpha`, and only the four edge strips are blitted (the
+    middle of the mask is fully transparent anyway).
+    """
+
+    def __init__(self, depth: int = 100, max_alpha: int = 255):
+        self.depth = depth
+        self.max_alpha = max_alpha
+        self._mask: pygame.Surface | None = None
+
+    def _bake(self, size: tuple[int, int]) -> None:
+        width, height = size
+        mask = pygame.Surface(size, pygame.SRCALPHA)
+        # Rows first, then columns (columns win in the corners).
+        for i in range(self.depth):
+            alpha = int((self.max_alpha * i) / self.depth)
+            pygame.draw.line(mask, (0, 0, 0, alpha), (0, i), (width, i))
+            pygame.draw.line(mask, (0, 0, 0, alpha), (0, height - i), (width, height - i))
+        for i in range(self.depth):
+            alpha = int((self.max_alpha * i) / self.depth)
+            pygame.draw.line(mask, (0, 0, 0, alpha), (i, 0), (i, height))
+            pygame.draw.line(mask, (0, 0, 0, alpha), (width - i, 0), (width - i, height))
+        try:
+            mask = mask.convert_alpha()
+        except pygame.error:
+            pass
+        self._mask = mask
+
+    def draw(self, surface: pygame.Surface, alpha: int) -> None:
+        size = surface.get_size()
+        if self._mask is None or self._mask.get_size() != size:
+            self._bake(size)
+        self._mask.set_alpha(max(0, min(255, alpha * 255 // self.max_alpha)))
+
+        width, height = size
+        d = self.depth
+        for area in (
+            pygame.Rect(0, 0, width, d),                   # top
+            pygame.Rect(0, height - d, width, d),          # bottom
+            pygame.Rect(0, d, d, height - 2 * d),          # left
+            pygame.Rect(width - d, d, d, height - 2 * d),  # right
+        ):
+            surface.blit(self._mask, area.topleft, area)
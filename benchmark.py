@@ -0,0 +1,514 @@
+"""benchmark.py
+
+Headless "soak" benchmark for the whole casino.
+
+It runs the real `main.main()` loop without a window or sound card
+(`SDL_VIDEODRIVER=dummy`, `SDL_AUDIODRIVER=dummy`) and feeds it a scripted
+input timeline: the bot clicks "Start game", walks to every table, plays a few
+rounds, visits the bar and the dancefloor in lobby 2, and then does the whole
+tour again until the simulated session time is over.
+
+Usage:
+    python benchmark.py                     # 10 simulated minutes
+    python benchmark.py --sim-minutes 180   # a 3 hour "night on the floor"
+    python benchmark.py --json report.json  # also save the numbers
+    python benchmark.py --importtime        # only: what does `import main` cost?
+
+If you're new to benchmarking games:
+- The clock is *uncapped*: frames are rendered as fast as the machine can go,
+  so the measured frame time is the real cost of a frame.
+- Game time is *simulated*: every frame advances the game by exactly 1/60 s,
+  no matter how long it took to render. That keeps the script deterministic
+  (a 3 hour session is always the same number of frames) and lets a multi-hour
+  session finish much faster than real time.
+
+The report shows:
+- frame-time percentiles per scene (p50 / p95 / p99 / max)
+- peak RSS (resident memory) and RSS at the start/end of the run
+- how long-lived particle lists (`confetti`, `dust_particles`, `sparkles`, ...)
+  grow: the biggest size seen during the first and the last lap
+"""
+
+import os
+
+# These must be set *before* pygame is imported (main.py imports pygame).
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from array import array
+
+import pygame
+
+import main as casino
+from perfhud import collect_list_sizes
+
+SIM_FPS = 60
+SIM_DT_MS = 1000.0 / SIM_FPS
+
+
+# -----------------------------------------------------------------------------
+# Fake time + scripted input
+# -----------------------------------------------------------------------------
+
+class SimClock:
+    """Stand-in for `pygame.time.Clock` that never sleeps.
+
+    `tick()` returns a fixed 1/60 s so game logic always advances by one
+    simulated frame, while the real frame is rendered as fast as possible.
+    """
+
+    def __init__(self):
+        self.sim_ms = 0.0
+
+    def tick(self, framerate: int = 0) -> int:
+        self.sim_ms += SIM_DT_MS
+        return int(round(SIM_DT_MS))
+
+    def get_ticks(self) -> int:
+        # Replacement for `pygame.time.get_ticks()` so timers that use
+        # milliseconds (slot machine spins, rainbow text) follow simulated time.
+        return int(self.sim_ms)
+
+
+class HeldKeys:
+    """Looks like the result of `pygame.key.get_pressed()` (index by key constant)."""
+
+    def __init__(self, held: set[int]):
+        self._held = held
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._held
+
+
+class ScriptedInput:
+    """Replaces pygame's event queue, keyboard state and mouse position."""
+
+    def __init__(self):
+        self.held: set[int] = set()
+        self.pending: list[pygame.event.Event] = []
+        self.mouse_pos = (-1, -1)
+        self._real_event_get = pygame.event.get
+
+    def install(self) -> None:
+        pygame.event.get = self.get_events
+        pygame.key.get_pressed = lambda: HeldKeys(self.held)
+        pygame.mouse.get_pos = lambda: self.mouse_pos
+
+    def get_events(self, *args, **kwargs):
+        # Still pump the real queue (e.g. music-end events from the mixer).
+        events = self.pending + list(self._real_event_get(*args, **kwargs))
+        self.pending = []
+        return events
+
+    def key_down(self, key: int, mod: int = 0) -> None:
+        self.pending.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=mod, unicode="", scancode=0))
+
+    def click(self, pos: tuple[int, int]) -> None:
+        self.mouse_pos = pos
+        self.pending.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+
+    def quit(self) -> None:
+        self.pending.append(pygame.event.Event(pygame.QUIT))
+
+
+# -----------------------------------------------------------------------------
+# Measurements
+# -----------------------------------------------------------------------------
+
+def current_rss_kb() -> int | None:
+    """Resident memory right now (Linux only, None elsewhere)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except Exception:
+        return None
+
+
+def peak_rss_kb() -> int | None:
+    """Highest resident memory of this process so far."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes.
+        return peak // 1024 if sys.platform == "darwin" else peak
+    except Exception:
+        return None
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class SoakRecorder:
+    """Collects frame times, list sizes and memory while the game runs."""
+
+    def __init__(self, sample_every_frames: int = SIM_FPS):
+        self.frame_times: dict[str, array] = {}
+        self.sample_every_frames = sample_every_frames
+        self.frames = 0
+        self.lap = 0
+        # "scene.key" -> {lap number: biggest size seen during that lap}
+        self.list_peaks: dict[str, dict[int, int]] = {}
+        self.rss_per_lap: list[int] = []
+        self._last = None
+
+    def on_frame(self, info: dict) -> None:
+        now = time.perf_counter()
+        if self._last is not None:
+            scene = info["scene"]
+            samples = self.frame_times.get(scene)
+            if samples is None:
+                samples = self.frame_times[scene] = array("d")
+            samples.append((now - self._last) * 1000.0)
+        self.frames += 1
+
+        if self.frames % self.sample_every_frames == 0:
+            state = info["states"].get(info["scene"])
+            if state:
+                for key, size in collect_list_sizes(state).items():
+                    peaks = self.list_peaks.setdefault(f"{info['scene']}.{key}", {})
+                    peaks[self.lap] = max(size, peaks.get(self.lap, 0))
+
+        # Measure from the end of this hook, so the bot's own work isn't counted.
+        self._last = time.perf_counter()
+
+    def start_lap(self, lap: int) -> None:
+        self.lap = lap
+        rss = current_rss_kb()
+        if rss is not None:
+            self.rss_per_lap.append(rss)
+
+    def summary(self) -> dict:
+        scenes = {}
+        for scene, samples in self.frame_times.items():
+            ordered = sorted(samples)
+            scenes[scene] = {
+                "frames": len(ordered),
+                "p50_ms": percentile(ordered, 0.50),
+                "p95_ms": percentile(ordered, 0.95),
+                "p99_ms": percentile(ordered, 0.99),
+                "max_ms": ordered[-1] if ordered else 0.0,
+            }
+
+        lists = {}
+        for key, peaks in sorted(self.list_peaks.items()):
+            laps = sorted(peaks)
+            lists[key] = {
+                "first_lap_peak": peaks[laps[0]],
+                "last_lap_peak": peaks[laps[-1]],
+                "overall_peak": max(peaks.values()),
+                "laps_seen": len(laps),
+            }
+
+        return {
+            "frames": self.frames,
+            "laps": self.lap,
+            "scenes": scenes,
+            "peak_rss_kb": peak_rss_kb(),
+            "rss_start_kb": self.rss_per_lap[0] if self.rss_per_lap else None,
+            "rss_end_kb": current_rss_kb(),
+            "lists": lists,
+        }
+
+
+# -----------------------------------------------------------------------------
+# The scripted tour
+# -----------------------------------------------------------------------------
+
+class TourBot:
+    """Plays the casino from a script.
+
+    Each step is a generator that `yield`s once per frame; `on_frame()` moves
+    the script forward by one step every frame. `self.info` is the latest frame
+    info from `main.main()` (scene, player, states).
+    """
+
+    START_BUTTON = (210, 505)  # center of the "Start game" button on the menu
+
+    def __init__(self, inputs: ScriptedInput, recorder: SoakRecorder, clock: SimClock, sim_minutes: float):
+        self.inputs = inputs
+        self.recorder = recorder
+        self.clock = clock
+        self.sim_ms_target = sim_minutes * 60_000.0
+        self.info: dict = {"scene": "menu", "player": None, "states": {}}
+        self.missed: list[str] = []
+        self._script = self.session()
+        self._done = False
+
+    def on_frame(self, info: dict) -> None:
+        self.recorder.on_frame(info)
+        self.info = info
+        if self._done:
+            return
+        try:
+            next(self._script)
+        except StopIteration:
+            self._done = True
+            self.inputs.held = set()
+            self.inputs.quit()
+
+    # --- small building blocks ------------------------------------------------
+
+    def wait(self, seconds: float):
+        for _ in range(max(1, int(seconds * SIM_FPS))):
+            yield
+
+    def press(self, key: int, mod: int = 0):
+        self.inputs.key_down(key, mod)
+        yield
+
+    def wait_for_scene(self, scene: str, timeout: float = 10.0):
+        for _ in range(int(timeout * SIM_FPS)):
+            if self.info["scene"] == scene:
+                return
+            yield
+        self.missed.append(f"never reached scene {scene!r}")
+
+    def walk_to(self, x: float, y: float, tolerance: float = 4.0, timeout: float = 20.0):
+        """Hold arrow keys until the player stands at (x, y) or the scene changes."""
+        start_scene = self.info["scene"]
+        for _ in range(int(timeout * SIM_FPS)):
+            player = self.info["player"]
+            if player is None or self.info["scene"] != start_scene:
+                break
+            dx = x - player.x
+            dy = y - player.y
+            held = set()
+            if dx > tolerance:
+                held.add(pygame.K_RIGHT)
+            elif dx < -tolerance:
+                held.add(pygame.K_LEFT)
+            if dy > tolerance:
+                held.add(pygame.K_DOWN)
+            elif dy < -tolerance:
+                held.add(pygame.K_UP)
+            if not held:
+                break
+            self.inputs.held = held
+            yield
+        self.inputs.held = set()
+        yield
+
+    def visit_table(self, spot: tuple[int, int], scene: str, play):
+        """Walk next to a table, press E, play a bit and leave with ESC."""
+        yield from self.walk_to(*spot)
+        yield from self.press(pygame.K_e)
+        yield
+        if self.info["scene"] != scene:
+            self.missed.append(f"could not enter {scene!r} from {spot}")
+            return
+        yield from play()
+        yield from self.press(pygame.K_ESCAPE)
+        yield
+
+    # --- what to do at each table --------------------------------------------
+
+    def play_slots(self):
+        for _ in range(3):
+            yield from self.press(pygame.K_SPACE)
+            yield from self.wait(3.0)
+
+    def play_blackjack(self):
+        for _ in range(2):
+            yield from self.press(pygame.K_SPACE)
+            yield from self.wait(2.0)
+            yield from self.press(pygame.K_h)
+            yield from self.wait(1.5)
+            yield from self.press(pygame.K_s)
+            yield from self.wait(3.0)
+
+    def play_luckywheel(self):
+        yield from self.press(pygame.K_SPACE)
+        yield from self.wait(8.0)
+
+    def play_roulette(self):
+        yield from self.press(pygame.K_SPACE)
+        yield from self.wait(10.0)
+
+    def play_higherlower(self):
+        for key in (pygame.K_UP, pygame.K_DOWN, pygame.K_UP):
+            yield from self.press(key)
+            yield from self.wait(2.5)
+
+    def play_horsegame(self):
+        yield from self.press(pygame.K_1)
+        yield from self.press(pygame.K_SPACE)
+        yield from self.wait(15.0)
+
+    # --- the session ------------------------------------------------------------
+
+    def lap(self):
+        # Lobby 1: four tables, one in each corner.
+        yield from self.press(pygame.K_p, pygame.KMOD_CTRL)  # +1000 tokens so bets never fail
+        yield from self.visit_table((385, 240), "slotmachine", self.play_slots)
+        yield from self.visit_table((515, 240), "blackjack", self.play_blackjack)
+        yield from self.visit_table((515, 360), "luckywheel", self.play_luckywheel)
+        yield from self.visit_table((385, 360), "roulette", self.play_roulette)
+
+        # Walk through the right edge into lobby 2.
+        yield from self.walk_to(885, 300)
+        yield from self.wait_for_scene("lobby2")
+
+        # Bar (top-left): buy a cocktail, then dance (drunk) on the dancefloor.
+        yield from self.walk_to(385, 240)
+        yield from self.press(pygame.K_e)
+        yield from self.walk_to(700, 120)
+        yield from self.wait(12.0)
+
+        yield from self.visit_table((515, 360), "higherlower", self.play_higherlower)
+        yield from self.visit_table((385, 360), "horsegame", self.play_horsegame)
+
+        # Back to lobby 1 through the left edge.
+        yield from self.walk_to(15, 300)
+        yield from self.wait_for_scene("game")
+
+    def session(self):
+        yield from self.wait(0.5)
+        self.inputs.click(self.START_BUTTON)
+        yield
+        yield from self.wait_for_scene("game")
+
+        lap = 0
+        while self.clock.sim_ms < self.sim_ms_target:
+            lap += 1
+            self.recorder.start_lap(lap)
+            yield from self.lap()
+
+
+# -----------------------------------------------------------------------------
+# Report
+# -----------------------------------------------------------------------------
+
+def print_report(summary: dict, missed: list[str], wall_seconds: float) -> None:
+    print()
+    print(f"Soak benchmark: {summary['frames']} frames, {summary['laps']} laps, {wall_seconds:.1f}s wall time")
+    print()
+    print(f"{'scene':<14}{'frames':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for scene, s in sorted(summary["scenes"].items()):
+        print(f"{scene:<14}{s['frames']:>9}{s['p50_ms']:>9.2f}{s['p95_ms']:>9.2f}{s['p99_ms']:>9.2f}{s['max_ms']:>9.2f}")
+
+    print()
+    def mb(kb):
+        return "n/a" if kb is None else f"{kb / 1024:.1f} MB"
+    print(f"RSS: start {mb(summary['rss_start_kb'])}, end {mb(summary['rss_end_kb'])}, peak {mb(summary['peak_rss_kb'])}")
+
+    print()
+    print(f"{'list':<44}{'lap 1':>8}{'last':>8}{'peak':>8}")
+    for key, s in summary["lists"].items():
+        # A list whose per-lap peak keeps climbing is a likely slow leak.
+        flag = "  <- growing" if s["last_lap_peak"] > s["first_lap_peak"] * 1.5 + 10 else ""
+        print(f"{key:<44}{s['first_lap_peak']:>8}{s['last_lap_peak']:>8}{s['overall_peak']:>8}{flag}")
+
+    if missed:
+        print()
+        print("Script problems (the tour did not go as planned):")
+        for problem in missed:
+            print(f"  - {problem}")
+
+
+# -----------------------------------------------------------------------------
+# Startup import report
+# -----------------------------------------------------------------------------
+
+def import_report(module: str = "main", runs: int = 5) -> dict:
+    """Import `module` in fresh interpreters with `python -X importtime`.
+
+    Python then prints, for every module it imports, the time spent in that
+    module alone ("self") and including everything it imported in turn
+    ("cumulative"). We keep the best cumulative time of `runs` runs (the
+    first run also pays for writing .pyc files and a cold disk cache).
+    """
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    best: dict[str, int] = {}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=project_dir, env=dict(os.environ), capture_output=True, text=True,
+        )
+        for line in result.stderr.splitlines():
+            # "import time:       954 |     162053 |   pygame"
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            name = name.strip()
+            cumulative_us = int(cumulative_us)
+            best[name] = min(best.get(name, cumulative_us), cumulative_us)
+
+    project = {
+        name: us / 1000.0 for name, us in best.items()
+        if os.path.exists(os.path.join(project_dir, f"{name}.py"))
+    }
+    return {
+        "module": module,
+        "total_ms": best.get(module, 0) / 1000.0,
+        "pygame_ms": best.get("pygame", 0) / 1000.0,
+        "project_modules_ms": dict(sorted(project.items(), key=lambda item: -item[1])),
+    }
+
+
+def print_import_report(report: dict) -> None:
+    import scenes
+
+    print()
+    print(f"import {report['module']}: {report['total_ms']:.1f} ms (pygame itself: {report['pygame_ms']:.1f} ms)")
+    print()
+    print(f"{'project module':<20}{'cumulative ms':>15}")
+    for name, ms in report["project_modules_ms"].items():
+        print(f"{name:<20}{ms:>15.2f}")
+    minigames = [name for name in scenes.SCENE_MODULES.values() if name in report["project_modules_ms"]]
+    print()
+    print(f"mini-games imported at startup: {', '.join(minigames) if minigames else 'none'}")
+
+
+def run(sim_minutes: float, seed: int) -> tuple[dict, list[str], float]:
+    random.seed(seed)
+    clock = SimClock()
+    inputs = ScriptedInput()
+    recorder = SoakRecorder()
+    bot = TourBot(inputs, recorder, clock, sim_minutes)
+
+    # Swap in the fake clock/input. `main.main()` looks these up at call time.
+    casino.CLOCK = clock
+    pygame.time.get_ticks = clock.get_ticks
+    inputs.install()
+
+    start = time.perf_counter()
+    asyncio.run(casino.main(frame_hook=bot.on_frame))
+    wall = time.perf_counter() - start
+    return recorder.summary(), bot.missed, wall
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Headless soak benchmark for the casino.")
+    parser.add_argument("--sim-minutes", type=float, default=10.0, help="simulated session length (default: 10)")
+    parser.add_argument("--seed", type=int, default=1234, help="random seed, for repeatable runs")
+    parser.add_argument("--json", metavar="PATH", help="also write the summary as JSON")
+    parser.add_argument("--importtime", action="store_true", help="only report what importing main.py costs")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    if args.importtime:
+        report = import_report()
+        print_import_report(report)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+        sys.exit(0)
+    summary, missed, wall = run(args.sim_minutes, args.seed)
+    print_report(summary, missed, wall)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({**summary, "script_problems": missed, "wall_seconds": wall}, f, indent=2)
@@ -18,6 +18,11 @@ import pygame
 import random
 import math
 
+import backgrounds
+import fonts
+import scenes
+import particles
+
 # Constants
 SCREEN_WIDTH = 900
 SCREEN_HEIGHT = 600
@@ -39,6 +44,15 @@ NEON_GREEN = (57, 255, 20)
 NEON_PINK = (255, 16, 240)
 ORANGE = (255, 165, 0)
 
+
+def _gradient_color(y, height):
+    # Casino green at the top, darker at the bottom.
+    progress = y / height
+    r = int(20 * (1 - progress) + 10 * progress)
+    g = int(60 * (1 - progress) + 30 * progress)
+    b = int(20 * (1 - progress) + 10 * progress)
+    return (r, g, b)
+
 # Card constants
 CARD_WIDTH = 70
 CARD_HEIGHT = 100
@@ -129,135 +143,42 @@ def draw_suit_icon(surface, suit, x, y, size, color):
         draw_club(surface, x, y, size, color)
 
 
-class CasinoFloater:
-    """Floating casino elements like chips, cards, dice"""
-    
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-        self.x = random.randint(0, width)
-        self.y = random.randint(0, height)
-        self.vx = random.uniform(-0.5, 0.5)
-        self.vy = random.uniform(-1, -0.3)
-        self.type = random.choice(["chip", "spade", "heart", "diamond", "club"])
-        self.size = random.randint(12, 25)
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-2, 2)
-        self.alpha = random.randint(20, 60)
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.rotation += self.rotation_speed
-        
-        if self.y < -50:
-            self.y = self.height + 50
-            self.x = random.randint(0, self.width)
-        if self.x < -50:
-            self.x = self.width + 50
-        elif self.x > self.width + 50:
-            self.x = -50
-    
-    def draw(self, screen):
-        surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        
-        if self.type == "chip":
-            pygame.draw.circle(surf, (255, 0, 0, self.alpha), (self.size, self.size), self.size)
-            pygame.draw.circle(surf, (255, 255, 255, self.alpha), (self.size, self.size), self.size, 2)
-        elif self.type == "spade":
-            color = (255, 255, 255, self.alpha)
-            points = [(self.size, self.size - 8), (self.size - 6, self.size + 4), (self.size + 6, self.size + 4)]
-            pygame.draw.polygon(surf, color, points)
-        elif self.type == "heart":
-            color = (255, 20, 60, self.alpha)
-            pygame.draw.circle(surf, color, (self.size - 4, self.size - 2), 5)
-            pygame.draw.circle(surf, color, (self.size + 4, self.size - 2), 5)
-        elif self.type == "diamond":
-            color = (255, 20, 60, self.alpha)
-            points = [(self.size, self.size - 8), (self.size - 6, self.size), 
-                      (self.size, self.size + 8), (self.size + 6, self.size)]
-            pygame.draw.polygon(surf, color, points)
-        elif self.type == "club":
-            color = (255, 255, 255, self.alpha)
-            pygame.draw.circle(surf, color, (self.size, self.size - 4), 5)
-            pygame.draw.circle(surf, color, (self.size - 5, self.size + 2), 5)
-            pygame.draw.circle(surf, color, (self.size + 5, self.size + 2), 5)
-        
-        screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
-
-
-class GoldenSparkle:
-    """Small golden sparkle particles"""
-    
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-        self.x = random.randint(0, width)
-        self.y = random.randint(0, height)
-        self.vx = random.uniform(-0.3, 0.3)
-        self.vy = random.uniform(-0.5, 0.5)
-        self.lifetime = random.randint(60, 180)
-        self.age = 0
-        self.max_brightness = random.randint(150, 255)
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.age += 1
-        
-        if self.x < 0:
-            self.x = self.width
-        if self.x > self.width:
-            self.x = 0
-        if self.y < 0:
-            self.y = self.height
-        if self.y > self.height:
-            self.y = 0
-        
-        return self.age < self.lifetime
-    
-    def draw(self, screen):
-        progress = self.age / self.lifetime
-        brightness = int(self.max_brightness * math.sin(progress * math.pi))
-        if brightness > 0:
-            color = (brightness, int(brightness * 0.8), 0, brightness)
-            surf = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(surf, color, (3, 3), 2)
-            screen.blit(surf, (int(self.x) - 3, int(self.y) - 3))
+# Floating chips and card suits in the background.
+# The particle engine (particles.py) moves them; this function paints what
+# one floater looks like, once, when it is created.
+FLOATER_KINDS = ["chip", "spade", "heart", "diamond", "club"]
 
 
-class ConfettiParticle:
-    """Confetti particle for win celebration"""
+def _paint_floater(kind, size, alpha):
+    surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
     
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-8, 8)
-        self.vy = random.uniform(-15, -5)
-        self.color = random.choice([GOLD, RED, CYAN, NEON_GREEN, NEON_PINK, ORANGE])
-        self.size = random.randint(4, 10)
-        self.rotation = random.randint(0, 360)
-        self.rotation_speed = random.randint(-15, 15)
-        self.lifetime = random.randint(60, 120)
-        self.age = 0
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.4  # Gravity
-        self.vx *= 0.99  # Air resistance
-        self.rotation += self.rotation_speed
-        self.age += 1
-        return self.age < self.lifetime
+    if kind == "chip":
+        pygame.draw.circle(surf, (255, 0, 0, alpha), (size, size), size)
+        pygame.draw.circle(surf, (255, 255, 255, alpha), (size, size), size, 2)
+    elif kind == "spade":
+        color = (255, 255, 255, alpha)
+        points = [(size, size - 8), (size - 6, size + 4), (size + 6, size + 4)]
+        pygame.draw.polygon(surf, color, points)
+    elif kind == "heart":
+        color = (255, 20, 60, alpha)
+        pygame.draw.circle(surf, color, (size - 4, size - 2), 5)
+        pygame.draw.circle(surf, color, (size + 4, size - 2), 5)
+    elif kind == "diamond":
+        color = (255, 20, 60, alpha)
+        points = [(size, size - 8), (size - 6, size), 
+                  (size, size + 8), (size + 6, size)]
+        pygame.draw.polygon(surf, color, points)
+    elif kind == "club":
+        color = (255, 255, 255, alpha)
+        pygame.draw.circle(surf, color, (size, size - 4), 5)
+        pygame.draw.circle(surf, color, (size - 5, size + 2), 5)
+        pygame.draw.circle(surf, color, (size + 5, size + 2), 5)
     
-    def draw(self, screen):
-        alpha = int(255 * (1 - self.age / self.lifetime))
-        if alpha > 0:
-            surf = pygame.Surface((self.size * 2, self.size), pygame.SRCALPHA)
-            pygame.draw.rect(surf, (*self.color[:3], alpha), (0, 0, self.size * 2, self.size))
-            rotated = pygame.transform.rotate(surf, self.rotation)
-            rect = rotated.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(rotated, rect)
+    return surf
+
+
+# Win confetti colors (the confetti itself lives in a particle system)
+CONFETTI_COLORS = [GOLD, RED, CYAN, NEON_GREEN, NEON_PINK, ORANGE]
 
 
 class Card:
@@ -349,72 +270,126 @@ class Card:
         # Determine if showing front or back
         show_front = self.flip_progress > 0.5
         
-        # Card rectangle
-        card_rect = pygame.Rect(
-            int(self.x - current_width // 2),
-            int(self.y - CARD_HEIGHT // 2 + self.hover_offset),
-            current_width,
-            CARD_HEIGHT
-        )
-        
-        # Card shadow
-        shadow_rect = card_rect.move(3, 3)
-        pygame.draw.rect(screen, (0, 0, 0, 100), shadow_rect, border_radius=8)
+        # Card position
+        left = int(self.x - current_width // 2)
+        top = int(self.y - CARD_HEIGHT // 2 + self.hover_offset)
         
+        # Shadow + card: both are baked sprites (see CARD SPRITES below)
+        screen.blit(_card_shadow(current_width), (left + 3, top + 3))
         if show_front and self.face_up:
-            # Draw card front with golden border
-            pygame.draw.rect(screen, WHITE, card_rect, border_radius=8)
-            pygame.draw.rect(screen, (218, 165, 32), card_rect, 3, border_radius=8)
-            pygame.draw.rect(screen, (200, 150, 20), card_rect.inflate(-4, -4), 1, border_radius=6)
-            
-            # Only draw content if card is wide enough
-            if current_width > CARD_WIDTH * 0.7:
-                # Card content
-                color = RED if self.is_red() else BLACK
-                
-                # Rank in top-left corner
-                rank_text = font_large.render(self.rank, True, color)
-                rank_rect = rank_text.get_rect(topleft=(card_rect.left + 5, card_rect.top + 5))
-                screen.blit(rank_text, rank_rect)
-                
-                # Small suit icon under rank in top-left
-                draw_suit_icon(screen, self.suit, card_rect.left + 14, card_rect.top + 38, 0.4, color)
-                
-                # Large suit icon in center
-                draw_suit_icon(screen, self.suit, card_rect.centerx, card_rect.centery, 1.2, color)
-                
-                # Decorative corner elements (gold dots)
-                corner_color = (218, 165, 32)
-                pygame.draw.circle(screen, corner_color, (card_rect.left + 6, card_rect.top + 6), 2)
-                pygame.draw.circle(screen, corner_color, (card_rect.right - 6, card_rect.top + 6), 2)
-                pygame.draw.circle(screen, corner_color, (card_rect.left + 6, card_rect.bottom - 6), 2)
-                pygame.draw.circle(screen, corner_color, (card_rect.right - 6, card_rect.bottom - 6), 2)
+            screen.blit(_card_face(self.rank, self.suit, current_width, font_large), (left, top))
         else:
-            # Draw card back (casino pattern)
-            pygame.draw.rect(screen, CASINO_RED, card_rect, border_radius=8)
-            pygame.draw.rect(screen, GOLD, card_rect, 3, border_radius=8)
-            
-            # Draw pattern on back
-            if current_width > 20:
-                inner_rect = card_rect.inflate(-10, -10)
-                pygame.draw.rect(screen, (100, 0, 0), inner_rect, border_radius=4)
-                pygame.draw.rect(screen, GOLD, inner_rect, 1, border_radius=4)
-                
-                # Diamond pattern
-                cx, cy = card_rect.center
-                if current_width > 40:
-                    for dy in range(-30, 31, 15):
-                        for dx in range(-15, 16, 15):
-                            diamond_x = cx + dx
-                            diamond_y = cy + dy
-                            if inner_rect.collidepoint(diamond_x, diamond_y):
-                                points = [
-                                    (diamond_x, diamond_y - 4),
-                                    (diamond_x - 3, diamond_y),
-                                    (diamond_x, diamond_y + 4),
-                                    (diamond_x + 3, diamond_y)
-                                ]
-                                pygame.draw.polygon(screen, GOLD, points)
+            screen.blit(_card_back(current_width), (left, top))
+
+
+# =============================================================================
+# CARD SPRITES
+# =============================================================================
+# Drawing a card from shapes (rounded rects, 360-point heart polygons, the
+# diamond pattern on the back, ...) every frame is slow, and a card always
+# looks the same for the same rank, suit and width. The width only changes
+# while the card flips (flip_progress moves in steps of 0.1), so there are
+# just a handful of widths. Every sprite is drawn once, on first use, onto a
+# transparent surface (the rounded corners stay see-through).
+
+_CARD_SPRITES = {}  # ("face", rank, suit, width, font) / ("back", width) / ("shadow", width) -> Surface
+
+
+def _new_card_surface(width):
+    return pygame.Surface((width, CARD_HEIGHT), pygame.SRCALPHA)
+
+
+def _finish(surface):
+    try:
+        return surface.convert_alpha()
+    except pygame.error:
+        return surface  # no display yet
+
+
+def _card_shadow(width):
+    key = ("shadow", width)
+    sprite = _CARD_SPRITES.get(key)
+    if sprite is None:
+        sprite = _new_card_surface(width)
+        pygame.draw.rect(sprite, (0, 0, 0, 100), sprite.get_rect(), border_radius=8)
+        sprite = _CARD_SPRITES[key] = _finish(sprite)
+    return sprite
+
+
+def _card_face(rank, suit, width, font_large):
+    key = ("face", rank, suit, width, font_large)
+    sprite = _CARD_SPRITES.get(key)
+    if sprite is not None:
+        return sprite
+
+    sprite = _new_card_surface(width)
+    card_rect = sprite.get_rect()
+    # Card front with golden border
+    pygame.draw.rect(sprite, WHITE, card_rect, border_radius=8)
+    pygame.draw.rect(sprite, (218, 165, 32), card_rect, 3, border_radius=8)
+    pygame.draw.rect(sprite, (200, 150, 20), card_rect.inflate(-4, -4), 1, border_radius=6)
+    
+    # Only draw content if card is wide enough
+    if width > CARD_WIDTH * 0.7:
+        color = RED if suit in ['♥', '♦'] else BLACK
+        
+        # Rank in top-left corner
+        rank_text = fonts.render(font_large, rank, True, color)
+        sprite.blit(rank_text, (card_rect.left + 5, card_rect.top + 5))
+        
+        # Small suit icon under rank in top-left
+        draw_suit_icon(sprite, suit, card_rect.left + 14, card_rect.top + 38, 0.4, color)
+        
+        # Large suit icon in center
+        draw_suit_icon(sprite, suit, card_rect.centerx, card_rect.centery, 1.2, color)
+        
+        # Decorative corner elements (gold dots)
+        corner_color = (218, 165, 32)
+        pygame.draw.circle(sprite, corner_color, (card_rect.left + 6, card_rect.top + 6), 2)
+        pygame.draw.circle(sprite, corner_color, (card_rect.right - 6, card_rect.top + 6), 2)
+        pygame.draw.circle(sprite, corner_color, (card_rect.left + 6, card_rect.bottom - 6), 2)
+        pygame.draw.circle(sprite, corner_color, (card_rect.right - 6, card_rect.bottom - 6), 2)
+    
+    sprite = _CARD_SPRITES[key] = _finish(sprite)
+    return sprite
+
+
+def _card_back(width):
+    key = ("back", width)
+    sprite = _CARD_SPRITES.get(key)
+    if sprite is not None:
+        return sprite
+
+    sprite = _new_card_surface(width)
+    card_rect = sprite.get_rect()
+    # Card back (casino pattern)
+    pygame.draw.rect(sprite, CASINO_RED, card_rect, border_radius=8)
+    pygame.draw.rect(sprite, GOLD, card_rect, 3, border_radius=8)
+    
+    # Draw pattern on back
+    if width > 20:
+        inner_rect = card_rect.inflate(-10, -10)
+        pygame.draw.rect(sprite, (100, 0, 0), inner_rect, border_radius=4)
+        pygame.draw.rect(sprite, GOLD, inner_rect, 1, border_radius=4)
+        
+        # Diamond pattern
+        cx, cy = card_rect.center
+        if width > 40:
+            for dy in range(-30, 31, 15):
+                for dx in range(-15, 16, 15):
+                    diamond_x = cx + dx
+                    diamond_y = cy + dy
+                    if inner_rect.collidepoint(diamond_x, diamond_y):
+                        points = [
+                            (diamond_x, diamond_y - 4),
+                            (diamond_x - 3, diamond_y),
+                            (diamond_x, diamond_y + 4),
+                            (diamond_x + 3, diamond_y)
+                        ]
+                        pygame.draw.polygon(sprite, GOLD, points)
+    
+    sprite = _CARD_SPRITES[key] = _finish(sprite)
+    return sprite
 
 
 class Deck:
@@ -467,18 +442,19 @@ class BlackjackGame:
         self.dealer_reveal_delay = 0
         
         # Visual effects
-        self.casino_floaters = [CasinoFloater(width, height) for _ in range(12)]
-        self.golden_sparkles = [GoldenSparkle(width, height) for _ in range(40)]
-        self.confetti = []
+        self.casino_floaters = particles.casino_floaters(width, height, 12, FLOATER_KINDS, _paint_floater,
+                                                         size_range=(12, 25), alpha_range=(20, 60))
+        self.golden_sparkles = particles.golden_sparkles(width, height, 40)
+        self.confetti = particles.confetti(drag_x=0.99)
         
         # Pulse effects
         self.pulse_time = 0
         self.win_effect_timer = 0
         
         # Fonts
-        self.font_large = pygame.font.Font(None, 36)
-        self.font_medium = pygame.font.Font(None, 28)
-        self.font_small = pygame.font.Font(None, 22)
+        self.font_large = fonts.get_font(36)
+        self.font_medium = fonts.get_font(28)
+        self.font_small = fonts.get_font(22)
         
         # Button rects (will be set during draw)
         self.hit_button = pygame.Rect(0, 0, 100, 45)
@@ -537,7 +513,7 @@ class BlackjackGame:
         self.dealer_hand = []
         self.last_win = 0
         self.message = ""
-        self.confetti = []
+        self.confetti.clear()
         
         # Deal cards with animation
         deck_x = self.width - 80
@@ -704,11 +680,8 @@ class BlackjackGame:
             if self.last_win > 0:
                 self.win_effect_timer = 120
                 # Create confetti
-                for _ in range(50):
-                    self.confetti.append(ConfettiParticle(
-                        self.width // 2,
-                        self.height // 2
-                    ))
+                particles.burst(self.confetti, self.width // 2, self.height // 2, 50,
+                                CONFETTI_COLORS, **particles.WIN_CONFETTI)
         
         # Reset bet amount if doubled
         self.bet_amount = min(self.bet_amount, 100)
@@ -764,14 +737,9 @@ class BlackjackGame:
                     self.dealer_play()
         
         # Update effects
-        for floater in self.casino_floaters:
-            floater.update()
-        
-        self.golden_sparkles = [s for s in self.golden_sparkles if s.update()]
-        while len(self.golden_sparkles) < 40:
-            self.golden_sparkles.append(GoldenSparkle(self.width, self.height))
-        
-        self.confetti = [p for p in self.confetti if p.update()]
+        self.casino_floaters.update()
+        self.golden_sparkles.update()  # dead sparkles are replaced automatically
+        self.confetti.update()
         
         if self.message_timer > 0:
             self.message_timer -= 1
@@ -790,8 +758,7 @@ class BlackjackGame:
         pygame.draw.rect(screen, GOLD, table_rect, 4, border_radius=20)
         
         # Draw golden sparkles
-        for sparkle in self.golden_sparkles:
-            sparkle.draw(screen)
+        self.golden_sparkles.draw(screen)
         
         # Draw deck
         deck_x = self.width - 80
@@ -804,7 +771,7 @@ class BlackjackGame:
             pygame.draw.rect(screen, GOLD, deck_rect, 2, border_radius=8)
         
         # Draw dealer label (centered)
-        dealer_label = self.font_medium.render("DEALER", True, GOLD)
+        dealer_label = fonts.render(self.font_medium, "DEALER", True, GOLD)
         dealer_label_rect = dealer_label.get_rect(centerx=self.width // 2, top=60)
         screen.blit(dealer_label, dealer_label_rect)
         
@@ -819,12 +786,12 @@ class BlackjackGame:
             else:
                 dealer_val = self.get_visible_dealer_value()
             
-            val_text = self.font_medium.render(f"Value: {dealer_val}", True, WHITE)
+            val_text = fonts.render(self.font_medium, f"Value: {dealer_val}", True, WHITE)
             val_rect = val_text.get_rect(centerx=self.width // 2, top=200)
             screen.blit(val_text, val_rect)
         
         # Draw player label (centered)
-        player_label = self.font_medium.render("YOUR HAND", True, GOLD)
+        player_label = fonts.render(self.font_medium, "YOUR HAND", True, GOLD)
         player_label_rect = player_label.get_rect(centerx=self.width // 2, bottom=self.height - 220)
         screen.blit(player_label, player_label_rect)
         
@@ -836,7 +803,7 @@ class BlackjackGame:
         if len(self.player_hand) > 0:
             player_val = self.calculate_hand_value(self.player_hand)
             color = RED if player_val > 21 else (NEON_GREEN if player_val == 21 else WHITE)
-            val_text = self.font_medium.render(f"Value: {player_val}", True, color)
+            val_text = fonts.render(self.font_medium, f"Value: {player_val}", True, color)
             val_rect = val_text.get_rect(centerx=self.width // 2, top=self.height - 95)
             screen.blit(val_text, val_rect)
         
@@ -844,8 +811,7 @@ class BlackjackGame:
         self.draw_ui(screen)
         
         # Draw confetti
-        for particle in self.confetti:
-            particle.draw(screen)
+        self.confetti.draw(screen)
         
         # Draw message
         if self.message and self.message_timer > 0:
@@ -853,33 +819,27 @@ class BlackjackGame:
     
     def draw_background(self, screen):
         """Draw the casino background"""
-        # Gradient background
-        for y in range(self.height):
-            progress = y / self.height
-            r = int(20 * (1 - progress) + 10 * progress)
-            g = int(60 * (1 - progress) + 30 * progress)
-            b = int(20 * (1 - progress) + 10 * progress)
-            pygame.draw.line(screen, (r, g, b), (0, y), (self.width, y))
+        # Gradient background (baked once, see backgrounds.py)
+        screen.blit(backgrounds.vertical_gradient("blackjack", (self.width, self.height), _gradient_color), (0, 0))
         
         # Draw floating elements
-        for floater in self.casino_floaters:
-            floater.draw(screen)
+        self.casino_floaters.draw(screen)
     
     def draw_ui(self, screen):
         """Draw UI elements"""
         # Token display
         token_text = f"Tokens: {self.tokens}"
-        token_surf = self.font_medium.render(token_text, True, GOLD)
+        token_surf = fonts.render(self.font_medium, token_text, True, GOLD)
         token_rect = token_surf.get_rect(topleft=(70, 70))
         pygame.draw.rect(screen, (0, 0, 0, 150), token_rect.inflate(20, 10), border_radius=8)
         screen.blit(token_surf, token_rect)
         
         # Bet display with +/- buttons
-        bet_label = self.font_small.render("Bet:", True, WHITE)
+        bet_label = fonts.render(self.font_small, "Bet:", True, WHITE)
         screen.blit(bet_label, (70, 103))
         
         bet_text = f"{self.bet_amount}"
-        bet_surf = self.font_medium.render(bet_text, True, WHITE)
+        bet_surf = fonts.render(self.font_medium, bet_text, True, WHITE)
         screen.blit(bet_surf, (110, 100))
         
         # Minus button
@@ -887,7 +847,7 @@ class BlackjackGame:
         minus_color = (80, 80, 120)
         pygame.draw.rect(screen, minus_color, self.bet_minus_button, border_radius=6)
         pygame.draw.rect(screen, WHITE, self.bet_minus_button, 2, border_radius=6)
-        minus_text = self.font_medium.render("-", True, WHITE)
+        minus_text = fonts.render(self.font_medium, "-", True, WHITE)
         screen.blit(minus_text, minus_text.get_rect(center=self.bet_minus_button.center))
         
         # Plus button
@@ -895,7 +855,7 @@ class BlackjackGame:
         plus_color = (80, 80, 120)
         pygame.draw.rect(screen, plus_color, self.bet_plus_button, border_radius=6)
         pygame.draw.rect(screen, WHITE, self.bet_plus_button, 2, border_radius=6)
-        plus_text = self.font_medium.render("+", True, WHITE)
+        plus_text = fonts.render(self.font_medium, "+", True, WHITE)
         screen.blit(plus_text, plus_text.get_rect(center=self.bet_plus_button.center))
         
         # Last win display
@@ -907,7 +867,7 @@ class BlackjackGame:
                 0
             )
             win_text = f"+{self.last_win}"
-            win_surf = self.font_large.render(win_text, True, color)
+            win_surf = fonts.render(self.font_large, win_text, True, color)
             win_rect = win_surf.get_rect(topleft=(70, 130))
             screen.blit(win_surf, win_rect)
         
@@ -921,7 +881,7 @@ class BlackjackGame:
             
             # Bet adjustment hint below button
             hint_text = "Use +/- buttons or UP/DOWN to change bet"
-            hint_surf = self.font_small.render(hint_text, True, (200, 200, 200))
+            hint_surf = fonts.render(self.font_small, hint_text, True, (200, 200, 200))
             hint_rect = hint_surf.get_rect(center=(self.width // 2, self.height - 18))
             screen.blit(hint_surf, hint_rect)
         
@@ -968,7 +928,7 @@ class BlackjackGame:
         
         hint_y = 70
         for i, hint in enumerate(controls):
-            hint_surf = self.font_small.render(hint, True, (180, 180, 180))
+            hint_surf = fonts.render(self.font_small, hint, True, (180, 180, 180))
             hint_rect = hint_surf.get_rect(right=self.width - 70, top=hint_y + i * 22)
             screen.blit(hint_surf, hint_rect)
     
@@ -988,7 +948,7 @@ class BlackjackGame:
         pygame.draw.rect(screen, WHITE, rect, 2, border_radius=10)
         
         # Button text
-        text_surf = self.font_medium.render(text, True, WHITE)
+        text_surf = fonts.render(self.font_medium, text, True, WHITE)
         text_rect = text_surf.get_rect(center=rect.center)
         screen.blit(text_surf, text_rect)
     
@@ -1014,8 +974,8 @@ class BlackjackGame:
             color = WHITE
         
         font_size = int(42 * scale)
-        msg_font = pygame.font.Font(None, font_size)
-        msg_surf = msg_font.render(self.message, True, color)
+        msg_font = fonts.get_font(font_size)
+        msg_surf = fonts.render(msg_font, self.message, True, color)
         msg_rect = msg_surf.get_rect(center=(self.width // 2, self.height // 2))
         screen.blit(msg_surf, msg_rect)
     
@@ -1066,32 +1026,45 @@ class BlackjackGame:
 # - drawing happens through a single draw_* function
 # - input is handled by small wrapper functions
 
-def draw_blackjack_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
-    """Draw and update blackjack game on the given surface."""
+def _ensure_blackjack_state(game_state: dict, size: tuple[int, int]) -> dict:
     # First call: create the game object and store it in the dict.
     # Next calls: reuse the same object so animations/timers continue.
     if "game" not in game_state:
         tokens = game_state.get("tokens", 100)
-        surf_w, surf_h = surface.get_size()
-        game = BlackjackGame(surf_w, surf_h)
+        game = BlackjackGame(*size)
         game.tokens = tokens
         
         game_state = {
             "game": game,
             "tokens": tokens,
         }
-    
-    # The actual blackjack rules/live logic are inside the BlackjackGame class.
+    return game_state
+
+
+def update_blackjack_scene(game_state: dict, size: tuple[int, int]) -> dict:
+    """Advance the blackjack game by one frame (`size` = the surface it is drawn on)."""
+    game_state = _ensure_blackjack_state(game_state, size)
     game: BlackjackGame = game_state["game"]
     game.update()
-    game.draw(surface)
     
     # Sync tokens
     game_state["tokens"] = game.tokens
-    
     return game_state
 
 
+def render_blackjack_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """Draw the blackjack game (no game logic, see update_blackjack_scene)."""
+    game_state = _ensure_blackjack_state(game_state, surface.get_size())
+    game_state["game"].draw(surface)
+    return game_state
+
+
+def draw_blackjack_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """Draw and update blackjack game on the given surface."""
+    game_state = update_blackjack_scene(game_state, surface.get_size())
+    return render_blackjack_scene(surface, game_state, font)
+
+
 def handle_blackjack_click(game_state: dict, pos: tuple) -> dict:
     """Handle mouse click in blackjack game."""
     # This receives the click position in the *same coordinate system* as the
@@ -1114,3 +1087,36 @@ def change_blackjack_bet(game_state: dict, increase: bool) -> dict:
     if "game" in game_state:
         game_state["game"].change_bet(increase)
     return game_state
+
+
+def set_blackjack_tokens(game_state: dict, tokens: int) -> dict:
+    """Set the token balance (the game object keeps its own copy)."""
+    game_state["tokens"] = tokens
+    if "game" in game_state:
+        game_state["game"].tokens = tokens
+    return game_state
+
+
+class BlackjackScene(scenes.MiniGameScene):
+    """The blackjack table as a scene (see scenes.py)."""
+
+    name = "blackjack"
+
+    def update_state(self, state, size):
+        return update_blackjack_scene(state, size)
+
+    def render(self, surface, state, font):
+        return render_blackjack_scene(surface, state, font)
+
+    def set_tokens(self, state, tokens):
+        return set_blackjack_tokens(state, tokens)
+
+    def handle_event(self, app, event):
+        if event.type == pygame.KEYDOWN:
+            # The game object has its own key handling (see handle_keypress).
+            self.state = handle_blackjack_keypress(self.state, event.key)
+        else:
+            super().handle_event(app, event)
+
+    def click(self, app, pos):
+        self.state = handle_blackjack_click(self.state, pos)
@@ -0,0 +1,106 @@
+"""disco.py
+
+Disco lighting for the dancefloor in lobby 2: the rotating colored light rays
+coming out of the disco ball. (The colored "flash" over the whole room is a
+post effect, see `TintStage` in postfx.py.)
+
+Why this is its own module:
+The first version drew every ray by creating a brand new full-screen (900x600)
+SRCALPHA surface, drawing one line on it and blitting the whole surface onto
+the canvas. With 12 rays that is 12 big allocations + 12 full-screen alpha
+blends *every frame*, while each ray only covers a few thousand pixels.
+
+How it works now:
+- Each ray is drawn as a thin 4-point polygon with `pygame.gfxdraw`, which can
+  blend a translucent color straight onto the canvas. Only the pixels of the
+  ray itself are touched, and nothing is allocated.
+- If `gfxdraw` isn't available (it's an optional pygame module), the rays are
+  drawn into ONE reusable transparent layer that is blitted once per frame.
+"""
+
+import math
+
+import pygame
+
+try:
+    import pygame.gfxdraw
+    GFXDRAW_AVAILABLE = True
+except ImportError:
+    GFXDRAW_AVAILABLE = False
+
+DISCO_COLORS = [
+    (255, 50, 50),    # Red
+    (50, 255, 50),    # Green
+    (50, 50, 255),    # Blue
+    (255, 255, 50),   # Yellow
+    (255, 50, 255),   # Magenta
+    (50, 255, 255),   # Cyan
+    (255, 150, 50),   # Orange
+    (150, 50, 255),   # Purple
+]
+
+
+class DiscoLights:
+    """Rotating light rays, drawn without per-frame allocations."""
+
+    def __init__(
+        self,
+        colors: list[tuple[int, int, int]] | None = None,
+        num_rays: int = 12,
+        ray_length: int = 600,
+        ray_width: int = 8,
+        ray_alpha: int = 80,
+        rotation_speed: float = 2.0,
+    ):
+        self.colors = colors if colors is not None else DISCO_COLORS
+        self.num_rays = num_rays
+        self.ray_length = ray_length
+        self.ray_width = ray_width
+        self.ray_alpha = ray_alpha
+        self.rotation_speed = rotation_speed  # radians per second
+
+        # Fallback path only: one transparent layer reused every frame, plus the
+        # rays drawn on it last frame (so we can erase just those pixels).
+        self._layer: pygame.Surface | None = None
+        self._previous_rays: list[tuple[tuple[int, int], tuple[int, int]]] = []
+
+    def _ray_endpoints(self, origin: tuple[int, int], elapsed: float):
+        """Yield (start, end, color) for every ray at time `elapsed` (seconds)."""
+        rotation = elapsed * self.rotation_speed
+        for i in range(self.num_rays):
+            angle = (2 * math.pi * i / self.num_rays) + rotation
+            end_x = origin[0] + int(math.cos(angle) * self.ray_length)
+            end_y = origin[1] + int(math.sin(angle) * self.ray_length)
+            yield origin, (end_x, end_y), self.colors[i % len(self.colors)]
+
+    def _ray_polygon(self, start: tuple[int, int], end: tuple[int, int]) -> list[tuple[int, int]]:
+        # `pygame.draw.line(..., width)` makes thick lines by repeating the line
+        # shifted up/down (mostly horizontal lines) or left/right (mostly vertical
+        # lines). Building the same band as a polygon keeps the exact same look.
+        lo = -(self.ray_width // 2) + 1
+        hi = self.ray_width // 2
+        (x1, y1), (x2, y2) = start, end
+        if abs(x2 - x1) >= abs(y2 - y1):
+            return [(x1, y1 + lo), (x2, y2 + lo), (x2, y2 + hi), (x1, y1 + hi)]
+        return [(x1 + lo, y1), (x2 + lo, y2), (x2 + hi, y2), (x1 + hi, y1)]
+
+    def draw_rays(self, surface: pygame.Surface, origin: tuple[int, int], elapsed: float) -> None:
+        """Draw all rays from `origin` (the disco ball center) onto `surface`."""
+        if GFXDRAW_AVAILABLE:
+            for start, end, color in self._ray_endpoints(origin, elapsed):
+                pygame.gfxdraw.filled_polygon(surface, self._ray_polygon(start, end), (*color, self.ray_alpha))
+            return
+
+        # Fallback: a single reusable layer.
+        if self._layer is None or self._layer.get_size() != surface.get_size():
+            self._layer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            self._previous_rays = []
+        # Erasing last frame's rays (same lines, fully transparent) is much
+        # cheaper than clearing the whole layer.
+        for start, end in self._previous_rays:
+            pygame.draw.line(self._layer, (0, 0, 0, 0), start, end, self.ray_width)
+        self._previous_rays = []
+        for start, end, color in self._ray_endpoints(origin, elapsed):
+            pygame.draw.line(self._layer, (*color, self.ray_alpha), start, end, self.ray_width)
+            self._previous_rays.append((start, end))
+        surface.blit(self._layer, (0, 0))
@@ -0,0 +1,234 @@
+"""fonts.py
+
+One place for all fonts and all rendered text.
+
+If you're new to game-dev:
+- `pygame.font.Font(None, 32)` opens and parses a font file. Doing that inside
+  a draw function means doing it 60 times per second, for a font that is
+  exactly the same every time.
+- `font.render("SPACE - Spin", True, color)` draws the text into a brand new
+  Surface. For a label that never changes that is also wasted work: the
+  result is the same image every frame.
+
+So:
+- `get_font(size, name, bold, italic)` creates each font once and then hands
+  out the same object (a "registry").
+- `render(font, text, antialias, color)` has the same arguments as
+  `font.render(...)`, but remembers the result. The next frame, the same
+  label is just a dictionary lookup - the only real cost left is the blit.
+
+The text cache is bounded by the total number of pixels it holds; when it is
+full, the label that wasn't used for the longest time is thrown away (LRU).
+Text that changes all the time (a timer, a token counter) simply falls out
+of the cache again, so it doesn't cost more than before.
+
+IMPORTANT: never draw onto a Surface returned by `render()` - it is shared.
+Copy it first (`surface.copy()`) if you really need to modify it.
+
+Named (system) fonts:
+`pygame.font.SysFont(name, ...)` first asks the operating system for the list
+of ALL installed fonts (on Linux that runs `fc-list`), which can take
+hundreds of milliseconds. So we never call it on the main thread:
+- The file path a name resolves to is remembered in `.cache/fonts.json`, so
+  after the first run we can open the file directly.
+- A name that isn't in that file yet is looked up on a background thread.
+  Until the answer is there, `get_font` returns pygame's bundled default font
+  (the same one `pygame.font.Font(None, size)` uses), so nothing waits.
+- In the browser (pygbag) there are no system fonts and no threads: named
+  fonts simply use the bundled default font.
+"""
+
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pygame
+
+# Same "best effort" base-dir logic as the rest of the project.
+try:
+    FONT_CACHE_FILE = str(Path(__file__).resolve().parent / ".cache" / "fonts.json")
+except:
+    FONT_CACHE_FILE = os.path.join(".cache", "fonts.json")
+
+SYSTEM_FONTS_AVAILABLE = sys.platform != "emscripten"
+
+_FONTS: dict = {}
+
+# "name|bold|italic" -> font file path, or None for "use the bundled default".
+# Filled from FONT_CACHE_FILE and by the background lookups.
+_RESOLVED: dict = {}
+_PENDING: set = set()
+_RESOLVED_LOCK = threading.Lock()
+_resolved_loaded = False
+
+
+def _resolved_key(name: str, bold: bool, italic: bool) -> str:
+    return f"{name}|{int(bold)}|{int(italic)}"
+
+
+def _load_resolved() -> None:
+    global _resolved_loaded
+    _resolved_loaded = True
+    try:
+        with open(FONT_CACHE_FILE, "r") as f:
+            data = json.load(f)
+        # Drop entries whose font file was uninstalled since.
+        _RESOLVED.update({k: v for k, v in data.items() if v is None or os.path.exists(v)})
+    except Exception:
+        pass
+
+
+def _save_resolved() -> None:
+    try:
+        os.makedirs(os.path.dirname(FONT_CACHE_FILE), exist_ok=True)
+        with _RESOLVED_LOCK:
+            data = dict(_RESOLVED)
+        with open(FONT_CACHE_FILE, "w") as f:
+            json.dump(data, f, indent=2)
+    except Exception:
+        pass  # read-only install: we just look the name up again next run
+
+
+def _resolve_in_background(name: str, bold: bool, italic: bool) -> None:
+    key = _resolved_key(name, bold, italic)
+    try:
+        path = pygame.font.match_font(name, bold, italic)
+    except Exception:
+        path = None
+    with _RESOLVED_LOCK:
+        _RESOLVED[key] = path
+        _PENDING.discard(key)
+    _save_resolved()
+
+
+def prefetch_font(name: str, bold: bool = False, italic: bool = False) -> None:
+    """Start resolving a system font name now, so it's ready when a scene needs it."""
+    if not _resolved_loaded:
+        _load_resolved()
+    key = _resolved_key(name, bold, italic)
+    with _RESOLVED_LOCK:
+        if key in _RESOLVED or key in _PENDING:
+            return
+        if not SYSTEM_FONTS_AVAILABLE:
+            _RESOLVED[key] = None
+            return
+        _PENDING.add(key)
+    threading.Thread(target=_resolve_in_background, args=(name, bold, italic), daemon=True).start()
+
+
+def font_file(name: str, bold: bool = False, italic: bool = False) -> str | None:
+    """Which file `get_font(size, name, bold, italic)` opens.
+
+    "" means pygame's bundled default font, None means the name is still
+    being looked up (so whatever is drawn with it now will change later).
+    """
+    prefetch_font(name, bold, italic)
+    with _RESOLVED_LOCK:
+        key = _resolved_key(name, bold, italic)
+        if key not in _RESOLVED:
+            return None
+        return _RESOLVED[key] or ""
+
+
+def get_font(size: int, name: str | None = None, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+    """The shared font for (name, size, style).
+
+    `name=None` is pygame's bundled default font (same as
+    `pygame.font.Font(None, size)`). Any other name is a system font; while
+    it is still being looked up (see the module docstring), the default font
+    is returned instead.
+    """
+    key = (name, size, bold, italic)
+    font = _FONTS.get(key)
+    if font is not None:
+        return font
+
+    path = None
+    if name is not None:
+        prefetch_font(name, bold, italic)
+        with _RESOLVED_LOCK:
+            resolved = _resolved_key(name, bold, italic) in _RESOLVED
+            path = _RESOLVED.get(_resolved_key(name, bold, italic))
+        if not resolved:
+            # Not known yet: don't remember this stand-in, ask again next time.
+            return get_font(size, None, bold, italic)
+
+    try:
+        font = pygame.font.Font(path, size)
+    except Exception:
+        path = None
+        font = pygame.font.Font(None, size)
+    if path is None:
+        # Like SysFont: without a real bold/italic file, let pygame fake it.
+        font.set_bold(bold)
+        font.set_italic(italic)
+    _FONTS[key] = font
+    return font
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces, bounded by their total pixel count."""
+
+    def __init__(self, max_pixels: int = 4_000_000):
+        self.max_pixels = max_pixels
+        self._entries: OrderedDict = OrderedDict()
+        self._pixels = 0
+        # Totals since start, and for the current frame (see `new_frame`).
+        self.hits = 0
+        self.misses = 0
+        self.frame_hits = 0
+        self.frame_misses = 0
+
+    def new_frame(self) -> None:
+        """Reset the per-frame counters (called once at the top of the main loop)."""
+        self.frame_hits = 0
+        self.frame_misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color, background=None) -> pygame.Surface:
+        key = (font, text, antialias, tuple(color), None if background is None else tuple(background))
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.frame_hits += 1
+            return surface
+
+        self.misses += 1
+        self.frame_misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self._entries[key] = surface
+        self._pixels += surface.get_width() * surface.get_height()
+        while self._pixels > self.max_pixels and len(self._entries) > 1:
+            _, old = self._entries.popitem(last=False)
+            self._pixels -= old.get_width() * old.get_height()
+        return surface
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.frame_hits,
+            "misses": self.frame_misses,
+            "entries": len(self._entries),
+            "pixels": self._pixels,
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pixels = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# The text cache shared by the whole game.
+TEXT_CACHE = TextCache()
+
+
+def render(font: pygame.font.Font, text: str, antialias: bool, color, background=None) -> pygame.Surface:
+    """Cached `font.render(text, antialias, color, background)`."""
+    return TEXT_CACHE.render(font, text, antialias, color, background)
@@ -5,6 +5,8 @@ Uses PIL/Pillow to extract frames from animated GIFs.
 import pygame
 from pathlib import Path
 
+from scheduler import run_to_end
+
 try:
     from PIL import Image
     PIL_AVAILABLE = True
@@ -15,13 +17,15 @@ except ImportError:
 class GIFImage:
     """A class to load and animate GIF images in Pygame."""
     
-    def __init__(self, filepath: str, size: tuple[int, int] | None = None):
+    def __init__(self, filepath: str, size: tuple[int, int] | None = None, load: bool = True):
         """
         Initialize a GIFImage.
         
         Args:
             filepath: Path to the GIF file
             size: Optional tuple (width, height) to scale the GIF to
+            load: Decode the frames now. With False, run `load_steps()`
+                  (e.g. as a scheduler job) before using it.
         """
         self.filepath = filepath
         self.size = size
@@ -31,10 +35,15 @@ class GIFImage:
         self.elapsed_time = 0.0
         self._paused = False
         
-        self._load_gif()
+        if load:
+            self._load_gif()
     
     def _load_gif(self) -> None:
         """Load all frames from the GIF file with proper transparency handling."""
+        run_to_end(self.load_steps())
+
+    def load_steps(self):
+        """_load_gif as a scheduler job: one frame per step (see scheduler.py)."""
         if not PIL_AVAILABLE:
             # Fallback: just load the first frame with pygame
             self._load_single_frame()
@@ -60,6 +69,7 @@ class GIFImage:
                 gif.seek(frame_idx)
                 # Copy the frame to preserve it
                 pil_frames.append(gif.copy())
+            yield
             
             # Now process each frame
             # Keep track of the previous frame for proper compositing
@@ -101,6 +111,7 @@ class GIFImage:
                     surface = pygame.transform.smoothscale(surface, self.size)
                 
                 self.frames.append(surface)
+                yield
             
             gif.close()
             
@@ -125,6 +136,23 @@ class GIFImage:
             self.frames = [placeholder]
             self.frame_durations = [0.1]
     
+    def clone(self) -> "GIFImage":
+        """
+        Create a new GIFImage that shares this one's decoded frames.
+
+        Decoding is the slow part, so the copy reuses the frame surfaces and
+        only gets its own animation state (current frame, timer, paused).
+        """
+        copy = GIFImage.__new__(GIFImage)
+        copy.filepath = self.filepath
+        copy.size = self.size
+        copy.frames = self.frames
+        copy.frame_durations = self.frame_durations
+        copy.current_frame = 0
+        copy.elapsed_time = 0.0
+        copy._paused = False
+        return copy
+
     def update(self, dt: float) -> None:
         """
         Update the animation.
@@ -0,0 +1,115 @@
+"""glyphatlas.py
+
+Text whose color changes every frame (like the rainbow "Main Menu" title),
+without asking the font to draw it again every frame.
+
+If you're new to game-dev:
+- `font.render(...)` makes a brand new Surface every time. The text cache in
+  fonts.py avoids that for labels, but a rainbow title has a different color
+  every frame, so it would never hit that cache.
+- The *shape* of a letter never changes - only its color does.
+
+So every glyph (a character, or a whole word) is rasterized ONCE in white.
+To get it in a color we "tint" it: multiply the white glyph by the color
+(`BLEND_RGBA_MULT`). White * color = color, and the glyph's anti-aliased
+edges (its alpha) are kept. A tint can also carry an alpha, e.g.
+`(255, 255, 150, 100)` for a semi-transparent highlight.
+
+Tinted glyphs are kept too (LRU, bounded by their total pixel count). An
+animated color is snapped to a small palette first (`rainbow_colors(...,
+steps=36)` = 10 degree hue steps), so after the first loop of the animation
+every frame is only blits.
+
+Usage:
+    atlas = get_atlas(fonts.get_font(144))
+    atlas.draw_chars(screen, "Main Menu", (450, 200), rainbow_colors(9, t))
+    screen.blit(atlas.tinted("LUCKY WHEEL", (255, 255, 150, 100)), rect)
+
+IMPORTANT: never draw onto a Surface returned by `tinted()` - it is shared.
+"""
+
+import colorsys
+from collections import OrderedDict
+
+import pygame
+
+
+class GlyphAtlas:
+    """White glyphs of one font, rasterized once, plus their tinted copies."""
+
+    def __init__(self, font: pygame.font.Font, max_tinted_pixels: int = 2_000_000):
+        self.font = font
+        self.max_tinted_pixels = max_tinted_pixels
+        self._glyphs: dict[str, pygame.Surface] = {}
+        self._tinted: OrderedDict = OrderedDict()
+        self._tinted_pixels = 0
+
+    def glyph(self, text: str) -> pygame.Surface:
+        """The white (untinted) image of `text`."""
+        glyph = self._glyphs.get(text)
+        if glyph is None:
+            glyph = self.font.render(text, True, (255, 255, 255))
+            try:
+                glyph = glyph.convert_alpha()
+            except pygame.error:
+                pass  # no display yet
+            self._glyphs[text] = glyph
+        return glyph
+
+    def tinted(self, text: str, color) -> pygame.Surface:
+        """`text` in `color` (RGB or RGBA)."""
+        color = tuple(color) if len(color) == 4 else (*color, 255)
+        key = (text, color)
+        surface = self._tinted.get(key)
+        if surface is not None:
+            self._tinted.move_to_end(key)
+            return surface
+
+        surface = self.glyph(text).copy()
+        surface.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+        self._tinted[key] = surface
+        self._tinted_pixels += surface.get_width() * surface.get_height()
+        while self._tinted_pixels > self.max_tinted_pixels and len(self._tinted) > 1:
+            _, old = self._tinted.popitem(last=False)
+            self._tinted_pixels -= old.get_width() * old.get_height()
+        return surface
+
+    def draw_chars(self, surface: pygame.Surface, text: str, center: tuple[int, int],
+                   colors, offsets=None) -> None:
+        """Draw `text` one character at a time, centered on `center`.
+
+        `colors[i]` is the color of character i; `offsets[i]` (optional) is an
+        extra (dx, dy) for it, for waving/bouncing titles.
+        """
+        chars = [self.glyph(char) for char in text]
+        x = (center[0] * 2 - sum(glyph.get_width() for glyph in chars)) // 2
+        blits = []
+        for i, (char, glyph) in enumerate(zip(text, chars)):
+            dx, dy = offsets[i] if offsets else (0, 0)
+            blits.append((self.tinted(char, colors[i]), (x + dx, center[1] - glyph.get_height() // 2 + dy)))
+            x += glyph.get_width()
+        surface.blits(blits, False)
+
+
+_ATLASES: dict = {}
+
+
+def get_atlas(font: pygame.font.Font) -> GlyphAtlas:
+    """The shared atlas for `font` (use fonts.get_font to get the font)."""
+    atlas = _ATLASES.get(font)
+    if atlas is None:
+        atlas = _ATLASES[font] = GlyphAtlas(font)
+    return atlas
+
+
+def rainbow_colors(count: int, time_offset: float, steps: int = 36) -> list[tuple[int, int, int]]:
+    """`count` fully saturated colors spread over the color wheel, shifted by `time_offset` (0..1 = one loop).
+
+    Hues are snapped to `steps` per loop, so the tinted glyphs can be reused.
+    """
+    colors = []
+    for i in range(count):
+        hue = round((((i / count) + time_offset) % 1.0) * steps) % steps / steps
+        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
+        colors.append((int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255)))
+    return colors
@@ -15,6 +15,14 @@ Pattern:
 import pygame
 import random
 import math
+import os
+import zlib
+
+import fonts
+import scenes
+from assetmanager import CACHE_DIR
+import particles
+from scheduler import run_to_end
 
 # Constants
 SCREEN_WIDTH = 800
@@ -41,140 +49,53 @@ PINK = (255, 192, 203)
 YELLOW = (255, 255, 0)
 COLOR_BACKGROUND = (20, 60, 20)
 
+# System font for the card faces. Looking a system font up is slow, so it
+# starts in the background right away (see fonts.py); until it's found the
+# cards use the default font.
+CARD_FONT_NAME = 'serifbold'
+fonts.prefetch_font(CARD_FONT_NAME)
+
 
 # =============================================================================
-# VFX CLASSES
+# VFX
 # =============================================================================
 
-class CasinoFloater:
-    """Floating casino elements like chips, cards, dice"""
-    
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-        self.x = random.randint(0, width)
-        self.y = random.randint(0, height)
-        self.vx = random.uniform(-0.5, 0.5)
-        self.vy = random.uniform(-1, -0.3)
-        self.type = random.choice(["chip", "spade", "heart", "diamond", "club"])
-        self.size = random.randint(12, 25)
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-2, 2)
-        self.alpha = random.randint(20, 60)
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.rotation += self.rotation_speed
-        
-        if self.y < -50:
-            self.y = self.height + 50
-            self.x = random.randint(0, self.width)
-        if self.x < -50:
-            self.x = self.width + 50
-        elif self.x > self.width + 50:
-            self.x = -50
-    
-    def draw(self, screen):
-        surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        
-        if self.type == "chip":
-            pygame.draw.circle(surf, (255, 0, 0, self.alpha), (self.size, self.size), self.size)
-            pygame.draw.circle(surf, (255, 255, 255, self.alpha), (self.size, self.size), self.size, 2)
-        elif self.type == "spade":
-            color = (255, 255, 255, self.alpha)
-            points = [(self.size, self.size - 8), (self.size - 6, self.size + 4), (self.size + 6, self.size + 4)]
-            pygame.draw.polygon(surf, color, points)
-        elif self.type == "heart":
-            color = (255, 20, 60, self.alpha)
-            pygame.draw.circle(surf, color, (self.size - 4, self.size - 2), 5)
-            pygame.draw.circle(surf, color, (self.size + 4, self.size - 2), 5)
-        elif self.type == "diamond":
-            color = (255, 20, 60, self.alpha)
-            points = [(self.size, self.size - 8), (self.size - 6, self.size), 
-                      (self.size, self.size + 8), (self.size + 6, self.size)]
-            pygame.draw.polygon(surf, color, points)
-        elif self.type == "club":
-            color = (255, 255, 255, self.alpha)
-            pygame.draw.circle(surf, color, (self.size, self.size - 4), 5)
-            pygame.draw.circle(surf, color, (self.size - 5, self.size + 2), 5)
-            pygame.draw.circle(surf, color, (self.size + 5, self.size + 2), 5)
-        
-        screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
-
-
-class GoldenSparkle:
-    """Small golden sparkle particles"""
-    
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-        self.x = random.randint(0, width)
-        self.y = random.randint(0, height)
-        self.vx = random.uniform(-0.3, 0.3)
-        self.vy = random.uniform(-0.5, 0.5)
-        self.lifetime = random.randint(60, 180)
-        self.age = 0
-        self.max_brightness = random.randint(150, 255)
+# Floating chips and card suits in the background.
+# The particle engine (particles.py) moves them; this function paints what
+# one floater looks like, once, when it is created.
+FLOATER_KINDS = ["chip", "spade", "heart", "diamond", "club"]
+
+
+def _paint_floater(kind, size, alpha):
+    surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
     
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.age += 1
-        
-        if self.x < 0:
-            self.x = self.width
-        if self.x > self.width:
-            self.x = 0
-        if self.y < 0:
-            self.y = self.height
-        if self.y > self.height:
-            self.y = 0
-        
-        return self.age < self.lifetime
-    
-    def draw(self, screen):
-        progress = self.age / self.lifetime
-        brightness = int(self.max_brightness * math.sin(progress * math.pi))
-        if brightness > 0:
-            color = (brightness, int(brightness * 0.8), 0, brightness)
-            surf = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(surf, color, (3, 3), 2)
-            screen.blit(surf, (int(self.x) - 3, int(self.y) - 3))
-
-
-class ConfettiParticle:
-    """Confetti particle for win celebration"""
-    
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-8, 8)
-        self.vy = random.uniform(-15, -5)
-        self.color = random.choice([GOLD, RED, CYAN, NEON_GREEN, NEON_PINK, ORANGE])
-        self.size = random.randint(4, 10)
-        self.rotation = random.randint(0, 360)
-        self.rotation_speed = random.randint(-15, 15)
-        self.lifetime = random.randint(60, 120)
-        self.age = 0
+    if kind == "chip":
+        pygame.draw.circle(surf, (255, 0, 0, alpha), (size, size), size)
+        pygame.draw.circle(surf, (255, 255, 255, alpha), (size, size), size, 2)
+    elif kind == "spade":
+        color = (255, 255, 255, alpha)
+        points = [(size, size - 8), (size - 6, size + 4), (size + 6, size + 4)]
+        pygame.draw.polygon(surf, color, points)
+    elif kind == "heart":
+        color = (255, 20, 60, alpha)
+        pygame.draw.circle(surf, color, (size - 4, size - 2), 5)
+        pygame.draw.circle(surf, color, (size + 4, size - 2), 5)
+    elif kind == "diamond":
+        color = (255, 20, 60, alpha)
+        points = [(size, size - 8), (size - 6, size), 
+                  (size, size + 8), (size + 6, size)]
+        pygame.draw.polygon(surf, color, points)
+    elif kind == "club":
+        color = (255, 255, 255, alpha)
+        pygame.draw.circle(surf, color, (size, size - 4), 5)
+        pygame.draw.circle(surf, color, (size - 5, size + 2), 5)
+        pygame.draw.circle(surf, color, (size + 5, size + 2), 5)
     
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.4  # Gravity
-        self.vx *= 0.99  # Air resistance
-        self.rotation += self.rotation_speed
-        self.age += 1
-        return self.age < self.lifetime
-    
-    def draw(self, screen):
-        alpha = int(255 * (1 - self.age / self.lifetime))
-        if alpha > 0:
-            surf = pygame.Surface((self.size * 2, self.size), pygame.SRCALPHA)
-            pygame.draw.rect(surf, (*self.color[:3], alpha), (0, 0, self.size * 2, self.size))
-            rotated = pygame.transform.rotate(surf, self.rotation)
-            rect = rotated.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(rotated, rect)
+    return surf
+
+
+# Win confetti colors (the confetti itself lives in a particle system)
+CONFETTI_COLORS = [GOLD, RED, CYAN, NEON_GREEN, NEON_PINK, ORANGE]
 
 
 # =============================================================================
@@ -229,21 +150,17 @@ def create_card_surface(value, width=140, height=200):
     
     display_value = value_to_str(value)
     
-    # Create fonts
-    try:
-        large_font = pygame.font.SysFont('serifbold', 60)
-        small_font = pygame.font.SysFont('serifbold', 24)
-    except:
-        large_font = pygame.font.SysFont(None, 60)
-        small_font = pygame.font.SysFont(None, 24)
+    # Create fonts (get_font falls back to the default font if it is missing)
+    large_font = fonts.get_font(60, CARD_FONT_NAME)
+    small_font = fonts.get_font(24, CARD_FONT_NAME)
     
     # Top-left corner value
-    text_surface = small_font.render(display_value, True, heart_color)
+    text_surface = fonts.render(small_font, display_value, True, heart_color)
     card.blit(text_surface, (12, 8))
     draw_heart(card, 20, 38, 0.6, heart_color)
     
     # Bottom-right corner value (upside down)
-    text_surface = small_font.render(display_value, True, heart_color)
+    text_surface = fonts.render(small_font, display_value, True, heart_color)
     text_surface = pygame.transform.rotate(text_surface, 180)
     card.blit(text_surface, (width - text_surface.get_width() - 12, height - text_surface.get_height() - 8))
     draw_heart(card, width - 20, height - 38, 0.6, heart_color)
@@ -277,13 +194,13 @@ def create_card_surface(value, width=140, height=200):
             draw_heart(card, center_x + 25, center_y + 40, heart_size, heart_color)
         else:
             # For 6-10, draw large value + heart
-            large_text = large_font.render(display_value, True, heart_color)
+            large_text = fonts.render(large_font, display_value, True, heart_color)
             text_rect = large_text.get_rect(center=(center_x, center_y - 20))
             card.blit(large_text, text_rect)
             draw_heart(card, center_x, center_y + 35, 1.5, heart_color)
     else:
         # Face cards (J, Q, K) - large letter with decorative heart
-        large_text = large_font.render(display_value, True, heart_color)
+        large_text = fonts.render(large_font, display_value, True, heart_color)
         text_rect = large_text.get_rect(center=(center_x, center_y - 15))
         card.blit(large_text, text_rect)
         draw_heart(card, center_x, center_y + 40, 1.3, heart_color)
@@ -359,15 +276,147 @@ def generate_all_cards(width=140, height=200):
     Generate all card surfaces (1-13) and card back.
     Returns (card_dict, card_back_surface).
     """
+    return run_to_end(iter_all_cards(width, height))
+
+
+def iter_all_cards(width=140, height=200):
+    """generate_all_cards as a scheduler job: one card per step (see scheduler.py)."""
     card_dict = {}
     for value in range(1, 14):
         card_dict[value] = create_card_surface(value, width, height)
+        yield
     
     card_back = create_card_back(width, height)
     
     return card_dict, card_back
 
 
+# =============================================================================
+# CARD ATLAS (drawn once, reused by every visit to the table)
+# =============================================================================
+
+# Bump this whenever create_card_surface / create_card_back draw something
+# different, so old cards saved in the .cache folder are not used anymore.
+RENDER_VERSION = 2
+
+# Size of the cards on the table.
+CARD_SIZE = (120, 170)
+
+# A flip is drawn with this many different widths per half (back shrinking,
+# front growing). flip_speed 0.08 moves 0.04 per step on average, so every
+# animation frame still gets its own width.
+FLIP_STEPS = 25
+
+
+class CardAtlas:
+    """All 13 card faces + the card back at one size, and their flip frames.
+
+    If you're new to game-dev: squeezing a card horizontally is what makes it
+    look like it's turning around. `pygame.transform.scale` does that, but it
+    makes a new Surface every call. The flip always passes through the same
+    widths, so each squeezed card is made once and then only blitted.
+    """
+
+    def __init__(self, faces, back):
+        self.faces = faces
+        self.back = back
+        # (card surface, step) -> squeezed surface
+        self._flip_frames = {}
+        for step in range(FLIP_STEPS + 1):
+            self.flip_frame(back, step / FLIP_STEPS)
+
+    def flip_frame(self, card_img, scale_x):
+        """`card_img` squeezed to `scale_x` (0..1) of its width, snapped to FLIP_STEPS."""
+        step = round(max(0.0, min(1.0, scale_x)) * FLIP_STEPS)
+        key = (card_img, step)
+        frame = self._flip_frames.get(key)
+        if frame is None:
+            width, height = card_img.get_size()
+            frame = pygame.transform.scale(card_img, (max(1, int(width * step / FLIP_STEPS)), height))
+            self._flip_frames[key] = frame
+        return frame
+
+
+# (width, height) -> CardAtlas
+_CARD_ATLASES = {}
+
+
+def _card_sheet_path(width, height, font_file):
+    # The font is part of the name: another machine (or a newly installed
+    # font) draws different cards.
+    font_id = zlib.crc32(font_file.encode("utf-8"))
+    return os.path.join(CACHE_DIR, f"higherlower_cards_v{RENDER_VERSION}_{width}x{height}_{font_id:08x}.png")
+
+
+def _load_card_sheet(path, width, height):
+    """Cards saved by `_save_card_sheet`, or None if there is no (valid) file."""
+    try:
+        sheet = pygame.image.load(path)
+    except Exception:
+        return None
+    if sheet.get_size() != (width * 14, height):
+        return None
+    try:
+        sheet = sheet.convert_alpha()
+    except pygame.error:
+        pass  # no display yet
+    # One strip: faces 1..13, then the back.
+    cards = [sheet.subsurface((i * width, 0, width, height)).copy() for i in range(14)]
+    return {value: cards[value - 1] for value in range(1, 14)}, cards[13]
+
+
+def _save_card_sheet(path, faces, back):
+    width, height = back.get_size()
+    sheet = pygame.Surface((width * 14, height), pygame.SRCALPHA)
+    for value in range(1, 14):
+        sheet.blit(faces[value], ((value - 1) * width, 0))
+    sheet.blit(back, (13 * width, 0))
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        pygame.image.save(sheet, path)
+    except Exception:
+        pass  # read-only install / browser: we just draw them again next run
+
+
+def get_card_atlas(width=140, height=200):
+    """The shared CardAtlas for this card size.
+
+    Drawn at most once per run: from the .cache folder if an earlier run saved
+    it, otherwise with generate_all_cards (and then saved for next time).
+    """
+    atlas = _CARD_ATLASES.get((width, height))
+    if atlas is not None:
+        return atlas
+    return run_to_end(card_atlas_steps(width, height))
+
+
+def card_atlas_steps(width=140, height=200):
+    """get_card_atlas as a scheduler job, a card at a time; returns the atlas."""
+    atlas = _CARD_ATLASES.get((width, height))
+    if atlas is not None:
+        return atlas
+
+    font_file = fonts.font_file(CARD_FONT_NAME)
+    if font_file is None:
+        # The card font is still being looked up: these cards use the default
+        # font, so don't keep them - the next visit gets the real ones.
+        cards = yield from iter_all_cards(width, height)
+        return CardAtlas(*cards)
+
+    path = _card_sheet_path(width, height, font_file)
+    cards = _load_card_sheet(path, width, height)
+    if cards is None:
+        cards = yield from iter_all_cards(width, height)
+        _save_card_sheet(path, *cards)
+        try:
+            cards = ({value: card.convert_alpha() for value, card in cards[0].items()}, cards[1].convert_alpha())
+        except pygame.error:
+            pass
+    yield
+    atlas = _CARD_ATLASES[(width, height)] = CardAtlas(*cards)
+    return atlas
+
+
 # =============================================================================
 # MAIN GAME CLASS
 # =============================================================================
@@ -379,8 +428,10 @@ class HigherLowerGame:
         self.width = width
         self.height = height
         
-        # Generate card images
-        self.card_images, self.card_back = generate_all_cards(width=120, height=170)
+        # Card images (shared, only drawn the first time - see get_card_atlas)
+        self.card_atlas = get_card_atlas(*CARD_SIZE)
+        self.card_images = self.card_atlas.faces
+        self.card_back = self.card_atlas.back
         
         # Game state
         self.current_card = random.randint(1, 13)
@@ -403,22 +454,20 @@ class HigherLowerGame:
         self.last_result = None  # "win", "lose", or None
         
         # Visual effects
-        self.casino_floaters = [CasinoFloater(width, height) for _ in range(15)]
-        self.golden_sparkles = []
-        for _ in range(40):
-            sparkle = GoldenSparkle(width, height)
-            sparkle.age = random.randint(0, sparkle.lifetime - 1)
-            self.golden_sparkles.append(sparkle)
-        self.confetti = []
+        self.casino_floaters = particles.casino_floaters(width, height, 15, FLOATER_KINDS, _paint_floater,
+                                                         size_range=(12, 25), alpha_range=(20, 60))
+        # Random starting ages, so the sparkles don't all twinkle in sync.
+        self.golden_sparkles = particles.golden_sparkles(width, height, 40, random_age=True)
+        self.confetti = particles.confetti(drag_x=0.99)
         
         # Pulse effects
         self.pulse_time = 0
         
         # Fonts
-        self.font_large = pygame.font.Font(None, 42)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
-        self.font_button = pygame.font.Font(None, 36)
+        self.font_large = fonts.get_font(42)
+        self.font_medium = fonts.get_font(32)
+        self.font_small = fonts.get_font(24)
+        self.font_button = fonts.get_font(36)
         
         # Button rects
         self.higher_button = pygame.Rect(0, 0, 120, 50)
@@ -459,8 +508,8 @@ class HigherLowerGame:
             self.message = f"Correct! +{winnings} tokens!"
             self.last_result = "win"
             # Spawn confetti
-            for _ in range(20):
-                self.confetti.append(ConfettiParticle(self.width // 2, self.height // 2))
+            particles.burst(self.confetti, self.width // 2, self.height // 2, 20,
+                            CONFETTI_COLORS, **particles.WIN_CONFETTI)
         else:
             self.message = f"Wrong! Lost {self.bet_amount} tokens!"
             self.last_result = "lose"
@@ -537,23 +586,13 @@ class HigherLowerGame:
                     self.message_timer = 999999
         
         # Update VFX
-        for floater in self.casino_floaters:
-            floater.update()
-        
-        new_sparkles = []
-        for sparkle in self.golden_sparkles:
-            if sparkle.update():
-                new_sparkles.append(sparkle)
-            else:
-                new_sparkles.append(GoldenSparkle(self.width, self.height))
-        self.golden_sparkles = new_sparkles
-        
-        self.confetti = [c for c in self.confetti if c.update()]
+        self.casino_floaters.update()
+        self.golden_sparkles.update()  # dead sparkles are replaced automatically
+        self.confetti.update()
     
     def draw_flipped_card(self, screen, card_img, x, y):
         """Draw a card with horizontal flip animation."""
         width = card_img.get_width()
-        height = card_img.get_height()
         
         # Calculate scaled width based on flip progress (0->1->0)
         if self.flip_progress <= 1.0:
@@ -561,11 +600,9 @@ class HigherLowerGame:
         else:
             scale_x = self.flip_progress - 1.0
         
-        if scale_x < 0.01:
-            scale_x = 0.01  # Prevent zero width
-        
-        scaled_width = int(width * scale_x)
-        scaled_card = pygame.transform.scale(card_img, (scaled_width, height))
+        # Pre-made squeezed card (see CardAtlas.flip_frame)
+        scaled_card = self.card_atlas.flip_frame(card_img, scale_x)
+        scaled_width = scaled_card.get_width()
         
         # Center the scaled card
         offset_x = (width - scaled_width) // 2
@@ -577,26 +614,23 @@ class HigherLowerGame:
         surface.fill(COLOR_BACKGROUND)
         
         # Draw VFX (background layer)
-        for floater in self.casino_floaters:
-            floater.update()
-            floater.draw(surface)
-        
-        for sparkle in self.golden_sparkles:
-            sparkle.draw(surface)
+        self.casino_floaters.update()
+        self.casino_floaters.draw(surface)
+        self.golden_sparkles.draw(surface)
         
         # Draw title
-        title_text = self.font_large.render("Higher or Lower", True, GOLD)
+        title_text = fonts.render(self.font_large, "Higher or Lower", True, GOLD)
         title_rect = title_text.get_rect(centerx=self.width // 2, top=20)
         surface.blit(title_text, title_rect)
         
         # Draw balance
-        balance_text = self.font_medium.render(f"Tokens: {self.tokens}", True, GOLD)
+        balance_text = fonts.render(self.font_medium, f"Tokens: {self.tokens}", True, GOLD)
         balance_rect = balance_text.get_rect(centerx=self.width // 2, top=60)
         surface.blit(balance_text, balance_rect)
         
         # Draw bet info and buttons
         bet_y = 110
-        bet_text = self.font_small.render(f"Current Bet: {self.bet_amount}", True, WHITE)
+        bet_text = fonts.render(self.font_small, f"Current Bet: {self.bet_amount}", True, WHITE)
         surface.blit(bet_text, (30, bet_y))
         
         # Bet adjustment buttons
@@ -622,14 +656,14 @@ class HigherLowerGame:
         pygame.draw.rect(surface, WHITE, self.bet_100_button, width=2, border_radius=8)
         
         # Button text
-        button_font = pygame.font.Font(None, 48)
-        small_button_font = pygame.font.Font(None, 24)
+        button_font = fonts.get_font(48)
+        small_button_font = fonts.get_font(24)
         
-        minus_text = button_font.render("-", True, WHITE)
-        plus_text = button_font.render("+", True, WHITE)
-        allin_text = small_button_font.render("ALL IN", True, WHITE)
-        bet50_text = small_button_font.render("50", True, WHITE)
-        bet100_text = small_button_font.render("100", True, WHITE)
+        minus_text = fonts.render(button_font, "-", True, WHITE)
+        plus_text = fonts.render(button_font, "+", True, WHITE)
+        allin_text = fonts.render(small_button_font, "ALL IN", True, WHITE)
+        bet50_text = fonts.render(small_button_font, "50", True, WHITE)
+        bet100_text = fonts.render(small_button_font, "100", True, WHITE)
         
         surface.blit(minus_text, minus_text.get_rect(center=self.bet_minus_button.center))
         surface.blit(plus_text, plus_text.get_rect(center=self.bet_plus_button.center))
@@ -669,8 +703,8 @@ class HigherLowerGame:
         
         # Card labels
         label_y = card_y + card_h + 10
-        current_label = self.font_small.render("Current Card", True, WHITE)
-        next_label = self.font_small.render("Next Card", True, WHITE)
+        current_label = fonts.render(self.font_small, "Current Card", True, WHITE)
+        next_label = fonts.render(self.font_small, "Next Card", True, WHITE)
         surface.blit(current_label, current_label.get_rect(centerx=right_x + card_w // 2, top=label_y))
         surface.blit(next_label, next_label.get_rect(centerx=left_x + card_w // 2, top=label_y))
         
@@ -686,13 +720,13 @@ class HigherLowerGame:
             # Higher button (green)
             pygame.draw.rect(surface, (50, 180, 50), self.higher_button, border_radius=10)
             pygame.draw.rect(surface, GOLD, self.higher_button, width=3, border_radius=10)
-            higher_text = self.font_button.render("HIGHER", True, WHITE)
+            higher_text = fonts.render(self.font_button, "HIGHER", True, WHITE)
             surface.blit(higher_text, higher_text.get_rect(center=self.higher_button.center))
             
             # Lower button (red)
             pygame.draw.rect(surface, (180, 50, 50), self.lower_button, border_radius=10)
             pygame.draw.rect(surface, GOLD, self.lower_button, width=3, border_radius=10)
-            lower_text = self.font_button.render("LOWER", True, WHITE)
+            lower_text = fonts.render(self.font_button, "LOWER", True, WHITE)
             surface.blit(lower_text, lower_text.get_rect(center=self.lower_button.center))
         
         # Draw message
@@ -703,7 +737,7 @@ class HigherLowerGame:
                 msg_color = RED
             else:
                 msg_color = YELLOW
-            msg_text = self.font_medium.render(self.message, True, msg_color)
+            msg_text = fonts.render(self.font_medium, self.message, True, msg_color)
             msg_rect = msg_text.get_rect(centerx=self.width // 2, top=self.height - 150)
             
             # Background for message
@@ -712,13 +746,12 @@ class HigherLowerGame:
             surface.blit(msg_text, msg_rect)
         
         # Instructions
-        inst_text = self.font_small.render("UP = Higher | DOWN = Lower | ESC = Exit", True, (200, 200, 200))
+        inst_text = fonts.render(self.font_small, "UP = Higher | DOWN = Lower | ESC = Exit", True, (200, 200, 200))
         inst_rect = inst_text.get_rect(centerx=self.width // 2, bottom=self.height - 10)
         surface.blit(inst_text, inst_rect)
         
         # Draw confetti (foreground)
-        for c in self.confetti:
-            c.draw(surface)
+        self.confetti.draw(surface)
     
     def handle_click(self, pos):
         """Handle mouse click."""
@@ -768,32 +801,45 @@ class HigherLowerGame:
 # These are small adapter functions so `main.py` can treat this mini-game like a
 # "scene" with a state dictionary.
 
-def draw_higherlower_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
-    """Draw and update higher/lower game on the given surface."""
-    # First call: create the game object.
-    # Later calls: reuse it so the game continues.
+def _ensure_higherlower_state(game_state: dict, size: tuple[int, int]) -> dict:
+    # First call: create the game object and store it in the dict.
+    # Next calls: reuse the same object so animations/timers continue.
     if "game" not in game_state:
         tokens = game_state.get("tokens", 100)
-        surf_w, surf_h = surface.get_size()
-        game = HigherLowerGame(surf_w, surf_h)
+        game = HigherLowerGame(*size)
         game.tokens = tokens
         
         game_state = {
             "game": game,
             "tokens": tokens,
         }
-    
-    # Actual game logic lives inside the HigherLowerGame class.
+    return game_state
+
+
+def update_higherlower_scene(game_state: dict, size: tuple[int, int]) -> dict:
+    """Advance the higher/lower game by one frame (`size` = the surface it is drawn on)."""
+    game_state = _ensure_higherlower_state(game_state, size)
     game: HigherLowerGame = game_state["game"]
     game.update()
-    game.draw(surface)
     
     # Sync tokens
     game_state["tokens"] = game.tokens
-    
     return game_state
 
 
+def render_higherlower_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """Draw the higher/lower game (no game logic, see update_higherlower_scene)."""
+    game_state = _ensure_higherlower_state(game_state, surface.get_size())
+    game_state["game"].draw(surface)
+    return game_state
+
+
+def draw_higherlower_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """Draw and update higher/lower game on the given surface."""
+    game_state = update_higherlower_scene(game_state, surface.get_size())
+    return render_higherlower_scene(surface, game_state, font)
+
+
 def handle_higherlower_click(game_state: dict, pos: tuple) -> dict:
     """Handle mouse click in higher/lower game."""
     # Click position is in the same coordinates as the draw surface.
@@ -815,3 +861,46 @@ def change_higherlower_bet(game_state: dict, increase: bool) -> dict:
     if "game" in game_state:
         game_state["game"].change_bet(increase)
     return game_state
+
+
+def set_higherlower_tokens(game_state: dict, tokens: int) -> dict:
+    """Set the token balance (the game object keeps its own copy)."""
+    game_state["tokens"] = tokens
+    if "game" in game_state:
+        game_state["game"].tokens = tokens
+    return game_state
+
+
+class HigherLowerScene(scenes.MiniGameScene):
+    """The higher/lower table as a scene (see scenes.py)."""
+
+    name = "higherlower"
+    lobby = "lobby2"
+
+    def update_state(self, state, size):
+        return update_higherlower_scene(state, size)
+
+    def render(self, surface, state, font):
+        return render_higherlower_scene(surface, state, font)
+
+    def set_tokens(self, state, tokens):
+        return set_higherlower_tokens(state, tokens)
+
+    def prepare(self, size):
+        # Bake the card sprites a few at a time before the game is built.
+        yield from card_atlas_steps(*CARD_SIZE)
+
+    def handle_event(self, app, event):
+        if event.type == pygame.KEYDOWN:
+            # The game object has its own key handling (see handle_keypress).
+            self.state = handle_higherlower_keypress(self.state, event.key)
+        else:
+            super().handle_event(app, event)
+
+    def click(self, app, pos):
+        self.state = handle_higherlower_click(self.state, pos)
+
+    def spawn_point(self, size):
+        # Back in lobby 2, next to this table.
+        width, height = size
+        return (width - 80, height - 80)
@@ -8,8 +8,12 @@ Bet on horses and watch them race!
 import pygame
 import random
 import math
-import os
-from pathlib import Path
+
+import backgrounds
+import fonts
+import scenes
+import particles
+from assetmanager import ASSETS
 
 # Constants
 SCREEN_WIDTH = 900
@@ -39,6 +43,12 @@ BROWN = (139, 90, 43)
 SAND = (194, 178, 128)
 TRACK_BROWN = (160, 82, 45)
 
+
+def _gradient_color(y, height):
+    # Green at the top, slightly lighter and warmer towards the bottom.
+    ratio = y / height
+    return (int(20 + ratio * 30), int(60 + ratio * 20), int(20 + ratio * 30))
+
 # Horse colors for fallback (if images don't load)
 HORSE_COLORS = {
     "Red": (220, 50, 50),
@@ -49,161 +59,40 @@ HORSE_COLORS = {
 }
 
 # =============================================================================
-# VFX CLASSES
+# VFX
 # =============================================================================
 
-class CasinoFloater:
-    """Floating casino elements like chips, cards, dice"""
-    
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-        self.x = random.randint(0, width)
-        self.y = random.randint(0, height)
-        self.vx = random.uniform(-0.5, 0.5)
-        self.vy = random.uniform(-1, -0.3)
-        self.type = random.choice(["chip", "horseshoe", "star", "clover"])
-        self.size = random.randint(12, 25)
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-2, 2)
-        self.alpha = random.randint(20, 60)
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.rotation += self.rotation_speed
-        
-        if self.y < -50:
-            self.y = self.height + 50
-            self.x = random.randint(0, self.width)
-        if self.x < -50:
-            self.x = self.width + 50
-        elif self.x > self.width + 50:
-            self.x = -50
-    
-    def draw(self, screen):
-        surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        
-        if self.type == "chip":
-            pygame.draw.circle(surf, (255, 0, 0, self.alpha), (self.size, self.size), self.size)
-            pygame.draw.circle(surf, (255, 255, 255, self.alpha), (self.size, self.size), self.size, 2)
-        elif self.type == "horseshoe":
-            # Draw a simple horseshoe shape
-            pygame.draw.arc(surf, (218, 165, 32, self.alpha), 
-                          (self.size - 8, self.size - 8, 16, 16), 
-                          0.5, 2.6, 3)
-        elif self.type == "star":
-            color = (255, 215, 0, self.alpha)
-            pygame.draw.circle(surf, color, (self.size, self.size), 4)
-        elif self.type == "clover":
-            color = (0, 200, 0, self.alpha)
-            pygame.draw.circle(surf, color, (self.size - 4, self.size - 2), 4)
-            pygame.draw.circle(surf, color, (self.size + 4, self.size - 2), 4)
-            pygame.draw.circle(surf, color, (self.size, self.size + 3), 4)
-        
-        screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
-
-
-class GoldenSparkle:
-    """Small golden sparkle particles"""
-    
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-        self.x = random.randint(0, width)
-        self.y = random.randint(0, height)
-        self.vx = random.uniform(-0.3, 0.3)
-        self.vy = random.uniform(-0.5, 0.5)
-        self.lifetime = random.randint(60, 180)
-        self.age = 0
-        self.max_brightness = random.randint(150, 255)
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.age += 1
-        
-        if self.x < 0:
-            self.x = self.width
-        if self.x > self.width:
-            self.x = 0
-        if self.y < 0:
-            self.y = self.height
-        if self.y > self.height:
-            self.y = 0
-        
-        return self.age < self.lifetime
-    
-    def draw(self, screen):
-        progress = self.age / self.lifetime
-        brightness = int(self.max_brightness * math.sin(progress * math.pi))
-        if brightness > 0:
-            color = (brightness, int(brightness * 0.8), 0, brightness)
-            surf = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(surf, color, (3, 3), 2)
-            screen.blit(surf, (int(self.x) - 3, int(self.y) - 3))
-
-
-class ConfettiParticle:
-    """Confetti particle for win celebration"""
-    
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-8, 8)
-        self.vy = random.uniform(-15, -5)
-        self.color = random.choice([GOLD, RED, CYAN, NEON_GREEN, NEON_PINK, ORANGE])
-        self.size = random.randint(4, 10)
-        self.rotation = random.randint(0, 360)
-        self.rotation_speed = random.randint(-15, 15)
-        self.lifetime = random.randint(60, 120)
-        self.age = 0
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.4  # Gravity
-        self.vx *= 0.99  # Air resistance
-        self.rotation += self.rotation_speed
-        self.age += 1
-        return self.age < self.lifetime
-    
-    def draw(self, screen):
-        alpha = int(255 * (1 - self.age / self.lifetime))
-        if alpha > 0:
-            surf = pygame.Surface((self.size * 2, self.size), pygame.SRCALPHA)
-            pygame.draw.rect(surf, (*self.color[:3], alpha), (0, 0, self.size * 2, self.size))
-            rotated = pygame.transform.rotate(surf, self.rotation)
-            rect = rotated.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(rotated, rect)
-
-
-class DustParticle:
-    """Dust kicked up by racing horses"""
-    
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-2, 0)
-        self.vy = random.uniform(-1, 1)
-        self.lifetime = random.randint(20, 40)
-        self.age = 0
-        self.size = random.randint(3, 8)
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vx *= 0.95
-        self.vy *= 0.95
-        self.age += 1
-        return self.age < self.lifetime
-    
-    def draw(self, screen):
-        alpha = int(100 * (1 - self.age / self.lifetime))
-        if alpha > 0:
-            surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (180, 150, 100, alpha), (self.size, self.size), self.size)
-            screen.blit(surf, (int(self.x) - self.size, int(self.y) - self.size))
+# Floating chips, horseshoes, stars and clovers in the background.
+# The particle engine (particles.py) moves them; this function paints what
+# one floater looks like, once, when it is created.
+FLOATER_KINDS = ["chip", "horseshoe", "star", "clover"]
+
+
+def _paint_floater(kind, size, alpha):
+    surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    
+    if kind == "chip":
+        pygame.draw.circle(surf, (255, 0, 0, alpha), (size, size), size)
+        pygame.draw.circle(surf, (255, 255, 255, alpha), (size, size), size, 2)
+    elif kind == "horseshoe":
+        # Draw a simple horseshoe shape
+        pygame.draw.arc(surf, (218, 165, 32, alpha), 
+                      (size - 8, size - 8, 16, 16), 
+                      0.5, 2.6, 3)
+    elif kind == "star":
+        color = (255, 215, 0, alpha)
+        pygame.draw.circle(surf, color, (size, size), 4)
+    elif kind == "clover":
+        color = (0, 200, 0, alpha)
+        pygame.draw.circle(surf, color, (size - 4, size - 2), 4)
+        pygame.draw.circle(surf, color, (size + 4, size - 2), 4)
+        pygame.draw.circle(surf, color, (size, size + 3), 4)
+    
+    return surf
+
+
+# Win confetti colors (the confetti itself lives in a particle system)
+CONFETTI_COLORS = [GOLD, RED, CYAN, NEON_GREEN, NEON_PINK, ORANGE]
 
 
 # =============================================================================
@@ -316,16 +205,17 @@ class HorseRacingGame:
             self.horses.append(Horse(name, i, color, image))
         
         # VFX
-        self.floaters = [CasinoFloater(width, height) for _ in range(15)]
-        self.sparkles = [GoldenSparkle(width, height) for _ in range(20)]
-        self.confetti = []
-        self.dust_particles = []
+        self.floaters = particles.casino_floaters(width, height, 15, FLOATER_KINDS, _paint_floater,
+                                                  size_range=(12, 25), alpha_range=(20, 60))
+        self.sparkles = particles.golden_sparkles(width, height, 20)
+        self.confetti = particles.confetti(drag_x=0.99)
+        self.dust_particles = particles.dust()
         
         # Fonts
-        self.font_large = pygame.font.SysFont(None, 48)
-        self.font_medium = pygame.font.SysFont(None, 36)
-        self.font_small = pygame.font.SysFont(None, 28)
-        self.font_tiny = pygame.font.SysFont(None, 22)
+        self.font_large = fonts.get_font(48)
+        self.font_medium = fonts.get_font(36)
+        self.font_small = fonts.get_font(28)
+        self.font_tiny = fonts.get_font(22)
         
         # Buttons
         btn_y = height - 80
@@ -341,22 +231,14 @@ class HorseRacingGame:
             self.horse_buttons.append(pygame.Rect(10, y, 60, self.lane_height - 10))
     
     def _load_horse_images(self):
-        """Load horse images from assets folder"""
-        try:
-            base_dir = str(Path(__file__).resolve().parent)
-        except:
-            base_dir = str(Path.cwd())
-        
+        """Load horse images from assets folder (decoded and scaled once, shared by every race)"""
         horse_files = ["Red.png", "Blue.png", "Yellow.png", "Purple.png", "Orange.png"]
         
         for filename in horse_files:
             name = filename.replace(".png", "")
             try:
-                path = os.path.join(base_dir, "assets", "img", "horses", filename)
-                img = pygame.image.load(path).convert_alpha()
-                # Scale to appropriate size
-                img = pygame.transform.smoothscale(img, (60, 50))
-                self.horse_images[name] = img
+                # Scaled to the size used on the race track
+                self.horse_images[name] = ASSETS.scaled(f"img/horses/{filename}", (60, 50))
             except Exception as e:
                 print(f"Could not load horse image {filename}: {e}")
     
@@ -372,7 +254,7 @@ class HorseRacingGame:
         self.result_message = ""
         self.result_timer = 0
         self.winnings = 0
-        self.dust_particles = []
+        self.dust_particles.clear()
     
     def start_race(self):
         """Start a new race"""
@@ -429,15 +311,10 @@ class HorseRacingGame:
         dt = 1 / 60.0
         
         # Update VFX
-        for f in self.floaters:
-            f.update()
-        
-        self.sparkles = [s for s in self.sparkles if s.update()]
-        while len(self.sparkles) < 20:
-            self.sparkles.append(GoldenSparkle(self.width, self.height))
-        
-        self.confetti = [c for c in self.confetti if c.update()]
-        self.dust_particles = [d for d in self.dust_particles if d.update()]
+        self.floaters.update()
+        self.sparkles.update()  # dead sparkles are replaced automatically
+        self.confetti.update()
+        self.dust_particles.update()
         
         # Update result timer
         if self.result_timer > 0:
@@ -466,7 +343,7 @@ class HorseRacingGame:
                 # Add dust particles behind running horses
                 if not horse.finished and random.random() < 0.3:
                     y = horse.get_y(self.track_top, self.lane_height)
-                    self.dust_particles.append(DustParticle(horse.x - 20, y))
+                    particles.puff(self.dust_particles, horse.x - 20, y)
             
             # Check if race is over
             if len(self.finish_order) == 5:
@@ -483,13 +360,13 @@ class HorseRacingGame:
             self.winnings = self.bet_amount * 5
             self.result_message = f"[1ST] {selected.name} WON! +{self.winnings} tokens!"
             # Spawn confetti
-            for _ in range(50):
-                self.confetti.append(ConfettiParticle(self.width // 2, self.height // 3))
+            particles.burst(self.confetti, self.width // 2, self.height // 3, 50,
+                            CONFETTI_COLORS, **particles.WIN_CONFETTI)
         elif position == 2:
             self.winnings = self.bet_amount * 2
             self.result_message = f"[2ND] {selected.name} came 2nd! +{self.winnings} tokens!"
-            for _ in range(25):
-                self.confetti.append(ConfettiParticle(self.width // 2, self.height // 3))
+            particles.burst(self.confetti, self.width // 2, self.height // 3, 25,
+                            CONFETTI_COLORS, **particles.WIN_CONFETTI)
         elif position == 3:
             self.winnings = self.bet_amount
             self.result_message = f"[3RD] {selected.name} came 3rd! +{self.winnings} tokens!"
@@ -505,33 +382,26 @@ class HorseRacingGame:
     
     def draw(self, surface: pygame.Surface):
         """Draw the complete game"""
-        # Background gradient
-        for y in range(self.height):
-            ratio = y / self.height
-            r = int(20 + ratio * 30)
-            g = int(60 + ratio * 20)
-            b = int(20 + ratio * 30)
-            pygame.draw.line(surface, (r, g, b), (0, y), (self.width, y))
+        # Background gradient (baked once, see backgrounds.py)
+        surface.blit(backgrounds.vertical_gradient("horsegame", (self.width, self.height), _gradient_color), (0, 0))
         
         # Draw floaters (background)
-        for f in self.floaters:
-            f.draw(surface)
+        self.floaters.draw(surface)
         
         # Draw sparkles
-        for s in self.sparkles:
-            s.draw(surface)
+        self.sparkles.draw(surface)
         
         # Draw title
-        title_text = self.font_large.render("~ HORSE RACING ~", True, GOLD)
+        title_text = fonts.render(self.font_large, "~ HORSE RACING ~", True, GOLD)
         title_rect = title_text.get_rect(centerx=self.width // 2, top=15)
         
         # Title shadow
-        shadow = self.font_large.render("~ HORSE RACING ~", True, (50, 50, 50))
+        shadow = fonts.render(self.font_large, "~ HORSE RACING ~", True, (50, 50, 50))
         surface.blit(shadow, (title_rect.x + 2, title_rect.y + 2))
         surface.blit(title_text, title_rect)
         
         # Draw token counter
-        token_text = self.font_medium.render(f"Tokens: {self.tokens}", True, GOLD)
+        token_text = fonts.render(self.font_medium, f"Tokens: {self.tokens}", True, GOLD)
         surface.blit(token_text, (self.width - 180, 20))
         
         # Draw payout info
@@ -539,15 +409,14 @@ class HorseRacingGame:
         payout_texts = ["1st: 5x", "2nd: 2x", "3rd: 1x"]
         payout_colors = [GOLD, (192, 192, 192), (205, 127, 50)]
         for i, (text, color) in enumerate(zip(payout_texts, payout_colors)):
-            payout_surf = self.font_tiny.render(text, True, color)
+            payout_surf = fonts.render(self.font_tiny, text, True, color)
             surface.blit(payout_surf, (self.width - 170 + i * 55, payout_y))
         
         # Draw race track
         self._draw_track(surface)
         
         # Draw dust particles
-        for d in self.dust_particles:
-            d.draw(surface)
+        self.dust_particles.draw(surface)
         
         # Draw horses
         for horse in self.horses:
@@ -558,7 +427,7 @@ class HorseRacingGame:
         
         # Draw countdown
         if self.countdown > 0:
-            countdown_text = self.font_large.render(str(self.countdown), True, RED)
+            countdown_text = fonts.render(self.font_large, str(self.countdown), True, RED)
             rect = countdown_text.get_rect(center=(self.width // 2, self.height // 2))
             
             # Pulsing effect
@@ -571,7 +440,7 @@ class HorseRacingGame:
         
         # Draw GO! when race starts
         if self.is_racing and not self.finish_order:
-            go_text = self.font_large.render("GO!", True, NEON_GREEN)
+            go_text = fonts.render(self.font_large, "GO!", True, NEON_GREEN)
             go_rect = go_text.get_rect(center=(self.width // 2, 100))
             surface.blit(go_text, go_rect)
         
@@ -583,11 +452,10 @@ class HorseRacingGame:
             self._draw_result(surface)
         
         # Draw confetti (foreground)
-        for c in self.confetti:
-            c.draw(surface)
+        self.confetti.draw(surface)
         
         # Draw instructions
-        inst_text = self.font_tiny.render("SPACE = Start Race | UP/DOWN = Change Bet | 1-5 = Select Horse | ESC = Exit", True, (200, 200, 200))
+        inst_text = fonts.render(self.font_tiny, "SPACE = Start Race | UP/DOWN = Change Bet | 1-5 = Select Horse | ESC = Exit", True, (200, 200, 200))
         inst_rect = inst_text.get_rect(centerx=self.width // 2, bottom=self.height - 10)
         surface.blit(inst_text, inst_rect)
     
@@ -606,7 +474,7 @@ class HorseRacingGame:
         # Start line
         pygame.draw.line(surface, WHITE, (self.track_start, self.track_top - 5), 
                         (self.track_start, self.track_top + self.track_height + 5), 4)
-        start_text = self.font_tiny.render("START", True, WHITE)
+        start_text = fonts.render(self.font_tiny, "START", True, WHITE)
         surface.blit(start_text, (self.track_start - 20, self.track_top - 25))
         
         # Finish line (checkered pattern)
@@ -617,7 +485,7 @@ class HorseRacingGame:
                 rect = pygame.Rect(finish_x + j * 8, self.track_top + i * (self.track_height // 10), 8, self.track_height // 10)
                 pygame.draw.rect(surface, color, rect)
         
-        finish_text = self.font_tiny.render("FINISH", True, WHITE)
+        finish_text = fonts.render(self.font_tiny, "FINISH", True, WHITE)
         surface.blit(finish_text, (finish_x - 10, self.track_top - 25))
     
     def _draw_horse(self, surface: pygame.Surface, horse: Horse):
@@ -645,7 +513,7 @@ class HorseRacingGame:
         
         # Draw position label if finished
         if horse.finished:
-            pos_text = self.font_tiny.render(f"#{horse.finish_position}", True, GOLD)
+            pos_text = fonts.render(self.font_tiny, f"#{horse.finish_position}", True, GOLD)
             surface.blit(pos_text, (int(horse.x) + 30, y - 10))
     
     def _draw_selection_panel(self, surface: pygame.Surface):
@@ -661,7 +529,7 @@ class HorseRacingGame:
             pygame.draw.rect(surface, border_color, btn, width=border_width, border_radius=8)
             
             # Horse number
-            num_text = self.font_small.render(str(i + 1), True, WHITE)
+            num_text = fonts.render(self.font_small, str(i + 1), True, WHITE)
             num_rect = num_text.get_rect(center=btn.center)
             surface.blit(num_text, num_rect)
     
@@ -670,21 +538,21 @@ class HorseRacingGame:
         btn_y = self.height - 80
         
         # Bet display
-        bet_text = self.font_small.render(f"Bet: {self.bet_amount}", True, WHITE)
+        bet_text = fonts.render(self.font_small, f"Bet: {self.bet_amount}", True, WHITE)
         bet_rect = bet_text.get_rect(midleft=(self.width // 2 - 170, btn_y + 20))
         surface.blit(bet_text, bet_rect)
         
         # Minus button
         pygame.draw.rect(surface, (80, 80, 100), self.bet_minus_button, border_radius=8)
         pygame.draw.rect(surface, WHITE, self.bet_minus_button, width=2, border_radius=8)
-        minus_text = self.font_medium.render("-", True, WHITE)
+        minus_text = fonts.render(self.font_medium, "-", True, WHITE)
         minus_rect = minus_text.get_rect(center=self.bet_minus_button.center)
         surface.blit(minus_text, minus_rect)
         
         # Plus button
         pygame.draw.rect(surface, (80, 80, 100), self.bet_plus_button, border_radius=8)
         pygame.draw.rect(surface, WHITE, self.bet_plus_button, width=2, border_radius=8)
-        plus_text = self.font_medium.render("+", True, WHITE)
+        plus_text = fonts.render(self.font_medium, "+", True, WHITE)
         plus_rect = plus_text.get_rect(center=self.bet_plus_button.center)
         surface.blit(plus_text, plus_rect)
         
@@ -694,20 +562,20 @@ class HorseRacingGame:
         btn_text = "NEW RACE" if self.race_finished else "START"
         pygame.draw.rect(surface, btn_color, self.start_button, border_radius=8)
         pygame.draw.rect(surface, WHITE, self.start_button, width=2, border_radius=8)
-        start_text = self.font_small.render(btn_text, True, WHITE)
+        start_text = fonts.render(self.font_small, btn_text, True, WHITE)
         start_rect = start_text.get_rect(center=self.start_button.center)
         surface.blit(start_text, start_rect)
         
         # All-in button
         pygame.draw.rect(surface, CASINO_RED, self.allin_button, border_radius=8)
         pygame.draw.rect(surface, WHITE, self.allin_button, width=2, border_radius=8)
-        allin_text = self.font_small.render("ALL IN", True, WHITE)
+        allin_text = fonts.render(self.font_small, "ALL IN", True, WHITE)
         allin_rect = allin_text.get_rect(center=self.allin_button.center)
         surface.blit(allin_text, allin_rect)
         
         # Selected horse display
         selected = self.horses[self.selected_horse]
-        horse_text = self.font_small.render(f"Your Horse: {selected.name}", True, selected.color)
+        horse_text = fonts.render(self.font_small, f"Your Horse: {selected.name}", True, selected.color)
         horse_rect = horse_text.get_rect(midleft=(20, btn_y + 20))
         surface.blit(horse_text, horse_rect)
     
@@ -720,7 +588,7 @@ class HorseRacingGame:
         
         # Result text
         text_color = GOLD if self.winnings > 0 else RED
-        result_text = self.font_medium.render(self.result_message, True, text_color)
+        result_text = fonts.render(self.font_medium, self.result_message, True, text_color)
         result_rect = result_text.get_rect(center=(self.width // 2, self.height // 2))
         surface.blit(result_text, result_rect)
         
@@ -730,7 +598,7 @@ class HorseRacingGame:
             order_text = "Finish: "
             for i, horse in enumerate(self.finish_order):
                 order_text += f"{i+1}. {horse.name}  "
-            order_surf = self.font_tiny.render(order_text, True, WHITE)
+            order_surf = fonts.render(self.font_tiny, order_text, True, WHITE)
             order_rect = order_surf.get_rect(center=(self.width // 2, order_y))
             surface.blit(order_surf, order_rect)
     
@@ -782,29 +650,45 @@ class HorseRacingGame:
 # FUNCTIONS CALLED FROM MAIN.PY
 # =============================================================================
 
-def draw_horsegame_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
-    """Draw and update horse racing game on the given surface."""
+def _ensure_horsegame_state(game_state: dict, size: tuple[int, int]) -> dict:
+    # First call: create the game object and store it in the dict.
+    # Next calls: reuse the same object so animations/timers continue.
     if "game" not in game_state:
         tokens = game_state.get("tokens", 100)
-        surf_w, surf_h = surface.get_size()
-        game = HorseRacingGame(surf_w, surf_h)
+        game = HorseRacingGame(*size)
         game.tokens = tokens
         
         game_state = {
             "game": game,
             "tokens": tokens,
         }
-    
+    return game_state
+
+
+def update_horsegame_scene(game_state: dict, size: tuple[int, int]) -> dict:
+    """Advance the horse racing game by one frame (`size` = the surface it is drawn on)."""
+    game_state = _ensure_horsegame_state(game_state, size)
     game: HorseRacingGame = game_state["game"]
     game.update()
-    game.draw(surface)
     
     # Sync tokens
     game_state["tokens"] = game.tokens
-    
     return game_state
 
 
+def render_horsegame_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """Draw the horse racing game (no game logic, see update_horsegame_scene)."""
+    game_state = _ensure_horsegame_state(game_state, surface.get_size())
+    game_state["game"].draw(surface)
+    return game_state
+
+
+def draw_horsegame_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """Draw and update horse racing game on the given surface."""
+    game_state = update_horsegame_scene(game_state, surface.get_size())
+    return render_horsegame_scene(surface, game_state, font)
+
+
 def handle_horsegame_click(game_state: dict, pos: tuple) -> dict:
     """Handle mouse click in horse racing game."""
     if "game" in game_state:
@@ -824,3 +708,42 @@ def change_horsegame_bet(game_state: dict, increase: bool) -> dict:
     if "game" in game_state:
         game_state["game"].change_bet(increase)
     return game_state
+
+
+def set_horsegame_tokens(game_state: dict, tokens: int) -> dict:
+    """Set the token balance (the game object keeps its own copy)."""
+    game_state["tokens"] = tokens
+    if "game" in game_state:
+        game_state["game"].tokens = tokens
+    return game_state
+
+
+class HorseGameScene(scenes.MiniGameScene):
+    """The horse racing table as a scene (see scenes.py)."""
+
+    name = "horsegame"
+    lobby = "lobby2"
+
+    def update_state(self, state, size):
+        return update_horsegame_scene(state, size)
+
+    def render(self, surface, state, font):
+        return render_horsegame_scene(surface, state, font)
+
+    def set_tokens(self, state, tokens):
+        return set_horsegame_tokens(state, tokens)
+
+    def handle_event(self, app, event):
+        if event.type == pygame.KEYDOWN:
+            # The game object has its own key handling (see handle_keypress).
+            self.state = handle_horsegame_keypress(self.state, event.key)
+        else:
+            super().handle_event(app, event)
+
+    def click(self, app, pos):
+        self.state = handle_horsegame_click(self.state, pos)
+
+    def spawn_point(self, size):
+        # Back in lobby 2, next to this table.
+        width, height = size
+        return (80, height - 80)
@@ -1,39 +1,29 @@
 import pygame
-import os
 import math
-from typing import Optional, Dict, Tuple
+from typing import Optional
+
+from assetmanager import ASSETS
 
 WHITE = (255, 255, 255)
 GOLD = (255, 215, 0)
 DARK_GOLD = (184, 134, 11)
 
-_LOADING_BG_ORIGINAL: Optional[pygame.Surface] = None
-_LOADING_BG_SCALED: Dict[Tuple[int, int], pygame.Surface] = {}
-
-
-def _get_loading_bg() -> Optional[pygame.Surface]:
-    global _LOADING_BG_ORIGINAL
-    if _LOADING_BG_ORIGINAL is not None:
-        return _LOADING_BG_ORIGINAL
 
+def _get_scaled_bg(size: tuple[int, int]) -> Optional[pygame.Surface]:
+    # The AssetManager decodes outside.png once and keeps one scaled copy per size.
     try:
-        img_path = os.path.join(os.path.dirname(__file__), "assets", "img", "outside.png")
-    except:
-        img_path = os.path.join("assets", "img", "outside.png")
-    try:
-        _LOADING_BG_ORIGINAL = pygame.image.load(img_path).convert_alpha()
+        return ASSETS.scaled("img/outside.png", size)
     except Exception:
-        _LOADING_BG_ORIGINAL = None
-    return _LOADING_BG_ORIGINAL
+        return None
+
 
+def preload_background(size: tuple[int, int]) -> None:
+    """Load the loading screen's own background up front.
 
-def _get_scaled_bg(bg: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
-    cached = _LOADING_BG_SCALED.get(size)
-    if cached is not None:
-        return cached
-    scaled = pygame.transform.smoothscale(bg, size)
-    _LOADING_BG_SCALED[size] = scaled
-    return scaled
+    Everything else is loaded *while* this screen is shown, but this image has
+    to be there on its very first frame.
+    """
+    _get_scaled_bg(size)
 
 
 def _draw_center_text(surface: pygame.Surface, text: str, y: int, font, color=WHITE) -> None:
@@ -42,9 +32,9 @@ def _draw_center_text(surface: pygame.Surface, text: str, y: int, font, color=WH
     surface.blit(surf, rect)
 
 def draw_game_screen(surface: pygame.Surface, title_font, hint_font, progress: float = 0.0, elapsed_time: float = 0.0) -> None:
-    bg = _get_loading_bg()
+    bg = _get_scaled_bg(surface.get_size())
     if bg is not None:
-        surface.blit(_get_scaled_bg(bg, surface.get_size()), (0, 0))
+        surface.blit(bg, (0, 0))
     
     w = surface.get_width()
     h = surface.get_height()
@@ -3,7 +3,8 @@
 This module implements the Lucky Wheel mini-game.
 
 How it is used by the main project:
-- `main.py` creates a `LuckyWheel` instance (or stores one inside a state dict)
+- `LuckyWheelScene` (bottom of this file) is the table in the casino hub; it
+  keeps a `LuckyWheel` instance inside a state dict
 - each frame: `wheel.update()` advances animations/physics
 - each frame: `wheel.draw(surface)` renders the wheel to the given Surface
 
@@ -13,53 +14,35 @@ Important pygame concepts you'll see here:
 - `surface.blit(other_surface, pos)` copies pixels from one surface to another.
 - Many visual effects are implemented by drawing onto a temporary surface with
     per-pixel alpha (`pygame.SRCALPHA`), then blitting it on top.
+- Everything about the wheel that doesn't change from frame to frame (slices,
+    labels, rings, glow, center hub) is "baked" once into such surfaces and
+    reused; the wheel is then just rotated (see `_bake_wheel`). The baked
+    surfaces are shared by every wheel that looks the same, so the table can
+    bake them a little at a time before it is opened (`bake_steps`).
 """
 
 import pygame
 import math
 import random
 
-class Particle:
-    """Particle class for confetti and sparkle effects"""
-    def __init__(self, x, y, color, velocity_x, velocity_y, lifetime=60):
-        # Particles are tiny objects that exist for a short time.
-        # We update them every frame (position, gravity, lifetime) and draw them.
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self. lifetime = lifetime
-        self.max_lifetime = lifetime
-        self. size = random.randint(3, 8)
-        self.rotation = random.randint(0, 360)
-        self.rotation_speed = random.randint(-10, 10)
-    
-    def update(self):
-        # In game-dev, motion is usually "position += velocity" each frame.
-        # This file uses fixed-per-frame updates (not dt-based) because the wheel
-        # demo runs at a capped FPS; in `main.py` the wheel is still updated once
-        # per frame, so it looks fine.
-        self.x += self.velocity_x
-        self.y += self. velocity_y
-        self.velocity_y += 0.3  # Gravity
-        self.lifetime -= 1
-        self.rotation += self.rotation_speed
-    
-    def draw(self, surface):
-        # Alpha fades out as the particle approaches the end of its lifetime.
-        # `pygame.SRCALPHA` enables per-pixel alpha on a Surface.
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        if alpha > 0:
-            # Draw as a rotated rectangle for confetti effect
-            particle_surface = pygame.Surface((self.size * 2, self.size), pygame.SRCALPHA)
-            pygame.draw.rect(particle_surface, (*self.color, alpha), (0, 0, self.size * 2, self.size))
-            rotated = pygame.transform.rotate(particle_surface, self.rotation)
-            rect = rotated.get_rect(center=(self.x, self. y))
-            surface.blit(rotated, rect)
-    
-    def is_dead(self):
-        return self.lifetime <= 0
+import backgrounds
+import fonts
+import particles
+import scenes
+from glyphatlas import get_atlas
+from rotcache import ROTATIONS
+from scheduler import run_to_end
+
+try:
+    import pygame.gfxdraw
+    GFXDRAW_AVAILABLE = True
+except ImportError:
+    GFXDRAW_AVAILABLE = False
+
+# Baked layers shared by every LuckyWheel that looks the same:
+# wheel key (see `_ensure_baked`) -> slice texture, radius -> (frame, halo, hub)
+_WHEEL_TEXTURES = {}
+_STATIC_TEXTURES = {}
 
 
 class LuckyWheel:
@@ -115,31 +98,45 @@ class LuckyWheel:
         self.winner = None
         self. glow_intensity = 0
         self.glow_direction = 1
-        self.particles = []
-        self.sparkles = []
+        # Confetti (rotating rectangles) and star sparkles, see particles.py
+        self.particles = particles.confetti(gravity=0.3)
+        self.sparkles = particles.star_sparkles()
         self.light_rays = []
         self.winner_announced = False
         self.celebration_timer = 0
         
+        # Baked layers (see `_bake_wheel` / `_bake_static`), built on first draw
+        self._wheel_key = None
+        self._wheel_texture = None
+        self._static_radius = None
+        self._frame_texture = None
+        self._halo_texture = None
+        self._hub_texture = None
+        self._ray_layer = None  # only used when gfxdraw is missing
+        
         # Create initial sparkles around the wheel
         self.create_idle_sparkles()
     
+    def _add_sparkles(self, count, distance_range, life_range, max_life, size_range):
+        """Add `count` star sparkles at random angles around the wheel."""
+        # Sparkles don't move; they only fade out (alpha = life / max_life).
+        xs, ys = [], []
+        for _ in range(count):
+            angle = random.uniform(0, 2 * math.pi)
+            distance = self.radius + random.randint(*distance_range)
+            xs.append(self.x + distance * math.cos(angle))
+            ys.append(self.y + distance * math.sin(angle))
+        self.sparkles.emit(
+            x=xs,
+            y=ys,
+            lifetime=[random.randint(*life_range) for _ in range(count)],
+            size=[random.randint(*size_range) for _ in range(count)],
+            brightness=max_life,
+        )
+    
     def create_idle_sparkles(self):
         """Create sparkles that appear around the wheel when idle"""
-        # Sparkles here are stored as dictionaries (x/y/life/etc) instead of
-        # full classes. Either approach is common in small pygame projects.
-        for i in range(5):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = self.radius + random.randint(10, 40)
-            x = self.x + distance * math.cos(angle)
-            y = self.y + distance * math.sin(angle)
-            self.sparkles.append({
-                'x': x,
-                'y': y,
-                'life': random.randint(20, 40),
-                'max_life': 40,
-                'size': random.randint(2, 5)
-            })
+        self._add_sparkles(5, (10, 40), (20, 40), 40, (2, 5))
     
     def spin(self, force=None):
         """Start spinning the wheel"""
@@ -154,7 +151,7 @@ class LuckyWheel:
             self.angular_velocity = force
             self.winner = None
             self.winner_announced = False
-            self. particles. clear()
+            self.particles.clear()
     
     def update(self):
         """Update wheel rotation"""
@@ -171,17 +168,7 @@ class LuckyWheel:
             # Create sparkle trail while spinning fast
             if abs(self.angular_velocity) > 5:
                 if random.random() < 0.3:
-                    angle = random.uniform(0, 2 * math.pi)
-                    distance = self.radius + random.randint(-10, 10)
-                    x = self.x + distance * math.cos(angle)
-                    y = self.y + distance * math.sin(angle)
-                    self.sparkles.append({
-                        'x': x,
-                        'y': y,
-                        'life': random. randint(10, 20),
-                        'max_life': 20,
-                        'size': random.randint(3, 6)
-                    })
+                    self._add_sparkles(1, (-10, 10), (10, 20), 20, (3, 6))
             
             # Stop spinning when velocity is very low
             if abs(self.angular_velocity) < 0.1:
@@ -199,19 +186,9 @@ class LuckyWheel:
             self. glow_intensity = 0
             self.glow_direction = 1
         
-        # Update particles
-        # We iterate over a COPY of the list (`self.particles[:]`) so we can
-        # safely remove items while iterating.
-        for particle in self.particles[: ]:
-            particle.update()
-            if particle.is_dead():
-                self.particles.remove(particle)
-        
-        # Update sparkles
-        for sparkle in self.sparkles[:]:
-            sparkle['life'] -= 1
-            if sparkle['life'] <= 0:
-                self. sparkles.remove(sparkle)
+        # Update particles and sparkles (dead ones are dropped automatically)
+        self.particles.update()
+        self.sparkles.update()
         
         # Create new idle sparkles occasionally
         if not self.is_spinning and len(self.sparkles) < 8 and random.random() < 0.05:
@@ -239,30 +216,42 @@ class LuckyWheel:
             (255, 0, 255), (0, 255, 255), (255, 128, 0), (255, 255, 255)
         ]
         
-        for _ in range(100):
+        count = 100
+        velocity_x, velocity_y = [], []
+        for _ in range(count):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(5, 15)
-            velocity_x = speed * math.cos(angle)
-            velocity_y = speed * math.sin(angle) - random.uniform(5, 10)
-            color = random.choice(confetti_colors)
-            
-            # Start from wheel center
-            particle = Particle(self.x, self.y, color, velocity_x, velocity_y, lifetime=random.randint(60, 120))
-            self.particles.append(particle)
+            velocity_x.append(speed * math.cos(angle))
+            velocity_y.append(speed * math.sin(angle) - random.uniform(5, 10))
+        
+        # Start from wheel center
+        self.particles.emit(
+            x=[self.x] * count,
+            y=self.y,
+            vx=velocity_x,
+            vy=velocity_y,
+            lifetime=[random.randint(60, 120) for _ in range(count)],
+            size=[random.randint(3, 8) for _ in range(count)],
+            rotation=[random.randint(0, 360) for _ in range(count)],
+            spin=[random.randint(-10, 10) for _ in range(count)],
+            color=[random.choice(confetti_colors) for _ in range(count)],
+        )
     
     def create_winner_particles(self):
         """Create sparkle particles around the winning slot"""
         angle = random.uniform(0, 2 * math.pi)
         distance = random.randint(50, 150)
-        x = self.x + distance * math. cos(angle)
-        y = self.y + distance * math. sin(angle)
-        
-        color = random.choice([(255, 215, 0), (255, 255, 0), (255, 255, 255)])
-        velocity_x = random.uniform(-2, 2)
-        velocity_y = random.uniform(-5, -2)
-        
-        particle = Particle(x, y, color, velocity_x, velocity_y, lifetime=random.randint(30, 60))
-        self.particles.append(particle)
+        self.particles.emit(
+            x=self.x + distance * math.cos(angle),
+            y=self.y + distance * math.sin(angle),
+            vx=random.uniform(-2, 2),
+            vy=random.uniform(-5, -2),
+            lifetime=random.randint(30, 60),
+            size=random.randint(3, 8),
+            rotation=random.randint(0, 360),
+            spin=random.randint(-10, 10),
+            color=random.choice([(255, 215, 0), (255, 255, 0), (255, 255, 255)]),
+        )
     
     def determine_winner(self):
         """Determine which slot won based on the pointer position at the TOP"""
@@ -299,164 +288,179 @@ class LuckyWheel:
         self.celebration_timer = 0
         return self.winner
     
-    def draw(self, surface):
-        """Draw the wheel on the surface with fancy casino effects"""
-        # This method is the "render" phase.
-        # It does NOT change game rules; it only draws the current state.
+    # =========================================================================
+    # BAKED LAYERS
+    # =========================================================================
+    # The old `draw()` rebuilt the whole wheel every frame: 8 glow surfaces,
+    # 10 screen-sized "shine" surfaces, 40-point arcs per slice, a new Font per
+    # slice and 9 rotated label blits each. None of that changes while the
+    # wheel spins - only the angle does. So we render it once at angle 0 and
+    # rotate the result (with a cache, see rotcache.py).
+    
+    def _bake_wheel(self):
+        """Render slices, shine, separators, labels and dots at angle 0.
+
+        A generator (see scheduler.py): one slice per step; returns the texture.
+        """
         degrees_per_slot = 360 / self.num_slots
+        r = self.radius
+        c = r + 22  # texture center; the decorative dots reach out to r + 21
+        texture = pygame.Surface((c * 2 + 1, c * 2 + 1), pygame.SRCALPHA)
+        shine_layer = pygame.Surface(texture.get_size(), pygame.SRCALPHA)
+        font = fonts.get_font(32)
+        num_points = 40
         
-        # Draw light rays from center when winning
-        if self.winner and not self.is_spinning and self.celebration_timer < 60:
-            self.draw_light_rays(surface)
-        
-        # The outer glow is drawn using multiple translucent circles.
-        # The loop draws larger circles first, then smaller ones on top.
-        for i in range(8, 0, -1):
-            glow_radius = self.radius + i * 8
-            glow_alpha = int(30 * (i / 8) * (self.glow_intensity / 100))
-            glow_color = (255, 215, 0)  # Gold glow
-            
-            glow_surface = pygame.Surface((glow_radius * 2 + 50, glow_radius * 2 + 50), pygame.SRCALPHA)
-            pygame. draw.circle(glow_surface, (*glow_color, glow_alpha), 
-                             (glow_radius + 25, glow_radius + 25), glow_radius)
-            surface.blit(glow_surface, (self.x - glow_radius - 25, self.y - glow_radius - 25))
-        
-        # Draw outer decorative rings
-        ring_colors = [(139, 69, 19), (218, 165, 32), (184, 134, 11), (255, 215, 0)]
-        ring_widths = [15, 10, 6, 3]
-        ring_offsets = [25, 18, 12, 7]
-        
-        for color, width, offset in zip(ring_colors, ring_widths, ring_offsets):
-            pygame.draw.circle(surface, color, (self.x, self. y), self.radius + offset, width)
-        
-        # Draw metallic outer rim with gradient effect
-        for i in range(20):
-            rim_color_value = 100 + int(50 * math.sin(i / 5))
-            pygame.draw.circle(surface, (rim_color_value, rim_color_value, rim_color_value), 
-                             (self.x, self.y), self.radius + 5 - i, 1)
-        
-        # Draw each slot as a pie slice (a polygon).
-        # We approximate the arc with many points (`num_points`).
         for i in range(self.num_slots):
-            start_angle = math.radians(self.angle + i * degrees_per_slot)
-            end_angle = math.radians(self. angle + (i + 1) * degrees_per_slot)
+            start_angle = math.radians(i * degrees_per_slot)
+            end_angle = math.radians((i + 1) * degrees_per_slot)
+            arc = [start_angle + (end_angle - start_angle) * j / num_points for j in range(num_points + 1)]
             
-            # Create points for the pie slice
-            points = [(self.x, self.y)]
-            
-            # Add points along the arc
-            num_points = 40
-            for j in range(num_points + 1):
-                angle = start_angle + (end_angle - start_angle) * j / num_points
-                point_x = self.x + self.radius * math.cos(angle)
-                point_y = self.y + self.radius * math.sin(angle)
-                points.append((point_x, point_y))
-            
-            # Draw the slice with base color
+            # Slice with base color
             base_color = self.colors[i % len(self.colors)]
-            pygame.draw.polygon(surface, base_color, points)
-            
-            # Add gradient/shine effect to each slice
-            shine_surface = pygame.Surface((self.radius * 2 + 100, self.radius * 2 + 100), pygame.SRCALPHA)
-            shine_points = [(self.x, self. y)]
-            for j in range(num_points + 1):
-                angle = start_angle + (end_angle - start_angle) * j / num_points
-                # Inner radius for shine effect
-                inner_rad = self.radius * 0.5
-                point_x = self.x + inner_rad * math.cos(angle)
-                point_y = self.y + inner_rad * math.sin(angle)
-                shine_points.append((point_x, point_y))
+            points = [(c, c)] + [(c + r * math.cos(a), c + r * math.sin(a)) for a in arc]
+            pygame.draw.polygon(texture, base_color, points)
             
-            # Lighter color for shine
-            shine_color = tuple(min(c + 60, 255) for c in base_color)
-            pygame.draw.polygon(shine_surface, (*shine_color, 80), shine_points)
-            surface.blit(shine_surface, (0, 0))
+            # Gradient/shine: a lighter, translucent inner slice
+            shine_color = tuple(min(v + 60, 255) for v in base_color)
+            shine_points = [(c, c)] + [(c + r * 0.5 * math.cos(a), c + r * 0.5 * math.sin(a)) for a in arc]
+            shine_layer.fill((0, 0, 0, 0))
+            pygame.draw.polygon(shine_layer, (*shine_color, 80), shine_points)
+            texture.blit(shine_layer, (0, 0))
             
-            # Draw separator lines with gold color
-            line_end_x = self.x + self.radius * math.cos(start_angle)
-            line_end_y = self.y + self.radius * math.sin(start_angle)
-            pygame.draw.line(surface, (255, 215, 0), (self.x, self.y), 
-                           (line_end_x, line_end_y), 4)
+            # Separator line
+            pygame.draw.line(texture, (255, 215, 0), (c, c),
+                             (c + r * math.cos(start_angle), c + r * math.sin(start_angle)), 4)
             
-            # Draw prize text in the middle of each slice with better styling
+            # Prize text with outline, rotated to align with the slice
             text_angle = start_angle + (end_angle - start_angle) / 2
-            text_radius = self.radius * 0.75
-            text_x = self.x + text_radius * math.cos(text_angle)
-            text_y = self.y + text_radius * math.sin(text_angle)
-            
-            # Rotate text to align with slice
-            font = pygame.font.Font(None, 32)
+            text_x = c + r * 0.75 * math.cos(text_angle)
+            text_y = c + r * 0.75 * math.sin(text_angle)
             prize_text = self.prizes[i] if i < len(self.prizes) else str(i + 1)
-            
-            # Create text with outline
-            text_surface = font. render(prize_text, True, (255, 255, 255))
-            outline_surface = font.render(prize_text, True, (0, 0, 0))
-            
-            # Rotate text to align with the slice.
-            # `pygame.transform.rotate` returns a new Surface.
             angle_deg = math.degrees(text_angle) + 90
-            rotated_text = pygame.transform.rotate(text_surface, -angle_deg)
-            rotated_outline = pygame.transform.rotate(outline_surface, -angle_deg)
-            
-            text_rect = rotated_text. get_rect(center=(text_x, text_y))
+            # (Baked into the texture once, so no need for the rotation cache.)
+            rotated_text = pygame.transform.rotate(fonts.render(font, prize_text, True, (255, 255, 255)), -angle_deg)
+            rotated_outline = pygame.transform.rotate(fonts.render(font, prize_text, True, (0, 0, 0)), -angle_deg)
+            text_rect = rotated_text.get_rect(center=(text_x, text_y))
             outline_rect = rotated_outline.get_rect(center=(text_x, text_y))
-            
-            # Draw outline first (in multiple positions for thickness)
             for ox, oy in [(-1,-1), (-1,1), (1,-1), (1,1), (-2,0), (2,0), (0,-2), (0,2)]:
-                surface.blit(rotated_outline, outline_rect.move(ox, oy))
-            surface.blit(rotated_text, text_rect)
+                texture.blit(rotated_outline, outline_rect.move(ox, oy))
+            texture.blit(rotated_text, text_rect)
             
-            # Draw decorative dots between sections
-            dot_radius = self.radius + 15
-            dot_x = self.x + dot_radius * math.cos(start_angle)
-            dot_y = self.y + dot_radius * math.sin(start_angle)
-            pygame.draw.circle(surface, (255, 215, 0), (int(dot_x), int(dot_y)), 6)
-            pygame.draw.circle(surface, (255, 255, 255), (int(dot_x), int(dot_y)), 4)
-            pygame.draw.circle(surface, (255, 215, 0), (int(dot_x), int(dot_y)), 2)
-        
-        # Draw sparkles
-        for sparkle in self.sparkles:
-            alpha = int(255 * (sparkle['life'] / sparkle['max_life']))
-            if alpha > 0:
-                sparkle_surface = pygame.Surface((sparkle['size'] * 4, sparkle['size'] * 4), pygame.SRCALPHA)
-                # Draw a star shape
-                points = []
-                for i in range(8):
-                    angle = math. radians(i * 45)
-                    radius = sparkle['size'] if i % 2 == 0 else sparkle['size'] // 2
-                    px = sparkle['size'] * 2 + radius * math.cos(angle)
-                    py = sparkle['size'] * 2 + radius * math.sin(angle)
-                    points.append((px, py))
-                pygame.draw. polygon(sparkle_surface, (255, 255, 255, alpha), points)
-                pygame.draw.polygon(sparkle_surface, (255, 215, 0, alpha), points, 1)
-                surface.blit(sparkle_surface, (sparkle['x'] - sparkle['size'] * 2, sparkle['y'] - sparkle['size'] * 2))
-        
-        # Draw particles (confetti).
-        # Each particle draws itself onto the wheel surface.
-        for particle in self.particles:
-            particle.draw(surface)
-        
-        # Draw center hub with 3D effect
-        # Outer shadow
-        for i in range(10, 0, -1):
-            shadow_alpha = int(20 * (i / 10))
-            shadow_surface = pygame.Surface((100, 100), pygame.SRCALPHA)
-            pygame.draw.circle(shadow_surface, (0, 0, 0, shadow_alpha), (50, 50), 45 + i)
-            surface.blit(shadow_surface, (self.x - 50, self. y - 50))
-        
-        # Gold rim of center
-        pygame.draw.circle(surface, (255, 215, 0), (self.x, self.y), 45)
-        pygame.draw.circle(surface, (218, 165, 32), (self.x, self.y), 42)
+            # Decorative dot between sections
+            dot = (int(c + (r + 15) * math.cos(start_angle)), int(c + (r + 15) * math.sin(start_angle)))
+            pygame.draw.circle(texture, (255, 215, 0), dot, 6)
+            pygame.draw.circle(texture, (255, 255, 255), dot, 4)
+            pygame.draw.circle(texture, (255, 215, 0), dot, 2)
+            yield
+        
+        if pygame.display.get_surface() is not None:
+            texture = texture.convert_alpha()
+        return texture
+    
+    def _bake_static(self):
+        """Render the parts that never rotate: rings + rim, glow halo, center hub.
+
+        A generator like `_bake_wheel`; returns (frame, halo, hub).
+        """
+        r = self.radius
         
-        # Center circle with gradient
+        # Outer decorative rings + metallic rim gradient
+        c = r + 26
+        frame = pygame.Surface((c * 2 + 1, c * 2 + 1), pygame.SRCALPHA)
+        ring_colors = [(139, 69, 19), (218, 165, 32), (184, 134, 11), (255, 215, 0)]
+        ring_widths = [15, 10, 6, 3]
+        ring_offsets = [25, 18, 12, 7]
+        for color, width, offset in zip(ring_colors, ring_widths, ring_offsets):
+            pygame.draw.circle(frame, color, (c, c), r + offset, width)
+        for i in range(20):
+            rim_color_value = 100 + int(50 * math.sin(i / 5))
+            pygame.draw.circle(frame, (rim_color_value, rim_color_value, rim_color_value), (c, c), r + 5 - i, 1)
+        yield
+        
+        # Glow halo at FULL intensity. Every frame we only change its overall
+        # alpha (`set_alpha`) instead of drawing 8 new glow surfaces.
+        c = r + 64
+        halo = pygame.Surface((c * 2 + 1, c * 2 + 1), pygame.SRCALPHA)
+        layer = pygame.Surface(halo.get_size(), pygame.SRCALPHA)
+        for i in range(8, 0, -1):
+            layer.fill((0, 0, 0, 0))
+            pygame.draw.circle(layer, (255, 215, 0, int(30 * (i / 8))), (c, c), r + i * 8)
+            halo.blit(layer, (0, 0))
+            if i % 2:
+                yield
+        
+        # Center hub: soft shadow, gold rim, gray gradient and the emblem
+        hub = pygame.Surface((100, 100), pygame.SRCALPHA)
+        layer = pygame.Surface((100, 100), pygame.SRCALPHA)
+        for i in range(10, 0, -1):
+            layer.fill((0, 0, 0, 0))
+            pygame.draw.circle(layer, (0, 0, 0, int(20 * (i / 10))), (50, 50), 45 + i)
+            hub.blit(layer, (0, 0))
+        pygame.draw.circle(hub, (255, 215, 0), (50, 50), 45)
+        pygame.draw.circle(hub, (218, 165, 32), (50, 50), 42)
         for i in range(40, 0, -1):
             gray_value = 50 + int(150 * (i / 40))
-            pygame.draw.circle(surface, (gray_value, gray_value, gray_value), 
-                             (self.x, self.y), i)
+            pygame.draw.circle(hub, (gray_value, gray_value, gray_value), (50, 50), i)
+        pygame.draw.circle(hub, (255, 215, 0), (50, 50), 25)
+        pygame.draw.circle(hub, (0, 0, 0), (50, 50), 22)
+        
+        if pygame.display.get_surface() is not None:
+            frame, halo, hub = frame.convert_alpha(), halo.convert_alpha(), hub.convert_alpha()
+        return frame, halo, hub
+    
+    def bake_steps(self):
+        """Bake whatever this wheel's look is still missing, a piece per step."""
+        # The key is the wheel's content, so baked textures (and rotated copies
+        # in the shared rotation cache) are reused by every wheel that looks the same.
+        key = ("luckywheel", tuple(self.prizes), self.radius, tuple(self.colors), self.num_slots)
+        if key not in _WHEEL_TEXTURES:
+            _WHEEL_TEXTURES[key] = yield from self._bake_wheel()
+        if self.radius not in _STATIC_TEXTURES:
+            _STATIC_TEXTURES[self.radius] = yield from self._bake_static()
+        return key
+    
+    def _ensure_baked(self):
+        """(Re)bake when the prizes, radius, colors or number of slots change."""
+        key = run_to_end(self.bake_steps())
+        if key != self._wheel_key:
+            self._wheel_texture = _WHEEL_TEXTURES[key]
+            self._wheel_key = key
+        if self._static_radius != self.radius:
+            self._frame_texture, self._halo_texture, self._hub_texture = _STATIC_TEXTURES[self.radius]
+            self._static_radius = self.radius
+    
+    def draw(self, surface):
+        """Draw the wheel on the surface with fancy casino effects"""
+        # This method is the "render" phase.
+        # It does NOT change game rules; it only draws the current state.
+        self._ensure_baked()
+        center = (self.x, self.y)
         
-        # Center logo/emblem
-        pygame.draw.circle(surface, (255, 215, 0), (self.x, self.y), 25)
-        pygame.draw.circle(surface, (0, 0, 0), (self.x, self.y), 22)
+        # Draw light rays from center when winning
+        if self.winner and not self.is_spinning and self.celebration_timer < 60:
+            self.draw_light_rays(surface)
+        
+        # The outer glow: one pre-rendered halo, faded in/out with its alpha.
+        glow_alpha = int(255 * self.glow_intensity / 100)
+        if glow_alpha > 0:
+            self._halo_texture.set_alpha(glow_alpha)
+            surface.blit(self._halo_texture, self._halo_texture.get_rect(center=center))
+        
+        # Decorative rings + metallic rim (they look the same at every angle)
+        surface.blit(self._frame_texture, self._frame_texture.get_rect(center=center))
+        
+        # The slices, labels and dots rotate with the wheel.
+        # Our angles grow clockwise on screen (y points down), while
+        # `pygame.transform.rotate` turns counter-clockwise - hence the minus.
+        rotated = ROTATIONS.rotated(self._wheel_key, self._wheel_texture, -self.angle)
+        surface.blit(rotated, rotated.get_rect(center=center))
+        
+        # Draw sparkles, then the confetti particles
+        self.sparkles.draw(surface)
+        self.particles.draw(surface)
+        
+        # Draw center hub with 3D effect (pre-rendered)
+        surface.blit(self._hub_texture, (self.x - 50, self.y - 50))
         
         # Draw star in center
         self.draw_center_star(surface, self.x, self.y, 18, (255, 215, 0))
@@ -543,19 +547,29 @@ class LuckyWheel:
                 (x2 + dx, y2 + dy)
             ]
             
-            # Draw with transparency
-            ray_surface = pygame.Surface((1000, 700), pygame.SRCALPHA)
+            # Draw with transparency.
+            # gfxdraw blends the translucent color straight onto the surface;
+            # otherwise all rays share one reused transparent layer.
             alpha = 30 + int(20 * math.sin(self.celebration_timer * 0.1 + i))
             color = (255, 215, 0, alpha)
-            pygame.draw.polygon(ray_surface, color, points)
-            surface.blit(ray_surface, (0, 0))
+            if GFXDRAW_AVAILABLE:
+                pygame.gfxdraw.filled_polygon(surface, points, color)
+            else:
+                if self._ray_layer is None or self._ray_layer.get_size() != surface.get_size():
+                    self._ray_layer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+                if i == 0:
+                    self._ray_layer.fill((0, 0, 0, 0))
+                pygame.draw.polygon(self._ray_layer, color, points)
+        
+        if not GFXDRAW_AVAILABLE:
+            surface.blit(self._ray_layer, (0, 0))
 
 
 def draw_fancy_title(surface, width):
     """Draw an eye-catching LUCKY WHEEL title with decorative elements"""
     # Create large bold title font
-    title_font = pygame.font.Font(None, 120)
-    subtitle_font = pygame.font.Font(None, 40)
+    title_font = fonts.get_font(120)
+    subtitle_font = fonts.get_font(40)
     
     # Main title text
     title_text = "LUCKY WHEEL"
@@ -565,18 +579,18 @@ def draw_fancy_title(surface, width):
     offsets = [6, 4, 2]
     
     for i, (shadow_color, offset) in enumerate(zip(shadow_colors, offsets)):
-        shadow_surface = title_font.render(title_text, True, shadow_color)
+        shadow_surface = fonts.render(title_font, title_text, True, shadow_color)
         shadow_rect = shadow_surface.get_rect(center=(width // 2 + offset, 60 + offset))
         surface.blit(shadow_surface, shadow_rect)
     
     # Main title in gold gradient effect (simulate with multiple colors)
-    title_surface = title_font.render(title_text, True, (255, 215, 0))  # Gold
+    title_surface = fonts.render(title_font, title_text, True, (255, 215, 0))  # Gold
     title_rect = title_surface.get_rect(center=(width // 2, 60))
     surface.blit(title_surface, title_rect)
     
-    # Add bright highlight on top
-    highlight_surface = title_font.render(title_text, True, (255, 255, 150))
-    highlight_surface.set_alpha(100)  # Semi-transparent
+    # Add bright highlight on top, semi-transparent (alpha 100): a tinted
+    # copy of the title from the glyph atlas, so it's drawn only once.
+    highlight_surface = get_atlas(title_font).tinted(title_text, (255, 255, 150, 100))
     surface.blit(highlight_surface, title_rect. move(0, -2))
     
     # Decorative stars around the title
@@ -592,11 +606,11 @@ def draw_fancy_title(surface, width):
     
     # Subtitle/tagline
     tagline = "~ Spin Your Fortune ~"
-    tagline_surface = subtitle_font.render(tagline, True, (255, 215, 0))
+    tagline_surface = fonts.render(subtitle_font, tagline, True, (255, 215, 0))
     tagline_rect = tagline_surface. get_rect(center=(width // 2, 110))
     
     # Tagline shadow
-    tagline_shadow = subtitle_font. render(tagline, True, (0, 0, 0))
+    tagline_shadow = fonts.render(subtitle_font, tagline, True, (0, 0, 0))
     surface.blit(tagline_shadow, tagline_rect.move(2, 2))
     surface.blit(tagline_surface, tagline_rect)
     
@@ -693,9 +707,9 @@ def draw_spin_button(surface, x, y, width, height, mouse_pos, is_spinning):
     pygame.draw.rect(surface, border_color, button_rect, 4, border_radius=15)
     
     # Draw button text
-    font = pygame.font.Font(None, 48)
+    font = fonts.get_font(48)
     text = "SPIN!" if not is_spinning else "SPINNING..."
-    text_surface = font.render(text, True, text_color)
+    text_surface = fonts.render(font, text, True, text_color)
     text_rect = text_surface.get_rect(center=(x, y))
     surface.blit(text_surface, text_rect)
     
@@ -722,28 +736,171 @@ def draw_winner_announcement(surface, winner_text, celebration_timer, center_x=5
     pygame.draw.rect(surface, (218, 165, 32), (banner_x + 8, banner_y + 8, banner_width - 16, banner_height - 16), 3, border_radius=15)
     
     # "YOU WON!" text at top
-    top_font = pygame.font.Font(None, 56)
+    top_font = fonts.get_font(56)
     top_text = "YOU WON!"
     
-    top_surface = top_font.render(top_text, True, (255, 255, 255))
+    top_surface = fonts.render(top_font, top_text, True, (255, 255, 255))
     top_rect = top_surface.get_rect(center=(center_x, center_y - 50))
     surface.blit(top_surface, top_rect)
     
     # Prize text - static
-    prize_font = pygame.font.Font(None, 100)
-    prize_surface = prize_font.render(winner_text, True, (255, 215, 0))
+    prize_font = fonts.get_font(100)
+    prize_surface = fonts.render(prize_font, winner_text, True, (255, 215, 0))
     prize_rect = prize_surface.get_rect(center=(center_x, center_y + 20))
     surface.blit(prize_surface, prize_rect)
     
     # "Click to spin again" at bottom
-    bottom_font = pygame.font.Font(None, 36)
+    bottom_font = fonts.get_font(36)
     bottom_text = "Click to spin again!"
     
-    bottom_surface = bottom_font.render(bottom_text, True, (255, 255, 255))
+    bottom_surface = fonts.render(bottom_font, bottom_text, True, (255, 255, 255))
     bottom_rect = bottom_surface.get_rect(center=(center_x, banner_y + banner_height - 30))
     surface.blit(bottom_surface, bottom_rect)
 
 
+# =============================================================================
+# EMBEDDED SCENE (used by main.py)
+# =============================================================================
+# Same pattern as the other mini-games: the state is a dict, the functions
+# below take it and return the (possibly updated) dict.
+
+SPIN_COST = 100
+
+
+def _gradient_color(y: int, height: int) -> tuple[int, int, int]:
+    # Dark green at the top, a bit lighter at the bottom.
+    return (0, int(20 + (y / height) * 40), 0)
+
+
+def _table_wheel(x, y):
+    """The wheel of the casino table, centered at (x, y)."""
+    wheel = LuckyWheel(x, y, 180, num_slots=10)
+    wheel.prizes = ["10", "20", "100", "25", "5", "500", "15", "75", "200", "100"]
+    return wheel
+
+
+def _ensure_luckywheel_state(game_state: dict, size: tuple[int, int]) -> dict:
+    if "initialized" not in game_state:
+        tokens = game_state.get("tokens", 100)
+        surf_w, surf_h = size
+        wheel = _table_wheel(surf_w // 2, surf_h // 2 - 20)
+        
+        game_state = {
+            "initialized": True,
+            "wheel": wheel,
+            "tokens": tokens,
+            "last_win": 0,
+        }
+    return game_state
+
+
+def update_luckywheel_scene(game_state: dict, size: tuple[int, int]) -> dict:
+    """Advance the wheel by one frame and pay out a win once it stops."""
+    game_state = _ensure_luckywheel_state(game_state, size)
+    wheel: LuckyWheel = game_state["wheel"]
+    wheel.update()
+    
+    if wheel.winner and not wheel.is_spinning and not game_state.get("win_processed", False):
+        try:
+            win_amount = int(wheel.winner.replace("$", "").replace(",", ""))
+            game_state["tokens"] += win_amount
+            game_state["last_win"] = win_amount
+        except ValueError:
+            pass
+        game_state["win_processed"] = True
+    return game_state
+
+
+def render_luckywheel_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """Draw the lucky wheel table (no game logic, see update_luckywheel_scene)."""
+    game_state = _ensure_luckywheel_state(game_state, surface.get_size())
+    wheel: LuckyWheel = game_state["wheel"]
+    
+    # Draw background gradient (baked once per canvas size, see backgrounds.py)
+    surface.blit(backgrounds.vertical_gradient("luckywheel", surface.get_size(), _gradient_color), (0, 0))
+    
+    wheel.draw(surface)
+    
+    surf_w, surf_h = surface.get_size()
+    mouse_pos = pygame.mouse.get_pos()
+    button_rect = draw_spin_button(surface, surf_w // 2, surf_h - 60, 200, 60, mouse_pos, wheel.is_spinning)
+    game_state["button_rect"] = button_rect
+    
+    # Draw token counter
+    token_text = f"Tokens: {game_state['tokens']}"
+    token_surf = fonts.render(font, token_text, True, (255, 215, 0))
+    surface.blit(token_surf, (20, 20))
+    
+    # Draw spin cost
+    cost_text = f"Spin Cost: {SPIN_COST}"
+    cost_surf = fonts.render(fonts.get_font(32), cost_text, True, (255, 255, 255))
+    surface.blit(cost_surf, (20, 60))
+    
+    # Draw controls hint
+    hint_font = fonts.get_font(24)
+    hints = ["SPACE - Spin", "ESC - Back"]
+    for i, hint in enumerate(hints):
+        hint_surf = fonts.render(hint_font, hint, True, (200, 200, 200))
+        surface.blit(hint_surf, (20, surf_h - 60 + i * 22))
+    
+    # Draw winner announcement if won
+    if wheel.winner and not wheel.is_spinning:
+        draw_winner_announcement(surface, wheel.winner, wheel.celebration_timer, surf_w // 2, surf_h // 2)
+    
+    return game_state
+
+
+def draw_luckywheel_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """Draw and update lucky wheel game on the given surface."""
+    game_state = update_luckywheel_scene(game_state, surface.get_size())
+    return render_luckywheel_scene(surface, game_state, font)
+
+
+def spin_luckywheel(game_state: dict) -> dict:
+    """Start a lucky wheel spin. Fixed cost: SPIN_COST tokens."""
+    if "wheel" not in game_state:
+        return game_state
+    
+    wheel: LuckyWheel = game_state["wheel"]
+    tokens = game_state.get("tokens", 0)
+    
+    if wheel.is_spinning or tokens < SPIN_COST:
+        return game_state
+    
+    game_state["tokens"] = tokens - SPIN_COST
+    game_state["win_processed"] = False
+    wheel.spin()
+    
+    return game_state
+
+
+class LuckyWheelScene(scenes.MiniGameScene):
+    """The lucky wheel table as a scene (see scenes.py)."""
+
+    name = "luckywheel"
+
+    def __init__(self):
+        super().__init__()
+        self.on_key(pygame.K_SPACE, spin_luckywheel)
+
+    def prepare(self, size):
+        # Bake the background and the table wheel's textures (a slice at a
+        # time) before the game is built.
+        yield from backgrounds.vertical_gradient_steps("luckywheel", size, _gradient_color)
+        yield from _table_wheel(size[0] // 2, size[1] // 2 - 20).bake_steps()
+
+    def update_state(self, state, size):
+        return update_luckywheel_scene(state, size)
+
+    def render(self, surface, state, font):
+        return render_luckywheel_scene(surface, state, font)
+
+    def click(self, app, pos):
+        button = self.state.get("button_rect")
+        if isinstance(button, pygame.Rect) and button.collidepoint(pos):
+            self.state = spin_luckywheel(self.state)
+
+
 # Example usage / Demo
 def main():
     pygame.init()
@@ -760,8 +917,8 @@ def main():
         "$500", "$15", "$75", "$200", "JACKPOT"
     ]
     
-    font = pygame.font.Font(None, 36)
-    button_font = pygame.font.Font(None, 48)
+    font = fonts.get_font(36)
+    button_font = fonts.get_font(48)
     
     running = True
     while running:
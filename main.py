@@ -11,8 +11,11 @@ usually built around a loop that repeats ~60 times per second:
 3) draw the current state onto a Surface
 4) present the final frame to the window
 
-This project uses a simple "scene" (state machine) approach: `scene` is a string
-like "menu" or "roulette" that decides which update/draw code runs.
+This project uses a simple "scene" (state machine) approach: every screen
+("menu", "game", "roulette", ...) is a Scene object (see scenes.py) and the
+main loop only talks to the active one. The hub scenes (menu, settings,
+loading and the two lobbies) are defined in this file; each mini-game module
+defines its own scene.
 """
 
 import sys
@@ -33,22 +36,24 @@ import math
 import pygame
 
 # Type hints help the editor understand the shapes of values (optional but nice).
-from typing import Optional, Tuple, List, Dict
-from loading import draw_game_screen
+from typing import Optional, Tuple, List, Dict, Callable
+import fonts
+from glyphatlas import get_atlas, rainbow_colors
+from loading import draw_game_screen, preload_background
 from move import Player
-from gifimage import GIFImage
-from roulette import draw_roulette_scene, spin_roulette, reset_roulette, change_bet_amount, change_bet_type, handle_roulette_click, handle_roulette_keypress
-from slotmachine import draw_slotmachine_scene, spin_slotmachine
-from luckywheel import LuckyWheel, draw_spin_button, draw_winner_announcement
-from blackjack import draw_blackjack_scene, handle_blackjack_click, handle_blackjack_keypress, change_blackjack_bet
-from higherlower import draw_higherlower_scene, handle_higherlower_click, handle_higherlower_keypress, change_higherlower_bet
-from horsegame import draw_horsegame_scene, handle_horsegame_click, handle_horsegame_keypress, change_horsegame_bet
-
-# Initialize pygame.
-# - `pygame.init()` initializes the core modules (display, time, etc.)
-# - `pygame.mixer.init()` initializes the audio mixer (music/sfx playback)
-pygame.init()
-pygame.mixer.init()
+from assetmanager import ASSETS
+from preloader import Preloader, find_images
+from perfhud import PerfHUD, collect_list_sizes
+from scheduler import Scheduler, call_job
+from statepool import StatePool
+from disco import DiscoLights, DISCO_COLORS
+from postfx import DisplacementEffect, DrawStage, PostFX, PulseZoomStage, TintStage, WaveStage
+import scenes
+
+# The fonts below are created at import time, so the font module has to be
+# ready now. Everything else (display, audio, ...) is started in `main()`:
+# importing this module (e.g. from benchmark.py) doesn't open the audio device.
+pygame.font.init()
 
 BASE_WIDTH, BASE_HEIGHT = 900, 600
 # The game renders to a *fixed logical resolution* (900x600) called `canvas`.
@@ -61,8 +66,10 @@ BASE_WIDTH, BASE_HEIGHT = 900, 600
 # - wrap load/save in try/except so the game still runs even if saving fails
 try:
     SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "settings.json")
+    PERF_CSV_FILE = os.path.join(os.path.dirname(__file__), "perf_histograms.csv")
 except:
     SETTINGS_FILE = "settings.json"
+    PERF_CSV_FILE = "perf_histograms.csv"
 
 
 def _load_settings() -> dict:
@@ -135,14 +142,12 @@ def _present(canvas: pygame.Surface, window: pygame.Surface) -> None:
     window.blit(scaled, (0, 0))
 
 
-pygame.display.set_caption("Merge Casino")
-
 CLOCK = pygame.time.Clock()
-FONT = pygame.font.SysFont(None, 48)
-FONT_TITLE = pygame.font.SysFont(None, 144)  # 3x larger for Main Menu
-FONT_SMALL = pygame.font.SysFont(None, 32)
-FONT_TIP = pygame.font.SysFont(None, 24)
-FONT_GAME_HINT = pygame.font.SysFont(None, 28)
+FONT = fonts.get_font(48)
+FONT_TITLE = fonts.get_font(144)  # 3x larger for Main Menu
+FONT_SMALL = fonts.get_font(32)
+FONT_TIP = fonts.get_font(24)
+FONT_GAME_HINT = fonts.get_font(28)
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -152,7 +157,27 @@ BTN_IDLE = (70, 80, 110)
 BTN_HOVER = (95, 110, 150)
 BTN_TEXT = (255, 255, 255)
 
-LOADING_DURATION_SECONDS = 2
+# Mini-game modules are imported lazily (scenes.py). While the loading screen
+# is up we import and warm up all of them anyway ("idle-time prefetch").
+# A table that isn't warm (not prefetched, or dropped from the state pool) is
+# prewarmed, a step per frame, once the player comes within PREWARM_NEAR_PX
+# of it.
+PREFETCH_TABLES_WHILE_LOADING = True
+PREWARM_NEAR_PX = 120.0
+
+# Tables you leave are kept "warm" for the next visit (see statepool.py), up
+# to this much estimated memory; past that the least recently used table is
+# thrown away and starts fresh next time. All six tables take about 20 MB.
+STATE_POOL_MAX_MB = 32
+
+# Slow one-off work (prewarming tables, loading music, decoding GIFs) runs as
+# scheduler jobs for at most this long per frame (see scheduler.py).
+SCHEDULER_BUDGET_MS = 4.0
+
+# "Press E" works within this distance of a table; walking within ZONE_WIDTH
+# of the left/right edge moves you to the other lobby.
+INTERACT_NEAR_PX = 22.0
+ZONE_WIDTH = 60
 
 # Table colors for each game
 TABLE_COLOR_SLOTS = (139, 69, 19)      # Brown for slot machines
@@ -199,7 +224,7 @@ class Button:
         pygame.draw.rect(surface, color, self.rect, border_radius=12)
         pygame.draw.rect(surface, (20, 20, 25), self.rect, width=2, border_radius=12)
 
-        text_surf = FONT_SMALL.render(self.text, True, BTN_TEXT)
+        text_surf = fonts.render(FONT_SMALL, self.text, True, BTN_TEXT)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -269,193 +294,509 @@ class Slider:
 def draw_center_text(surface: pygame.Surface, text: str, y: int, font=FONT, color=WHITE):
     # pygame text rendering is a two-step process:
     # 1) font.render(...) creates a new Surface containing the text pixels
+    #    (`fonts.render` does that once and reuses the Surface, see fonts.py)
     # 2) surface.blit(...) copies that text surface onto the destination surface
-    surf = font.render(text, True, color)
+    surf = fonts.render(font, text, True, color)
     rect = surf.get_rect(center=(surface.get_width() // 2, y))
     surface.blit(surf, rect)
 
 
 def draw_rainbow_text(surface: pygame.Surface, text: str, y: int, font=FONT, time_offset: float = 0):
     """Draw text with rainbow colors that loop over time."""
-    import colorsys
-    
-    # Render each character separately to get their widths
-    char_surfaces = []
-    total_width = 0
-    for i, char in enumerate(text):
-        # Calculate hue based on character position and time
-        hue = ((i / len(text)) + time_offset) % 1.0
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        color = (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
-        char_surf = font.render(char, True, color)
-        char_surfaces.append(char_surf)
-        total_width += char_surf.get_width()
-    
-    # Calculate starting x position to center the text
-    start_x = (surface.get_width() - total_width) // 2
-    current_x = start_x
-    
-    # Blit each character
-    for char_surf in char_surfaces:
-        char_rect = char_surf.get_rect(topleft=(current_x, y - char_surf.get_height() // 2))
-        surface.blit(char_surf, char_rect)
-        current_x += char_surf.get_width()
-
-
-def draw_luckywheel_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
-    """Draw and update lucky wheel game on the given surface."""
-    # Pattern used across the project:
-    # - each mini-game stores its state in a dictionary (game_state)
-    # - the draw_* function both *updates* and *draws* that mini-game
-    # - it returns the (possibly updated) state dict
-    #
-    # This is a simple alternative to making lots of classes.
-    if "initialized" not in game_state:
-        tokens = game_state.get("tokens", 100)
-        surf_w, surf_h = surface.get_size()
-        wheel = LuckyWheel(surf_w // 2, surf_h // 2 - 20, 180, num_slots=10)
-        wheel.prizes = ["10", "20", "100", "25", "5", "500", "15", "75", "200", "100"]
-        
-        game_state = {
-            "initialized": True,
-            "wheel": wheel,
-            "tokens": tokens,
-            "last_win": 0,
-        }
-    
-    wheel: LuckyWheel = game_state["wheel"]
-    wheel.update()
-    
-    # Draw background gradient
-    for y in range(surface.get_height()):
-        color_value = int(20 + (y / surface.get_height()) * 40)
-        pygame.draw.line(surface, (0, color_value, 0), (0, y), (surface.get_width(), y))
-    
-    wheel.draw(surface)
-    
-    surf_w, surf_h = surface.get_size()
-    mouse_pos = pygame.mouse.get_pos()
-    button_rect = draw_spin_button(surface, surf_w // 2, surf_h - 60, 200, 60, mouse_pos, wheel.is_spinning)
-    game_state["button_rect"] = button_rect
-    
-    # Draw token counter
-    token_text = f"Tokens: {game_state['tokens']}"
-    token_surf = font.render(token_text, True, (255, 215, 0))
-    surface.blit(token_surf, (20, 20))
-    
-    # Draw spin cost
-    cost_text = "Spin Cost: 100"
-    cost_surf = pygame.font.Font(None, 32).render(cost_text, True, (255, 255, 255))
-    surface.blit(cost_surf, (20, 60))
-    
-    # Draw controls hint
-    hint_font = pygame.font.Font(None, 24)
-    hints = ["SPACE - Spin", "ESC - Back"]
-    for i, hint in enumerate(hints):
-        hint_surf = hint_font.render(hint, True, (200, 200, 200))
-        surface.blit(hint_surf, (20, surf_h - 60 + i * 22))
-    
-    # Draw winner announcement if won
-    if wheel.winner and not wheel.is_spinning:
-        draw_winner_announcement(surface, wheel.winner, wheel.celebration_timer, surf_w // 2, surf_h // 2)
-        
-        if not game_state.get("win_processed", False):
-            try:
-                win_amount = int(wheel.winner.replace("$", "").replace(",", ""))
-                game_state["tokens"] += win_amount
-                game_state["last_win"] = win_amount
-            except ValueError:
-                pass
-            game_state["win_processed"] = True
-    
-    return game_state
+    # Each character gets its own hue, shifted by time_offset. The letters are
+    # rasterized once (in white) and only re-colored each frame, see glyphatlas.py.
+    colors = rainbow_colors(len(text), time_offset)
+    get_atlas(font).draw_chars(surface, text, (surface.get_width() // 2, y), colors)
 
 
-def spin_luckywheel(game_state: dict) -> dict:
-    """Start a lucky wheel spin. Fixed cost: 100 tokens."""
-    if "wheel" not in game_state:
-        return game_state
-    
-    wheel: LuckyWheel = game_state["wheel"]
-    tokens = game_state.get("tokens", 0)
-    spin_cost = 100
-    
-    if wheel.is_spinning or tokens < spin_cost:
-        return game_state
-    
-    game_state["tokens"] = tokens - spin_cost
-    game_state["win_processed"] = False
-    wheel.spin()
-    
-    return game_state
+def _table_warmups(app: "CasinoApp", canvas_size: tuple[int, int]) -> list:
+    """Preloader tasks that play the first frame of every table off-screen.
+
+    The first frame of a mini-game fills the shared caches (scaled symbols,
+    card sprites, rotated wheels, text, ...). Doing it on a scratch surface
+    during loading means the real first visit only blits. Each table is a
+    generator running its `prewarm` steps, so the loading screen keeps
+    animating while it is built.
+    """
+    scratch = pygame.Surface(canvas_size)
+
+    def warm(name):
+        scene = app.registry.get(name)
+        yield
+        yield from scene.prewarm(app, scratch)
+
+    return [lambda: Player((canvas_size[0] // 2, canvas_size[1] // 2))] + [warm(name) for name in scenes.SCENE_MODULES]
+
+
+def _draw_token_counter(surface: pygame.Surface, tokens: int) -> None:
+    # Token counter at the top center of the lobbies.
+    token_surf = fonts.render(FONT_SMALL, f"Tokens: {tokens}", True, (255, 215, 0))
+    token_rect = token_surf.get_rect(midtop=(surface.get_width() // 2, 10))
+    pygame.draw.rect(surface, (30, 30, 30), token_rect.inflate(20, 10), border_radius=8)
+    surface.blit(token_surf, token_rect)
+
+
+def _draw_interact_popup(surface: pygame.Surface, player: Player) -> None:
+    # The little 'E' box above the player's head.
+    popup = pygame.Rect(0, 0, 26, 26)
+    popup.center = (int(player.x), int(player.y - (player.radius + 18)))
+    popup.clamp_ip(surface.get_rect())
+    pygame.draw.rect(surface, (20, 20, 25), popup, border_radius=4)
+    pygame.draw.rect(surface, (255, 255, 255), popup, width=2, border_radius=4)
+    e_surf = fonts.render(FONT_TIP, "E", True, (255, 255, 255))
+    e_rect = e_surf.get_rect(center=popup.center)
+    surface.blit(e_surf, e_rect)
+
+
+def _emote(app: "CasinoApp", event) -> None:
+    # Smoke emote in the lobbies (B key)
+    if app.player is not None:
+        app.player.trigger_emote()
+
+
+class CasinoApp(scenes.App):
+    """The app context (see scenes.py) plus what the hub scenes share."""
+
+    def __init__(self, registry: scenes.SceneRegistry, size: tuple[int, int], font, music_volume: int,
+                 state_pool: StatePool | None = None, scheduler: Scheduler | None = None):
+        super().__init__(registry, size, font, state_pool, scheduler)
+        self.music_volume = music_volume  # 0-100
+        # Cocktail/Drunk effect state
+        # These are classic "game state": timers and flags updated every frame.
+        self.holding_cocktail = False
+        self.cocktail_timer = 0.0
+        self.drunk_active = False
+        self.drunk_timer = 0.0
+
+
+class MenuScene(scenes.Scene):
+    name = "menu"
+
+    def __init__(self, background: pygame.Surface | None):
+        super().__init__()
+        self.background = background
+        btn_width, btn_height = 200, 60
+        spacing = 40
+        start_btn_x = (BASE_WIDTH - (btn_width * 3 + spacing * 2)) // 2
+        self.start_btn = Button(pygame.Rect(start_btn_x, 475, btn_width, btn_height), "Start game")
+        self.settings_btn = Button(pygame.Rect(start_btn_x + btn_width + spacing, 475, btn_width, btn_height), "Settings")
+        self.leave_btn = Button(pygame.Rect(start_btn_x + (btn_width + spacing) * 2, 475, btn_width, btn_height), "Leave")
+
+    def click(self, app, pos):
+        if self.start_btn.handle_click(pos):
+            app.switch("loading")
+        elif self.settings_btn.handle_click(pos):
+            app.switch("settings")
+        elif self.leave_btn.handle_click(pos):
+            app.running = False
+
+    def draw(self, app, surface):
+        if self.background is not None:
+            # Already stretched to the canvas size when it was loaded
+            surface.blit(self.background, (0, 0))
+        else:
+            surface.fill(BG)
+        rainbow_time = pygame.time.get_ticks() / 1000.0  # Convert to seconds
+        draw_rainbow_text(surface, "Main Menu", 200, font=FONT_TITLE, time_offset=rainbow_time)
+        self.start_btn.draw(surface, app.mouse_pos)
+        self.settings_btn.draw(surface, app.mouse_pos)
+        self.leave_btn.draw(surface, app.mouse_pos)
+        draw_center_text(surface, "Tip: ESC = go back (in games)", 580, font=FONT_TIP, color=(200, 200, 200))
+
+
+class SettingsScene(scenes.Scene):
+    name = "settings"
+
+    def __init__(self, background: pygame.Surface | None, on_volume: Callable[[int], None]):
+        super().__init__()
+        self.background = background
+        # Called with the new volume (0-100) whenever the slider moves.
+        self.on_volume = on_volume
+        self.panel_rect = pygame.Rect(BASE_WIDTH // 2 - 200, BASE_HEIGHT // 2 - 120, 400, 240)
+        self.volume_slider = Slider(pygame.Rect(self.panel_rect.left + 50, self.panel_rect.centery, 300, 20), 0, 100, 100)
+        self.back_btn = Button(pygame.Rect(self.panel_rect.centerx - 75, self.panel_rect.bottom - 70, 150, 50), "Back")
+
+    def enter(self, app):
+        self.volume_slider.value = app.music_volume  # Sync slider with current volume
+
+    def back(self, app):
+        app.switch("menu")
+
+    def handle_event(self, app, event):
+        # UI widgets often need to see raw events so they can manage dragging.
+        if self.volume_slider.handle_event(event, app.mouse_pos):
+            self.on_volume(self.volume_slider.value)
+        super().handle_event(app, event)
+
+    def click(self, app, pos):
+        if self.back_btn.handle_click(pos):
+            app.switch("menu")
+
+    def draw(self, app, surface):
+        if self.background is not None:
+            surface.blit(self.background, (0, 0))
+        else:
+            surface.fill(BG)
+        panel = self.panel_rect
+        # Draw settings panel background
+        pygame.draw.rect(surface, (35, 40, 50), panel, border_radius=16)
+        pygame.draw.rect(surface, (60, 70, 90), panel, width=3, border_radius=16)
+
+        # Title
+        title_surf = fonts.render(FONT, "Settings", True, WHITE)
+        title_rect = title_surf.get_rect(centerx=panel.centerx, top=panel.top + 20)
+        surface.blit(title_surf, title_rect)
+
+        # Volume label
+        volume_label = fonts.render(FONT_SMALL, "Music Volume", True, WHITE)
+        volume_label_rect = volume_label.get_rect(centerx=panel.centerx, top=panel.top + 70)
+        surface.blit(volume_label, volume_label_rect)
+
+        # Volume slider
+        self.volume_slider.draw(surface, app.mouse_pos)
+
+        # Volume percentage
+        volume_text = fonts.render(FONT_SMALL, f"{self.volume_slider.value}%", True, (180, 200, 255))
+        volume_text_rect = volume_text.get_rect(centerx=panel.centerx, top=self.volume_slider.rect.bottom + 10)
+        surface.blit(volume_text, volume_text_rect)
+
+        # Back button
+        self.back_btn.draw(surface, app.mouse_pos)
+
+
+class LoadingScene(scenes.Scene):
+    """Shown until the preloader has loaded everything.
+
+    The preloader does a few milliseconds of work per frame, so the dots keep
+    spinning.
+    """
+
+    name = "loading"
+
+    def __init__(self, preloader: Preloader):
+        super().__init__()
+        self.preloader = preloader
+        self.elapsed = 0.0
+        self.progress = 0.0
+
+    def enter(self, app):
+        self.elapsed = 0.0
+
+    def back(self, app):
+        app.switch("menu")
+        app.player = None
+
+    def update(self, app, dt):
+        self.elapsed += dt
+        self.progress = self.preloader.update()
+        if self.preloader.done:
+            app.switch("game")
+            app.player = Player((BASE_WIDTH // 2, BASE_HEIGHT // 2))
+
+    def draw(self, app, surface):
+        draw_game_screen(surface, title_font=FONT, hint_font=FONT_GAME_HINT, progress=self.progress, elapsed_time=self.elapsed)
+
+
+class HubScene(scenes.Scene):
+    """A lobby you walk around in; E at a table opens its mini-game.
+
+    `tables` is a list of (table rect, scene name), checked in that order.
+    Tables are invisible interaction zones (no collision).
+    """
+
+    spawn = (BASE_WIDTH // 2, BASE_HEIGHT // 2)
+
+    def __init__(self, tables: list[tuple[pygame.Rect, str]]):
+        super().__init__()
+        self.tables = tables
+        self.background: pygame.Surface | None = None
+        self.keymap[pygame.K_e] = self.interact
+        self.keymap[pygame.K_b] = _emote
+
+    def near_table(self, app) -> str | None:
+        """The scene of the table the player can interact with (None = none)."""
+        for table, table_scene in self.tables:
+            if _player_can_interact(app.player, [table], INTERACT_NEAR_PX):
+                return table_scene
+        return None
+
+    def interact(self, app, event) -> None:
+        table_scene = self.near_table(app)
+        if table_scene is not None:
+            app.switch(table_scene)
+
+    def prewarm_near_tables(self, app) -> None:
+        # Build a table's game while the player is still walking up to it
+        # (see `Prewarmer` in scenes.py).
+        for table, table_scene in self.tables:
+            if _player_can_interact(app.player, [table], PREWARM_NEAR_PX):
+                app.prewarmer.request(table_scene)
+
+    def move_player(self, app, dt) -> Player:
+        if app.player is None:
+            app.player = Player(self.spawn)
+        # Movement uses current key state (pressed or not), not discrete key events.
+        # This feels smoother for continuous movement.
+        keys = pygame.key.get_pressed()
+        app.player.update(dt, keys, pygame.Rect((0, 0), app.size), obstacles=[])
+        return app.player
+
+    def draw_background(self, surface, fallback_color) -> None:
+        if self.background is not None:
+            surface.blit(self.background, (0, 0))
+        else:
+            surface.fill(fallback_color)
+
+
+class LobbyScene(HubScene):
+    """The first hall: four tables, walk out on the right for Lobby 2."""
+
+    name = "game"
+
+    def back(self, app):
+        app.switch("menu")
+        app.player = None
+
+    def update(self, app, dt):
+        player = self.move_player(app, dt)
+        # Check if player goes to right edge -> lobby2
+        if player.x > BASE_WIDTH - ZONE_WIDTH:
+            app.switch("lobby2")
+            app.player = Player((80, BASE_HEIGHT // 2))
+            return
+        self.prewarm_near_tables(app)
+
+    def draw(self, app, surface):
+        self.draw_background(surface, (40, 60, 80))
+        if app.player is None:
+            return
+        app.player.draw(surface)
+        _draw_token_counter(surface, app.tokens)
+
+        # Show arrow hint to go to lobby2
+        hint_surf = fonts.render(FONT_TIP, "Lobby 2 >", True, (200, 200, 200))
+        surface.blit(hint_surf, (BASE_WIDTH - 80, BASE_HEIGHT // 2 - 10))
+
+        # Show 'E' popup when near any interactive table
+        if self.near_table(app) is not None:
+            _draw_interact_popup(surface, app.player)
+
 
+class Lobby2Scene(HubScene):
+    """The second hall: Higher/Lower, horse racing, the bar and the dancefloor."""
 
-async def main():
+    name = "lobby2"
+    spawn = (80, BASE_HEIGHT // 2)
+    COCKTAIL_COST = 10
+
+    def __init__(self, tables, bar: pygame.Rect, dancefloor: pygame.Rect,
+                 enter_music: Callable[[], None], leave_music: Callable[[], None], flash_stage: TintStage,
+                 hint_stage: DrawStage):
+        super().__init__(tables)
+        self.bar = bar
+        self.dancefloor = dancefloor
+        # Music mode switching (see _enter/_leave_dancefloor_music in main()).
+        self.enter_music = enter_music
+        self.leave_music = leave_music
+        # The disco flash is drawn by the post-processing pipeline; we only pick its color.
+        self.flash_stage = flash_stage
+        # While dancing, the back hint is drawn by the pipeline right after the
+        # flash, so it isn't tinted (but still pulses with the rest).
+        hint_stage.draw = self.draw_back_hint
+        self.cocktail_img: pygame.Surface | None = None
+        self.disco_ball_gif = None
+
+        # Dancefloor disco state
+        # The disco effect is a mix of:
+        # - state flags (was_on_dancefloor)
+        # - animation variables (disco_ball_y, timers)
+        # - music mode switching (enter_music / leave_music)
+        self.was_on_dancefloor = False
+        self.disco_ball_y = -100  # Start above screen
+        self.disco_ball_target_y = BASE_HEIGHT // 2 - 50
+        self.disco_ball_lowering = False
+        self.disco_ray_timer = 0.0
+        self.disco_flash_timer = 0.0
+        self.disco_flash_index = 0
+        self.disco_flash_colors = DISCO_COLORS
+        # Rays (see disco.py). Created once, reused every frame.
+        self.disco_lights = DiscoLights(colors=DISCO_COLORS)
+
+    @property
+    def dancing(self) -> bool:
+        return self.was_on_dancefloor
+
+    def can_order(self, app) -> bool:
+        return (not app.holding_cocktail and not app.drunk_active
+                and _player_can_interact(app.player, [self.bar], INTERACT_NEAR_PX))
+
+    def interact(self, app, event):
+        if self.near_table(app) is not None:
+            super().interact(app, event)
+        # Top-left: Bar stand (cocktail)
+        elif self.can_order(app) and app.tokens >= self.COCKTAIL_COST:
+            app.tokens -= self.COCKTAIL_COST
+            app.holding_cocktail = True
+            app.cocktail_timer = 0.0
+
+    def exit(self, app):
+        # Ensure disco stops if we leave lobby2 while it is playing.
+        self.leave_music()
+
+    def back(self, app):
+        app.switch("game")
+        app.player = Player((BASE_WIDTH - 80, BASE_HEIGHT // 2))
+
+    def update(self, app, dt):
+        player = self.move_player(app, dt)
+
+        # Check if player is on the dancefloor (top-right corner)
+        on_dancefloor = self.dancefloor.collidepoint(player.x, player.y)
+        player.set_dancing(on_dancefloor)
+
+        # Handle disco music and ball when entering/leaving dancefloor
+        if on_dancefloor and not self.was_on_dancefloor:
+            # Just entered dancefloor - start disco!
+            self.disco_ball_lowering = True
+            self.disco_ball_y = -100
+            self.enter_music()
+        elif not on_dancefloor and self.was_on_dancefloor:
+            # Just left dancefloor - stop disco
+            self.disco_ball_lowering = False
+            self.disco_ball_y = -100
+            self.leave_music()
+        self.was_on_dancefloor = on_dancefloor
+
+        # Animate disco ball lowering (dt-based animation)
+        if self.disco_ball_lowering:
+            if self.disco_ball_y < self.disco_ball_target_y:
+                self.disco_ball_y += 150 * dt  # Lower at 150 pixels per second
+            else:
+                self.disco_ball_y = self.disco_ball_target_y
+
+        self.disco_ray_timer += dt
+        if on_dancefloor:
+            if self.disco_ball_gif is not None:
+                self.disco_ball_gif.update(dt)
+            # Disco color flash effect
+            self.disco_flash_timer += dt
+            if self.disco_flash_timer >= 0.15:  # Flash every 0.15 seconds
+                self.disco_flash_timer = 0.0
+                self.disco_flash_index = (self.disco_flash_index + 1) % len(self.disco_flash_colors)
+            self.flash_stage.color = self.disco_flash_colors[self.disco_flash_index]
+
+        # Check if player goes to left edge -> back to lobby1
+        if player.x < ZONE_WIDTH:
+            player.set_dancing(False)  # Stop dancing when leaving
+            app.switch("game")
+            app.player = Player((BASE_WIDTH - 80, BASE_HEIGHT // 2))
+            return
+        self.prewarm_near_tables(app)
+
+    def draw(self, app, surface):
+        self.draw_background(surface, (60, 40, 80))
+        player = app.player
+        if player is None:
+            return
+
+        # Draw disco light rays when on dancefloor
+        if self.was_on_dancefloor:
+            # Draw colorful light rays from disco ball position
+            ball_center_x = self.dancefloor.centerx
+            ball_center_y = int(self.disco_ball_y) + 50  # Center of ball
+
+            # 12 semi-transparent rays rotating 2 radians per second.
+            # They are blended straight onto the canvas (no temporary
+            # full-screen surfaces), see `DiscoLights` in disco.py.
+            self.disco_lights.draw_rays(surface, (ball_center_x, ball_center_y), self.disco_ray_timer)
+
+            # Draw disco ball
+            if self.disco_ball_gif is not None:
+                ball_x = ball_center_x - 50
+                ball_y = int(self.disco_ball_y)
+                self.disco_ball_gif.draw(surface, (ball_x, ball_y))
+
+                # Draw string from top to disco ball
+                pygame.draw.line(surface, (100, 100, 100), (ball_center_x, 0), (ball_center_x, ball_y), 2)
+
+        player.draw(surface)
+
+        # Draw cocktail when holding
+        if app.holding_cocktail and self.cocktail_img is not None:
+            cocktail_x = int(player.x + 15 if player._facing_right else player.x - 15 - 40)
+            cocktail_y = int(player.y - 10)
+            surface.blit(self.cocktail_img, (cocktail_x, cocktail_y))
+
+        _draw_token_counter(surface, app.tokens)
+
+        # Show 'E' popup when near a table or the bar
+        if self.near_table(app) is not None or self.can_order(app):
+            _draw_interact_popup(surface, player)
+
+        # Show dancefloor hint when on it
+        if self.was_on_dancefloor:
+            dance_hint = fonts.render(FONT_TIP, "~ DANCEFLOOR ~", True, (255, 100, 255))
+            dance_rect = dance_hint.get_rect(center=(self.dancefloor.centerx, self.dancefloor.bottom + 20))
+            surface.blit(dance_hint, dance_rect)
+
+        if not self.dancing:
+            self.draw_back_hint(surface)
+
+    def draw_back_hint(self, surface):
+        # Show arrow hint to go back
+        hint_surf = fonts.render(FONT_TIP, "< Back to Lobby 1", True, (200, 200, 200))
+        surface.blit(hint_surf, (10, BASE_HEIGHT // 2 - 10))
+
+
+async def main(frame_hook: Optional[Callable[[dict], None]] = None):
     # This `main()` is async for pygbag/browser compatibility.
     # On desktop pygame you typically see a normal `def main():`.
+    #
+    # `frame_hook` is optional and only used by tools such as `benchmark.py`:
+    # when given, it is called once at the end of every frame with a small dict
+    # describing the current scene, player and mini-game states.
+
+    # Initialize pygame.
+    # - `pygame.init()` initializes the core modules (display, time, etc.)
+    # - `pygame.mixer.init()` initializes the audio mixer (music/sfx playback)
+    pygame.init()
+    pygame.mixer.init()
+
+    # Load saved settings from settings.json (or defaults if missing).
+    saved_settings = _load_settings()
+
+    # Scenes (a.k.a. a simple state machine), see scenes.py. `app.scene` is the
+    # active one; `app.switch("roulette")` makes another one active. The
+    # mini-games register themselves the first time they're needed.
+    registry = scenes.SceneRegistry()
+    app = CasinoApp(registry, (BASE_WIDTH, BASE_HEIGHT), FONT, saved_settings.get("music_volume", 100),
+                    state_pool=StatePool(max_bytes=STATE_POOL_MAX_MB * 1024 * 1024),
+                    scheduler=Scheduler(budget_ms=SCHEDULER_BUDGET_MS))
 
-    # Scenes (a.k.a. a simple state machine). `scene` decides what input/update/draw
-    # logic runs. Switching scenes is done by assigning a new string.
-    # Examples: "menu" / "loading" / "game" / "roulette" / "settings" / ...
-    scene = "menu"
-    player: Player | None = None
-
-    loading_elapsed = 0.0
-    # Each mini-game owns its own state dictionary.
-    # When you enter the scene we typically initialize it with {"tokens": tokens}.
-    roulette_state = {}  # State for roulette game
-    slotmachine_state = {}
-    luckywheel_state = {}  # State for lucky wheel game
-    blackjack_state = {}  # State for blackjack game
-    higherlower_state = {}  # State for higher/lower game
-    horsegame_state = {}  # State for horse racing game
-
-    # Cocktail/Drunk effect state
-    # These variables are classic "game state": timers and flags updated every frame.
-    holding_cocktail = False
-    cocktail_timer = 0.0
-    drunk_active = False
-    drunk_timer = 0.0
     drunk_duration = 5.0  # 5 seconds of drunk effect
     cocktail_hold_duration = 1.0  # Hold cocktail for 1 second before drunk
-    
-    # Dancefloor disco state
-    # The disco effect is a mix of:
-    # - state flags (was_on_dancefloor)
-    # - animation variables (disco_ball_y, timers)
-    # - music mode switching (see _enter/_leave_dancefloor_music)
-    was_on_dancefloor = False
-    disco_ball_y = -100  # Start above screen
-    disco_ball_target_y = BASE_HEIGHT // 2 - 50
-    disco_ball_lowering = False
-    disco_ray_timer = 0.0
-    disco_music_playing = False
-    disco_flash_timer = 0.0
-    disco_flash_index = 0
     disco_pulse_timer = 0.0
-    disco_flash_colors = [
-        (255, 50, 50),    # Red
-        (50, 255, 50),    # Green
-        (50, 50, 255),    # Blue
-        (255, 255, 50),   # Yellow
-        (255, 50, 255),   # Magenta
-        (50, 255, 255),   # Cyan
-        (255, 150, 50),   # Orange
-        (150, 50, 255),   # Purple
-    ]
+
+    # Post-processing pipeline (see postfx.py). Stages run in this order and
+    # can be combined (drunk while dancing), all using the same reused buffers.
+    postfx = PostFX((BASE_WIDTH, BASE_HEIGHT))
+    # Semi-transparent disco color flash + the pulse zoom (1.0 .. 1.05).
+    disco_flash_stage = postfx.add_stage(TintStage("disco_flash", DISCO_COLORS[0], 40), scenes={"lobby2"})
+    # The "< Back to Lobby 1" hint goes on top of the flash (see Lobby2Scene).
+    disco_hint_stage = postfx.add_stage(DrawStage("disco_hint"), scenes={"lobby2"})
+    disco_pulse_stage = postfx.add_stage(PulseZoomStage("disco_pulse"), scenes={"lobby2"})
+    # Drunk wave: rows shift by up to 8 px (amplitude), 0.03 = how tight the
+    # waves are, 5 = animation speed. Then a green tint (0, 100, 0) at alpha 70.
+    drunk_wave_stage = postfx.add_stage(WaveStage(
+        "drunk_wave",
+        DisplacementEffect((BASE_WIDTH, BASE_HEIGHT), row_amplitude=8, row_frequency=0.03, speed=5),
+    ))
+    drunk_tint_stage = postfx.add_stage(TintStage("drunk_tint", (0, 100, 0), 70))
 
     # Token currency system
-    # `tokens` is the shared currency across the hub and mini-games.
-    tokens = 100  # Starting tokens
+    # `app.tokens` is the shared currency across the hub and mini-games.
     token_timer = 0.0  # Timer for passive token income (25 tokens per minute)
 
-    # Lobby 2: Bar/cocktail price
-    COCKTAIL_COST = 10
-    
-    # Load saved settings from settings.json (or defaults if missing).
-    saved_settings = _load_settings()
-    music_volume = saved_settings.get("music_volume", 100)  # 0-100
-
     # `window` is the actual OS window (can be resized/fullscreen).
     # `canvas` is where we *actually draw* each frame at BASE_WIDTH/BASE_HEIGHT.
     window = pygame.display.set_mode((BASE_WIDTH, BASE_HEIGHT), pygame.RESIZABLE)
@@ -463,14 +804,11 @@ async def main():
     canvas = pygame.Surface((BASE_WIDTH, BASE_HEIGHT))
     is_fullscreen = False
 
-    menu_bg = None
-    lobby_bg = None
-    lobby2_bg = None
     try:
         base_dir = str(Path(__file__).resolve().parent)
     except:
         base_dir = str(Path.cwd())
-    
+
     # Music playlist system
     # pygame has two audio concepts:
     # - `pygame.mixer.music` for streaming background music
@@ -478,8 +816,14 @@ async def main():
     music_tracks = ["bgm1.mp3", "bgm2.mp3", "bgm3.mp3", "bgm4.mp3", "bgm5.mp3", "bgm6.mp3", "bgm7.mp3"]
     current_track = None
     music_mode = "bgm"  # "bgm" (random playlist) or "disco" (dancefloor)
-    
+
     def play_random_track():
+        # Opening a music file takes a few milliseconds, so it runs as a
+        # scheduler job after the current frame is shown (see scheduler.py).
+        # A newer music request replaces one that hasn't run yet.
+        app.scheduler.add("music", call_job(_play_random_track_now))
+
+    def _play_random_track_now():
         nonlocal current_track
         # Nested function + `nonlocal`:
         # `play_random_track()` is defined inside `main()` so it can share variables
@@ -502,11 +846,11 @@ async def main():
             except Exception:
                 pass
             pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(music_volume / 100.0)
+            pygame.mixer.music.set_volume(app.music_volume / 100.0)
             pygame.mixer.music.play()  # Play once, then we'll pick another
         except Exception as e:
             print(f"Could not load music {next_track}: {e}")
-    
+
     # Set up music end event.
     # pygame can post a custom event when the current music track ends, which lets
     # us start the next random track in the playlist.
@@ -514,15 +858,21 @@ async def main():
     pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
 
     def _enter_dancefloor_music() -> None:
-        nonlocal music_mode, disco_music_playing
+        nonlocal music_mode
         # Switch the audio system into a special "disco" mode (looping track).
-        # Note: we clear MUSIC_END_EVENT so old queued events don't fight us.
         if music_mode == "disco":
             return
         if not disco_music_tracks:
             return
         music_mode = "disco"
-        disco_music_playing = True
+        # Loaded like the playlist tracks: as a job, after this frame.
+        app.scheduler.add("music", call_job(_play_disco_track_now))
+
+    def _play_disco_track_now() -> None:
+        nonlocal music_mode
+        # Note: we clear MUSIC_END_EVENT so old queued events don't fight us.
+        if music_mode != "disco":
+            return  # left the dancefloor before this job ran
         try:
             # Prevent any queued end events (from bgm) from restarting playlist music.
             try:
@@ -539,23 +889,21 @@ async def main():
             # Randomly pick a disco track
             disco_track = random.choice(disco_music_tracks)
             pygame.mixer.music.load(disco_track)
-            pygame.mixer.music.set_volume(music_volume / 100.0)
+            pygame.mixer.music.set_volume(app.music_volume / 100.0)
             pygame.mixer.music.play(-1)  # Loop forever
         except Exception as e:
             print(f"Could not play disco music: {e}")
             # Fall back to bgm mode if disco couldn't start.
-            disco_music_playing = False
             music_mode = "bgm"
             pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
             play_random_track()
 
     def _leave_dancefloor_music() -> None:
-        nonlocal music_mode, disco_music_playing
+        nonlocal music_mode
         # Return from disco mode back to normal playlist (bgm mode).
         if music_mode != "disco":
             return
         music_mode = "bgm"
-        disco_music_playing = False
         try:
             pygame.mixer.music.stop()
         except Exception:
@@ -567,10 +915,15 @@ async def main():
         except Exception:
             pass
         play_random_track()
-    
+
+    def _set_music_volume(volume: int) -> None:
+        app.music_volume = volume
+        pygame.mixer.music.set_volume(volume / 100.0)
+        _save_settings({"music_volume": volume})
+
     # Start playing first random track
     play_random_track()
-    
+
     # Tables are defined as pygame.Rects.
     # Rects are used for:
     # - "interaction zones" (are you near it?)
@@ -580,7 +933,7 @@ async def main():
     TABLE_WIDTH = 370
     TABLE_HEIGHT = 250
     TABLE_MARGIN = 0
-    
+
     # Top-left: Slot Machines
     table_slots = pygame.Rect(TABLE_MARGIN, TABLE_MARGIN, TABLE_WIDTH, TABLE_HEIGHT)
     # Top-right: Blackjack
@@ -589,48 +942,86 @@ async def main():
     table_roulette = pygame.Rect(TABLE_MARGIN, BASE_HEIGHT - TABLE_MARGIN - TABLE_HEIGHT, TABLE_WIDTH, TABLE_HEIGHT)
     # Bottom-right: Lucky Wheel
     table_wheel = pygame.Rect(BASE_WIDTH - TABLE_MARGIN - TABLE_WIDTH, BASE_HEIGHT - TABLE_MARGIN - TABLE_HEIGHT, TABLE_WIDTH, TABLE_HEIGHT)
-    
-    # All tables for collision/rendering
-    all_tables = [table_slots, table_blackjack, table_roulette, table_wheel]
-    interact_near_px = 22.0
-    
+
+    # Lobby 2 tables (same size/positions as lobby 1)
+    lobby2_table_topleft = pygame.Rect(TABLE_MARGIN, TABLE_MARGIN, TABLE_WIDTH, TABLE_HEIGHT)
+    lobby2_table_topright = pygame.Rect(BASE_WIDTH - TABLE_MARGIN - TABLE_WIDTH, TABLE_MARGIN, TABLE_WIDTH, TABLE_HEIGHT)
+    lobby2_table_bottomleft = pygame.Rect(TABLE_MARGIN, BASE_HEIGHT - TABLE_MARGIN - TABLE_HEIGHT, TABLE_WIDTH, TABLE_HEIGHT)
+    lobby2_table_bottomright = pygame.Rect(BASE_WIDTH - TABLE_MARGIN - TABLE_WIDTH, BASE_HEIGHT - TABLE_MARGIN - TABLE_HEIGHT, TABLE_WIDTH, TABLE_HEIGHT)
+
+    # Backgrounds are decoded once and pre-scaled to the fixed canvas size by the
+    # shared AssetManager. Scaling a 1536x1024 image every frame was one of the
+    # most expensive things the main loop did, and the canvas size never changes.
+    canvas_size = (BASE_WIDTH, BASE_HEIGHT)
     try:
-        menu_bg_path = os.path.join(base_dir, "assets", "img", "mainmenu.png")
-        menu_bg = pygame.image.load(menu_bg_path).convert_alpha()
-        # Remove fixed scaling here
+        menu_bg = ASSETS.scaled("img/mainmenu.png", canvas_size)
     except Exception:
         menu_bg = None
+    preload_background(canvas_size)
+
+    # Everything the loading scene and the lobbies need. Which mini-game each
+    # table opens is listed here too, so its module can be imported while the
+    # player is still walking up to it (see scenes.py).
+    preloader = Preloader()
+    registry.register(MenuScene(menu_bg))
+    registry.register(SettingsScene(menu_bg, _set_music_volume))
+    registry.register(LoadingScene(preloader))
+    lobby = registry.register(LobbyScene([
+        (table_roulette, "roulette"),
+        (table_slots, "slotmachine"),
+        (table_wheel, "luckywheel"),
+        (table_blackjack, "blackjack"),
+    ]))
+    lobby2 = registry.register(Lobby2Scene(
+        [(lobby2_table_bottomright, "higherlower"), (lobby2_table_bottomleft, "horsegame")],
+        bar=lobby2_table_topleft,
+        dancefloor=lobby2_table_topright,
+        enter_music=_enter_dancefloor_music,
+        leave_music=_leave_dancefloor_music,
+        flash_stage=disco_flash_stage,
+        hint_stage=disco_hint_stage,
+    ))
+
+    # The lobby images are loaded behind the "Game loading..." screen (see the
+    # preloader below), so starting the game only has to load the menu.
+    def _load_lobby_assets():
+        try:
+            lobby.background = ASSETS.scaled("img/lobby-bg.png", canvas_size)
+        except Exception:
+            lobby.background = None
+
+        try:
+            lobby2.background = ASSETS.scaled("img/bg2 (2).png", canvas_size)
+        except Exception:
+            lobby2.background = None
+
+        # Load cocktail image
+        try:
+            lobby2.cocktail_img = ASSETS.scaled("img/cocktail.png", (40, 40))
+        except Exception:
+            lobby2.cocktail_img = None
+
+        # The disco ball GIF is decoded a frame at a time (a scheduler job);
+        # lobby 2 simply has no ball until it's done.
+        app.scheduler.add("discoball", _load_disco_ball())
+
+    def _load_disco_ball():
+        try:
+            lobby2.disco_ball_gif = yield from ASSETS.gif_steps("img/discoball.gif", size=(100, 100))
+        except Exception as e:
+            print(f"Could not load disco ball: {e}")
+            lobby2.disco_ball_gif = None
+
+    # Everything the lobby and the tables need the first time, done while the
+    # loading screen is up instead of when you walk up to a table.
+    preloader.add_images(find_images("img"))
+    preloader.add_task(_load_lobby_assets)
+    if PREFETCH_TABLES_WHILE_LOADING:
+        for task in _table_warmups(app, canvas_size):
+            preloader.add_task(task)
+    # The worker threads start decoding right away, while the menu is shown.
+    preloader.start()
 
-    try:
-        lobby_bg_path = os.path.join(base_dir, "assets", "img", "lobby-bg.png")
-        lobby_bg = pygame.image.load(lobby_bg_path).convert_alpha()
-    except Exception:
-        lobby_bg = None
-    
-    try:
-        lobby2_bg_path = os.path.join(base_dir, "assets", "img", "bg2 (2).png")
-        lobby2_bg = pygame.image.load(lobby2_bg_path).convert_alpha()
-    except Exception:
-        lobby2_bg = None
-    
-    # Load cocktail image
-    cocktail_img = None
-    try:
-        cocktail_path = os.path.join(base_dir, "assets", "img", "cocktail.png")
-        cocktail_img = pygame.image.load(cocktail_path).convert_alpha()
-        cocktail_img = pygame.transform.smoothscale(cocktail_img, (40, 40))
-    except Exception:
-        cocktail_img = None
-    
-    # Load disco ball animated GIF
-    disco_ball_gif = None
-    try:
-        disco_ball_path = os.path.join(base_dir, "assets", "img", "discoball.gif")
-        disco_ball_gif = GIFImage(disco_ball_path, size=(100, 100))
-    except Exception as e:
-        print(f"Could not load disco ball: {e}")
-        disco_ball_gif = None
-    
     # Load disco music tracks (randomly pick one when entering dancefloor)
     disco_music_tracks = []
     try:
@@ -646,116 +1037,71 @@ async def main():
             print(f"Disco music file not found: {track2}")
     except Exception as e:
         print(f"Error setting disco music paths: {e}")
-    
-    # Transition zones between lobbies
-    ZONE_WIDTH = 60
-    
-    # Lobby 2 tables (same size/positions as lobby 1)
-    lobby2_table_topleft = pygame.Rect(TABLE_MARGIN, TABLE_MARGIN, TABLE_WIDTH, TABLE_HEIGHT)
-    lobby2_table_topright = pygame.Rect(BASE_WIDTH - TABLE_MARGIN - TABLE_WIDTH, TABLE_MARGIN, TABLE_WIDTH, TABLE_HEIGHT)
-    lobby2_table_bottomleft = pygame.Rect(TABLE_MARGIN, BASE_HEIGHT - TABLE_MARGIN - TABLE_HEIGHT, TABLE_WIDTH, TABLE_HEIGHT)
-    lobby2_table_bottomright = pygame.Rect(BASE_WIDTH - TABLE_MARGIN - TABLE_WIDTH, BASE_HEIGHT - TABLE_MARGIN - TABLE_HEIGHT, TABLE_WIDTH, TABLE_HEIGHT)
-    lobby2_tables = [lobby2_table_topleft, lobby2_table_topright, lobby2_table_bottomleft, lobby2_table_bottomright]
-
-    btn_width, btn_height = 200, 60
-    spacing = 40
-    start_btn_x = (BASE_WIDTH - (btn_width * 3 + spacing * 2)) // 2
-    start_btn = Button(pygame.Rect(start_btn_x, 475, btn_width, btn_height), "Start game")
-    settings_btn = Button(pygame.Rect(start_btn_x + btn_width + spacing, 475, btn_width, btn_height), "Settings")
-    leave_btn = Button(pygame.Rect(start_btn_x + (btn_width + spacing) * 2, 475, btn_width, btn_height), "Leave")
-    
-    # Settings UI
-    settings_panel_rect = pygame.Rect(BASE_WIDTH // 2 - 200, BASE_HEIGHT // 2 - 120, 400, 240)
-    volume_slider = Slider(pygame.Rect(settings_panel_rect.left + 50, settings_panel_rect.centery, 300, 20), 0, 100, music_volume)
-    back_btn = Button(pygame.Rect(settings_panel_rect.centerx - 75, settings_panel_rect.bottom - 70, 150, 50), "Back")
-    
-    def is_near_table(p: Player | None, table: pygame.Rect) -> bool:
-        # Wrapper around the distance check used for "Press E" prompts.
-        if p is None:
-            return False
-        return _circle_rect_distance(p.x, p.y, table) <= interact_near_px
-
-    running = True
-    while running:
+
+    # Performance overlay (F3). It always measures (that is cheap), but only
+    # draws itself and writes a CSV on exit when it has been opened.
+    perf_hud = PerfHUD()
+
+    app.switch("menu")
+    while app.running:
         # `dt` is "delta time": seconds since last frame.
         # Use dt when updating movement/timers so the game speed is consistent,
         # even if the frame rate changes.
         dt = CLOCK.tick(60) / 1000.0
-        
+        # Start measuring *after* tick(), so the time spent waiting for the
+        # next frame isn't counted as work.
+        perf_hud.begin_frame()
+        fonts.TEXT_CACHE.new_frame()
+
         # Passive token income: 25 tokens every 60 seconds (works in ALL scenes)
         # This is a common game-dev pattern: accumulate dt into a timer, and when it
         # passes a threshold, do the periodic action and subtract the threshold.
         token_timer += dt
         if token_timer >= 60.0:
-            tokens += 25
+            # Also updates the active mini-game's state, so income isn't lost
+            app.add_tokens(25)
             token_timer -= 60.0
 
-            # Also update active scene state, so income isn't lost
-            if scene == "roulette" and "tokens" in roulette_state:
-                roulette_state["tokens"] = roulette_state.get("tokens", 0) + 25
-            if scene == "slotmachine" and "tokens" in slotmachine_state:
-                slotmachine_state["tokens"] = slotmachine_state.get("tokens", 0) + 25
-            if scene == "luckywheel" and "tokens" in luckywheel_state:
-                luckywheel_state["tokens"] = luckywheel_state.get("tokens", 0) + 25
-            if scene == "blackjack" and "tokens" in blackjack_state:
-                blackjack_state["tokens"] = blackjack_state.get("tokens", 0) + 25
-            if scene == "higherlower" and "tokens" in higherlower_state:
-                higherlower_state["tokens"] = higherlower_state.get("tokens", 0) + 25
-
         # Update cocktail/drunk timers
         # Timers are just floats in seconds that count up via dt.
-        if holding_cocktail:
-            cocktail_timer += dt
-            if cocktail_timer >= cocktail_hold_duration:
-                holding_cocktail = False
-                drunk_active = True
-                drunk_timer = 0.0
-        
-        if drunk_active:
-            drunk_timer += dt
-            if drunk_timer >= drunk_duration:
-                drunk_active = False
+        if app.holding_cocktail:
+            app.cocktail_timer += dt
+            if app.cocktail_timer >= cocktail_hold_duration:
+                app.holding_cocktail = False
+                app.drunk_active = True
+                app.drunk_timer = 0.0
+
+        if app.drunk_active:
+            app.drunk_timer += dt
+            if app.drunk_timer >= drunk_duration:
+                app.drunk_active = False
 
         # Mouse position from pygame is in *window pixel* coordinates.
         # We map it back to our fixed 900x600 canvas coordinates for UI hit-testing.
         window_mouse_pos = pygame.mouse.get_pos()
         mouse_pos = _window_to_canvas_pos(window_mouse_pos, window.get_size())
-        if mouse_pos is None:
-            mouse_pos = (-1, -1)
+        app.mouse_pos = mouse_pos if mouse_pos is not None else (-1, -1)
 
         # EVENT LOOP
         # pygame collects input/window events. You must poll them each frame.
         # If you don't, the OS can consider your app unresponsive.
+        # A few keys work everywhere; everything else goes to the active scene.
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                running = False
-
-            # Cheat: Ctrl+P gives +1000 tokens.
-            # We update both the shared `tokens` and the active mini-game state (if any)
-            # so the UI stays consistent even while inside a mini-game scene.
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_p and (event.mod & pygame.KMOD_CTRL):
-                tokens += 1000
-                if scene == "roulette" and "tokens" in roulette_state:
-                    roulette_state["tokens"] = roulette_state.get("tokens", 0) + 1000
-                elif scene == "slotmachine" and "tokens" in slotmachine_state:
-                    slotmachine_state["tokens"] = slotmachine_state.get("tokens", 0) + 1000
-                elif scene == "luckywheel" and "tokens" in luckywheel_state:
-                    luckywheel_state["tokens"] = luckywheel_state.get("tokens", 0) + 1000
-                elif scene == "blackjack" and "tokens" in blackjack_state:
-                    blackjack_state["tokens"] = blackjack_state.get("tokens", 0) + 1000
-                elif scene == "higherlower" and "tokens" in higherlower_state:
-                    higherlower_state["tokens"] = higherlower_state.get("tokens", 0) + 1000
-                elif scene == "horsegame" and "tokens" in horsegame_state:
-                    horsegame_state["tokens"] = horsegame_state.get("tokens", 0) + 1000
-            
+                app.running = False
+
+            # Cheat: Ctrl+P gives +1000 tokens (also inside a mini-game).
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_p and (event.mod & pygame.KMOD_CTRL):
+                app.add_tokens(1000)
+
             # Play next random track when current one ends
-            if event.type == MUSIC_END_EVENT:
+            elif event.type == MUSIC_END_EVENT:
                 if music_mode == "bgm":
                     play_random_track()
 
             # Fullscreen toggle (F11 or Alt+Enter): recreate the display surface.
             # Note: changing display mode returns a *new* window surface.
-            if event.type == pygame.KEYDOWN and (
+            elif event.type == pygame.KEYDOWN and (
                 event.key == pygame.K_F11
                 or (event.key == pygame.K_RETURN and (event.mod & pygame.KMOD_ALT))
             ):
@@ -767,539 +1113,100 @@ async def main():
                     window = pygame.display.set_mode((BASE_WIDTH, BASE_HEIGHT), pygame.RESIZABLE)
                 pygame.display.set_caption("Merge Casino")
 
+            # F3 toggles the performance overlay.
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                perf_hud.toggle()
+
             # ESC is used as "back".
             # Each scene decides what ESC means (return to lobby, reset state, etc.).
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                if scene == "settings":
-                    scene = "menu"
-                elif scene == "testscene":
-                    scene = "game"
-                elif scene == "roulette":
-                    scene = "game"
-                    roulette_state = {}
-                elif scene == "slotmachine":
-                    scene = "game"
-                    slotmachine_state = {}
-                elif scene == "luckywheel":
-                    scene = "game"
-                    luckywheel_state = {}
-                elif scene == "blackjack":
-                    scene = "game"
-                    blackjack_state = {}
-                elif scene == "higherlower":
-                    scene = "lobby2"
-                    player = Player((BASE_WIDTH - 80, BASE_HEIGHT - 80))
-                    higherlower_state = {}
-                elif scene == "horsegame":
-                    scene = "lobby2"
-                    player = Player((80, BASE_HEIGHT - 80))
-                    horsegame_state = {}
-                elif scene == "lobby2":
-                    # Ensure disco stops if we leave lobby2 while it is playing.
-                    _leave_dancefloor_music()
-                    scene = "game"
-                    player = Player((BASE_WIDTH - 80, BASE_HEIGHT // 2))
-                elif scene in ("game", "loading"):
-                    scene = "menu"
-                    player = None
-                    loading_elapsed = 0.0
-
-            # "E" is the interact key in the hub scenes.
-            # If you're near a table rect, we switch `scene` and create that game's state.
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_e:
-                if scene == "game":
-                    if is_near_table(player, table_roulette):
-                        scene = "roulette"
-                        roulette_state = {"tokens": tokens}
-                    elif is_near_table(player, table_slots):
-                        scene = "slotmachine"
-                        slotmachine_state = {"tokens": tokens}
-                    elif is_near_table(player, table_wheel):
-                        scene = "luckywheel"
-                        luckywheel_state = {"tokens": tokens}
-                    elif is_near_table(player, table_blackjack):
-                        scene = "blackjack"
-                        blackjack_state = {"tokens": tokens}
-                elif scene == "lobby2":
-                    # Bottom-right: Higher or Lower
-                    if is_near_table(player, lobby2_table_bottomright):
-                        scene = "higherlower"
-                        higherlower_state = {"tokens": tokens}
-                    # Bottom-left: Horse Racing
-                    elif is_near_table(player, lobby2_table_bottomleft):
-                        scene = "horsegame"
-                        horsegame_state = {"tokens": tokens}
-                    # Top-left: Bar stand (cocktail)
-                    elif is_near_table(player, lobby2_table_topleft) and not holding_cocktail and not drunk_active:
-                        if tokens >= COCKTAIL_COST:
-                            tokens -= COCKTAIL_COST
-                            holding_cocktail = True
-                            cocktail_timer = 0.0
-
-            # Smoke emote in lobby (B key)
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_b:
-                if scene in ("game", "lobby2") and player is not None:
-                    player.trigger_emote()
-
-            # Roulette controls
-            if event.type == pygame.KEYDOWN and scene == "roulette":
-                # First check if number input is handling the key
-                roulette_state = handle_roulette_keypress(roulette_state, event)
-                # Only process other keys if number input is not active
-                if not roulette_state.get("number_input_active", False):
-                    if event.key == pygame.K_SPACE:
-                        roulette_state = spin_roulette(roulette_state)
-                    elif event.key == pygame.K_r:
-                        roulette_state = reset_roulette(roulette_state)
-                    elif event.key == pygame.K_1:
-                        roulette_state = change_bet_amount(roulette_state, False)  # Decrease
-                    elif event.key == pygame.K_2:
-                        roulette_state = change_bet_amount(roulette_state, True)   # Increase
-                    elif event.key == pygame.K_q:
-                        roulette_state = change_bet_type(roulette_state, "red")
-                    elif event.key == pygame.K_w:
-                        roulette_state = change_bet_type(roulette_state, "black")
-                    elif event.key == pygame.K_e:
-                        roulette_state = change_bet_type(roulette_state, "green")
-                    elif event.key == pygame.K_a:
-                        roulette_state = change_bet_type(roulette_state, "odd")
-                    elif event.key == pygame.K_s:
-                        roulette_state = change_bet_type(roulette_state, "even")
-
-            # Slotmachine controls
-            if event.type == pygame.KEYDOWN and scene == "slotmachine":
-                if event.key == pygame.K_SPACE:
-                    slotmachine_state = spin_slotmachine(slotmachine_state)
-
-            # Lucky wheel controls
-            if event.type == pygame.KEYDOWN and scene == "luckywheel":
-                if event.key == pygame.K_SPACE:
-                    luckywheel_state = spin_luckywheel(luckywheel_state)
-
-            # Blackjack controls
-            if event.type == pygame.KEYDOWN and scene == "blackjack":
-                blackjack_state = handle_blackjack_keypress(blackjack_state, event.key)
-
-            # Higher/Lower controls
-            if event.type == pygame.KEYDOWN and scene == "higherlower":
-                higherlower_state = handle_higherlower_keypress(higherlower_state, event.key)
-
-            # Horse Racing controls
-            if event.type == pygame.KEYDOWN and scene == "horsegame":
-                horsegame_state = handle_horsegame_keypress(horsegame_state, event.key)
-
-            # Settings slider event handling
-            if scene == "settings":
-                # UI widgets often need to see raw events so they can manage dragging.
-                if volume_slider.handle_event(event, mouse_pos):
-                    music_volume = volume_slider.value
-                    pygame.mixer.music.set_volume(music_volume / 100.0)
-                    _save_settings({"music_volume": music_volume})
-
-            # Menu/scene mouse clicks
-            # We route the click to the active scene; this keeps scenes isolated.
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if scene == "menu":
-                    if start_btn.handle_click(mouse_pos):
-                        scene = "loading"
-                        loading_elapsed = 0.0
-                    elif settings_btn.handle_click(mouse_pos):
-                        scene = "settings"
-                        volume_slider.value = music_volume  # Sync slider with current volume
-                    elif leave_btn.handle_click(mouse_pos):
-                        running = False
-                elif scene == "settings":
-                    if back_btn.handle_click(mouse_pos):
-                        scene = "menu"
-                elif scene == "roulette":
-                    roulette_state = handle_roulette_click(roulette_state, mouse_pos)
-                elif scene == "slotmachine":
-                    btn = slotmachine_state.get("button_rect")
-                    lever = slotmachine_state.get("handle_rect")
-                    if (isinstance(btn, pygame.Rect) and btn.collidepoint(mouse_pos)) or (
-                        isinstance(lever, pygame.Rect) and lever.collidepoint(mouse_pos)
-                    ):
-                        slotmachine_state = spin_slotmachine(slotmachine_state)
-                elif scene == "luckywheel":
-                    btn = luckywheel_state.get("button_rect")
-                    if isinstance(btn, pygame.Rect) and btn.collidepoint(mouse_pos):
-                        luckywheel_state = spin_luckywheel(luckywheel_state)
-                elif scene == "blackjack":
-                    blackjack_state = handle_blackjack_click(blackjack_state, mouse_pos)
-                elif scene == "higherlower":
-                    higherlower_state = handle_higherlower_click(higherlower_state, mouse_pos)
-                elif scene == "horsegame":
-                    horsegame_state = handle_horsegame_click(horsegame_state, mouse_pos)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                app.scene.back(app)
+
+            else:
+                app.scene.handle_event(app, event)
+
+        perf_hud.mark("events")
+
+        # UPDATE PHASE: move the active scene forward by `dt` (may switch scenes).
+        app.scene.update(app, dt)
+
+        perf_hud.mark("update")
 
         # DRAW PHASE
         # The common pygame pattern is: clear -> draw background -> draw entities/UI.
         canvas.fill(BG)
+        app.scene.draw(app, canvas)
 
-        # Get current window size for scaling backgrounds.
-        # (Note: we still draw on a fixed-size canvas; window size mainly matters
-        # for the final present step and for mapping mouse coordinates.)
-        win_w, win_h = window.get_size()
-
-        if scene == "menu":
-            if menu_bg is not None:
-                # Stretch background to window size of the canvas
-                stretched_bg = pygame.transform.smoothscale(menu_bg, (BASE_WIDTH, BASE_HEIGHT))
-                canvas.blit(stretched_bg, (0, 0))
-            else:
-                canvas.fill(BG)
-            rainbow_time = pygame.time.get_ticks() / 1000.0  # Convert to seconds
-            draw_rainbow_text(canvas, "Main Menu", 200, font=FONT_TITLE, time_offset=rainbow_time)
-            start_btn.draw(canvas, mouse_pos)
-            settings_btn.draw(canvas, mouse_pos)
-            leave_btn.draw(canvas, mouse_pos)
-            draw_center_text(canvas, "Tip: ESC = go back (in games)", 580, font=FONT_TIP, color=(200, 200, 200))
-
-        elif scene == "settings":
-            if menu_bg is not None:
-                stretched_bg = pygame.transform.smoothscale(menu_bg, (BASE_WIDTH, BASE_HEIGHT))
-                canvas.blit(stretched_bg, (0, 0))
-            else:
-                canvas.fill(BG)
-            # Draw settings panel background
-            pygame.draw.rect(canvas, (35, 40, 50), settings_panel_rect, border_radius=16)
-            pygame.draw.rect(canvas, (60, 70, 90), settings_panel_rect, width=3, border_radius=16)
-            
-            # Title
-            title_surf = FONT.render("Settings", True, WHITE)
-            title_rect = title_surf.get_rect(centerx=settings_panel_rect.centerx, top=settings_panel_rect.top + 20)
-            canvas.blit(title_surf, title_rect)
-            
-            # Volume label
-            volume_label = FONT_SMALL.render("Music Volume", True, WHITE)
-            volume_label_rect = volume_label.get_rect(centerx=settings_panel_rect.centerx, top=settings_panel_rect.top + 70)
-            canvas.blit(volume_label, volume_label_rect)
-            
-            # Volume slider
-            volume_slider.draw(canvas, mouse_pos)
-            
-            # Volume percentage
-            volume_text = FONT_SMALL.render(f"{volume_slider.value}%", True, (180, 200, 255))
-            volume_text_rect = volume_text.get_rect(centerx=settings_panel_rect.centerx, top=volume_slider.rect.bottom + 10)
-            canvas.blit(volume_text, volume_text_rect)
-            
-            # Back button
-            back_btn.draw(canvas, mouse_pos)
-
-        elif scene == "loading":
-            # Loading scene: show a screen for a fixed time before entering the lobby.
-            loading_elapsed += dt
-            progress = min(loading_elapsed / LOADING_DURATION_SECONDS, 1.0)
-            draw_game_screen(canvas, title_font=FONT, hint_font=FONT_GAME_HINT, progress=progress, elapsed_time=loading_elapsed)
-            if loading_elapsed >= LOADING_DURATION_SECONDS:
-                scene = "game"
-                player = Player((BASE_WIDTH // 2, BASE_HEIGHT // 2))
-
-        elif scene == "roulette":
-            # Mini-game scenes draw themselves and return their updated state.
-            roulette_state = draw_roulette_scene(canvas, roulette_state, font=FONT)
-            tokens = roulette_state.get("tokens", tokens)  # Update tokens from roulette
-
-        elif scene == "slotmachine":
-            slotmachine_state = draw_slotmachine_scene(canvas, slotmachine_state, font=FONT)
-            tokens = slotmachine_state.get("tokens", tokens)
-
-        elif scene == "luckywheel":
-            luckywheel_state = draw_luckywheel_scene(canvas, luckywheel_state, font=FONT)
-            tokens = luckywheel_state.get("tokens", tokens)
-
-        elif scene == "blackjack":
-            blackjack_state = draw_blackjack_scene(canvas, blackjack_state, font=FONT)
-            tokens = blackjack_state.get("tokens", tokens)
-
-        elif scene == "higherlower":
-            higherlower_state = draw_higherlower_scene(canvas, higherlower_state, font=FONT)
-            tokens = higherlower_state.get("tokens", tokens)
-
-        elif scene == "horsegame":
-            horsegame_state = draw_horsegame_scene(canvas, horsegame_state, font=FONT)
-            tokens = horsegame_state.get("tokens", tokens)
-
-        elif scene == "lobby2":
-            # Second lobby with bg2 background
-            if lobby2_bg is not None:
-                stretched_bg = pygame.transform.smoothscale(lobby2_bg, (BASE_WIDTH, BASE_HEIGHT))
-                canvas.blit(stretched_bg, (0, 0))
-            else:
-                canvas.fill((60, 40, 80))
-
-            if player is None:
-                player = Player((80, BASE_HEIGHT // 2))
-
-            keys = pygame.key.get_pressed()
-            # Movement uses current key state (pressed or not), not discrete key events.
-            # This feels smoother for continuous movement.
-            player.update(dt, keys, canvas.get_rect(), obstacles=[])
-            
-            # Check if player is on the dancefloor (top-right corner)
-            on_dancefloor = lobby2_table_topright.collidepoint(player.x, player.y)
-            player.set_dancing(on_dancefloor)
-            
-            # Handle disco music and ball when entering/leaving dancefloor
-            if on_dancefloor and not was_on_dancefloor:
-                # Just entered dancefloor - start disco!
-                disco_ball_lowering = True
-                disco_ball_y = -100
-                _enter_dancefloor_music()
-            elif not on_dancefloor and was_on_dancefloor:
-                # Just left dancefloor - stop disco
-                disco_ball_lowering = False
-                disco_ball_y = -100
-                _leave_dancefloor_music()
-            
-            was_on_dancefloor = on_dancefloor
-            
-            # Animate disco ball lowering (dt-based animation)
-            if disco_ball_lowering:
-                if disco_ball_y < disco_ball_target_y:
-                    disco_ball_y += 150 * dt  # Lower at 150 pixels per second
-                else:
-                    disco_ball_y = disco_ball_target_y
-            
-            # Update disco ray timer
-            disco_ray_timer += dt
-            
-            # Draw disco light rays when on dancefloor
-            if on_dancefloor:
-                # Draw colorful light rays from disco ball position
-                disco_colors = [
-                    (255, 50, 50),    # Red
-                    (50, 255, 50),    # Green
-                    (50, 50, 255),    # Blue
-                    (255, 255, 50),   # Yellow
-                    (255, 50, 255),   # Magenta
-                    (50, 255, 255),   # Cyan
-                    (255, 150, 50),   # Orange
-                    (150, 50, 255),   # Purple
-                ]
-                ball_center_x = BASE_WIDTH - TABLE_MARGIN - TABLE_WIDTH // 2
-                ball_center_y = int(disco_ball_y) + 50  # Center of ball
-                
-                # Draw 12 rotating rays
-                num_rays = 12
-                ray_rotation = disco_ray_timer * 2  # Rotate 2 radians per second
-                for i in range(num_rays):
-                    angle = (2 * math.pi * i / num_rays) + ray_rotation
-                    ray_length = 600
-                    end_x = ball_center_x + int(math.cos(angle) * ray_length)
-                    end_y = ball_center_y + int(math.sin(angle) * ray_length)
-                    color = disco_colors[i % len(disco_colors)]
-                    
-                    # Draw semi-transparent ray using a surface.
-                    # `SRCALPHA` enables per-pixel alpha so the rays can be translucent.
-                    ray_surf = pygame.Surface((BASE_WIDTH, BASE_HEIGHT), pygame.SRCALPHA)
-                    pygame.draw.line(ray_surf, (*color, 80), (ball_center_x, ball_center_y), (end_x, end_y), 8)
-                    canvas.blit(ray_surf, (0, 0))
-                
-                # Draw disco ball
-                if disco_ball_gif is not None:
-                    disco_ball_gif.update(dt)
-                    ball_x = ball_center_x - 50
-                    ball_y = int(disco_ball_y)
-                    disco_ball_gif.draw(canvas, (ball_x, ball_y))
-                    
-                    # Draw string from top to disco ball
-                    pygame.draw.line(canvas, (100, 100, 100), (ball_center_x, 0), (ball_center_x, ball_y), 2)
-            
-            player.draw(canvas)
-            
-            # Draw cocktail when holding
-            if holding_cocktail and cocktail_img is not None:
-                cocktail_x = int(player.x + 15 if player._facing_right else player.x - 15 - 40)
-                cocktail_y = int(player.y - 10)
-                canvas.blit(cocktail_img, (cocktail_x, cocktail_y))
-            
-            # Check if player goes to left edge -> back to lobby1
-            if player.x < ZONE_WIDTH:
-                player.set_dancing(False)  # Stop dancing when leaving
-                _leave_dancefloor_music()
-                scene = "game"
-                player = Player((BASE_WIDTH - 80, BASE_HEIGHT // 2))
-
-            # Draw token counter
-            token_text = f"Tokens: {tokens}"
-            token_surf = FONT_SMALL.render(token_text, True, (255, 215, 0))
-            token_rect = token_surf.get_rect(midtop=(BASE_WIDTH // 2, 10))
-            pygame.draw.rect(canvas, (30, 30, 30), token_rect.inflate(20, 10), border_radius=8)
-            canvas.blit(token_surf, token_rect)
-            
-            # Show 'E' popup when near bottom-right table (Higher/Lower)
-            if is_near_table(player, lobby2_table_bottomright):
-                popup = pygame.Rect(0, 0, 26, 26)
-                popup.center = (int(player.x), int(player.y - (player.radius + 18)))
-                popup.clamp_ip(canvas.get_rect())
-                pygame.draw.rect(canvas, (20, 20, 25), popup, border_radius=4)
-                pygame.draw.rect(canvas, (255, 255, 255), popup, width=2, border_radius=4)
-                e_surf = FONT_TIP.render("E", True, (255, 255, 255))
-                e_rect = e_surf.get_rect(center=popup.center)
-                canvas.blit(e_surf, e_rect)
-            
-            # Show 'E' popup when near bottom-left table (Horse Racing)
-            if is_near_table(player, lobby2_table_bottomleft):
-                popup = pygame.Rect(0, 0, 26, 26)
-                popup.center = (int(player.x), int(player.y - (player.radius + 18)))
-                popup.clamp_ip(canvas.get_rect())
-                pygame.draw.rect(canvas, (20, 20, 25), popup, border_radius=4)
-                pygame.draw.rect(canvas, (255, 255, 255), popup, width=2, border_radius=4)
-                e_surf = FONT_TIP.render("E", True, (255, 255, 255))
-                e_rect = e_surf.get_rect(center=popup.center)
-                canvas.blit(e_surf, e_rect)
-            
-            # Show 'E' popup when near top-left bar (Cocktail)
-            if is_near_table(player, lobby2_table_topleft) and not holding_cocktail and not drunk_active:
-                popup = pygame.Rect(0, 0, 26, 26)
-                popup.center = (int(player.x), int(player.y - (player.radius + 18)))
-                popup.clamp_ip(canvas.get_rect())
-                pygame.draw.rect(canvas, (20, 20, 25), popup, border_radius=4)
-                pygame.draw.rect(canvas, (255, 255, 255), popup, width=2, border_radius=4)
-                e_surf = FONT_TIP.render("E", True, (255, 255, 255))
-                e_rect = e_surf.get_rect(center=popup.center)
-                canvas.blit(e_surf, e_rect)
-            
-            # Show dancefloor hint when on it
-            if on_dancefloor:
-                dance_hint = FONT_TIP.render("~ DANCEFLOOR ~", True, (255, 100, 255))
-                dance_rect = dance_hint.get_rect(center=(lobby2_table_topright.centerx, lobby2_table_topright.bottom + 20))
-                canvas.blit(dance_hint, dance_rect)
-                
-                # Disco color flash effect
-                disco_flash_timer += dt
-                if disco_flash_timer >= 0.15:  # Flash every 0.15 seconds
-                    disco_flash_timer = 0.0
-                    disco_flash_index = (disco_flash_index + 1) % len(disco_flash_colors)
-                
-                flash_color = disco_flash_colors[disco_flash_index]
-                flash_overlay = pygame.Surface((BASE_WIDTH, BASE_HEIGHT), pygame.SRCALPHA)
-                flash_overlay.fill((*flash_color, 40))  # Semi-transparent color flash
-                canvas.blit(flash_overlay, (0, 0))
-            
-            # Show arrow hint to go back
-            hint_surf = FONT_TIP.render("< Back to Lobby 1", True, (200, 200, 200))
-            canvas.blit(hint_surf, (10, BASE_HEIGHT // 2 - 10))
-
-        else:  # scene == "game"
-            if lobby_bg is not None:
-                stretched_bg = pygame.transform.smoothscale(lobby_bg, (BASE_WIDTH, BASE_HEIGHT))
-                canvas.blit(stretched_bg, (0, 0))
-            else:
-                canvas.fill((40, 60, 80))
-
-            if player is None:
-                player = Player((BASE_WIDTH // 2, BASE_HEIGHT // 2))
-
-            keys = pygame.key.get_pressed()
-            player.update(dt, keys, canvas.get_rect(), obstacles=[])
-            player.draw(canvas)
-            
-            # Check if player goes to right edge -> lobby2
-            if player.x > BASE_WIDTH - ZONE_WIDTH:
-                scene = "lobby2"
-                player = Player((80, BASE_HEIGHT // 2))
-
-            # Tables are invisible interaction zones (no collision)
-
-            # Draw token counter at top center
-            token_text = f"Tokens: {tokens}"
-            token_surf = FONT_SMALL.render(token_text, True, (255, 215, 0))
-            token_rect = token_surf.get_rect(midtop=(BASE_WIDTH // 2, 10))
-            pygame.draw.rect(canvas, (30, 30, 30), token_rect.inflate(20, 10), border_radius=8)
-            canvas.blit(token_surf, token_rect)
-            
-            # Show arrow hint to go to lobby2
-            hint_surf = FONT_TIP.render("Lobby 2 >", True, (200, 200, 200))
-            canvas.blit(hint_surf, (BASE_WIDTH - 80, BASE_HEIGHT // 2 - 10))
-
-            # Show 'E' popup when near any interactive table
-            near_table = None
-            if is_near_table(player, table_roulette):
-                near_table = table_roulette
-            elif is_near_table(player, table_slots):
-                near_table = table_slots
-            elif is_near_table(player, table_wheel):
-                near_table = table_wheel
-            elif is_near_table(player, table_blackjack):
-                near_table = table_blackjack
-            
-            if near_table is not None:
-                popup = pygame.Rect(0, 0, 26, 26)
-                popup.center = (int(player.x), int(player.y - (player.radius + 18)))
-                popup.clamp_ip(canvas.get_rect())
-                pygame.draw.rect(canvas, (20, 20, 25), popup, border_radius=4)
-                pygame.draw.rect(canvas, (255, 255, 255), popup, width=2, border_radius=4)
-                e_surf = FONT_TIP.render("E", True, (255, 255, 255))
-                e_rect = e_surf.get_rect(center=popup.center)
-                canvas.blit(e_surf, e_rect)
+        perf_hud.mark("scene")
 
         # POST-PROCESS + PRESENT
-        # We sometimes apply effects (pulse/drunk) by rendering into a temporary surface.
-        # `present_canvas` starts as the normal canvas, but may be replaced.
-        present_canvas = canvas
-        
-        # Apply disco pulse effect when on dancefloor
-        if scene == "lobby2" and was_on_dancefloor:
+        # Effects are stages of the `postfx` pipeline: we only switch them on/off
+        # and update their parameters here. The pipeline renders into its own
+        # reused buffers, so `canvas` itself is never modified (otherwise the
+        # tints would accumulate across frames, especially noticeable on macOS).
+        dancing = app.scene is lobby2 and lobby2.dancing
+        disco_flash_stage.active = dancing
+        disco_hint_stage.active = dancing
+        disco_pulse_stage.active = dancing
+        if dancing:
             # Disco pulse effect: scale slightly larger/smaller over time.
             disco_pulse_timer += dt
             # Pulse scale oscillates between 1.0 and 1.05 using sine wave
-            pulse_scale = 1.0 + 0.05 * abs(math.sin(disco_pulse_timer * 12))  # 12 = pulse speed
-            
-            # Scale canvas from center
-            pulse_width = int(BASE_WIDTH * pulse_scale)
-            pulse_height = int(BASE_HEIGHT * pulse_scale)
-            pulsed_canvas = pygame.transform.smoothscale(present_canvas, (pulse_width, pulse_height))
-            
-            # Create a new surface and blit the scaled canvas centered
-            pulse_result = pygame.Surface((BASE_WIDTH, BASE_HEIGHT))
-            offset_x = (pulse_width - BASE_WIDTH) // 2
-            offset_y = (pulse_height - BASE_HEIGHT) // 2
-            pulse_result.blit(pulsed_canvas, (-offset_x, -offset_y))
-            present_canvas = pulse_result
-
-        # Apply drunk effect if active (greenish tint + wave distortion)
-        # Important: do NOT overwrite `canvas` across frames, otherwise the tint accumulates
-        # and becomes opaque (this is especially noticeable on macOS).
-        if drunk_active:
-            # "Drunk" effect:
-            # 1) wave-distort the image by shifting each horizontal row by a sine offset
-            # 2) apply a green tint overlay
-            drunk_canvas = pygame.Surface((BASE_WIDTH, BASE_HEIGHT)).convert()
-            wave_amplitude = 8  # How far pixels shift
-            wave_frequency = 0.03  # How tight the waves are
-            time_factor = drunk_timer * 5  # Speed of wave animation
-
-            # Use efficient row-by-row blitting instead of pixel-by-pixel
-            for y in range(BASE_HEIGHT):
-                offset = int(wave_amplitude * math.sin(wave_frequency * y + time_factor))
-                # Blit the entire row with offset
-                drunk_canvas.blit(canvas, (offset, y), (0, y, BASE_WIDTH, 1))
-                # Fill gaps on edges
-                if offset > 0:
-                    drunk_canvas.blit(canvas, (0, y), (BASE_WIDTH - offset, y, offset, 1))
-                elif offset < 0:
-                    drunk_canvas.blit(canvas, (BASE_WIDTH + offset, y), (0, y, -offset, 1))
-
-            # Apply green tint overlay using per-pixel alpha (more consistent across platforms)
-            green_overlay = pygame.Surface((BASE_WIDTH, BASE_HEIGHT), pygame.SRCALPHA)
-            green_overlay.fill((0, 100, 0, 70))
-            drunk_canvas.blit(green_overlay, (0, 0))
-
-            present_canvas = drunk_canvas
+            disco_pulse_stage.zoom = 1.0 + 0.05 * abs(math.sin(disco_pulse_timer * 12))  # 12 = pulse speed
+
+        # "Drunk" effect: wave-distort the rows, then a green tint on top.
+        drunk_wave_stage.active = app.drunk_active
+        drunk_tint_stage.active = app.drunk_active
+        drunk_wave_stage.time = app.drunk_timer
+
+        # `present_canvas` is the normal canvas when no stage is enabled.
+        present_canvas = postfx.process(canvas, app.scene_name)
+
+        perf_hud.mark("postfx")
 
         # Now always stretch the (possibly post-processed) canvas to fill the window.
         # This is the final step users see.
         _present(present_canvas, window)
+        if perf_hud.visible:
+            # Drawn on the window (not the canvas) so it stays sharp and isn't
+            # affected by the post effects. Its own cost is not measured.
+            perf_hud.mark("present")
+            active_state = app.scene.state
+            perf_hud.set_counts(collect_list_sizes(active_state) if active_state else {})
+            perf_hud.draw(window)
+            perf_hud.skip()
         pygame.display.flip()
-        
+        perf_hud.mark("present")
+
+        # JOBS: the frame is on screen; use a slice of the remaining time for
+        # queued slow work (see scheduler.py).
+        app.scheduler.run()
+        perf_hud.set_jobs(app.scheduler.stats())
+        perf_hud.mark("jobs")
+        perf_hud.end_frame(app.scene_name)
+
+        if frame_hook is not None:
+            frame_hook({
+                "scene": app.scene_name,
+                "player": app.player,
+                "tokens": app.tokens,
+                "states": {name: registry.state_of(name) for name in scenes.SCENE_MODULES},
+            })
+
         # Required for pygbag - yield control back to browser.
         # In a normal desktop pygame loop you usually *don't* need this.
         await asyncio.sleep(0)
 
+    # If the performance overlay was used, save the per-scene frame-time
+    # histograms. May fail in the browser build (no file system), that's fine.
+    if perf_hud.was_used:
+        try:
+            perf_hud.dump_csv(PERF_CSV_FILE)
+        except Exception:
+            pass
+
     pygame.quit()
 
 
 if __name__ == "__main__":
     asyncio.run(main())
-
@@ -14,9 +14,7 @@ sprite image when available.
 """
 
 import pygame
-import os
-from pathlib import Path
-from gifimage import GIFImage
+from assetmanager import ASSETS
 
 
 class Player:
@@ -58,37 +56,29 @@ class Player:
 	def _load_images(self):
 		"""Load character sprite images."""
 		# Loading images is usually done once up front (not every frame) for
-		# performance. `convert_alpha()` keeps transparency.
-		try:
-			base_dir = str(Path(__file__).resolve().parent)
-		except:
-			base_dir = str(Path.cwd())
-		
+		# performance. The shared AssetManager goes one step further: the files are
+		# decoded, converted (`convert_alpha()` keeps transparency) and scaled only
+		# once per game, so creating a new Player again later is cheap.
+
 		# Target size for the character.
 		# Even though physics uses a circle (`radius`), sprites can be a bit larger.
 		target_size = (self.radius * 3, self.radius * 3)
-		
+
 		try:
 			# Load idle/base character image
-			idle_path = os.path.join(base_dir, "assets", "img", "standing.png")
-			self._img_idle = pygame.image.load(idle_path).convert_alpha()
-			self._img_idle = pygame.transform.smoothscale(self._img_idle, target_size)
+			self._img_idle = ASSETS.scaled("img/standing.png", target_size)
 		except Exception:
 			self._img_idle = None
-		
+
 		try:
 			# Load left foot walking frame
-			left_path = os.path.join(base_dir, "assets", "img", "leftfoot.png")
-			self._img_left = pygame.image.load(left_path).convert_alpha()
-			self._img_left = pygame.transform.smoothscale(self._img_left, target_size)
+			self._img_left = ASSETS.scaled("img/leftfoot.png", target_size)
 		except Exception:
 			self._img_left = None
-		
+
 		try:
 			# Load right foot walking frame
-			right_path = os.path.join(base_dir, "assets", "img", "rightfoot.png")
-			self._img_right = pygame.image.load(right_path).convert_alpha()
-			self._img_right = pygame.transform.smoothscale(self._img_right, target_size)
+			self._img_right = ASSETS.scaled("img/rightfoot.png", target_size)
 		except Exception:
 			self._img_right = None
 		
@@ -98,9 +88,9 @@ class Player:
 		self._color_walk_1 = (70, 210, 90)   # groen
 		
 		# Load smoke gif animation using GIFImage
+		# (the frames are shared, but each Player gets its own animation timer)
 		try:
-			smoke_path = os.path.join(base_dir, "assets", "img", "smoke.gif")
-			self._smoke_gif = GIFImage(smoke_path, size=(30, 30))
+			self._smoke_gif = ASSETS.gif("img/smoke.gif", size=(30, 30))
 		except Exception:
 			self._smoke_gif = None
 
@@ -0,0 +1,497 @@
+"""particles.py
+
+One shared particle engine for all mini-games (confetti, sparkles, dust,
+floating casino chips, ...).
+
+If you're new to game-dev:
+- A "particle" is a tiny short-lived object: a piece of confetti, a speck of
+  dust. Effects look good when there are *many* of them.
+- The classic way is one Python object per particle, each with its own
+  `update()` and `draw()`. That is easy to read, but a win celebration spawns
+  hundreds of particles, and hundreds of Python method calls (plus a new
+  Surface per particle) per frame makes the game stutter.
+
+How this module does it ("structure of arrays"):
+- A `ParticleSystem` keeps every property in its own NumPy array: all x
+  positions in one array, all y positions in another, and so on.
+- `update()` moves ALL particles with a handful of array operations
+  (`x += vx` works on the whole array at once).
+- Dead particles are removed by "compaction": the living ones are copied to
+  the front of the arrays in one go (no `list.remove`, which is O(n) each).
+- Drawing computes every particle's color/corners as arrays too, and then
+  only does the actual pygame draw calls in a tight loop (no temporary
+  surfaces, no `pygame.transform.rotate` per particle). Glyph-like
+  particles (floaters, sparkles, stars) are blitted from the shared sprite
+  atlas (spriteatlas.py) instead of being drawn shape by shape.
+
+The emitter functions at the bottom (`casino_floaters`, `golden_sparkles`,
+`confetti`, `dust`, `star_sparkles`, `burst`) create systems that behave
+like the old per-module classes.
+
+NumPy is required for this module (see README).
+"""
+
+import math
+import random
+
+import numpy as np
+import pygame
+
+from spriteatlas import ATLAS
+
+try:
+    import pygame.gfxdraw
+    GFXDRAW_AVAILABLE = True
+except ImportError:
+    GFXDRAW_AVAILABLE = False
+
+# What happens at the edge of the screen:
+# - EDGE_NONE: nothing (particles fly off-screen until their lifetime ends)
+# - EDGE_WRAP: leaving one side re-enters on the opposite side (sparkles)
+# - EDGE_DRIFT: floaters drift up and out, then re-enter at the bottom at a
+#   random x; sideways they wrap with a 50 px margin
+EDGE_NONE = "none"
+EDGE_WRAP = "wrap"
+EDGE_DRIFT = "drift"
+
+DRIFT_MARGIN = 50
+
+_FLOAT_FIELDS = ("x", "y", "vx", "vy", "age", "lifetime", "rotation", "spin", "size", "brightness")
+
+
+def _rng() -> np.random.Generator:
+    # Seeded from Python's `random`, so `random.seed(...)` (used by the soak
+    # benchmark) still makes every run reproducible.
+    return np.random.default_rng(random.getrandbits(64))
+
+
+class ParticleSystem:
+    """A group of particles of one kind, stored as NumPy arrays.
+
+    Arrays (only the first `len(system)` entries are alive):
+        x, y, vx, vy    position and velocity (pixels, pixels per frame)
+        age, lifetime   frames lived / frames to live (inf = forever)
+        rotation, spin  degrees / degrees per frame
+        size            radius or half-width in pixels
+        brightness      max brightness or base alpha (meaning depends on `draw_style`)
+        color           (n, 3) uint8 RGB
+        sprite          index into `sprites` (for sprite-based particles)
+
+    `draw_style` is one of the `draw_*` functions below.
+    """
+
+    def __init__(
+        self,
+        draw_style,
+        width: int = 0,
+        height: int = 0,
+        capacity: int = 64,
+        gravity: float = 0.0,
+        drag_x: float = 1.0,
+        drag_y: float = 1.0,
+        edge: str = EDGE_NONE,
+        respawn=None,
+        target_count: int = 0,
+    ):
+        self.draw_style = draw_style
+        self.width = width
+        self.height = height
+        self.gravity = gravity
+        self.drag_x = drag_x
+        self.drag_y = drag_y
+        self.edge = edge
+        # Optional "keep N alive" behaviour: after each update,
+        # `respawn(system, missing)` is called to top the system back up.
+        self.respawn = respawn
+        self.target_count = target_count
+        # Extra settings used by some draw styles.
+        self.fade = 1.0
+        self.sprites: list[pygame.Surface] = []
+
+        self.count = 0
+        self._capacity = 0
+        for name in _FLOAT_FIELDS:
+            setattr(self, name, np.empty(0, dtype=np.float64))
+        self.color = np.empty((0, 3), dtype=np.uint8)
+        self.sprite = np.empty(0, dtype=np.int32)
+        self._grow(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _grow(self, needed: int) -> None:
+        """Make room for at least `needed` particles (arrays double in size)."""
+        if needed <= self._capacity:
+            return
+        capacity = max(needed, self._capacity * 2, 16)
+        for name in _FLOAT_FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=np.float64)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        color = np.zeros((capacity, 3), dtype=np.uint8)
+        color[:self.count] = self.color[:self.count]
+        self.color = color
+        sprite = np.zeros(capacity, dtype=np.int32)
+        sprite[:self.count] = self.sprite[:self.count]
+        self.sprite = sprite
+        self._capacity = capacity
+
+    def emit(self, x, y, vx=0.0, vy=0.0, lifetime=math.inf, size=1.0, rotation=0.0,
+             spin=0.0, brightness=255.0, color=(255, 255, 255), sprite=0, age=0.0) -> None:
+        """Add particles. Every argument is a number or an array (one value per particle)."""
+        values = {
+            "x": x, "y": y, "vx": vx, "vy": vy, "age": age, "lifetime": lifetime,
+            "rotation": rotation, "spin": spin, "size": size, "brightness": brightness,
+        }
+        n = max(np.size(v) for v in values.values())
+        color = np.asarray(color, dtype=np.uint8).reshape(-1, 3)
+        n = max(n, len(color), np.size(sprite))
+        if n == 0:
+            return
+        start, end = self.count, self.count + n
+        self._grow(end)
+        for name, value in values.items():
+            getattr(self, name)[start:end] = value
+        self.color[start:end] = color
+        self.sprite[start:end] = sprite
+        self.count = end
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def update(self) -> None:
+        """Advance every particle by one frame and drop the dead ones."""
+        n = self.count
+        if n:
+            x, y = self.x[:n], self.y[:n]
+            vx, vy = self.vx[:n], self.vy[:n]
+            x += vx
+            y += vy
+            if self.gravity:
+                vy += self.gravity
+            if self.drag_x != 1.0:
+                vx *= self.drag_x
+            if self.drag_y != 1.0:
+                vy *= self.drag_y
+            self.rotation[:n] += self.spin[:n]
+            self.age[:n] += 1
+
+            if self.edge == EDGE_WRAP:
+                x[x < 0] = self.width
+                x[x > self.width] = 0
+                y[y < 0] = self.height
+                y[y > self.height] = 0
+            elif self.edge == EDGE_DRIFT:
+                gone = y < -DRIFT_MARGIN
+                if gone.any():
+                    y[gone] = self.height + DRIFT_MARGIN
+                    x[gone] = _rng().integers(0, self.width + 1, int(gone.sum()))
+                left = x < -DRIFT_MARGIN
+                right = x > self.width + DRIFT_MARGIN
+                x[left] = self.width + DRIFT_MARGIN
+                x[right] = -DRIFT_MARGIN
+
+            alive = self.age[:n] < self.lifetime[:n]
+            if not alive.all():
+                self._compact(alive)
+
+        if self.respawn is not None and self.count < self.target_count:
+            self.respawn(self, self.target_count - self.count)
+
+    def _compact(self, alive: np.ndarray) -> None:
+        # Boolean indexing copies the survivors (in order) to the front.
+        n = self.count
+        kept = int(alive.sum())
+        for name in _FLOAT_FIELDS:
+            array = getattr(self, name)
+            array[:kept] = array[:n][alive]
+        self.color[:kept] = self.color[:n][alive]
+        self.sprite[:kept] = self.sprite[:n][alive]
+        self.count = kept
+
+    def progress(self) -> np.ndarray:
+        """age / lifetime for every living particle (0 = just born, 1 = dead)."""
+        n = self.count
+        return self.age[:n] / self.lifetime[:n]
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if self.count:
+            self.draw_style(self, surface)
+
+
+# =============================================================================
+# DRAW STYLES
+# =============================================================================
+# Each style gets the system and the target surface. They compute everything
+# (colors, corners, visibility) as arrays first and convert to plain Python
+# lists once (`tolist()`), which is much faster than reading NumPy scalars one
+# by one inside the loop. The loop then only makes the pygame draw calls.
+#
+# Translucent shapes are drawn with `pygame.gfxdraw`, which blends straight
+# onto the target. If gfxdraw is missing, they are drawn opaque instead.
+
+def draw_confetti_rects(ps: ParticleSystem, surface: pygame.Surface) -> None:
+    """Rotated rectangles (2*size x size) that fade out over their lifetime."""
+    n = ps.count
+    alpha = (255 * (1.0 - ps.progress())).astype(np.int32)
+    visible = alpha > 0
+    # Corners of the rectangle, rotated counter-clockwise on screen (like
+    # `pygame.transform.rotate`).
+    rad = np.radians(ps.rotation[:n][visible])
+    cos, sin = np.cos(rad)[:, None], np.sin(rad)[:, None]
+    half_w = ps.size[:n][visible][:, None]
+    half_h = half_w / 2
+    corners_x = half_w * np.array([-1, 1, 1, -1])
+    corners_y = half_h * np.array([-1, -1, 1, 1])
+    points = np.empty((len(rad), 4, 2))
+    points[:, :, 0] = ps.x[:n][visible][:, None] + corners_x * cos + corners_y * sin
+    points[:, :, 1] = ps.y[:n][visible][:, None] - corners_x * sin + corners_y * cos
+    rgba = np.empty((len(rad), 4), dtype=np.int32)
+    rgba[:, :3] = ps.color[:n][visible]
+    rgba[:, 3] = alpha[visible]
+    if GFXDRAW_AVAILABLE:
+        fill = pygame.gfxdraw.filled_polygon
+        for corners, color in zip(points.tolist(), rgba.tolist()):
+            fill(surface, corners, color)
+    else:
+        for corners, color in zip(points.tolist(), rgba[:, :3].tolist()):
+            pygame.draw.polygon(surface, color, corners)
+
+
+def draw_confetti_quads(ps: ParticleSystem, surface: pygame.Surface) -> None:
+    """Opaque spinning squares (corners `size` away from the center)."""
+    n = ps.count
+    angles = np.radians(ps.rotation[:n])[:, None] + np.radians([0, 90, 180, 270])[None, :]
+    points = np.empty((n, 4, 2))
+    points[:, :, 0] = ps.x[:n, None] + np.cos(angles) * ps.size[:n, None]
+    points[:, :, 1] = ps.y[:n, None] + np.sin(angles) * ps.size[:n, None]
+    for corners, color in zip(points.tolist(), ps.color[:n].tolist()):
+        pygame.draw.polygon(surface, color, corners)
+
+
+def _paint_spark_dot(kind, radius, brightness):
+    surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    color = (brightness, brightness, int(brightness * 0.7))
+    pygame.draw.circle(surf, color, (radius, radius), radius)
+    return surf
+
+
+def _paint_glow_dot(kind, radius, brightness):
+    surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    color = (brightness, int(brightness * 0.8), 0, brightness)
+    if GFXDRAW_AVAILABLE:
+        pygame.gfxdraw.filled_circle(surf, radius, radius, radius, color)
+    else:
+        pygame.draw.circle(surf, color, (radius, radius), radius)
+    return surf
+
+
+def _paint_star(kind, size, alpha):
+    # A white 4-pointed star with a gold outline, centered in a 4*size square.
+    surf = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
+    points = []
+    for i in range(8):
+        radius = size if i % 2 == 0 else size // 2
+        angle = math.radians(i * 45)
+        points.append((size * 2 + radius * math.cos(angle), size * 2 + radius * math.sin(angle)))
+    pygame.draw.polygon(surf, (255, 255, 255, alpha), points)
+    pygame.draw.polygon(surf, (255, 215, 0, alpha), points, 1)
+    return surf
+
+
+def _blit_glyphs(surface, paint, xs, ys, sizes, alphas) -> None:
+    # Top-left positions in `xs`/`ys`; one atlas lookup + one `blits()` call.
+    sprite = ATLAS.sprite
+    surface.blits(
+        [(sprite(paint, None, s, a), (x, y))
+         for x, y, s, a in zip(xs.tolist(), ys.tolist(), sizes.tolist(), alphas.tolist())],
+        False,
+    )
+
+
+def draw_spark_dots(ps: ParticleSystem, surface: pygame.Surface) -> None:
+    """Opaque golden dots that dim by `ps.fade` over their life and shrink at half-life."""
+    n = ps.count
+    progress = ps.progress()
+    b = (ps.brightness[:n] * (1.0 - progress * ps.fade)).astype(np.int32)
+    radius = np.where(progress > 0.5, 1, 2)
+    x = ps.x[:n].astype(np.int32) - radius
+    y = ps.y[:n].astype(np.int32) - radius
+    _blit_glyphs(surface, _paint_spark_dot, x, y, radius, b)
+
+
+def draw_glow_dots(ps: ParticleSystem, surface: pygame.Surface) -> None:
+    """Translucent gold dots that fade in and out (sine curve)."""
+    n = ps.count
+    b = (ps.brightness[:n] * np.sin(ps.progress() * math.pi)).astype(np.int32)
+    visible = b > 0
+    x = ps.x[:n][visible].astype(np.int32) - 2
+    y = ps.y[:n][visible].astype(np.int32) - 2
+    _blit_glyphs(surface, _paint_glow_dot, x, y, np.full(len(x), 2), b[visible])
+
+
+def draw_soft_circles(ps: ParticleSystem, surface: pygame.Surface) -> None:
+    """Translucent circles in their own color, alpha = brightness fading to 0 (dust)."""
+    n = ps.count
+    alpha = (ps.brightness[:n] * (1.0 - ps.progress())).astype(np.int32)
+    visible = alpha > 0
+    xs = ps.x[:n][visible].astype(np.int32).tolist()
+    ys = ps.y[:n][visible].astype(np.int32).tolist()
+    radii = ps.size[:n][visible].astype(np.int32).tolist()
+    rgba = np.empty((len(xs), 4), dtype=np.int32)
+    rgba[:, :3] = ps.color[:n][visible]
+    rgba[:, 3] = alpha[visible]
+    if GFXDRAW_AVAILABLE:
+        fill = pygame.gfxdraw.filled_circle
+        for x, y, r, color in zip(xs, ys, radii, rgba.tolist()):
+            fill(surface, x, y, r, color)
+    else:
+        for x, y, r, color in zip(xs, ys, radii, rgba[:, :3].tolist()):
+            pygame.draw.circle(surface, color, (x, y), r)
+
+
+def draw_star_sparkles(ps: ParticleSystem, surface: pygame.Surface) -> None:
+    """White 4-pointed stars with a gold outline.
+
+    Alpha = remaining life / `brightness` (the old code's `life / max_life`).
+    """
+    n = ps.count
+    alpha = (255 * (ps.lifetime[:n] - ps.age[:n]) / ps.brightness[:n]).astype(np.int32)
+    visible = alpha > 0
+    size = ps.size[:n][visible].astype(np.int32)
+    x = np.floor(ps.x[:n][visible] - size * 2).astype(np.int32)
+    y = np.floor(ps.y[:n][visible] - size * 2).astype(np.int32)
+    _blit_glyphs(surface, _paint_star, x, y, size, alpha[visible])
+
+
+def draw_sprites(ps: ParticleSystem, surface: pygame.Surface) -> None:
+    """Blit `ps.sprites[sprite]` centered on each particle, in one `blits()` call."""
+    n = ps.count
+    xs = (ps.x[:n] - ps.size[:n]).astype(np.int32).tolist()
+    ys = (ps.y[:n] - ps.size[:n]).astype(np.int32).tolist()
+    sprites = ps.sprites
+    surface.blits([(sprites[s], (xs[i], ys[i])) for i, s in enumerate(ps.sprite[:n].tolist())], False)
+
+
+# =============================================================================
+# EMITTERS
+# =============================================================================
+# Small helpers that create systems behaving like the old per-module classes.
+
+def _uniform(rng, value_range, n):
+    return rng.uniform(value_range[0], value_range[1], n)
+
+
+def _randint(rng, value_range, n):
+    # Like `random.randint`: both ends included.
+    return rng.integers(value_range[0], value_range[1] + 1, n)
+
+
+def casino_floaters(width, height, count, kinds, paint, size_range=(15, 30), alpha_range=(30, 80)):
+    """Slowly drifting chips / card suits in the background.
+
+    `paint(kind, size, alpha)` draws one floater and returns its Surface
+    (2*size x 2*size). The images come from the shared sprite atlas, so each
+    look is painted once per game session, not once per floater or frame.
+    """
+    ps = ParticleSystem(draw_sprites, width, height, capacity=count, edge=EDGE_DRIFT)
+    rng = _rng()
+    sizes = _randint(rng, size_range, count)
+    alphas = _randint(rng, alpha_range, count)
+    kind_index = rng.integers(0, len(kinds), count)
+    ps.sprites = [ATLAS.sprite(paint, kinds[k], int(s), int(a)) for k, s, a in zip(kind_index, sizes, alphas)]
+    ps.emit(
+        x=_randint(rng, (0, width), count),
+        y=_randint(rng, (0, height), count),
+        vx=_uniform(rng, (-0.5, 0.5), count),
+        vy=_uniform(rng, (-1, -0.3), count),
+        size=sizes,
+        rotation=_uniform(rng, (0, 360), count),
+        spin=_uniform(rng, (-2, 2), count),
+        brightness=alphas,
+        sprite=np.arange(count),
+    )
+    return ps
+
+
+def _respawn_sparkles(ps, n, random_age=False):
+    rng = _rng()
+    lifetime = _randint(rng, (60, 180), n)
+    ps.emit(
+        x=_randint(rng, (0, ps.width), n),
+        y=_randint(rng, (0, ps.height), n),
+        vx=_uniform(rng, (-0.3, 0.3), n),
+        vy=_uniform(rng, (-0.5, 0.5), n),
+        lifetime=lifetime,
+        age=rng.integers(0, lifetime) if random_age else 0,
+        brightness=_randint(rng, (150, 255), n),
+    )
+
+
+def golden_sparkles(width, height, count, draw_style=draw_glow_dots, fade=1.0, random_age=False):
+    """Tiny twinkling dots that wander around; a new one replaces every one that dies.
+
+    - `draw_glow_dots`: translucent dots fading in and out
+    - `draw_spark_dots`: opaque dots dimming by `fade` (0.5 = to half brightness)
+    `random_age=True` starts them at random points of their life, so they
+    don't all twinkle in sync on the first frames.
+    """
+    ps = ParticleSystem(draw_style, width, height, capacity=count, edge=EDGE_WRAP,
+                        respawn=_respawn_sparkles, target_count=count)
+    ps.fade = fade
+    _respawn_sparkles(ps, count, random_age)
+    return ps
+
+
+# Launch settings of the big win confetti in blackjack, higher/lower and the
+# horse race: `burst(system, x, y, 50, colors, **WIN_CONFETTI)`.
+WIN_CONFETTI = {"vx": (-8, 8), "vy": (-15, -5), "size": (4, 10), "spin": (-15, 15)}
+
+
+def confetti(draw_style=draw_confetti_rects, gravity=0.4, drag_x=1.0):
+    """An empty confetti system; fill it with `burst()`."""
+    return ParticleSystem(draw_style, capacity=128, gravity=gravity, drag_x=drag_x)
+
+
+def burst(ps, x, y, count, colors, vx=(-3, 3), vy=(-8, -3), size=(4, 8), spin=(-10, 10),
+          lifetime=(60, 120), rotation=(0, 360)):
+    """Spawn `count` particles at (x, y) with random values from the given ranges."""
+    rng = _rng()
+    palette = np.asarray(colors, dtype=np.uint8)
+    ps.emit(
+        x=np.full(count, float(x)),
+        y=float(y),
+        vx=_uniform(rng, vx, count),
+        vy=_uniform(rng, vy, count),
+        size=_randint(rng, size, count),
+        rotation=_uniform(rng, rotation, count),
+        spin=_uniform(rng, spin, count),
+        lifetime=_randint(rng, lifetime, count),
+        color=palette[rng.integers(0, len(palette), count)],
+    )
+
+
+def dust():
+    """An empty dust system (soft circles that slow down and fade); fill it with `puff()`."""
+    return ParticleSystem(draw_soft_circles, capacity=128, drag_x=0.95, drag_y=0.95)
+
+
+def puff(ps, x, y, count=1, color=(180, 150, 100), alpha=100):
+    """Spawn dust particles at (x, y), drifting backwards (to the left)."""
+    rng = _rng()
+    ps.emit(
+        x=np.full(count, float(x)),
+        y=float(y),
+        vx=_uniform(rng, (-2, 0), count),
+        vy=_uniform(rng, (-1, 1), count),
+        lifetime=_randint(rng, (20, 40), count),
+        size=_randint(rng, (3, 8), count),
+        color=color,
+        brightness=alpha,
+    )
+
+
+def star_sparkles():
+    """An empty system of stationary star sparkles (see `draw_star_sparkles`)."""
+    return ParticleSystem(draw_star_sparkles, capacity=32)
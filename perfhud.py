@@ -0,0 +1,246 @@
+"""perfhud.py
+
+A small performance overlay for the main loop (toggle it with F3).
+
+If you're new to profiling games:
+- A frame at 60 FPS has a budget of about 16.7 ms. When a frame takes longer,
+  the game "drops" frames and feels choppy.
+- Knowing the *total* frame time is not enough: you want to know which part
+  of the frame is slow. The main loop is split into phases:
+
+    events   - polling input and reacting to it (plus timers at the top of the loop)
+    update   - game logic of the current scene (movement, physics, payouts)
+    scene    - drawing the current scene onto the canvas
+    postfx   - post-processing (disco flash/pulse, drunk wave/tint)
+    present  - scaling the canvas to the window + `pygame.display.flip()`
+    jobs     - slow one-off work spread over frames (see scheduler.py)
+
+Usage in the main loop:
+    hud.begin_frame()
+    ...events...      hud.mark("events")
+    ...update scene.. hud.mark("update")
+    ...draw scene...  hud.mark("scene")
+    ...post fx...     hud.mark("postfx")
+    ...present/flip   hud.mark("present")
+    ...jobs...        hud.mark("jobs")
+    hud.end_frame(scene)
+
+On exit, `dump_csv()` writes a frame-time histogram per scene (and per phase)
+so slow scenes can be compared between builds.
+"""
+
+import csv
+import time
+from collections import deque
+
+import pygame
+
+from fonts import TEXT_CACHE, get_font
+from particles import ParticleSystem
+from rotcache import ROTATIONS
+
+PHASES = ("events", "update", "scene", "postfx", "present", "jobs")
+PHASE_COLORS = {
+    "events": (90, 170, 255),
+    "update": (240, 220, 90),
+    "scene": (120, 220, 120),
+    "postfx": (255, 170, 60),
+    "present": (230, 90, 200),
+    "jobs": (160, 160, 255),
+}
+
+FRAME_BUDGET_MS = 1000.0 / 60.0
+HISTORY_FRAMES = 240      # frames shown in the rolling graph (~4 s at 60 FPS)
+AVERAGE_FRAMES = 60       # frames used for the averaged numbers in the panel
+HISTOGRAM_BINS_MS = 50    # 1 ms wide bins from 0 to 50 ms, plus one "50+" bin
+
+# Names of the effect lists we count (confetti, dust_particles, golden_sparkles, ...).
+# Other lists (cards in a hand, prize names, reel timers) have a fixed size anyway.
+PARTICLE_LIST_WORDS = ("confetti", "particle", "sparkle", "floater", "burst", "ray")
+
+
+def _is_particle_list(name: str) -> bool:
+    return any(word in name for word in PARTICLE_LIST_WORDS)
+
+
+def collect_list_sizes(state: dict) -> dict[str, int]:
+    """Find the particle lists/systems inside a mini-game state and return their lengths.
+
+    Mini-game states are dicts that either hold them directly (roulette) or a
+    game object (`game`, `_machine`, `wheel`) with them as attributes.
+    Both plain lists and `ParticleSystem`s (particles.py) are counted.
+    """
+    sizes: dict[str, int] = {}
+    for key, value in state.items():
+        if isinstance(value, (list, ParticleSystem)):
+            if _is_particle_list(key):
+                sizes[key] = len(value)
+        elif hasattr(value, "__dict__") and not isinstance(value, pygame.Surface):
+            for attr, inner in vars(value).items():
+                if isinstance(inner, (list, ParticleSystem)) and _is_particle_list(attr):
+                    sizes[f"{key}.{attr}"] = len(inner)
+    return sizes
+
+
+class PerfHUD:
+    """Measures the phases of every frame and draws them as an overlay."""
+
+    def __init__(self):
+        self.visible = False
+        # True once the overlay has been opened; only then is a CSV written on exit.
+        self.was_used = False
+
+        self._frame_start = 0.0
+        self._last_mark = 0.0
+        self._current: dict[str, float] = {}
+        self._last_begin = None
+
+        # Rolling history for the graph: (total_ms, {phase: ms})
+        self._history: deque = deque(maxlen=HISTORY_FRAMES)
+        self._intervals: deque = deque(maxlen=AVERAGE_FRAMES)
+        # scene -> phase ("frame" or one of PHASES) -> list of bin counts
+        self._histograms: dict[str, dict[str, list[int]]] = {}
+        self._counts: dict[str, int] = {}
+        self._jobs: dict = {}
+
+        self._font = None
+        self._overlay = None
+
+    # --- measuring ---------------------------------------------------------------
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+        if self.visible:
+            self.was_used = True
+
+    def begin_frame(self) -> None:
+        now = time.perf_counter()
+        if self._last_begin is not None:
+            self._intervals.append(now - self._last_begin)
+        self._last_begin = now
+        self._frame_start = now
+        self._last_mark = now
+        self._current = {}
+
+    def mark(self, phase: str) -> None:
+        """Add the time since the previous mark to `phase`."""
+        now = time.perf_counter()
+        self._current[phase] = self._current.get(phase, 0.0) + (now - self._last_mark) * 1000.0
+        self._last_mark = now
+
+    def skip(self) -> None:
+        """Don't count the time since the previous mark (used for drawing the HUD itself)."""
+        self._last_mark = time.perf_counter()
+
+    def set_counts(self, counts: dict[str, int]) -> None:
+        self._counts = counts
+
+    def set_jobs(self, stats: dict) -> None:
+        """Scheduler stats to show (see `Scheduler.stats` in scheduler.py)."""
+        self._jobs = stats
+
+    def end_frame(self, scene: str) -> None:
+        total = sum(self._current.values())
+        self._history.append((total, self._current))
+
+        per_scene = self._histograms.get(scene)
+        if per_scene is None:
+            per_scene = self._histograms[scene] = {}
+        self._add_to_histogram(per_scene, "frame", total)
+        for phase, ms in self._current.items():
+            self._add_to_histogram(per_scene, phase, ms)
+
+    @staticmethod
+    def _add_to_histogram(per_scene: dict, phase: str, ms: float) -> None:
+        bins = per_scene.get(phase)
+        if bins is None:
+            bins = per_scene[phase] = [0] * (HISTOGRAM_BINS_MS + 1)
+        bins[min(int(ms), HISTOGRAM_BINS_MS)] += 1
+
+    # --- reporting ---------------------------------------------------------------
+
+    def averages(self) -> tuple[float, dict[str, float]]:
+        recent = list(self._history)[-AVERAGE_FRAMES:]
+        if not recent:
+            return 0.0, {}
+        total = sum(t for t, _ in recent) / len(recent)
+        phases = {p: sum(ph.get(p, 0.0) for _, ph in recent) / len(recent) for p in PHASES}
+        return total, phases
+
+    def fps(self) -> float:
+        if not self._intervals:
+            return 0.0
+        avg = sum(self._intervals) / len(self._intervals)
+        return 1.0 / avg if avg > 0 else 0.0
+
+    def dump_csv(self, path: str) -> None:
+        """Write `scene, phase, bin_start_ms, bin_end_ms, count` rows (non-empty bins only)."""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["scene", "phase", "bin_start_ms", "bin_end_ms", "count"])
+            for scene in sorted(self._histograms):
+                for phase in ("frame",) + PHASES:
+                    bins = self._histograms[scene].get(phase)
+                    if not bins:
+                        continue
+                    for i, count in enumerate(bins):
+                        if count == 0:
+                            continue
+                        end = "" if i == HISTOGRAM_BINS_MS else i + 1
+                        writer.writerow([scene, phase, i, end, count])
+
+    # --- drawing -----------------------------------------------------------------
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the overlay in the top-left corner of `surface` (usually the window)."""
+        if self._font is None:
+            self._font = get_font(20)
+        font = self._font
+
+        total, phases = self.averages()
+        lines = [(f"{self.fps():5.1f} FPS   frame {total:5.2f} ms", (255, 255, 255))]
+        for phase in PHASES:
+            lines.append((f"{phase:<8} {phases.get(phase, 0.0):5.2f} ms", PHASE_COLORS[phase]))
+        rot = ROTATIONS.stats()
+        lines.append((f"rotations {rot['hits']} hit / {rot['misses']} miss ({rot['entries']} cached, {rot['bytes'] / (1024 * 1024):.1f} MB)", (200, 200, 200)))
+        text = TEXT_CACHE.stats()
+        lines.append((f"text {text['hits']} hit / {text['misses']} miss this frame ({text['entries']} cached)", (200, 200, 200)))
+        if self._jobs:
+            jobs = self._jobs
+            lines.append((f"jobs {jobs['queued']} queued, {jobs['steps']} steps, "
+                          f"{jobs['ms']:.1f}/{jobs['budget_ms']:.1f} ms", PHASE_COLORS["jobs"]))
+            lines.append((f"  {jobs['overruns']} overruns (worst {jobs['worst_overrun_ms']:.1f} ms)", PHASE_COLORS["jobs"]))
+        if self._counts:
+            lines.append(("particles:", (200, 200, 200)))
+            for name, count in sorted(self._counts.items()):
+                lines.append((f"  {name} {count}", (200, 200, 200)))
+
+        graph_w, graph_h = HISTORY_FRAMES, 60
+        line_h = 16
+        panel = pygame.Rect(8, 8, graph_w + 16, 16 + len(lines) * line_h + graph_h + 8)
+        if self._overlay is None or self._overlay.get_size() != panel.size:
+            self._overlay = pygame.Surface(panel.size, pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 170))
+        surface.blit(self._overlay, panel.topleft)
+
+        y = panel.top + 8
+        for text, color in lines:
+            surface.blit(font.render(text, True, color), (panel.left + 8, y))
+            y += line_h
+
+        # Rolling graph: one stacked bar per frame, 2 frame budgets tall.
+        graph = pygame.Rect(panel.left + 8, y + 4, graph_w, graph_h)
+        scale = graph_h / (2 * FRAME_BUDGET_MS)
+        x = graph.right - len(self._history)
+        for _, frame_phases in self._history:
+            bottom = graph.bottom
+            for phase in PHASES:
+                h = int(frame_phases.get(phase, 0.0) * scale)
+                if h > 0:
+                    top = max(graph.top, bottom - h)
+                    pygame.draw.line(surface, PHASE_COLORS[phase], (x, bottom), (x, top))
+                    bottom = top
+            x += 1
+        budget_y = graph.bottom - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(surface, (255, 80, 80), (graph.left, budget_y), (graph.right, budget_y))
+        pygame.draw.rect(surface, (120, 120, 120), graph, 1)
@@ -0,0 +1,404 @@
+"""postfx.py
+
+Post-processing effects: things that are applied to the *finished* canvas,
+right before it is presented (for example the wavy green "drunk" screen).
+
+The `PostFX` pipeline at the bottom of this file chains effects ("stages")
+together: disco flash -> disco pulse zoom -> drunk wave -> drunk tint.
+
+If you're new to post-processing:
+- The scene is first drawn normally onto the canvas.
+- A post effect then reads that picture and writes a modified copy
+  (distorted, tinted, zoomed, ...) which is what the player sees.
+- Because this runs on every pixel every frame, it must not allocate new
+  full-screen surfaces each frame and should avoid Python loops per row/pixel.
+
+Displacement maps
+-----------------
+`DisplacementEffect` moves pixels around:
+- a *row* displacement shifts every row left/right by its own amount
+  (the drunk sine wave)
+- a *column* displacement shifts every column up/down by its own amount
+Pixels that move off one side come back in on the other side (wrap-around).
+
+With NumPy available the whole distortion is one vectorized gather using
+`pygame.surfarray`: we build a (wrap-padded) copy of the source pixels and an
+index map saying "output pixel comes from source pixel N", then copy all
+pixels in one `numpy.take`. Every buffer is allocated once and reused.
+
+Without NumPy (or for surface formats surfarray can't map) it falls back to
+blitting rows/columns one by one into a reused surface. That is slower but
+gives the same picture for a single map (with both maps active the two passes
+run one after the other, which can differ by a pixel here and there).
+"""
+
+import math
+from abc import ABC, abstractmethod
+from typing import Callable
+
+import pygame
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class DisplacementEffect:
+    """Row/column sine displacement plus an optional color tint.
+
+    Offsets follow the original drunk effect:
+        row_offset(y)    = int(row_amplitude * sin(row_frequency * y + time * speed))
+        column_offset(x) = int(col_amplitude * sin(col_frequency * x + time * speed))
+
+    For other distortions, subclass and override `row_offsets()` /
+    `column_offsets()` (they return one integer offset per row / column).
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        row_amplitude: float = 0.0,
+        row_frequency: float = 0.0,
+        col_amplitude: float = 0.0,
+        col_frequency: float = 0.0,
+        speed: float = 1.0,
+        tint: tuple[int, int, int] | None = None,
+        tint_alpha: int = 0,
+    ):
+        self.size = size
+        self.row_amplitude = row_amplitude
+        self.row_frequency = row_frequency
+        self.col_amplitude = col_amplitude
+        self.col_frequency = col_frequency
+        self.speed = speed
+        self.tint = tint
+        self.tint_alpha = tint_alpha
+
+        # Reused every frame (created lazily, because the output has to match
+        # the pixel format of the source surface).
+        self._out: pygame.Surface | None = None
+        self._tint_overlay: pygame.Surface | None = None
+        self._tint_key = None
+        self._columns: pygame.Surface | None = None  # blit fallback only
+        self._buffers = None
+
+    # --- offsets -------------------------------------------------------------------
+
+    def row_offsets(self, time: float):
+        """Horizontal shift for every row (NumPy int array of length height)."""
+        ys = self._buffers["ys"]
+        return (self.row_amplitude * np.sin(self.row_frequency * ys + time * self.speed)).astype(np.intp)
+
+    def column_offsets(self, time: float):
+        """Vertical shift for every column (NumPy int array of length width)."""
+        xs = self._buffers["xs"]
+        return (self.col_amplitude * np.sin(self.col_frequency * xs + time * self.speed)).astype(np.intp)
+
+    def _row_offset(self, y: int, time: float) -> int:
+        return int(self.row_amplitude * math.sin(self.row_frequency * y + time * self.speed))
+
+    def _column_offset(self, x: int, time: float) -> int:
+        return int(self.col_amplitude * math.sin(self.col_frequency * x + time * self.speed))
+
+    # --- applying --------------------------------------------------------------
+
+    def apply(self, source: pygame.Surface, time: float, dest: pygame.Surface | None = None) -> pygame.Surface:
+        """Distort (and tint) `source` into `dest` (or an internal reused surface).
+
+        `source` itself is never modified. Returns the surface that was written.
+        """
+        if dest is None:
+            if self._out is None or self._out.get_size() != source.get_size():
+                self._out = pygame.Surface(source.get_size(), 0, source)
+            dest = self._out
+
+        if not (NUMPY_AVAILABLE and self._apply_numpy(source, dest, time)):
+            self._apply_blits(source, dest, time)
+
+        if self.tint is not None and self.tint_alpha > 0:
+            # One blend of a preallocated overlay. SDL's blitter is SIMD-optimized,
+            # so this is cheaper than doing the per-channel math in NumPy.
+            if self._tint_overlay is None or self._tint_overlay.get_size() != dest.get_size():
+                self._tint_overlay = pygame.Surface(dest.get_size(), pygame.SRCALPHA)
+                self._tint_key = None
+            if self._tint_key != (self.tint, self.tint_alpha):
+                self._tint_overlay.fill((*self.tint, self.tint_alpha))
+                self._tint_key = (self.tint, self.tint_alpha)
+            dest.blit(self._tint_overlay, (0, 0))
+        return dest
+
+    def _ensure_buffers(self, width: int, height: int) -> dict:
+        pad_x = int(math.ceil(abs(self.row_amplitude)))
+        pad_y = int(math.ceil(abs(self.col_amplitude)))
+        key = (width, height, pad_x, pad_y)
+        if self._buffers is None or self._buffers["key"] != key:
+            self._buffers = {
+                "key": key,
+                "pad_x": pad_x,
+                "pad_y": pad_y,
+                "xs": np.arange(width, dtype=np.intp),
+                "ys": np.arange(height, dtype=np.intp),
+                # Source pixels with `pad` pixels of wrap-around on every side,
+                # so shifted reads never need a modulo.
+                "padded": np.empty((height + 2 * pad_y, width + 2 * pad_x), dtype=np.uint32),
+                "index": np.empty((height, width), dtype=np.intp),
+                "row_term": np.empty(height, dtype=np.intp),
+                "col_term": np.empty(width, dtype=np.intp),
+            }
+        return self._buffers
+
+    def _apply_numpy(self, source: pygame.Surface, dest: pygame.Surface, time: float) -> bool:
+        width, height = source.get_size()
+        try:
+            # `pixels2d` gives a (width, height) view of the real pixel memory
+            # (one uint32 per pixel). `.T` makes it (height, width) = row-major.
+            src = pygame.surfarray.pixels2d(source).T
+            dst = pygame.surfarray.pixels2d(dest).T
+        except (ValueError, pygame.error):
+            return False  # e.g. 24-bit surfaces: use the blit fallback
+
+        buffers = self._ensure_buffers(width, height)
+        pad_x, pad_y = buffers["pad_x"], buffers["pad_y"]
+        padded = buffers["padded"]
+        padded_w = width + 2 * pad_x
+
+        # 1) Copy the source into the middle of the padded buffer + wrap the edges.
+        padded[pad_y:pad_y + height, pad_x:pad_x + width] = src
+        if pad_x:
+            padded[pad_y:pad_y + height, :pad_x] = src[:, width - pad_x:]
+            padded[pad_y:pad_y + height, pad_x + width:] = src[:, :pad_x]
+        if pad_y:
+            padded[:pad_y] = padded[height:height + pad_y]
+            padded[pad_y + height:] = padded[pad_y:2 * pad_y]
+
+        # 2) Build the index map. The output pixel (x, y) reads the source pixel
+        #    (x - row_offset[y], y - column_offset[x]). In the flattened padded
+        #    buffer that index splits into a per-row part + a per-column part,
+        #    so the whole map is one broadcast add.
+        row_term = buffers["row_term"]
+        col_term = buffers["col_term"]
+        np.multiply(buffers["ys"] + pad_y, padded_w, out=row_term)
+        row_term += pad_x
+        if pad_x:
+            row_term -= np.clip(self.row_offsets(time), -pad_x, pad_x)
+        col_term[:] = buffers["xs"]
+        if pad_y:
+            col_term -= np.clip(self.column_offsets(time), -pad_y, pad_y) * padded_w
+        np.add(row_term[:, None], col_term[None, :], out=buffers["index"])
+
+        # 3) One gather writes every output pixel.
+        np.take(padded.ravel(), buffers["index"], out=dst, mode="clip")
+
+        # Release the pixel views (they keep the surfaces locked).
+        del src, dst
+        return True
+
+    def _apply_blits(self, source: pygame.Surface, dest: pygame.Surface, time: float) -> None:
+        width, height = source.get_size()
+        if self.col_amplitude:
+            # Column pass first into `dest`, then rows need a second buffer.
+            if not self.row_amplitude:
+                self._blit_columns(source, dest, time)
+                return
+            if self._columns is None or self._columns.get_size() != source.get_size():
+                self._columns = pygame.Surface(source.get_size(), 0, source)
+            self._blit_columns(source, self._columns, time)
+            source = self._columns
+        if not self.row_amplitude:
+            dest.blit(source, (0, 0))
+            return
+        for y in range(height):
+            offset = self._row_offset(y, time)
+            dest.blit(source, (offset, y), (0, y, width, 1))
+            # Fill the gap with the part that wrapped around
+            if offset > 0:
+                dest.blit(source, (0, y), (width - offset, y, offset, 1))
+            elif offset < 0:
+                dest.blit(source, (width + offset, y), (0, y, -offset, 1))
+
+    def _blit_columns(self, source: pygame.Surface, dest: pygame.Surface, time: float) -> None:
+        width, height = source.get_size()
+        for x in range(width):
+            offset = self._column_offset(x, time)
+            dest.blit(source, (x, offset), (x, 0, 1, height))
+            if offset > 0:
+                dest.blit(source, (x, 0), (x, height - offset, 1, offset))
+            elif offset < 0:
+                dest.blit(source, (x, height + offset), (x, 0, 1, -offset))
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+# Stages are small objects with an `apply(source, dest)` method. The pipeline
+# owns two full-size "ping-pong" buffers: a stage reads from one buffer and
+# writes into the other, then the next stage reads what was just written, and
+# so on. That way any number of effects can be stacked (drunk while dancing)
+# without allocating a single new surface per frame.
+
+class PostFXStage(ABC):
+    """Base class for one post effect.
+
+    - `active`: switched on/off by the game every frame (e.g. "is drunk")
+    - `scenes`: set of scene names the stage may run in (None = every scene)
+    - `in_place`: True if the stage edits its input directly instead of
+      writing a new picture (cheap effects like tints)
+    """
+
+    in_place = False
+
+    def __init__(self, name: str):
+        self.name = name
+        self.active = False
+        self.scenes: set[str] | None = None
+
+    def enabled_for(self, scene: str) -> bool:
+        return self.active and (self.scenes is None or scene in self.scenes)
+
+    @abstractmethod
+    def apply(self, source: pygame.Surface, dest: pygame.Surface) -> None:
+        """Draw the effect of `source` into `dest` (for `in_place` stages they are the same)."""
+
+
+class TintStage(PostFXStage):
+    """Blend a flat color over the whole picture (disco flash, drunk green)."""
+
+    in_place = True
+
+    def __init__(self, name: str, color: tuple[int, int, int], alpha: int):
+        super().__init__(name)
+        self.color = color
+        self.alpha = alpha
+        self._overlay: pygame.Surface | None = None
+        self._overlay_key = None
+
+    def apply(self, source: pygame.Surface, dest: pygame.Surface) -> None:
+        # `source` and `dest` are the same surface for in-place stages.
+        if self._overlay is None or self._overlay.get_size() != dest.get_size():
+            self._overlay = pygame.Surface(dest.get_size(), pygame.SRCALPHA)
+            self._overlay_key = None
+        # Only refill the overlay when the color actually changes.
+        if self._overlay_key != (self.color, self.alpha):
+            self._overlay.fill((*self.color, self.alpha))
+            self._overlay_key = (self.color, self.alpha)
+        dest.blit(self._overlay, (0, 0))
+
+
+class DrawStage(PostFXStage):
+    """Draw something on top of the picture so far, e.g. a hint that must not
+    be tinted by the stages before it but should still move with the ones after.
+
+    `draw(surface)` is set by whoever owns the overlay.
+    """
+
+    in_place = True
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.draw: Callable[[pygame.Surface], None] | None = None
+
+    def apply(self, source: pygame.Surface, dest: pygame.Surface) -> None:
+        if self.draw is not None:
+            self.draw(dest)
+
+
+class PulseZoomStage(PostFXStage):
+    """Zoom into the center of the picture by `zoom` (1.0 = no zoom).
+
+    The old version scaled the whole canvas up to e.g. 945x630 and then
+    cropped the middle. Here we crop first (a subsurface, no pixel copy) and
+    scale that crop straight into the fixed-size output buffer.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.zoom = 1.0
+
+    def apply(self, source: pygame.Surface, dest: pygame.Surface) -> None:
+        width, height = source.get_size()
+        zoomed_w = int(width * self.zoom)
+        zoomed_h = int(height * self.zoom)
+        if zoomed_w <= width and zoomed_h <= height:
+            dest.blit(source, (0, 0))
+            return
+        # The part of the zoomed picture that stays visible, in source pixels.
+        crop = pygame.Rect(
+            round(((zoomed_w - width) // 2) * width / zoomed_w),
+            round(((zoomed_h - height) // 2) * height / zoomed_h),
+            round(width * width / zoomed_w),
+            round(height * height / zoomed_h),
+        )
+        crop = crop.clip(source.get_rect())
+        pygame.transform.smoothscale(source.subsurface(crop), (width, height), dest)
+
+
+class WaveStage(PostFXStage):
+    """Runs a `DisplacementEffect` at `time` seconds (e.g. the drunk wave)."""
+
+    def __init__(self, name: str, effect: DisplacementEffect):
+        super().__init__(name)
+        self.effect = effect
+        self.time = 0.0
+
+    def apply(self, source: pygame.Surface, dest: pygame.Surface) -> None:
+        self.effect.apply(source, self.time, dest)
+
+
+class PostFX:
+    """Ordered list of stages + two reusable frame buffers.
+
+    Usage:
+        postfx = PostFX((900, 600))
+        pulse = postfx.add_stage(PulseZoomStage("pulse"), scenes={"lobby2"})
+        ...
+        pulse.active = on_dancefloor
+        present_canvas = postfx.process(canvas, scene)
+
+    `process()` never modifies the canvas it is given. If no stage is enabled
+    it simply returns that canvas (zero cost).
+    """
+
+    def __init__(self, size: tuple[int, int]):
+        self.size = size
+        self.stages: list[PostFXStage] = []
+        self._buffers: list[pygame.Surface] = []
+
+    def add_stage(self, stage: PostFXStage, scenes=None) -> PostFXStage:
+        """Append a stage (stages run in the order they were added)."""
+        if scenes is not None:
+            stage.scenes = set(scenes)
+        self.stages.append(stage)
+        return stage
+
+    def stage(self, name: str) -> PostFXStage:
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        raise KeyError(name)
+
+    def _ensure_buffers(self, like: pygame.Surface) -> None:
+        # Created lazily so they match the canvas pixel format (fast blits).
+        if not self._buffers or self._buffers[0].get_size() != like.get_size():
+            self._buffers = [pygame.Surface(like.get_size(), 0, like) for _ in range(2)]
+
+    def process(self, canvas: pygame.Surface, scene: str) -> pygame.Surface:
+        """Run every enabled stage and return the surface to present."""
+        current = canvas
+        for stage in self.stages:
+            if not stage.enabled_for(scene):
+                continue
+            self._ensure_buffers(canvas)
+            if stage.in_place:
+                if current is canvas:
+                    # Never draw on the canvas itself: copy it into a buffer first.
+                    self._buffers[0].blit(canvas, (0, 0))
+                    current = self._buffers[0]
+                stage.apply(current, current)
+            else:
+                dest = self._buffers[1] if current is self._buffers[0] else self._buffers[0]
+                stage.apply(current, dest)
+                current = dest
+        return current
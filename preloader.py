@@ -0,0 +1,153 @@
+"""preloader.py
+
+The work behind the "Game loading..." screen.
+
+If you're new to game-dev:
+- Loading a PNG has two parts. *Decoding* (unpacking the compressed file into
+  pixels) is slow but doesn't need the screen, so it can run on other CPU
+  cores ("worker threads") while the game keeps drawing. *Converting* the
+  pixels to the screen's format (`convert()` / `convert_alpha()`) needs the
+  display, so that part stays on the main thread.
+- Everything else that is slow the first time (baking card sprites, reel
+  strips, rotated wheels, text, ...) also has to happen on the main thread.
+  Instead of doing it all at once (the loading screen would freeze), the
+  preloader does a few milliseconds of it per frame. A big task is given as
+  a generator (see scheduler.py): every `yield` is a point where it may be
+  paused until the next frame. A plain function runs in one go.
+
+Usage:
+    preloader = Preloader()
+    preloader.add_images(["img/lobby-bg.png", "img/cocktail.png"])
+    preloader.add_task(lambda: LuckyWheel(...))   # runs on the main thread
+    preloader.add_task(bake_cards())              # a generator: a step at a time
+    preloader.start()
+    ...
+    # every frame of the loading scene:
+    preloader.update()
+    draw_game_screen(..., progress=preloader.progress)
+    if preloader.done: ...
+
+In the browser (pygbag) there are no threads: images are then decoded inside
+`update()` too, one at a time, within the same per-frame time budget.
+"""
+
+import inspect
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from assetmanager import ASSETS, asset_path
+
+THREADS_AVAILABLE = sys.platform != "emscripten"
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+def find_images(folder: str = "img") -> list[str]:
+    """Every image under `assets/<folder>`, as relpaths for the AssetManager."""
+    found = []
+    root = asset_path(folder)
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in sorted(filenames):
+            if filename.lower().endswith(IMAGE_EXTENSIONS):
+                rel = os.path.relpath(os.path.join(dirpath, filename), asset_path(""))
+                found.append(rel.replace(os.sep, "/"))
+    return sorted(found)
+
+
+class Preloader:
+    """Decodes images on a thread pool and runs main-thread tasks in time slices."""
+
+    def __init__(self, workers: int = 4, budget_ms: float = 8.0):
+        self.workers = workers
+        self.budget_ms = budget_ms
+        self._images: list[str] = []
+        self._tasks: list = []
+        self._pool: ThreadPoolExecutor | None = None
+        # relpath -> Future of the decoded Surface (threaded mode only)
+        self._decoding: dict = {}
+        self._total = 0
+        self._finished = 0
+        self.started = False
+
+    def add_images(self, relpaths) -> None:
+        for relpath in relpaths:
+            if relpath not in self._images and not ASSETS.has_image(relpath):
+                self._images.append(relpath)
+
+    def add_task(self, task) -> None:
+        """Run `task` on the main thread, after all images are in.
+
+        `task` is a function (called once) or a generator (advanced with
+        `next()` until it is exhausted, as many steps per frame as fit).
+        """
+        self._tasks.append(task)
+
+    def start(self) -> None:
+        if self.started:
+            return
+        self.started = True
+        self._total = len(self._images) + len(self._tasks)
+        if THREADS_AVAILABLE and self._images:
+            try:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="preload")
+                for relpath in self._images:
+                    self._decoding[relpath] = self._pool.submit(ASSETS.decode, relpath)
+            except RuntimeError:
+                # Threads can't be started here after all: decode in update().
+                self._pool = None
+                self._decoding.clear()
+
+    @property
+    def progress(self) -> float:
+        """Finished jobs / all jobs (0.0 .. 1.0)."""
+        if not self._total:
+            return 1.0 if self.started else 0.0
+        return self._finished / self._total
+
+    @property
+    def done(self) -> bool:
+        return self.started and not self._images and not self._tasks
+
+    def update(self) -> float:
+        """Do main-thread work for up to `budget_ms`; returns the progress."""
+        if not self.started:
+            self.start()
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+
+        # Images first, in order, so tasks can rely on them being cached.
+        while self._images and time.perf_counter() < deadline:
+            relpath = self._images[0]
+            future = self._decoding.get(relpath)
+            if future is not None and not future.done():
+                break  # still decoding; keep the loading screen animating
+            self._images.pop(0)
+            self._decoding.pop(relpath, None)
+            try:
+                # (A scene may have loaded it itself in the meantime.)
+                if not ASSETS.has_image(relpath):
+                    surface = future.result() if future is not None else ASSETS.decode(relpath)
+                    ASSETS.add_decoded(relpath, surface)
+            except Exception:
+                pass  # the scene that needs it falls back like it always did
+            self._finished += 1
+
+        while not self._images and self._tasks and time.perf_counter() < deadline:
+            task = self._tasks[0]
+            try:
+                if inspect.isgenerator(task):
+                    next(task)
+                    continue  # more steps to go
+                task()
+            except StopIteration:
+                pass
+            except Exception as e:
+                print(f"Preload task failed: {e}")
+            self._tasks.pop(0)
+            self._finished += 1
+
+        if self.done and self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        return self.progress
@@ -0,0 +1,122 @@
+"""rotcache.py
+
+A small cache for rotated images.
+
+If you're new to game-dev:
+- `pygame.transform.rotate()` creates a brand new (bigger) surface every time
+  it is called, and touches every pixel of the image. For a 400x400 wheel
+  that is a lot of work to do 60 times per second.
+- A spinning wheel is usually drawn at angles that are *almost* the same
+  from frame to frame (and exactly the same while it stands still).
+
+So we round ("quantize") the angle to a small step, e.g. 0.5 degrees, and
+keep the rotated result for that step. Half a degree is far less than one
+pixel at the edge of our wheels' fine details, so nobody can see it.
+
+The cache is bounded by the memory its images take (width x height x bytes
+per pixel, not their number: one rotated roulette wheel is ~1.3 MB, a card
+label a few KB), with LRU ("least recently used") eviction: when it is
+full, the image that wasn't asked for the longest is thrown away. That keeps
+memory in check even while a wheel spins through hundreds of angles. A
+scene that is left can also drop its big rotations right away with
+`discard_named(...)`.
+
+Only rotations that are asked for again frame after frame (a spinning
+wheel) belong here. A one-time rotation, e.g. while baking a card image,
+just calls `pygame.transform.rotate` itself: it would only push the useful
+entries out, and its key would have to describe everything that went into
+the image (font included) to never return a stale copy.
+
+All per-frame rotations go through the one shared cache, `ROTATIONS`, so
+its hit/miss counters (shown in the F3 performance overlay) tell how much
+rotating is really going on. Each source image needs a key ("sprite id")
+that is unique in the whole game, so start it with the module/effect name.
+
+Usage:
+    rotated = ROTATIONS.rotated(("roulette-wheel", radius), wheel_texture, angle)
+    screen.blit(rotated, rotated.get_rect(center=wheel_center))
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+class RotationCache:
+    """LRU cache of `pygame.transform.rotate` results at quantized angles."""
+
+    def __init__(self, step_degrees: float = 0.5, max_bytes: int = 16 * 1024 * 1024):
+        self.step_degrees = step_degrees
+        self.max_bytes = max_bytes
+        # (key, angle bucket) -> rotated surface, oldest first
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def bucket(self, angle: float) -> int:
+        """Index of the quantization step `angle` falls into (0 .. steps-1)."""
+        steps = int(round(360.0 / self.step_degrees))
+        return int(round((angle % 360.0) / self.step_degrees)) % steps
+
+    def quantize(self, angle: float) -> float:
+        """The angle that is actually drawn for `angle` (in degrees)."""
+        return self.bucket(angle) * self.step_degrees
+
+    def rotated(self, key, surface: pygame.Surface, angle: float) -> pygame.Surface:
+        """Return `surface` rotated by `angle` degrees (counter-clockwise, like pygame).
+
+        `key` identifies the source image (for example `("wheel", radius)`).
+        Use a new key whenever the source image is re-rendered.
+        """
+        bucket = self.bucket(angle)
+        cache_key = (key, bucket)
+        cached = self._entries.get(cache_key)
+        if cached is not None:
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        if bucket == 0:
+            result = surface
+        else:
+            result = pygame.transform.rotate(surface, bucket * self.step_degrees)
+        self._entries[cache_key] = result
+        self._bytes += _surface_bytes(result)
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, old = self._entries.popitem(last=False)
+            self._bytes -= _surface_bytes(old)
+        return result
+
+    def discard(self, key) -> None:
+        """Drop every rotation of the image `key` (e.g. after re-rendering it)."""
+        self._discard_where(lambda k: k == key)
+
+    def discard_named(self, name: str) -> None:
+        """Drop every rotation whose key starts with `name` (e.g. "roulette-wheel")."""
+        self._discard_where(lambda k: isinstance(k, tuple) and k and k[0] == name)
+
+    def _discard_where(self, matches) -> None:
+        for cache_key in [k for k in self._entries if matches(k[0])]:
+            self._bytes -= _surface_bytes(self._entries.pop(cache_key))
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self._bytes}
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# The shared rotation service. Big wheel textures are ~1-2 MB per rotated
+# copy, so 16 MB holds about a dozen angles of one wheel; small sprites
+# barely count against it.
+ROTATIONS = RotationCache(step_degrees=0.5, max_bytes=16 * 1024 * 1024)
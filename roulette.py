@@ -21,12 +21,19 @@ If you're new to game-dev, notice the pattern:
 - The *state* is stored in a plain Python dict (`game_state`).
 - The draw function also performs the per-frame update (physics + VFX).
 - Input handlers mutate the state dict, but don't draw.
+- The wheel itself (37 wedges) is rendered ONCE into a texture and then only
+  rotated each frame (see "WHEEL TEXTURE" below).
 """
 
 import pygame
 import math
 import random
 
+import fonts
+import scenes
+import particles
+from rotcache import ROTATIONS
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -82,105 +89,45 @@ BALL_STOP_THRESHOLD = 0.1  # Ball "lands" when speed drops below this
 # VFX CLASSES
 # =============================================================================
 
-class CasinoFloater:
-    """Floating casino elements like chips, cards, dice"""
-
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-        self.x = random.randint(0, width)
-        self.y = random.randint(0, height)
-        self.vx = random.uniform(-0.5, 0.5)
-        self.vy = random.uniform(-1, -0.3)
-        self.type = random.choice(["chip", "spade", "heart", "diamond", "club", "dollar"])
-        self.size = random.randint(15, 30)
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-2, 2)
-        self.alpha = random.randint(30, 80)
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.rotation += self.rotation_speed
-
-        if self.y < -50:
-            self.y = self.height + 50
-            self.x = random.randint(0, self.width)
-        if self.x < -50:
-            self.x = self.width + 50
-        elif self.x > self.width + 50:
-            self.x = -50
-
-    def draw(self, screen):
-        surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-
-        if self.type == "chip":
-            pygame.draw.circle(surf, (255, 0, 0, self.alpha), (self.size, self.size), self.size)
-            pygame.draw.circle(surf, (255, 255, 255, self.alpha), (self.size, self.size), self.size, 3)
-        elif self.type == "spade":
-            color = (255, 255, 255, self.alpha)
-            points = [(self.size, self.size - 10), (self.size - 8, self.size + 5), (self.size + 8, self.size + 5)]
-            pygame.draw.polygon(surf, color, points)
-            pygame.draw.circle(surf, color, (self.size - 5, self.size), 6)
-            pygame.draw.circle(surf, color, (self.size + 5, self.size), 6)
-        elif self.type == "heart":
-            color = (255, 20, 60, self.alpha)
-            pygame.draw.circle(surf, color, (self.size - 5, self.size - 3), 7)
-            pygame.draw.circle(surf, color, (self.size + 5, self.size - 3), 7)
-            points = [(self.size - 12, self.size), (self.size, self.size + 12), (self.size + 12, self.size)]
-            pygame.draw.polygon(surf, color, points)
-        elif self.type == "diamond":
-            color = (255, 20, 60, self.alpha)
-            points = [(self.size, self.size - 10), (self.size - 8, self.size), (self.size, self.size + 10), (self.size + 8, self.size)]
-            pygame.draw.polygon(surf, color, points)
-        elif self.type == "club":
-            color = (255, 255, 255, self.alpha)
-            pygame.draw.circle(surf, color, (self.size, self.size - 5), 6)
-            pygame.draw.circle(surf, color, (self.size - 6, self.size + 2), 6)
-            pygame.draw.circle(surf, color, (self.size + 6, self.size + 2), 6)
-        elif self.type == "dollar":
-            font = pygame.font.Font(None, self.size)
-            text = font.render("$", True, (0, 255, 100, self.alpha))
-            surf.blit(text, (self.size - 8, self.size - 10))
-
-        screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
-
-
-class GoldenSparkle:
-    """Small golden sparkle particles"""
-
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-        self.x = random.randint(0, width)
-        self.y = random.randint(0, height)
-        self.vx = random.uniform(-0.3, 0.3)
-        self.vy = random.uniform(-0.5, 0.5)
-        self.lifetime = random.randint(60, 180)
-        self.age = 0
-        self.max_brightness = random.randint(150, 255)
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.age += 1
-
-        if self.x < 0: self.x = self.width
-        if self.x > self.width: self.x = 0
-        if self.y < 0: self.y = self.height
-        if self.y > self.height: self.y = 0
-
-        if self.age >= self.lifetime:
-            self.age = 0
-            self.x = random.randint(0, self.width)
-            self.y = random.randint(0, self.height)
-
-    def draw(self, screen):
-        progress = self.age / self.lifetime
-        brightness = int(self.max_brightness * (1 - progress * 0.5))
-        size = 1 if progress > 0.5 else 2
-        color = (brightness, brightness, int(brightness * 0.7))
-        pygame.draw.circle(screen, color, (int(self.x), int(self.y)), size)
+# Floating casino elements like chips, card suits and dollar signs.
+# The particle engine (particles.py) moves them; this function paints what
+# one floater looks like, once, when it is created.
+FLOATER_KINDS = ["chip", "spade", "heart", "diamond", "club", "dollar"]
+
+
+def _paint_floater(kind, size, alpha):
+    surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+
+    if kind == "chip":
+        pygame.draw.circle(surf, (255, 0, 0, alpha), (size, size), size)
+        pygame.draw.circle(surf, (255, 255, 255, alpha), (size, size), size, 3)
+    elif kind == "spade":
+        color = (255, 255, 255, alpha)
+        points = [(size, size - 10), (size - 8, size + 5), (size + 8, size + 5)]
+        pygame.draw.polygon(surf, color, points)
+        pygame.draw.circle(surf, color, (size - 5, size), 6)
+        pygame.draw.circle(surf, color, (size + 5, size), 6)
+    elif kind == "heart":
+        color = (255, 20, 60, alpha)
+        pygame.draw.circle(surf, color, (size - 5, size - 3), 7)
+        pygame.draw.circle(surf, color, (size + 5, size - 3), 7)
+        points = [(size - 12, size), (size, size + 12), (size + 12, size)]
+        pygame.draw.polygon(surf, color, points)
+    elif kind == "diamond":
+        color = (255, 20, 60, alpha)
+        points = [(size, size - 10), (size - 8, size), (size, size + 10), (size + 8, size)]
+        pygame.draw.polygon(surf, color, points)
+    elif kind == "club":
+        color = (255, 255, 255, alpha)
+        pygame.draw.circle(surf, color, (size, size - 5), 6)
+        pygame.draw.circle(surf, color, (size - 6, size + 2), 6)
+        pygame.draw.circle(surf, color, (size + 6, size + 2), 6)
+    elif kind == "dollar":
+        font = fonts.get_font(size)
+        text = fonts.render(font, "$", True, (0, 255, 100, alpha))
+        surf.blit(text, (size - 8, size - 10))
+
+    return surf
 
 
 class LightRay:
@@ -222,39 +169,8 @@ class LightRay:
         screen.blit(surf, (0, 0))
 
 
-class Confetti:
-    """Single confetti particle for wins"""
-
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-3, 3)
-        self.vy = random.uniform(-8, -3)
-        self.gravity = 0.3
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-10, 10)
-        self.color = random.choice([COLOR_GOLD, COLOR_RED, (0, 255, 0), CYAN, PURPLE, PINK, YELLOW, ORANGE])
-        self.size = random.randint(4, 8)
-        self.lifetime = random.randint(60, 120)
-        self.age = 0
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        self.rotation += self.rotation_speed
-        self.age += 1
-        return self.age < self.lifetime
-
-    def draw(self, screen):
-        if self.age < self.lifetime:
-            points = []
-            for i in range(4):
-                angle = math.radians(self.rotation + i * 90)
-                px = self.x + math.cos(angle) * self.size
-                py = self.y + math.sin(angle) * self.size
-                points.append((px, py))
-            pygame.draw.polygon(screen, self.color, points)
+# Win confetti colors (the confetti itself lives in a particle system)
+CONFETTI_COLORS = [COLOR_GOLD, COLOR_RED, (0, 255, 0), CYAN, PURPLE, PINK, YELLOW, ORANGE]
 
 
 class StarBurst:
@@ -333,6 +249,102 @@ def calculate_result(ball_angle, wheel_angle):
     return pocket_index, result_number
 
 
+# =============================================================================
+# WHEEL TEXTURE
+# =============================================================================
+# Drawing 37 polygon wedges (11 trig points each) every frame is expensive, but
+# the wheel never changes - it only rotates. So we draw it once per radius into
+# an off-screen texture and rotate that texture with the shared rotation cache.
+# The numbers are NOT baked in: they stay upright like before, so they are
+# rendered once per font size and blitted on top of the rotated texture.
+
+_WHEEL_TEXTURES = {}  # (wheel_radius, separator_inner) -> Surface
+_NUMBER_LABELS = {}   # font size -> [label Surface per pocket index]
+_WHEEL_COLORKEY = (0, 0, 0)
+
+
+def _get_wheel_texture(wheel_radius, separator_inner=None):
+    """
+    Return the (unrotated) wheel: a black disc with the colored pocket wedges.
+
+    If `separator_inner` is given, gold lines are drawn between the pockets,
+    starting at that distance from the center (the standalone game does this).
+    """
+    key = (wheel_radius, separator_inner)
+    texture = _WHEEL_TEXTURES.get(key)
+    if texture is not None:
+        return texture
+
+    size = wheel_radius * 2 + 1
+    # Opaque surface + colorkey instead of per-pixel alpha: the corners are
+    # skipped when blitting, and colorkey blits are much cheaper than alpha
+    # blending. (Pure black is never used by the wheel itself.)
+    texture = pygame.Surface((size, size))
+    texture.fill(_WHEEL_COLORKEY)
+    texture.set_colorkey(_WHEEL_COLORKEY)
+    c = wheel_radius  # center of the texture
+    pygame.draw.circle(texture, COLOR_BLACK, (c, c), wheel_radius)
+
+    for i, number in enumerate(POCKETS):
+        start_angle = math.radians(i * POCKET_ANGLE)
+        end_angle = math.radians((i + 1) * POCKET_ANGLE)
+
+        points = [(c, c)]
+        for j in range(11):
+            angle = start_angle + (end_angle - start_angle) * j / 10
+            points.append((c + wheel_radius * math.cos(angle), c + wheel_radius * math.sin(angle)))
+        pygame.draw.polygon(texture, get_pocket_color(number), points)
+
+        if separator_inner is not None:
+            pygame.draw.line(
+                texture, COLOR_GOLD,
+                (c + separator_inner * math.cos(start_angle), c + separator_inner * math.sin(start_angle)),
+                (c + wheel_radius * math.cos(start_angle), c + wheel_radius * math.sin(start_angle)),
+                2,
+            )
+
+    if pygame.display.get_surface() is not None:
+        texture = texture.convert()
+    _WHEEL_TEXTURES[key] = texture
+    return texture
+
+
+def _get_number_labels(font_size):
+    """Rendered number labels (one per pocket), cached per font size."""
+    labels = _NUMBER_LABELS.get(font_size)
+    if labels is None:
+        font = fonts.get_font(font_size)
+        labels = [fonts.render(font, str(number), True, COLOR_WHITE) for number in POCKETS]
+        _NUMBER_LABELS[font_size] = labels
+    return labels
+
+
+def draw_wheel_texture(surface, center, wheel_radius, pocket_radius, wheel_angle, font_size, separator_inner=None):
+    """
+    Draw the wheel rotated by `wheel_angle` degrees, with upright numbers.
+
+    Returns the angle that was actually drawn (quantized to the rotation
+    cache step), so anything drawn "on" the wheel can line up with it.
+    """
+    cx, cy = center
+    texture = _get_wheel_texture(wheel_radius, separator_inner)
+
+    # Our angles grow clockwise on screen (y points down), while
+    # `pygame.transform.rotate` turns counter-clockwise - hence the minus.
+    rotated = ROTATIONS.rotated(("roulette-wheel", wheel_radius, separator_inner), texture, -wheel_angle)
+    surface.blit(rotated, rotated.get_rect(center=center))
+    drawn_angle = -ROTATIONS.quantize(-wheel_angle) % 360
+
+    labels = _get_number_labels(font_size)
+    for i, label in enumerate(labels):
+        mid_angle = math.radians((i + 0.5) * POCKET_ANGLE + drawn_angle)
+        text_x = cx + pocket_radius * math.cos(mid_angle)
+        text_y = cy + pocket_radius * math.sin(mid_angle)
+        surface.blit(label, label.get_rect(center=(text_x, text_y)))
+
+    return drawn_angle
+
+
 # =============================================================================
 # GAME STATE
 # =============================================================================
@@ -347,8 +359,8 @@ class RouletteGame:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("European Roulette - Deterministic")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = fonts.get_font(36)
+        self.small_font = fonts.get_font(24)
         
         # State variables
         self.reset()
@@ -446,52 +458,13 @@ class RouletteGame:
         Draw the roulette wheel with all pockets.
         The wheel rotates based on wheel_angle.
         """
-        cx, cy = WHEEL_CENTER
-        
-        # Draw outer rim
+        # Draw outer rim (a circle looks the same at every angle)
         pygame.draw.circle(self.screen, COLOR_GOLD, WHEEL_CENTER, WHEEL_RADIUS + 10)
-        pygame.draw.circle(self.screen, COLOR_BLACK, WHEEL_CENTER, WHEEL_RADIUS)
         
-        # Draw each pocket wedge
-        for i, number in enumerate(POCKETS):
-            # Calculate the start and end angles for this pocket
-            # Account for wheel rotation
-            start_angle = math.radians(i * POCKET_ANGLE + self.wheel_angle)
-            end_angle = math.radians((i + 1) * POCKET_ANGLE + self.wheel_angle)
-            mid_angle = (start_angle + end_angle) / 2
-            
-            # Get pocket color
-            color = get_pocket_color(number)
-            
-            # Draw filled wedge using polygon
-            points = [WHEEL_CENTER]
-            num_arc_points = 10
-            for j in range(num_arc_points + 1):
-                angle = start_angle + (end_angle - start_angle) * j / num_arc_points
-                x = cx + WHEEL_RADIUS * math.cos(angle)
-                y = cy + WHEEL_RADIUS * math.sin(angle)
-                points.append((x, y))
-            
-            pygame.draw.polygon(self.screen, color, points)
-            
-            # Draw wedge border lines for clarity
-            line_start_x = cx + 50 * math.cos(start_angle)
-            line_start_y = cy + 50 * math.sin(start_angle)
-            line_end_x = cx + WHEEL_RADIUS * math.cos(start_angle)
-            line_end_y = cy + WHEEL_RADIUS * math.sin(start_angle)
-            pygame.draw.line(self.screen, COLOR_GOLD, 
-                           (line_start_x, line_start_y), 
-                           (line_end_x, line_end_y), 2)
-            
-            # Draw number in the pocket
-            text_radius = POCKET_RADIUS
-            text_x = cx + text_radius * math.cos(mid_angle)
-            text_y = cy + text_radius * math.sin(mid_angle)
-            
-            # Render number text
-            text = self.small_font.render(str(number), True, COLOR_WHITE)
-            text_rect = text.get_rect(center=(text_x, text_y))
-            self.screen.blit(text, text_rect)
+        # Pocket wedges, separator lines and numbers come from the pre-rendered
+        # wheel texture (see "WHEEL TEXTURE" above)
+        draw_wheel_texture(self.screen, WHEEL_CENTER, WHEEL_RADIUS, POCKET_RADIUS,
+                           self.wheel_angle, 24, separator_inner=50)
         
         # Draw center hub
         pygame.draw.circle(self.screen, COLOR_GOLD, WHEEL_CENTER, 50)
@@ -527,7 +500,7 @@ class RouletteGame:
         
         y = 20
         for text in instructions:
-            surface = self.small_font.render(text, True, COLOR_WHITE)
+            surface = fonts.render(self.small_font, text, True, COLOR_WHITE)
             self.screen.blit(surface, (20, y))
             y += 25
         
@@ -538,7 +511,7 @@ class RouletteGame:
             result_text = f"Result: {self.result_number}"
             
             # Draw result box
-            text_surface = self.font.render(result_text, True, COLOR_WHITE)
+            text_surface = fonts.render(self.font, result_text, True, COLOR_WHITE)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
             
             # Background box
@@ -557,14 +530,14 @@ class RouletteGame:
             
             y = SCREEN_HEIGHT - 120
             for line in debug_lines:
-                surface = self.small_font.render(line, True, COLOR_WHITE)
+                surface = fonts.render(self.small_font, line, True, COLOR_WHITE)
                 self.screen.blit(surface, (20, y))
                 y += 22
         
         # Show current speeds while spinning
         elif self.ball_active and not self.ball_landed:
             speed_text = f"Ball speed: {abs(self.ball_speed):.2f}"
-            surface = self.small_font.render(speed_text, True, COLOR_WHITE)
+            surface = fonts.render(self.small_font, speed_text, True, COLOR_WHITE)
             self.screen.blit(surface, (20, SCREEN_HEIGHT - 40))
     
     def draw_pocket_highlight(self):
@@ -641,18 +614,7 @@ class RouletteGame:
 # ENTRY POINT
 # =============================================================================
 
-def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
-    """
-    Draw and update roulette game on the given surface.
-    
-    Args:
-        surface: The pygame surface to draw on
-        game_state: Dictionary containing the roulette state (or empty for first call)
-        font: Font to use for rendering
-    
-    Returns:
-        Updated game_state dictionary
-    """
+def _ensure_roulette_state(game_state: dict, size: tuple[int, int]) -> dict:
     # Initialize state if needed.
     # This is a very common pattern for "embedded scenes":
     # - the first time you enter the scene, `game_state` is `{}`
@@ -660,7 +622,7 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     # - subsequent calls reuse the state so animations continue
     if "initialized" not in game_state:
         tokens = game_state.get("tokens", 100)  # Get tokens passed from app
-        surf_w, surf_h = surface.get_size()
+        surf_w, surf_h = size
         game_state = {
             "initialized": True,
             "wheel_angle": 0.0,
@@ -681,20 +643,25 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
             "bet_placed": False,  # Whether a bet is active
             "winnings": 0,  # Last win amount
             # VFX
-            "floaters": [CasinoFloater(surf_w, surf_h) for _ in range(20)],
-            "sparkles": [GoldenSparkle(surf_w, surf_h) for _ in range(50)],
+            "floaters": particles.casino_floaters(surf_w, surf_h, 20, FLOATER_KINDS, _paint_floater),
+            "sparkles": particles.golden_sparkles(surf_w, surf_h, 50, particles.draw_spark_dots, fade=0.5),
             "light_rays": [LightRay(surf_w, surf_h, i * 90) for i in range(4)],
-            "confetti": [],
+            "confetti": particles.confetti(particles.draw_confetti_quads, gravity=0.3),
             "starbursts": [],
             # Button rects (will be set during drawing)
             "buttons": {},
         }
     
+    return game_state
+
+
+def _layout(size: tuple[int, int]):
+    """(scale, center_x, center_y, wheel_radius, pocket_radius, ball_orbit_radius) for a surface of `size`."""
     # Get surface dimensions and calculate scale.
     # The roulette scene was originally designed at SCREEN_WIDTH/SCREEN_HEIGHT.
     # When embedded in `main.py`, we draw onto a surface of whatever size we get,
     # so we compute a uniform scale and derive all radii from it.
-    surf_w, surf_h = surface.get_size()
+    surf_w, surf_h = size
     scale = min(surf_w / SCREEN_WIDTH, surf_h / SCREEN_HEIGHT) * 0.9
     center_x, center_y = surf_w // 2, surf_h // 2
     
@@ -703,6 +670,14 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     pocket_radius = int(POCKET_RADIUS * scale)
     ball_orbit_radius = int(BALL_ORBIT_RADIUS * scale)
     
+    return scale, center_x, center_y, wheel_radius, pocket_radius, ball_orbit_radius
+
+
+def update_roulette_scene(game_state: dict, size: tuple[int, int]) -> dict:
+    """Advance the roulette game by one frame (`size` = the surface it is drawn on)."""
+    game_state = _ensure_roulette_state(game_state, size)
+    center_x, center_y = _layout(size)[1:3]
+    
     # UPDATE PHASE (physics)
     # Wheel and ball angles are updated each frame.
     # Speeds decay via friction multipliers, so things come to a stop naturally.
@@ -758,8 +733,7 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
                         game_state["tokens"] += winnings
                         game_state["winnings"] = winnings
                         # Spawn win VFX
-                        for _ in range(30):
-                            game_state["confetti"].append(Confetti(center_x, center_y))
+                        particles.burst(game_state["confetti"], center_x, center_y, 30, CONFETTI_COLORS)
                         game_state["starbursts"].append(StarBurst(center_x, center_y))
                     else:
                         game_state["winnings"] = -bet_amount
@@ -769,53 +743,39 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
             game_state["ball_angle"] = (game_state["ball_relative_angle"] + game_state["wheel_angle"]) % 360
     
     # Update win VFX
-    game_state["confetti"] = [c for c in game_state.get("confetti", []) if c.update()]
+    game_state["confetti"].update()
     game_state["starbursts"] = [s for s in game_state.get("starbursts", []) if s.update()]
     
-    # Draw background
-    surface.fill(COLOR_BACKGROUND)
+    # Background VFX
+    game_state["floaters"].update()
+    game_state["sparkles"].update()
+    for ray in game_state.get("light_rays", []):
+        ray.update()
     
-    # Update and draw VFX (background layer)
-    for floater in game_state.get("floaters", []):
-        floater.update()
-        floater.draw(surface)
+    return game_state
+
+
+def render_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """Draw the roulette game (no game logic, see update_roulette_scene)."""
+    game_state = _ensure_roulette_state(game_state, surface.get_size())
+    surf_w, surf_h = surface.get_size()
+    scale, center_x, center_y, wheel_radius, pocket_radius, ball_orbit_radius = _layout((surf_w, surf_h))
     
-    for sparkle in game_state.get("sparkles", []):
-        sparkle.update()
-        sparkle.draw(surface)
+    # Draw background
+    surface.fill(COLOR_BACKGROUND)
     
+    # Draw VFX (background layer)
+    game_state["floaters"].draw(surface)
+    game_state["sparkles"].draw(surface)
     for ray in game_state.get("light_rays", []):
-        ray.update()
         ray.draw(surface)
     
     # Draw outer rim
     pygame.draw.circle(surface, COLOR_GOLD, (center_x, center_y), wheel_radius + int(10 * scale))
-    pygame.draw.circle(surface, COLOR_BLACK, (center_x, center_y), wheel_radius)
     
-    # Draw each pocket wedge
-    small_font = pygame.font.Font(None, max(12, int(24 * scale)))
-    for i, number in enumerate(POCKETS):
-        start_angle = math.radians(i * POCKET_ANGLE + game_state["wheel_angle"])
-        end_angle = math.radians((i + 1) * POCKET_ANGLE + game_state["wheel_angle"])
-        mid_angle = (start_angle + end_angle) / 2
-        
-        color = get_pocket_color(number)
-        
-        points = [(center_x, center_y)]
-        for j in range(11):
-            angle = start_angle + (end_angle - start_angle) * j / 10
-            x = center_x + wheel_radius * math.cos(angle)
-            y = center_y + wheel_radius * math.sin(angle)
-            points.append((x, y))
-        
-        pygame.draw.polygon(surface, color, points)
-        
-        # Draw number
-        text_x = center_x + pocket_radius * math.cos(mid_angle)
-        text_y = center_y + pocket_radius * math.sin(mid_angle)
-        text = small_font.render(str(number), True, COLOR_WHITE)
-        text_rect = text.get_rect(center=(text_x, text_y))
-        surface.blit(text, text_rect)
+    # Draw the pocket wedges + numbers (pre-rendered wheel texture, rotated)
+    draw_wheel_texture(surface, (center_x, center_y), wheel_radius, pocket_radius,
+                       game_state["wheel_angle"], max(12, int(24 * scale)))
     
     # Draw center hub
     pygame.draw.circle(surface, COLOR_GOLD, (center_x, center_y), int(50 * scale))
@@ -829,9 +789,9 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
         pygame.draw.circle(surface, COLOR_BALL, (int(ball_x), int(ball_y)), int(12 * scale))
     
     # Draw UI - Use fixed font sizes (canvas is always 900x600)
-    hint_font = pygame.font.Font(None, 24)
-    bet_font = pygame.font.Font(None, 28)
-    btn_font = pygame.font.Font(None, 24)
+    hint_font = fonts.get_font(24)
+    bet_font = fonts.get_font(28)
+    btn_font = fonts.get_font(24)
     
     # Store button rects for click detection
     buttons = {}
@@ -850,7 +810,7 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     spin_color = (50, 150, 50) if not game_state.get("ball_active", False) else (80, 80, 80)
     pygame.draw.rect(surface, spin_color, spin_rect, border_radius=8)
     pygame.draw.rect(surface, COLOR_GOLD, spin_rect, 2, border_radius=8)
-    spin_text = btn_font.render("SPIN", True, COLOR_WHITE)
+    spin_text = fonts.render(btn_font, "SPIN", True, COLOR_WHITE)
     surface.blit(spin_text, spin_text.get_rect(center=spin_rect.center))
     buttons["spin"] = spin_rect
     btn_y += 55
@@ -859,13 +819,13 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     reset_rect = pygame.Rect(btn_x, btn_y, btn_w, btn_h)
     pygame.draw.rect(surface, (100, 50, 50), reset_rect, border_radius=6)
     pygame.draw.rect(surface, COLOR_WHITE, reset_rect, 2, border_radius=6)
-    reset_text = btn_font.render("Reset", True, COLOR_WHITE)
+    reset_text = fonts.render(btn_font, "Reset", True, COLOR_WHITE)
     surface.blit(reset_text, reset_text.get_rect(center=reset_rect.center))
     buttons["reset"] = reset_rect
     btn_y += 50
     
     # Bet amount controls
-    amount_label = hint_font.render("Bet Amount:", True, COLOR_WHITE)
+    amount_label = fonts.render(hint_font, "Bet Amount:", True, COLOR_WHITE)
     surface.blit(amount_label, (btn_x, btn_y))
     btn_y += 25
     
@@ -873,7 +833,7 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     minus_rect = pygame.Rect(btn_x, btn_y, 40, btn_h)
     pygame.draw.rect(surface, (80, 80, 120), minus_rect, border_radius=6)
     pygame.draw.rect(surface, COLOR_WHITE, minus_rect, 2, border_radius=6)
-    minus_text = btn_font.render("-", True, COLOR_WHITE)
+    minus_text = fonts.render(btn_font, "-", True, COLOR_WHITE)
     surface.blit(minus_text, minus_text.get_rect(center=minus_rect.center))
     buttons["bet_minus"] = minus_rect
     
@@ -881,13 +841,13 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     plus_rect = pygame.Rect(btn_x + 50, btn_y, 40, btn_h)
     pygame.draw.rect(surface, (80, 80, 120), plus_rect, border_radius=6)
     pygame.draw.rect(surface, COLOR_WHITE, plus_rect, 2, border_radius=6)
-    plus_text = btn_font.render("+", True, COLOR_WHITE)
+    plus_text = fonts.render(btn_font, "+", True, COLOR_WHITE)
     surface.blit(plus_text, plus_text.get_rect(center=plus_rect.center))
     buttons["bet_plus"] = plus_rect
     btn_y += 50
     
     # Bet type label
-    type_label = hint_font.render("Bet Type:", True, COLOR_WHITE)
+    type_label = fonts.render(hint_font, "Bet Type:", True, COLOR_WHITE)
     surface.blit(type_label, (btn_x, btn_y))
     btn_y += 25
     
@@ -900,7 +860,7 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     red_color = (200, 50, 50) if bet_type == "red" else (120, 30, 30)
     pygame.draw.rect(surface, red_color, red_rect, border_radius=6)
     pygame.draw.rect(surface, COLOR_WHITE if bet_type == "red" else (80, 80, 80), red_rect, 2, border_radius=6)
-    red_text = btn_font.render("RED", True, COLOR_WHITE)
+    red_text = fonts.render(btn_font, "RED", True, COLOR_WHITE)
     surface.blit(red_text, red_text.get_rect(center=red_rect.center))
     buttons["red"] = red_rect
     
@@ -909,7 +869,7 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     black_color = (60, 60, 60) if bet_type == "black" else (30, 30, 30)
     pygame.draw.rect(surface, black_color, black_rect, border_radius=6)
     pygame.draw.rect(surface, COLOR_WHITE if bet_type == "black" else (80, 80, 80), black_rect, 2, border_radius=6)
-    black_text = btn_font.render("BLK", True, COLOR_WHITE)
+    black_text = fonts.render(btn_font, "BLK", True, COLOR_WHITE)
     surface.blit(black_text, black_text.get_rect(center=black_rect.center))
     buttons["black"] = black_rect
     btn_y += btn_h + btn_spacing
@@ -919,7 +879,7 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     green_color = (30, 150, 30) if bet_type == "green" else (20, 80, 20)
     pygame.draw.rect(surface, green_color, green_rect, border_radius=6)
     pygame.draw.rect(surface, COLOR_WHITE if bet_type == "green" else (80, 80, 80), green_rect, 2, border_radius=6)
-    green_text = btn_font.render("GRN", True, COLOR_WHITE)
+    green_text = fonts.render(btn_font, "GRN", True, COLOR_WHITE)
     surface.blit(green_text, green_text.get_rect(center=green_rect.center))
     buttons["green"] = green_rect
     btn_y += btn_h + btn_spacing
@@ -929,7 +889,7 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     odd_color = (80, 80, 160) if bet_type == "odd" else (50, 50, 100)
     pygame.draw.rect(surface, odd_color, odd_rect, border_radius=6)
     pygame.draw.rect(surface, COLOR_WHITE if bet_type == "odd" else (80, 80, 80), odd_rect, 2, border_radius=6)
-    odd_text = btn_font.render("ODD", True, COLOR_WHITE)
+    odd_text = fonts.render(btn_font, "ODD", True, COLOR_WHITE)
     surface.blit(odd_text, odd_text.get_rect(center=odd_rect.center))
     buttons["odd"] = odd_rect
     
@@ -937,13 +897,13 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     even_color = (160, 80, 80) if bet_type == "even" else (100, 50, 50)
     pygame.draw.rect(surface, even_color, even_rect, border_radius=6)
     pygame.draw.rect(surface, COLOR_WHITE if bet_type == "even" else (80, 80, 80), even_rect, 2, border_radius=6)
-    even_text = btn_font.render("EVN", True, COLOR_WHITE)
+    even_text = fonts.render(btn_font, "EVN", True, COLOR_WHITE)
     surface.blit(even_text, even_text.get_rect(center=even_rect.center))
     buttons["even"] = even_rect
     btn_y += btn_h + 15
     
     # Number bet section
-    num_label = hint_font.render("Bet on #:", True, COLOR_WHITE)
+    num_label = fonts.render(hint_font, "Bet on #:", True, COLOR_WHITE)
     surface.blit(num_label, (btn_x, btn_y))
     btn_y += 25
     
@@ -957,9 +917,9 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     
     # Display input text or placeholder
     if number_input:
-        input_text = btn_font.render(number_input, True, COLOR_WHITE)
+        input_text = fonts.render(btn_font, number_input, True, COLOR_WHITE)
     else:
-        input_text = btn_font.render("0-36", True, (100, 100, 120))
+        input_text = fonts.render(btn_font, "0-36", True, (100, 100, 120))
     surface.blit(input_text, input_text.get_rect(center=input_rect.center))
     buttons["number_input"] = input_rect
     
@@ -968,7 +928,7 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     confirm_color = (50, 120, 50) if bet_type == "number" else (40, 80, 40)
     pygame.draw.rect(surface, confirm_color, confirm_rect, border_radius=6)
     pygame.draw.rect(surface, COLOR_WHITE if bet_type == "number" else (80, 80, 80), confirm_rect, 2, border_radius=6)
-    confirm_text = btn_font.render("OK", True, COLOR_WHITE)
+    confirm_text = fonts.render(btn_font, "OK", True, COLOR_WHITE)
     surface.blit(confirm_text, confirm_text.get_rect(center=confirm_rect.center))
     buttons["confirm_number"] = confirm_rect
     btn_y += btn_h + 10
@@ -976,7 +936,7 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     # Show current number bet if active
     bet_number = game_state.get("bet_number")
     if bet_type == "number" and bet_number is not None:
-        num_bet_text = hint_font.render(f"Betting on: {bet_number}", True, COLOR_GOLD)
+        num_bet_text = fonts.render(hint_font, f"Betting on: {bet_number}", True, COLOR_GOLD)
         surface.blit(num_bet_text, (btn_x, btn_y))
     
     # Store buttons in game state for click handling
@@ -988,12 +948,12 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
     
     # Token display
     token_text = f"Tokens: {tokens}"
-    token_surf = bet_font.render(token_text, True, COLOR_GOLD)
+    token_surf = fonts.render(bet_font, token_text, True, COLOR_GOLD)
     surface.blit(token_surf, (surf_w - 140, 20))
     
     # Current bet display
     bet_text = f"Bet: {current_bet}"
-    bet_surf = bet_font.render(bet_text, True, COLOR_WHITE)
+    bet_surf = fonts.render(bet_font, bet_text, True, COLOR_WHITE)
     surface.blit(bet_surf, (surf_w - 140, 50))
     
     # Bet type display with color
@@ -1002,14 +962,14 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
         type_text = f"Type: #{bet_number}"
     else:
         type_text = f"Type: {bet_type.upper()}"
-    type_surf = bet_font.render(type_text, True, bet_colors.get(bet_type, COLOR_WHITE))
+    type_surf = fonts.render(bet_font, type_text, True, bet_colors.get(bet_type, COLOR_WHITE))
     surface.blit(type_surf, (surf_w - 140, 80))
     
     # Show result
     if game_state["ball_landed"] and game_state["result_number"] is not None:
         result_color = get_pocket_color(game_state["result_number"])
         result_text = f"Result: {game_state['result_number']}"
-        text_surface = font.render(result_text, True, COLOR_WHITE)
+        text_surface = fonts.render(font, result_text, True, COLOR_WHITE)
         text_rect = text_surface.get_rect(center=(center_x, 50))
         box_rect = text_rect.inflate(40, 20)
         pygame.draw.rect(surface, result_color, box_rect, border_radius=10)
@@ -1029,23 +989,38 @@ def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.
             win_color = COLOR_WHITE
         
         if win_text:
-            win_surf = font.render(win_text, True, win_color)
+            win_surf = fonts.render(font, win_text, True, win_color)
             win_rect = win_surf.get_rect(center=(center_x, surf_h - 50))
             surface.blit(win_surf, win_rect)
     
     # Draw ESC hint at bottom right
-    esc_hint = hint_font.render("ESC - Back to Casino", True, (180, 180, 180))
+    esc_hint = fonts.render(hint_font, "ESC - Back to Casino", True, (180, 180, 180))
     surface.blit(esc_hint, (surf_w - 180, surf_h - 30))
     
     # Draw win VFX on top
     for starburst in game_state.get("starbursts", []):
         starburst.draw(surface)
-    for confetti in game_state.get("confetti", []):
-        confetti.draw(surface)
+    game_state["confetti"].draw(surface)
     
     return game_state
 
 
+def draw_roulette_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """
+    Draw and update roulette game on the given surface.
+    
+    Args:
+        surface: The pygame surface to draw on
+        game_state: Dictionary containing the roulette state (or empty for first call)
+        font: Font to use for rendering
+    
+    Returns:
+        Updated game_state dictionary
+    """
+    game_state = update_roulette_scene(game_state, surface.get_size())
+    return render_roulette_scene(surface, game_state, font)
+
+
 def spin_roulette(game_state: dict) -> dict:
     """Start a new spin with bet."""
     # This function is called from `main.py` when the player presses SPACE
@@ -1217,6 +1192,62 @@ def handle_roulette_keypress(game_state: dict, event) -> dict:
     return game_state
 
 
+class RouletteScene(scenes.MiniGameScene):
+    """The roulette table as a scene (see scenes.py)."""
+
+    name = "roulette"
+
+    def __init__(self):
+        super().__init__()
+        self.on_key(pygame.K_SPACE, spin_roulette)
+        self.on_key(pygame.K_r, reset_roulette)
+        self.on_key(pygame.K_1, lambda state: change_bet_amount(state, False))  # Decrease
+        self.on_key(pygame.K_2, lambda state: change_bet_amount(state, True))   # Increase
+        self.on_key(pygame.K_q, lambda state: change_bet_type(state, "red"))
+        self.on_key(pygame.K_w, lambda state: change_bet_type(state, "black"))
+        self.on_key(pygame.K_e, lambda state: change_bet_type(state, "green"))
+        self.on_key(pygame.K_a, lambda state: change_bet_type(state, "odd"))
+        self.on_key(pygame.K_s, lambda state: change_bet_type(state, "even"))
+
+    def prepare(self, size):
+        # Draw the wheel texture and its number labels before the game is built.
+        scale, _, _, wheel_radius = _layout(size)[:4]
+        _get_wheel_texture(wheel_radius)
+        yield
+        _get_number_labels(max(12, int(24 * scale)))
+        yield
+
+    def update_state(self, state, size):
+        return update_roulette_scene(state, size)
+
+    def render(self, surface, state, font):
+        return render_roulette_scene(surface, state, font)
+
+    def handle_event(self, app, event):
+        if event.type == pygame.KEYDOWN and self.state.get("number_input_active", False):
+            # While typing a number, keys go to the input field only.
+            self.state = handle_roulette_keypress(self.state, event)
+        else:
+            super().handle_event(app, event)
+
+    def back(self, app):
+        # ESC first closes the number input, only then leaves the table.
+        if self.state.get("number_input_active", False):
+            self.state["number_input_active"] = False
+            self.state["number_input"] = ""
+        else:
+            super().back(app)
+
+    def click(self, app, pos):
+        self.state = handle_roulette_click(self.state, pos)
+
+    def exit(self, app):
+        # A rotated wheel is ~1.3 MB; don't keep a few dozen of them around
+        # once nobody is looking at the table.
+        ROTATIONS.discard_named("roulette-wheel")
+        super().exit(app)
+
+
 if __name__ == "__main__":
     game = RouletteGame()
     game.run()
@@ -0,0 +1,312 @@
+"""scenes.py
+
+Scenes (menu, lobby, one per table, ...) and the registry that finds them.
+
+If you're new to game-dev:
+- A game is usually a "state machine" of scenes: only one of them is active,
+  and it decides what input does, what moves and what is drawn.
+- Every scene has the same five entry points:
+    enter(app)               the scene becomes active
+    exit(app)                the scene stops being active
+    handle_event(app, event) one pygame event (key, click, ...)
+    update(app, dt)          move things forward by `dt` seconds
+    draw(app, surface)       draw the current picture (no game logic here)
+  So the main loop doesn't need an `if scene == "..."` for every scene: it
+  looks the active scene up once and calls those methods.
+- `app` is the shared "app context" (see `App`): tokens, the player, the
+  default font, and `app.switch(name)` to go to another scene.
+
+Keys are dispatched through a per-scene `keymap` (key -> handler), a single
+dictionary lookup no matter how many keys or scenes there are.
+
+The mini-games live in their own modules (roulette.py, ...), and those are
+only imported when their scene is first needed: the registry knows the
+module and class name of each table (`SCENE_MODULES` / `SCENE_CLASSES`) and
+imports it on the first `get(name)`. `prefetch(name)` does that ahead of
+time. The `Prewarmer` goes further when the player walks up to a table: it
+imports the module and builds the whole game in small steps spread over a
+few frames (a scheduler job, see scheduler.py), so pressing E only has to
+swap it in.
+"""
+
+import importlib
+import sys
+
+import pygame
+
+from move import Player
+from scheduler import Scheduler
+from statepool import StatePool
+
+# scene name -> module that implements it
+SCENE_MODULES = {
+    "roulette": "roulette",
+    "slotmachine": "slotmachine",
+    "luckywheel": "luckywheel",
+    "blackjack": "blackjack",
+    "higherlower": "higherlower",
+    "horsegame": "horsegame",
+}
+
+# scene name -> its Scene class inside that module
+SCENE_CLASSES = {
+    "roulette": "RouletteScene",
+    "slotmachine": "SlotMachineScene",
+    "luckywheel": "LuckyWheelScene",
+    "blackjack": "BlackjackScene",
+    "higherlower": "HigherLowerScene",
+    "horsegame": "HorseGameScene",
+}
+
+
+def module(scene: str):
+    """The module of `scene`, imported now if it wasn't yet."""
+    return importlib.import_module(SCENE_MODULES[scene])
+
+
+def prefetch(scene: str) -> None:
+    """Import `scene`'s module now (does nothing if it is already imported)."""
+    if SCENE_MODULES[scene] not in sys.modules:
+        module(scene)
+
+
+class Scene:
+    """Base class: every method does nothing, override what you need."""
+
+    name = ""
+    # The scene's own state dict, if it has one (mini-games do). The perf
+    # overlay and benchmark.py look inside it.
+    state: dict | None = None
+
+    def __init__(self):
+        # pygame key -> handler(app, event)
+        self.keymap: dict = {}
+
+    def enter(self, app: "App") -> None:
+        pass
+
+    def exit(self, app: "App") -> None:
+        pass
+
+    def back(self, app: "App") -> None:
+        """What ESC does in this scene."""
+
+    def click(self, app: "App", pos: tuple[int, int]) -> None:
+        """Left mouse click at `pos` (canvas coordinates)."""
+
+    def handle_event(self, app: "App", event) -> None:
+        if event.type == pygame.KEYDOWN:
+            handler = self.keymap.get(event.key)
+            if handler is not None:
+                handler(app, event)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.click(app, app.mouse_pos)
+
+    def add_tokens(self, amount: int) -> None:
+        """Tokens given from outside (passive income, cheat) while this scene is active."""
+
+    def update(self, app: "App", dt: float) -> None:
+        pass
+
+    def draw(self, app: "App", surface: pygame.Surface) -> None:
+        pass
+
+
+class MiniGameScene(Scene):
+    """A table. Its module keeps all game state in one dict, like before.
+
+    Subclasses provide:
+    - `update_state(state, size) -> state`: one frame of game logic
+    - `render(surface, state, font) -> state`: draw it
+    and bind their keys with `on_key`. ESC goes back to `lobby`; if
+    `spawn_point` returns a position, the player is put there (next to the
+    table) when leaving.
+
+    Leaving suspends the state into `app.state_pool` and the next visit
+    resumes it (see statepool.py), so the table isn't built again. Games
+    that keep their own copy of the tokens override `set_tokens`.
+    """
+
+    lobby = "game"
+
+    def __init__(self):
+        super().__init__()
+        self.state = {}
+
+    def on_key(self, key: int, action) -> None:
+        """Call `action(state) -> state` when `key` is pressed."""
+        def handler(app, event):
+            self.state = action(self.state)
+        self.keymap[key] = handler
+
+    def enter(self, app: "App") -> None:
+        # A table that is still being prewarmed is finished first (cheaper
+        # than starting over).
+        app.prewarmer.finish(self.name)
+        # Pick up where we left off (if the pool still has it), otherwise
+        # start a fresh game. Either way with the player's current tokens.
+        state = app.state_pool.resume(self.name)
+        if state is None:
+            self.state = {"tokens": app.tokens}
+        else:
+            self.state = self.set_tokens(state, app.tokens)
+
+    def exit(self, app: "App") -> None:
+        app.state_pool.suspend(self.name, self.state)
+        self.state = {}
+
+    def set_tokens(self, state: dict, tokens: int) -> dict:
+        """Put a new token balance into `state`."""
+        state["tokens"] = tokens
+        return state
+
+    def spawn_point(self, size: tuple[int, int]) -> tuple[int, int] | None:
+        """Where the player stands after leaving (None = where they were)."""
+        return None
+
+    def back(self, app: "App") -> None:
+        app.switch(self.lobby)
+        spawn = self.spawn_point(app.size)
+        if spawn is not None:
+            app.player = Player(spawn)
+
+    def add_tokens(self, amount: int) -> None:
+        if "tokens" in self.state:
+            self.state = self.set_tokens(self.state, self.state.get("tokens", 0) + amount)
+
+    def update_state(self, state: dict, size: tuple[int, int]) -> dict:
+        return state
+
+    def render(self, surface: pygame.Surface, state: dict, font) -> dict:
+        return state
+
+    def update(self, app: "App", dt: float) -> None:
+        self.state = self.update_state(self.state, app.size)
+        app.tokens = self.state.get("tokens", app.tokens)
+
+    def draw(self, app: "App", surface: pygame.Surface) -> None:
+        self.state = self.render(surface, self.state, app.font)
+        app.tokens = self.state.get("tokens", app.tokens)
+
+    def prepare(self, size: tuple[int, int]):
+        """Steps to run before the game is built (a generator, see scheduler.py).
+
+        For expensive shared resources that can be made in small pieces,
+        like the Higher/Lower card sprites or a baked wheel, for a game drawn
+        on a surface of `size`. Nothing by default.
+        """
+        return
+        yield
+
+    def prewarm(self, app: "App", surface: pygame.Surface):
+        """Build this table's game ahead of time, one step per `next()`.
+
+        A generator (a scheduler job): every `yield` is a point where the
+        main loop may stop and continue next frame. The finished state goes
+        into the state pool, where `enter` picks it up.
+        """
+        yield from self.prepare(surface.get_size())
+        # Step 1: build the game (the expensive constructors).
+        state = self.update_state({"tokens": app.tokens}, surface.get_size())
+        yield
+        # Step 2: draw it once off-screen, to fill the shared caches.
+        state = self.render(surface, state, app.font)
+        yield
+        if self.name not in app.state_pool:
+            app.state_pool.suspend(self.name, state)
+
+
+class SceneRegistry:
+    """Scene name -> Scene object; the tables are created on first use."""
+
+    def __init__(self):
+        self._scenes: dict[str, Scene] = {}
+
+    def register(self, scene: Scene) -> Scene:
+        self._scenes[scene.name] = scene
+        return scene
+
+    def get(self, name: str) -> Scene:
+        scene = self._scenes.get(name)
+        if scene is None:
+            # A table that hasn't been used yet: import its module now.
+            scene = self.register(getattr(module(name), SCENE_CLASSES[name])())
+        return scene
+
+    def state_of(self, name: str) -> dict:
+        """The state dict of scene `name` ({} if it has none or wasn't created yet)."""
+        scene = self._scenes.get(name)
+        return scene.state if scene is not None and scene.state is not None else {}
+
+
+class Prewarmer:
+    """Prepares the tables the player walks up to, a little every frame.
+
+    `request(name)` queues a scheduler job that imports the table's module,
+    creates its scene and then runs its `prewarm` steps. Tables that are
+    already in the state pool are skipped.
+    """
+
+    def __init__(self, app: "App"):
+        self.app = app
+        self._scratch: pygame.Surface | None = None
+
+    @staticmethod
+    def job_name(name: str) -> str:
+        return f"prewarm:{name}"
+
+    def _job(self, name: str):
+        prefetch(name)
+        yield
+        scene = self.app.registry.get(name)
+        yield
+        if self._scratch is None:
+            self._scratch = pygame.Surface(self.app.size)
+        yield from scene.prewarm(self.app, self._scratch)
+
+    def request(self, name: str) -> None:
+        job_name = self.job_name(name)
+        if self.app.scheduler.has(job_name) or name in self.app.state_pool or name == self.app.scene_name:
+            return
+        self.app.scheduler.add(job_name, self._job(name))
+
+    def busy(self, name: str) -> bool:
+        return self.app.scheduler.has(self.job_name(name))
+
+    def finish(self, name: str) -> None:
+        """Run the remaining steps of `name` right now (if it is being prepared)."""
+        self.app.scheduler.finish(self.job_name(name))
+
+
+class App:
+    """The app context handed to every scene method."""
+
+    def __init__(self, registry: SceneRegistry, size: tuple[int, int], font,
+                 state_pool: StatePool | None = None, scheduler: Scheduler | None = None):
+        self.registry = registry
+        self.size = size
+        self.font = font
+        # Suspended mini-game states (see statepool.py).
+        self.state_pool = state_pool if state_pool is not None else StatePool()
+        # Work spread over several frames (see scheduler.py).
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
+        self.prewarmer = Prewarmer(self)
+        self.tokens = 100
+        self.player: Player | None = None
+        # Left mouse position in canvas coordinates ((-1, -1) = outside).
+        self.mouse_pos = (-1, -1)
+        self.running = True
+        self.scene_name = ""
+        self.scene: Scene = Scene()
+
+    def switch(self, name: str) -> None:
+        """Make scene `name` the active scene (takes effect immediately)."""
+        self.scene.exit(self)
+        self.scene_name = name
+        self.scene = self.registry.get(name)
+        self.scene.enter(self)
+
+    def add_tokens(self, amount: int) -> None:
+        """Give tokens to the player, also inside the table they're playing at."""
+        self.tokens += amount
+        self.scene.add_tokens(amount)
@@ -0,0 +1,138 @@
+"""scheduler.py
+
+Slow one-off work (building a table, baking cards, decoding a GIF, loading
+the next music track) spread over several frames instead of freezing one.
+
+If you're new to game-dev:
+- Every frame has a budget of about 16.7 ms at 60 FPS. A task that takes
+  30 ms in one go makes the game visibly stutter, even if it only happens
+  once.
+- A Python *generator* (a function with `yield` in it) can stop in the
+  middle and continue later. Each `yield` marks a point where the work may
+  be paused until the next frame:
+
+      def bake_cards():
+          for value in range(1, 14):
+              cards[value] = draw_card(value)
+              yield                        # <- may continue next frame
+
+- The scheduler runs such "jobs" a step at a time, for at most `budget_ms`
+  per frame, after the frame has been shown. A single step can't be
+  interrupted, so a step that takes longer than the budget is counted as an
+  "overrun" (shown in the F3 overlay): that step should be split up.
+
+The main loop calls `run()` once per frame, right before its
+`await asyncio.sleep(0)`, so in the browser build (pygbag) the page gets its
+turn after every slice of work too.
+
+Usage:
+    scheduler = Scheduler(budget_ms=4.0)
+    scheduler.add("cards", bake_cards())
+    scheduler.add("music", call_job(load_next_track))   # plain function, one step
+    ...
+    scheduler.run()                    # every frame
+    scheduler.finish("cards")          # need it *now*: run the rest at once
+"""
+
+import time
+from collections import OrderedDict
+
+
+def run_to_end(job):
+    """Run all steps of generator `job` right now and return what it returns."""
+    while True:
+        try:
+            next(job)
+        except StopIteration as stop:
+            return stop.value
+
+
+def call_job(func, *args):
+    """A job with a single step: `func(*args)`."""
+    return func(*args)
+    yield  # (only here to make this a generator)
+
+
+class Scheduler:
+    """Runs generator jobs a step at a time, within a per-frame time budget."""
+
+    def __init__(self, budget_ms: float = 4.0):
+        self.budget_ms = budget_ms
+        # name -> generator, in the order they were added
+        self._jobs: OrderedDict = OrderedDict()
+        # Stats for the F3 overlay.
+        self.frame_ms = 0.0      # time spent in the last run()
+        self.frame_steps = 0     # steps done in the last run()
+        self.finished = 0        # jobs completed since start
+        self.overruns = 0        # frames where run() went over the budget
+        self.worst_overrun_ms = 0.0
+
+    def add(self, name: str, job) -> None:
+        """Queue generator `job` (replaces a queued job with the same name)."""
+        self._jobs.pop(name, None)
+        self._jobs[name] = job
+
+    def has(self, name: str) -> bool:
+        return name in self._jobs
+
+    def cancel(self, name: str) -> None:
+        self._jobs.pop(name, None)
+
+    def finish(self, name: str):
+        """Run the remaining steps of job `name` now; returns its result (None if not queued)."""
+        job = self._jobs.pop(name, None)
+        if job is None:
+            return None
+        self.finished += 1
+        return run_to_end(job)
+
+    def _step(self, name: str, job) -> None:
+        try:
+            next(job)
+        except StopIteration:
+            # (It may have been re-added or finished by its own step.)
+            if self._jobs.get(name) is job:
+                del self._jobs[name]
+            self.finished += 1
+        except Exception as e:
+            print(f"Job {name} failed: {e}")
+            if self._jobs.get(name) is job:
+                del self._jobs[name]
+
+    def run(self) -> None:
+        """Run job steps for up to `budget_ms` (always at least one step)."""
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000.0
+        steps = 0
+        # Round-robin: one step of every job per pass, so a long job doesn't
+        # hold up a short one queued behind it.
+        while self._jobs:
+            for name, job in list(self._jobs.items()):
+                if steps and time.perf_counter() >= deadline:
+                    break
+                if self._jobs.get(name) is job:
+                    self._step(name, job)
+                    steps += 1
+            else:
+                continue
+            break
+
+        self.frame_ms = (time.perf_counter() - start) * 1000.0
+        self.frame_steps = steps
+        if self.frame_ms > self.budget_ms:
+            self.overruns += 1
+            self.worst_overrun_ms = max(self.worst_overrun_ms, self.frame_ms)
+
+    def stats(self) -> dict:
+        return {
+            "queued": len(self._jobs),
+            "steps": self.frame_steps,
+            "ms": self.frame_ms,
+            "budget_ms": self.budget_ms,
+            "finished": self.finished,
+            "overruns": self.overruns,
+            "worst_overrun_ms": self.worst_overrun_ms,
+        }
+
+    def __len__(self) -> int:
+        return len(self._jobs)
@@ -13,13 +13,17 @@ Game-dev concepts used here:
     Surface of fixed size and then scale/blit it to the main canvas.
 """
 
+import numpy as np
 import pygame
 import random
 import sys
 import math
 
-# Initialize Pygame
-pygame.init()
+import backgrounds
+import fonts
+import scenes
+import particles
+from assetmanager import ASSETS, SCALE_FAST
 
 # Constants
 SCREEN_WIDTH = 800
@@ -36,6 +40,9 @@ SPIN_DURATION = 2000  # milliseconds
 SPIN_SPEED_INCREMENT = 300  # Each reel stops 300ms after the previous
 BOUNCE_DURATION = 200  # Bounce effect duration in ms
 COOLDOWN_DURATION = 1000  # 1 second cooldown after results
+REEL_MOTION_BLUR = True  # Blur the symbols while the reels spin at full speed
+MOTION_BLUR_LENGTH = 12  # Pixels a symbol is smeared over while spinning
+SYMBOLS = ("cherry", "lemon", "orange", "plum", "bell", "bar", "seven")
 
 # Colors
 WHITE = (255, 255, 255)
@@ -60,85 +67,72 @@ NEON_PINK = (255, 16, 240)
 NEON_BLUE = (4, 217, 255)
 
 
-class CasinoFloater:
-    """Floating casino elements like chips, cards, dice"""
+def _gradient_color(y, height):
+    # Deep red at the top to dark blue at the bottom (with a purple tint).
+    progress = y / height
+    r = int(DEEP_RED[0] * (1 - progress) + DARK_BLUE[0] * progress)
+    g = int(DEEP_RED[1] * (1 - progress) + DARK_BLUE[1] * progress)
+    b = int(DEEP_RED[2] * (1 - progress) + DEEP_PURPLE[2] * progress)
+    return (r, g, b)
 
-    def __init__(self):
-        self.x = random.randint(0, SCREEN_WIDTH)
-        self.y = random.randint(0, SCREEN_HEIGHT)
-        self.vx = random.uniform(-0.5, 0.5)
-        self.vy = random.uniform(-1, -0.3)
-        self.type = random.choice(["chip", "spade", "heart", "diamond", "club", "dollar", "dice"])
-        self.size = random.randint(15, 30)
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-2, 2)
-        self.alpha = random.randint(30, 80)
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.rotation += self.rotation_speed
-
-        # Wrap around screen
-        if self.y < -50:
-            self.y = SCREEN_HEIGHT + 50
-            self.x = random.randint(0, SCREEN_WIDTH)
-        if self.x < -50:
-            self.x = SCREEN_WIDTH + 50
-        elif self.x > SCREEN_WIDTH + 50:
-            self.x = -50
+# Floating casino elements like chips, card suits and dice.
+# The particle engine (particles.py) moves them; this function paints what
+# one floater looks like, once, when it is created.
+FLOATER_KINDS = ["chip", "spade", "heart", "diamond", "club", "dollar", "dice"]
 
-    def draw(self, screen):
-        # Create a surface with alpha
-        surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-
-        if self.type == "chip":
-            pygame.draw.circle(surf, (255, 0, 0, self.alpha), (self.size, self.size), self.size)
-            pygame.draw.circle(surf, (255, 255, 255, self.alpha), (self.size, self.size), self.size, 3)
-        elif self.type == "spade":
-            color = (255, 255, 255, self.alpha)
-            points = [
-                (self.size, self.size - 10),
-                (self.size - 8, self.size + 5),
-                (self.size + 8, self.size + 5),
-            ]
-            pygame.draw.polygon(surf, color, points)
-            pygame.draw.circle(surf, color, (self.size - 5, self.size), 6)
-            pygame.draw.circle(surf, color, (self.size + 5, self.size), 6)
-        elif self.type == "heart":
-            color = (255, 20, 60, self.alpha)
-            pygame.draw.circle(surf, color, (self.size - 5, self.size - 3), 7)
-            pygame.draw.circle(surf, color, (self.size + 5, self.size - 3), 7)
-            points = [
-                (self.size - 12, self.size),
-                (self.size, self.size + 12),
-                (self.size + 12, self.size),
-            ]
-            pygame.draw.polygon(surf, color, points)
-        elif self.type == "diamond":
-            color = (255, 20, 60, self.alpha)
-            points = [
-                (self.size, self.size - 10),
-                (self.size - 8, self.size),
-                (self.size, self.size + 10),
-                (self.size + 8, self.size),
-            ]
-            pygame.draw.polygon(surf, color, points)
-        elif self.type == "club":
-            color = (255, 255, 255, self.alpha)
-            pygame.draw.circle(surf, color, (self.size, self.size - 5), 6)
-            pygame.draw.circle(surf, color, (self.size - 6, self.size + 2), 6)
-            pygame.draw.circle(surf, color, (self.size + 6, self.size + 2), 6)
-        elif self.type == "dollar":
-            font = pygame.font.Font(None, self.size)
-            text = font.render("$", True, (0, 255, 100, self.alpha))
-            surf.blit(text, (self.size - 8, self.size - 10))
-        elif self.type == "dice":
-            rect = pygame.Rect(self.size - 8, self.size - 8, 16, 16)
-            pygame.draw.rect(surf, (255, 255, 255, self.alpha), rect, border_radius=3)
-            pygame.draw.circle(surf, (0, 0, 0, self.alpha), (self.size, self.size), 2)
-
-        screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
+
+def _paint_floater(kind, size, alpha):
+    # Create a surface with alpha
+    surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+
+    if kind == "chip":
+        pygame.draw.circle(surf, (255, 0, 0, alpha), (size, size), size)
+        pygame.draw.circle(surf, (255, 255, 255, alpha), (size, size), size, 3)
+    elif kind == "spade":
+        color = (255, 255, 255, alpha)
+        points = [
+            (size, size - 10),
+            (size - 8, size + 5),
+            (size + 8, size + 5),
+        ]
+        pygame.draw.polygon(surf, color, points)
+        pygame.draw.circle(surf, color, (size - 5, size), 6)
+        pygame.draw.circle(surf, color, (size + 5, size), 6)
+    elif kind == "heart":
+        color = (255, 20, 60, alpha)
+        pygame.draw.circle(surf, color, (size - 5, size - 3), 7)
+        pygame.draw.circle(surf, color, (size + 5, size - 3), 7)
+        points = [
+            (size - 12, size),
+            (size, size + 12),
+            (size + 12, size),
+        ]
+        pygame.draw.polygon(surf, color, points)
+    elif kind == "diamond":
+        color = (255, 20, 60, alpha)
+        points = [
+            (size, size - 10),
+            (size - 8, size),
+            (size, size + 10),
+            (size + 8, size),
+        ]
+        pygame.draw.polygon(surf, color, points)
+    elif kind == "club":
+        color = (255, 255, 255, alpha)
+        pygame.draw.circle(surf, color, (size, size - 5), 6)
+        pygame.draw.circle(surf, color, (size - 6, size + 2), 6)
+        pygame.draw.circle(surf, color, (size + 6, size + 2), 6)
+    elif kind == "dollar":
+        font = fonts.get_font(size)
+        text = fonts.render(font, "$", True, (0, 255, 100, alpha))
+        surf.blit(text, (size - 8, size - 10))
+    elif kind == "dice":
+        rect = pygame.Rect(size - 8, size - 8, 16, 16)
+        pygame.draw.rect(surf, (255, 255, 255, alpha), rect, border_radius=3)
+        pygame.draw.circle(surf, (0, 0, 0, alpha), (size, size), 2)
+
+    return surf
 
 
 class LightRay:
@@ -180,76 +174,8 @@ class LightRay:
         screen.blit(surf, (0, 0))
 
 
-class GoldenSparkle:
-    """Small golden sparkle particles"""
-
-    def __init__(self):
-        self.x = random.randint(0, SCREEN_WIDTH)
-        self.y = random.randint(0, SCREEN_HEIGHT)
-        self.vx = random.uniform(-0.3, 0.3)
-        self.vy = random.uniform(-0.5, 0.5)
-        self.lifetime = random.randint(60, 180)
-        self.age = 0
-        self.max_brightness = random.randint(150, 255)
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.age += 1
-
-        if self.x < 0:
-            self.x = SCREEN_WIDTH
-        if self.x > SCREEN_WIDTH:
-            self.x = 0
-        if self.y < 0:
-            self.y = SCREEN_HEIGHT
-        if self.y > SCREEN_HEIGHT:
-            self.y = 0
-
-        return self.age < self.lifetime
-
-    def draw(self, screen):
-        progress = self.age / self.lifetime
-        brightness = int(self.max_brightness * (1 - progress))
-        size = 1 if progress > 0.5 else 2
-        color = (brightness, brightness, int(brightness * 0.7))
-        pygame.draw.circle(screen, color, (int(self.x), int(self.y)), size)
-
-
-class Confetti:
-    """Single confetti particle"""
-
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-3, 3)
-        self.vy = random.uniform(-8, -3)
-        self.gravity = 0.3
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-10, 10)
-        self.color = random.choice([GOLD, RED, GREEN, CYAN, PURPLE, PINK, YELLOW, ORANGE])
-        self.size = random.randint(4, 8)
-        self.lifetime = random.randint(60, 120)
-        self.age = 0
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        self.rotation += self.rotation_speed
-        self.age += 1
-        return self.age < self.lifetime
-
-    def draw(self, screen):
-        alpha = 1 - (self.age / self.lifetime)
-        if alpha > 0:
-            points = []
-            for i in range(4):
-                angle = math.radians(self.rotation + i * 90)
-                px = self.x + math.cos(angle) * self.size
-                py = self.y + math.sin(angle) * self.size
-                points.append((px, py))
-            pygame.draw.polygon(screen, self.color, points)
+# Win confetti colors (the confetti itself lives in a particle system)
+CONFETTI_COLORS = [GOLD, RED, GREEN, CYAN, PURPLE, PINK, YELLOW, ORANGE]
 
 
 class StarBurst:
@@ -282,6 +208,73 @@ class StarBurst:
                 pygame.draw.line(screen, BRIGHT_GOLD, (self.x, self.y), (end_x, end_y), 3)
 
 
+# =============================================================================
+# REEL STRIPS
+# =============================================================================
+# A reel is a column of symbol "cells" (REEL_WIDTH x REEL_HEIGHT, white with
+# the symbol in the middle). Instead of blitting every symbol into a fresh
+# reel surface each frame, the cells of a spin are baked ONCE into one tall
+# "strip" surface. Scrolling is then just choosing which part of the strip
+# to show: one blit with an `area` rectangle at the current offset.
+
+def _motion_blurred(cell: pygame.Surface, length: int) -> pygame.Surface:
+    """`cell` smeared vertically over `length` pixels (a box blur), like a fast-moving reel."""
+    pixels = pygame.surfarray.array3d(cell).astype(np.uint32)  # (width, height, rgb)
+    before = length // 2
+    after = length - 1 - before
+    # Repeat the edge rows so the blur doesn't darken the top/bottom of the cell.
+    padded = np.concatenate(
+        [np.repeat(pixels[:, :1], before + 1, axis=1), pixels, np.repeat(pixels[:, -1:], after, axis=1)],
+        axis=1,
+    )
+    # Sum of `length` rows via a running total (cumulative sum), then average.
+    total = np.cumsum(padded, axis=1)
+    blurred = (total[:, length:] - total[:, :-length]) // length
+    return pygame.surfarray.make_surface(blurred.astype(np.uint8)).convert()
+
+
+# (symbol, blurred) -> cell Surface. Shared by every SlotMachine: the symbol
+# images come from the shared AssetManager, so their cells are the same too.
+_CELLS = {}
+
+
+def _get_cell(images, symbol, blurred=False):
+    cell = _CELLS.get((symbol, blurred))
+    if cell is None:
+        if blurred:
+            cell = _motion_blurred(_get_cell(images, symbol), MOTION_BLUR_LENGTH)
+        else:
+            cell = pygame.Surface((REEL_WIDTH, REEL_HEIGHT)).convert()
+            cell.fill(WHITE)
+            cell.blit(images[symbol], ((REEL_WIDTH - SYMBOL_SIZE) // 2, (REEL_HEIGHT - SYMBOL_SIZE) // 2))
+        _CELLS[(symbol, blurred)] = cell
+    return cell
+
+
+def _symbol_image(symbol):
+    return ASSETS.scaled(f"img/slotmachine/{symbol}.png", (SYMBOL_SIZE, SYMBOL_SIZE), SCALE_FAST)
+
+
+def prepare_steps():
+    """Bake what every SlotMachine shares (background, symbol cells), a piece per step.
+
+    A generator for the scheduler (see SlotMachineScene.prepare), so a new
+    SlotMachine only has to assemble its reel strips from finished cells.
+    """
+    yield from backgrounds.vertical_gradient_steps("slotmachine", (SCREEN_WIDTH, SCREEN_HEIGHT), _gradient_color)
+    for symbol in SYMBOLS:
+        try:
+            images = {symbol: _symbol_image(symbol)}
+        except Exception:
+            continue  # the machine draws a placeholder for this one
+        yield
+        _get_cell(images, symbol)
+        yield
+        if REEL_MOTION_BLUR:
+            _get_cell(images, symbol, blurred=True)
+            yield
+
+
 class SlotMachine:
     def __init__(self, screen: pygame.Surface | None = None, starting_tokens: int = 100):
         self._owns_display = screen is None
@@ -294,18 +287,18 @@ class SlotMachine:
         self.clock = pygame.time.Clock()
 
         # Fonts
-        self.font_title = pygame.font.Font(None, 80)
-        self.font_large = pygame.font.Font(None, 56)
-        self.font_medium = pygame.font.Font(None, 42)
-        self.font_small = pygame.font.Font(None, 28)
-        self.font_tiny = pygame.font.Font(None, 22)
-        self.font_button = pygame.font.Font(None, 44)
+        self.font_title = fonts.get_font(80)
+        self.font_large = fonts.get_font(56)
+        self.font_medium = fonts.get_font(42)
+        self.font_small = fonts.get_font(28)
+        self.font_tiny = fonts.get_font(22)
+        self.font_button = fonts.get_font(44)
 
         # Load images
         self.load_images()
 
         # Game state
-        self.symbols = ["cherry", "lemon", "orange", "plum", "bell", "bar", "seven"]
+        self.symbols = list(SYMBOLS)
         self.visible_symbols = [[random.choice(self.symbols) for _ in range(3)] for _ in range(NUM_REELS)]
         self.spinning = False
         self.spin_start_time = 0
@@ -327,24 +320,34 @@ class SlotMachine:
         self.bounce_start_times = [0, 0, 0]
         self.is_bouncing = [False, False, False]
 
-        # Symbol queue for smooth scrolling
+        # Symbol queue for smooth scrolling. `queue_heads[i]` is the queue index
+        # shown at the top of reel i (moving it scrolls the reel by one symbol).
         self.symbol_queues = [[random.choice(self.symbols) for _ in range(20)] for _ in range(NUM_REELS)]
+        self.queue_heads = [0, 0, 0]
+
+        # Baked reel strips (see "REEL STRIPS" above): the spinning queue, and
+        # the three symbols a reel stops on. Rebuilt at the start of each spin.
+        self._spin_strips = [None] * NUM_REELS
+        self._result_strips = [None] * NUM_REELS
+        self._reel_frame = None
+        self._bake_reel_strips()
 
         # Title animation
         self.title_pulse = 0
 
         # Win effects
-        self.confetti_particles = []
+        self.confetti_particles = particles.confetti(particles.draw_confetti_quads, gravity=0.3)
         self.star_bursts = []
         self.win_text_scale = 1.0
         self.win_text_pulse = 0
         self.show_win_effect = False
 
         # Enhanced background effects
-        self.casino_floaters = [CasinoFloater() for _ in range(25)]
+        self.casino_floaters = particles.casino_floaters(SCREEN_WIDTH, SCREEN_HEIGHT, 25, FLOATER_KINDS, _paint_floater)
         self.light_rays = [LightRay(i * 90) for i in range(4)]
-        self.golden_sparkles = [GoldenSparkle() for _ in range(100)]
+        self.golden_sparkles = particles.golden_sparkles(SCREEN_WIDTH, SCREEN_HEIGHT, 100, particles.draw_spark_dots)
         self.vignette_pulse = 0
+        self.vignette = backgrounds.Vignette(depth=100, max_alpha=130)
         self.neon_border_offset = 0
 
         # Lever/handle animation (cosmetic)
@@ -363,20 +366,14 @@ class SlotMachine:
 
     def load_images(self):
         """Load all symbol images"""
-        import os
-        from pathlib import Path
-        try:
-            base_dir = str(Path(__file__).resolve().parent)
-        except:
-            base_dir = str(Path.cwd())
+        # The shared AssetManager decodes, converts and scales each symbol once,
+        # so a new SlotMachine (e.g. after leaving and re-entering the table)
+        # doesn't hit the disk again.
         self.images = {}
-        symbols = ["cherry", "lemon", "orange", "plum", "bell", "bar", "seven"]
 
-        for symbol in symbols:
+        for symbol in SYMBOLS:
             try:
-                img_path = os.path.join(base_dir, "assets", "img", "slotmachine", f"{symbol}.png")
-                img = pygame.image.load(img_path)
-                self.images[symbol] = pygame.transform.scale(img, (SYMBOL_SIZE, SYMBOL_SIZE))
+                self.images[symbol] = _symbol_image(symbol)
             except Exception:
                 self.images[symbol] = self.create_placeholder(symbol)
 
@@ -394,16 +391,46 @@ class SlotMachine:
         surface.fill(colors.get(symbol, (100, 100, 100)))
         pygame.draw.rect(surface, BLACK, surface.get_rect(), 3)
 
-        font = pygame.font.Font(None, 32)
-        text = font.render(symbol[:3].upper(), True, BLACK)
+        font = fonts.get_font(32)
+        text = fonts.render(font, symbol[:3].upper(), True, BLACK)
         text_rect = text.get_rect(center=(SYMBOL_SIZE // 2, SYMBOL_SIZE // 2))
         surface.blit(text, text_rect)
 
         return surface
 
+    def _cell(self, symbol, blurred=False):
+        return _get_cell(self.images, symbol, blurred)
+
+    def _bake_strip(self, symbols, blurred=False):
+        cells = [self._cell(symbol, blurred) for symbol in symbols]
+        # Created in the cells' pixel format, so it needs no convert().
+        strip = pygame.Surface((REEL_WIDTH, REEL_HEIGHT * len(symbols)), 0, cells[0])
+        strip.blits([(cell, (0, i * REEL_HEIGHT)) for i, cell in enumerate(cells)], False)
+        return strip
+
+    def _bake_reel_strips(self, blurred=False):
+        for i in range(NUM_REELS):
+            queue = self.symbol_queues[i]
+            # The first 3 symbols are repeated at the end, so the 3-symbol
+            # window never runs off the strip when the queue wraps around.
+            self._spin_strips[i] = self._bake_strip(queue + queue[:3], blurred)
+            self._result_strips[i] = self._bake_strip(self.visible_symbols[i])
+
+    def _get_reel_frame(self):
+        # The gold glow around a reel never changes: bake it once (black = transparent).
+        if self._reel_frame is None:
+            frame = pygame.Surface((REEL_WIDTH + 10, REEL_HEIGHT * 3 + 10)).convert()
+            frame.fill(BLACK)
+            frame.set_colorkey(BLACK)
+            glow_rect = pygame.Rect(2, 2, REEL_WIDTH + 6, REEL_HEIGHT * 3 + 6)
+            for i in range(3):
+                glow_color = (GOLD[0] // (i + 2), GOLD[1] // (i + 2), GOLD[2] // (i + 2))
+                pygame.draw.rect(frame, glow_color, glow_rect.inflate(i * 2, i * 2), 2)
+            self._reel_frame = frame
+        return self._reel_frame
+
     def create_confetti_burst(self, x, y, amount=50):
-        for _ in range(amount):
-            self.confetti_particles.append(Confetti(x, y))
+        particles.burst(self.confetti_particles, x, y, amount, CONFETTI_COLORS)
 
     def create_star_burst(self, x, y):
         self.star_bursts.append(StarBurst(x, y))
@@ -486,6 +513,8 @@ class SlotMachine:
         for i in range(NUM_REELS):
             self.symbol_queues[i] = [random.choice(self.symbols) for _ in range(20)]
             self.visible_symbols[i] = [random.choice(self.symbols), random.choice(self.symbols), random.choice(self.symbols)]
+        self.queue_heads = [0, 0, 0]
+        self._bake_reel_strips(blurred=REEL_MOTION_BLUR)
 
     def update_spin(self):
         if not self.spinning:
@@ -500,7 +529,7 @@ class SlotMachine:
 
                 if self.spin_offsets[i] >= REEL_HEIGHT:
                     self.spin_offsets[i] = 0
-                    self.symbol_queues[i].append(self.symbol_queues[i].pop(0))
+                    self.queue_heads[i] = (self.queue_heads[i] + 1) % len(self.symbol_queues[i])
 
                 all_stopped = False
                 self.reel_stopped[i] = False
@@ -576,57 +605,36 @@ class SlotMachine:
         # once per frame in both standalone mode and embedded mode.
         self._update_handle_animation()
 
-        self.confetti_particles = [p for p in self.confetti_particles if p.update()]
+        self.confetti_particles.update()
         self.star_bursts = [s for s in self.star_bursts if s.update()]
 
         if self.show_win_effect:
             self.win_text_pulse += 0.15
             self.win_text_scale = 1.0 + 0.15 * abs(math.sin(self.win_text_pulse))
 
-        for floater in self.casino_floaters:
-            floater.update()
+        self.casino_floaters.update()
 
         for ray in self.light_rays:
             ray.update()
 
-        self.golden_sparkles = [s for s in self.golden_sparkles if s.update()]
-        while len(self.golden_sparkles) < 100:
-            self.golden_sparkles.append(GoldenSparkle())
+        self.golden_sparkles.update()  # dead sparkles are replaced automatically
 
         self.vignette_pulse += 0.05
         self.neon_border_offset = (self.neon_border_offset + 2) % 20
 
     def draw_background(self):
-        for y in range(SCREEN_HEIGHT):
-            progress = y / SCREEN_HEIGHT
-            r = int(DEEP_RED[0] * (1 - progress) + DARK_BLUE[0] * progress)
-            g = int(DEEP_RED[1] * (1 - progress) + DARK_BLUE[1] * progress)
-            b = int(DEEP_RED[2] * (1 - progress) + DEEP_PURPLE[2] * progress)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        # Static gradient: baked once (backgrounds.py), then a single blit.
+        self.screen.blit(backgrounds.vertical_gradient("slotmachine", (SCREEN_WIDTH, SCREEN_HEIGHT), _gradient_color), (0, 0))
 
         for ray in self.light_rays:
             ray.draw(self.screen)
 
-        for sparkle in self.golden_sparkles:
-            sparkle.draw(self.screen)
-
-        for floater in self.casino_floaters:
-            floater.draw(self.screen)
+        self.golden_sparkles.draw(self.screen)
+        self.casino_floaters.draw(self.screen)
 
-        vignette_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        # The vignette pulses between alpha 70 and 130; its mask is baked once.
         vignette_alpha = int(100 + 30 * math.sin(self.vignette_pulse))
-
-        for i in range(100):
-            alpha = int((vignette_alpha * i) / 100)
-            pygame.draw.line(vignette_surf, (0, 0, 0, alpha), (0, i), (SCREEN_WIDTH, i))
-            pygame.draw.line(vignette_surf, (0, 0, 0, alpha), (0, SCREEN_HEIGHT - i), (SCREEN_WIDTH, SCREEN_HEIGHT - i))
-
-        for i in range(100):
-            alpha = int((vignette_alpha * i) / 100)
-            pygame.draw.line(vignette_surf, (0, 0, 0, alpha), (i, 0), (i, SCREEN_HEIGHT))
-            pygame.draw.line(vignette_surf, (0, 0, 0, alpha), (SCREEN_WIDTH - i, 0), (SCREEN_WIDTH - i, SCREEN_HEIGHT))
-
-        self.screen.blit(vignette_surf, (0, 0))
+        self.vignette.draw(self.screen, vignette_alpha)
 
         border_colors = [NEON_PINK, NEON_BLUE, NEON_GREEN, GOLD]
         for i, color in enumerate(border_colors):
@@ -636,38 +644,23 @@ class SlotMachine:
     def draw_reel(self, reel_index, x_pos):
         y_start = 120
 
-        glow_rect = pygame.Rect(x_pos - 3, y_start - 3, REEL_WIDTH + 6, REEL_HEIGHT * 3 + 6)
-        for i in range(3):
-            glow_color = (GOLD[0] // (i + 2), GOLD[1] // (i + 2), GOLD[2] // (i + 2))
-            pygame.draw.rect(self.screen, glow_color, glow_rect.inflate(i * 2, i * 2), 2)
-
+        self.screen.blit(self._get_reel_frame(), (x_pos - 5, y_start - 5))
         reel_rect = pygame.Rect(x_pos, y_start, REEL_WIDTH, REEL_HEIGHT * 3)
-        pygame.draw.rect(self.screen, WHITE, reel_rect)
-        pygame.draw.rect(self.screen, GOLD, reel_rect, 5)
-
-        reel_surface = pygame.Surface((REEL_WIDTH, REEL_HEIGHT * 3))
-        reel_surface.fill(WHITE)
-
-        symbol_x = (REEL_WIDTH - SYMBOL_SIZE) // 2
 
-        if self.reel_stopped[reel_index] and not self.is_bouncing[reel_index]:
-            for i in range(3):
-                y_pos = (REEL_HEIGHT - SYMBOL_SIZE) // 2 + i * REEL_HEIGHT
-                reel_surface.blit(self.images[self.visible_symbols[reel_index][i]], (symbol_x, y_pos))
-        elif self.is_bouncing[reel_index]:
-            for i in range(3):
-                y_pos = (REEL_HEIGHT - SYMBOL_SIZE) // 2 + i * REEL_HEIGHT
-                if i == 1:
-                    y_pos += self.spin_offsets[reel_index]
-                reel_surface.blit(self.images[self.visible_symbols[reel_index][i]], (symbol_x, y_pos))
+        offset = self.spin_offsets[reel_index]
+        if self.reel_stopped[reel_index] or self.is_bouncing[reel_index]:
+            self.screen.blit(self._result_strips[reel_index], (x_pos, y_start))
+            if self.is_bouncing[reel_index] and offset:
+                # Only the middle symbol bounces: erase it and draw it `offset` lower.
+                symbol_pos = (x_pos + (REEL_WIDTH - SYMBOL_SIZE) // 2, y_start + REEL_HEIGHT + (REEL_HEIGHT - SYMBOL_SIZE) // 2)
+                self.screen.fill(WHITE, (symbol_pos, (SYMBOL_SIZE, SYMBOL_SIZE)))
+                self.screen.blit(self.images[self.visible_symbols[reel_index][1]], (symbol_pos[0], symbol_pos[1] + offset))
         else:
-            for i in range(5):
-                symbol = self.symbol_queues[reel_index][i % len(self.symbol_queues[reel_index])]
-                y_pos = (REEL_HEIGHT - SYMBOL_SIZE) // 2 + i * REEL_HEIGHT - self.spin_offsets[reel_index]
-                if -REEL_HEIGHT <= y_pos <= REEL_HEIGHT * 3:
-                    reel_surface.blit(self.images[symbol], (symbol_x, y_pos))
+            # Scrolling: show a 3-symbol window of the strip, `offset` pixels
+            # past the symbol at the head of the queue.
+            window = pygame.Rect(0, self.queue_heads[reel_index] * REEL_HEIGHT + offset, REEL_WIDTH, REEL_HEIGHT * 3)
+            self.screen.blit(self._spin_strips[reel_index], (x_pos, y_start), window)
 
-        self.screen.blit(reel_surface, (x_pos, y_start))
         pygame.draw.rect(self.screen, GOLD, reel_rect, 5)
 
         if self.reel_stopped[reel_index] and not self.is_bouncing[reel_index]:
@@ -735,22 +728,22 @@ class SlotMachine:
 
         title_text = "SLOT MACHINE"
         title_font_size = int(80 * pulse_scale)
-        title_font = pygame.font.Font(None, title_font_size)
+        title_font = fonts.get_font(title_font_size)
         title_x = SCREEN_WIDTH // 2
 
-        shadow = title_font.render(title_text, True, BLACK)
+        shadow = fonts.render(title_font, title_text, True, BLACK)
         shadow_rect = shadow.get_rect(center=(title_x + 4, 54))
         self.screen.blit(shadow, shadow_rect)
 
-        outline = title_font.render(title_text, True, CASINO_RED)
+        outline = fonts.render(title_font, title_text, True, CASINO_RED)
         outline_rect = outline.get_rect(center=(title_x, 50))
         self.screen.blit(outline, outline_rect)
 
-        title = title_font.render(title_text, True, GOLD)
+        title = fonts.render(title_font, title_text, True, GOLD)
         title_rect = title.get_rect(center=(title_x, 50))
         self.screen.blit(title, title_rect)
 
-        highlight = title_font.render(title_text, True, BRIGHT_GOLD)
+        highlight = fonts.render(title_font, title_text, True, BRIGHT_GOLD)
         highlight_rect = highlight.get_rect(center=(title_x, 48))
 
         clip_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 45)
@@ -770,25 +763,25 @@ class SlotMachine:
         pygame.draw.rect(self.screen, (40, 40, 40), credits_box, border_radius=8)
         pygame.draw.rect(self.screen, CYAN, credits_box, 2, border_radius=8)
 
-        credits_label = self.font_tiny.render("TOKENS", True, CYAN)
+        credits_label = fonts.render(self.font_tiny, "TOKENS", True, CYAN)
         self.screen.blit(credits_label, (20, 18))
 
-        credits_text = self.font_small.render(f"{self.tokens:,}", True, NEON_GREEN)
+        credits_text = fonts.render(self.font_small, f"{self.tokens:,}", True, NEON_GREEN)
         self.screen.blit(credits_text, (20, 38))
 
         bet_box = pygame.Rect(15, 70, 110, 45)
         pygame.draw.rect(self.screen, (40, 40, 40), bet_box, border_radius=8)
         pygame.draw.rect(self.screen, CASINO_RED, bet_box, 2, border_radius=8)
 
-        bet_label = self.font_tiny.render("PRICE", True, CYAN)
+        bet_label = fonts.render(self.font_tiny, "PRICE", True, CYAN)
         self.screen.blit(bet_label, (20, 73))
 
-        bet_text = self.font_small.render(f"{self.bet_amount}", True, CASINO_RED)
+        bet_text = fonts.render(self.font_small, f"{self.bet_amount}", True, CASINO_RED)
         self.screen.blit(bet_text, (20, 90))
 
         if self.last_win > 0 and self.show_win_effect:
             win_font_size = int(56 * self.win_text_scale)
-            win_font = pygame.font.Font(None, win_font_size)
+            win_font = fonts.get_font(win_font_size)
 
             win_bg_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT - 110, 400, 70)
             pygame.draw.rect(self.screen, GOLD, win_bg_rect, border_radius=15)
@@ -800,7 +793,7 @@ class SlotMachine:
                 glow_color = (0, glow_intensity, 0)
                 pygame.draw.rect(self.screen, glow_color, glow_rect, 2, border_radius=15)
 
-            win_text = win_font.render(f"WIN {self.last_win:,}!", True, BLACK)
+            win_text = fonts.render(win_font, f"WIN {self.last_win:,}!", True, BLACK)
             win_rect = win_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 75))
             self.screen.blit(win_text, win_rect)
 
@@ -823,19 +816,19 @@ class SlotMachine:
 
         if self.cooldown_active:
             cooldown_remaining = self.get_cooldown_remaining()
-            button_text = self.font_small.render(f"{cooldown_remaining:.1f}s", True, WHITE)
+            button_text = fonts.render(self.font_small, f"{cooldown_remaining:.1f}s", True, WHITE)
         else:
-            button_text = self.font_button.render("SPIN", True, BLACK if button_color == NEON_GREEN else WHITE)
+            button_text = fonts.render(self.font_button, "SPIN", True, BLACK if button_color == NEON_GREEN else WHITE)
 
         button_text_rect = button_text.get_rect(center=button_rect.center)
         self.screen.blit(button_text, button_text_rect)
 
         if self.cooldown_active:
-            cooldown_hint = self.font_tiny.render("Cooldown...", True, ORANGE)
+            cooldown_hint = fonts.render(self.font_tiny, "Cooldown...", True, ORANGE)
             cooldown_hint_rect = cooldown_hint.get_rect(center=(SCREEN_WIDTH - 85, 90))
             self.screen.blit(cooldown_hint, cooldown_hint_rect)
         else:
-            space_hint = self.font_tiny.render("SPACE", True, LIGHT_GRAY)
+            space_hint = fonts.render(self.font_tiny, "SPACE", True, LIGHT_GRAY)
             space_hint_rect = space_hint.get_rect(center=(SCREEN_WIDTH - 85, 90))
             self.screen.blit(space_hint, space_hint_rect)
 
@@ -855,8 +848,7 @@ class SlotMachine:
         # Draw the lever/handle after reels so it appears part of the machine.
         handle_rect = self.draw_handle()
 
-        for confetti in self.confetti_particles:
-            confetti.draw(self.screen)
+        self.confetti_particles.draw(self.screen)
 
         button_rect = self.draw_ui()
 
@@ -904,8 +896,9 @@ class SlotMachine:
 def _ensure_slotmachine_state(game_state: dict) -> dict:
     # This helper turns an empty dict into a fully-initialized slot-machine state.
     # It stores two important private fields:
-    # - `_surface`: internal 800x600 render target
+    # - `_surface`: internal 800x600 render target (only used when scaling)
     # - `_machine`: the SlotMachine instance that owns the actual logic
+    # (`draw_slotmachine_scene` adds `_target`, the canvas subsurface it draws into.)
     if "initialized" in game_state:
         return game_state
 
@@ -913,7 +906,8 @@ def _ensure_slotmachine_state(game_state: dict) -> dict:
     bet_amount = FIXED_BET_AMOUNT
 
     # Internal fixed-resolution surface.
-    # We draw the whole slot machine UI here, then scale it into `main.py`'s canvas.
+    # If `main.py`'s canvas ever needs the machine scaled, we draw the whole
+    # slot machine UI here first and then scale it into the canvas.
     internal_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
     machine = SlotMachine(screen=internal_surface, starting_tokens=tokens)
     machine.bet_amount = FIXED_BET_AMOUNT
@@ -928,14 +922,29 @@ def _ensure_slotmachine_state(game_state: dict) -> dict:
     return game_state
 
 
-def draw_slotmachine_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
-    """
-    Embedded slotmachine renderer (same window as main.py).
-    Keeps original style by rendering at 800x600 internally and scaling.
-    """
+def _fit_view(size: tuple[int, int]) -> tuple[float, int, int]:
+    """(scale, offset_x, offset_y) that fits the 800x600 machine centered into `size`."""
+    dst_w, dst_h = size
+    scale = min(dst_w / SCREEN_WIDTH, dst_h / SCREEN_HEIGHT)
+    offset_x = (dst_w - int(SCREEN_WIDTH * scale)) // 2
+    offset_y = (dst_h - int(SCREEN_HEIGHT * scale)) // 2
+    return scale, offset_x, offset_y
+
+
+def _to_canvas(rect: pygame.Rect, scale: float, offset_x: int, offset_y: int) -> pygame.Rect:
+    """Map a rect from machine coordinates to canvas coordinates (see `_fit_view`)."""
+    return pygame.Rect(
+        offset_x + int(rect.x * scale),
+        offset_y + int(rect.y * scale),
+        int(rect.width * scale),
+        int(rect.height * scale),
+    )
+
+
+def update_slotmachine_scene(game_state: dict, size: tuple[int, int]) -> dict:
+    """Advance the slot machine by one frame (reels, effects)."""
     game_state = _ensure_slotmachine_state(game_state)
     machine: SlotMachine = game_state["_machine"]
-    internal_surface: pygame.Surface = game_state["_surface"]
 
     # Sync tokens & bet into machine (so passive income in main stays synced).
     # The hub (`main.py`) is the source-of-truth for tokens, but each mini-game
@@ -943,50 +952,65 @@ def draw_slotmachine_scene(surface: pygame.Surface, game_state: dict, font: pyga
     machine.tokens = game_state.get("tokens", machine.tokens)
     machine.bet_amount = FIXED_BET_AMOUNT
 
-    # Update and draw into internal surface.
-    # Note how `draw(flip=False)` draws onto the internal surface instead of
-    # flipping the display; flipping is done once globally in `main.py`.
     machine.update_spin()
     machine.update_effects()
+
+    game_state["tokens"] = machine.tokens
+    game_state["bet_amount"] = FIXED_BET_AMOUNT
+    return game_state
+
+
+def render_slotmachine_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """
+    Embedded slotmachine renderer (same window as main.py).
+    Keeps original style by rendering at 800x600 and fitting that into `surface`:
+    directly into a subsurface when it fits 1:1, otherwise via an internal
+    surface that is scaled.
+    """
+    game_state = _ensure_slotmachine_state(game_state)
+    machine: SlotMachine = game_state["_machine"]
+    internal_surface: pygame.Surface = game_state["_surface"]
+
+    # Fit the machine (800x600) into whatever surface size we got (main canvas).
+    # We compute a uniform scale so the machine isn't stretched.
+    scale, offset_x, offset_y = _fit_view(surface.get_size())
+
+    if scale == 1.0:
+        # No scaling needed (the usual case: 800x600 inside the 900x600 canvas):
+        # draw straight into that part of the canvas through a subsurface, a
+        # "window" into the canvas that shares its pixels. No intermediate
+        # image, no full-frame copy or resample.
+        target = game_state.get("_target")
+        if target is None or target.get_parent() is not surface or target.get_offset() != (offset_x, offset_y):
+            target = surface.subsurface((offset_x, offset_y, SCREEN_WIDTH, SCREEN_HEIGHT))
+            game_state["_target"] = target
+        machine.screen = target
+    else:
+        machine.screen = internal_surface
+
+    # Note how `draw(flip=False)` draws onto the target surface instead of
+    # flipping the display; flipping is done once globally in `main.py`.
     button_rect_internal = machine.draw(flip=False)
     handle_rect_internal = getattr(machine, "_handle_rect", pygame.Rect(0, 0, 0, 0))
 
-    # Fit internal (800x600) into whatever surface size we got (main canvas).
-    # We compute a uniform scale so the internal image isn't stretched.
-    dst_w, dst_h = surface.get_size()
-    scale = min(dst_w / SCREEN_WIDTH, dst_h / SCREEN_HEIGHT)
-    render_w = int(SCREEN_WIDTH * scale)
-    render_h = int(SCREEN_HEIGHT * scale)
-    offset_x = (dst_w - render_w) // 2
-    offset_y = (dst_h - render_h) // 2
-
-    scaled = pygame.transform.smoothscale(internal_surface, (render_w, render_h))
-    surface.blit(scaled, (offset_x, offset_y))
-
-    # Provide a button rect in CANVAS coordinates for click detection in main.py.
-    # The button rect returned by SlotMachine is in internal coordinates, so we
-    # scale + offset it to match the surface we actually displayed.
-    button_rect_canvas = pygame.Rect(
-        offset_x + int(button_rect_internal.x * scale),
-        offset_y + int(button_rect_internal.y * scale),
-        int(button_rect_internal.width * scale),
-        int(button_rect_internal.height * scale),
-    )
-
-    handle_rect_canvas = pygame.Rect(
-        offset_x + int(handle_rect_internal.x * scale),
-        offset_y + int(handle_rect_internal.y * scale),
-        int(handle_rect_internal.width * scale),
-        int(handle_rect_internal.height * scale),
-    )
+    if machine.screen is internal_surface:
+        render_size = (int(SCREEN_WIDTH * scale), int(SCREEN_HEIGHT * scale))
+        surface.blit(pygame.transform.smoothscale(internal_surface, render_size), (offset_x, offset_y))
 
-    game_state["button_rect"] = button_rect_canvas
-    game_state["handle_rect"] = handle_rect_canvas
-    game_state["tokens"] = machine.tokens
-    game_state["bet_amount"] = FIXED_BET_AMOUNT
+    # Provide button/handle rects in CANVAS coordinates for click detection in
+    # main.py. SlotMachine returns them in its own 800x600 coordinates, so they
+    # go through the same scale + offset as the picture.
+    game_state["button_rect"] = _to_canvas(button_rect_internal, scale, offset_x, offset_y)
+    game_state["handle_rect"] = _to_canvas(handle_rect_internal, scale, offset_x, offset_y)
     return game_state
 
 
+def draw_slotmachine_scene(surface: pygame.Surface, game_state: dict, font: pygame.font.Font) -> dict:
+    """Update and draw the embedded slot machine in one call."""
+    game_state = update_slotmachine_scene(game_state, surface.get_size())
+    return render_slotmachine_scene(surface, game_state, font)
+
+
 def spin_slotmachine(game_state: dict) -> dict:
     # Wrapper called by `main.py` when player presses SPACE or clicks the button.
     game_state = _ensure_slotmachine_state(game_state)
@@ -1009,6 +1033,36 @@ def change_slot_bet_amount(game_state: dict, increase: bool) -> dict:
     return game_state
 
 
+class SlotMachineScene(scenes.MiniGameScene):
+    """The slot machine table as a scene (see scenes.py)."""
+
+    name = "slotmachine"
+
+    def __init__(self):
+        super().__init__()
+        self.on_key(pygame.K_SPACE, spin_slotmachine)
+
+    def prepare(self, size):
+        # Bake the shared symbol cells before the machine is built (it always
+        # draws at 800x600, whatever `size` is).
+        yield from prepare_steps()
+
+    def update_state(self, state, size):
+        return update_slotmachine_scene(state, size)
+
+    def render(self, surface, state, font):
+        return render_slotmachine_scene(surface, state, font)
+
+    def click(self, app, pos):
+        # The SPIN button and the lever both spin.
+        for name in ("button_rect", "handle_rect"):
+            rect = self.state.get(name)
+            if isinstance(rect, pygame.Rect) and rect.collidepoint(pos):
+                self.state = spin_slotmachine(self.state)
+                return
+
+
 if __name__ == "__main__":
+    pygame.init()
     game = SlotMachine()
     game.run()
\ No newline at end of file
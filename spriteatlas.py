@@ -0,0 +1,70 @@
+"""spriteatlas.py
+
+A shared store of small pre-drawn images ("sprites"): background floaters
+(chips, card suits, dice, ...) and sparkle glyphs.
+
+If you're new to game-dev:
+- Drawing a shape with `pygame.draw` onto a fresh transparent Surface is
+  slow compared to copying ("blitting") an image that already exists. It's
+  even worse for text: `pygame.font.Font(...)` loads the font file again.
+- Most of these little glyphs look exactly the same: there are only a few
+  kinds, a handful of sizes and an alpha (transparency) between 0 and 255.
+
+So every glyph is painted ONCE per (paint function, kind, size, alpha bucket)
+and reused by every floater / sparkle that looks like it, in every mini-game.
+Alpha is rounded to steps of `alpha_step` ("bucketed"): a floater at alpha 43
+simply uses the alpha-40 image. That difference is invisible, but it keeps
+the number of images small (a few hundred tiny surfaces at most).
+
+Usage:
+    sprite = ATLAS.sprite(paint_floater, "chip", 20, 55)
+    screen.blit(sprite, (x - 20, y - 20))
+
+`paint(kind, size, alpha)` must return a new Surface; it is only called on a
+cache miss.
+"""
+
+import pygame
+
+
+class SpriteAtlas:
+    """Pre-painted glyphs keyed by (paint function, kind, size, alpha bucket)."""
+
+    def __init__(self, alpha_step: int = 8):
+        self.alpha_step = alpha_step
+        self._sprites: dict = {}
+        self.hits = 0
+        self.misses = 0
+
+    def alpha_bucket(self, alpha) -> int:
+        """The alpha value that is actually drawn for `alpha` (0 .. 255)."""
+        alpha = int(round(alpha / self.alpha_step)) * self.alpha_step
+        return max(0, min(255, alpha))
+
+    def sprite(self, paint, kind, size: int, alpha) -> pygame.Surface:
+        alpha = self.alpha_bucket(alpha)
+        key = (paint, kind, size, alpha)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = paint(kind, size, alpha)
+        try:
+            # Matching the display's pixel format makes every blit cheaper.
+            sprite = sprite.convert_alpha()
+        except pygame.error:
+            pass  # no display yet (e.g. created before set_mode)
+        self._sprites[key] = sprite
+        return sprite
+
+    def clear(self) -> None:
+        self._sprites.clear()
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+
+# The one atlas shared by all mini-games.
+ATLAS = SpriteAtlas()
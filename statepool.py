@@ -0,0 +1,129 @@
+"""statepool.py
+
+Keeps the state of mini-games you walked away from, so walking back is instant.
+
+If you're new to game-dev:
+- Creating a mini-game is the slow part of opening it: the blackjack table
+  bakes its card sprites, the horse race loads its horse images, the slot
+  machine loads its symbols, and every table creates its particles and
+  effects. Throwing all of that away on ESC means paying for it again on the
+  very next visit.
+- A "pool" keeps such objects around instead. When you leave a table its
+  state is *suspended* into the pool; when you come back it is *resumed*
+  from there (with your current token balance put in, since you may have
+  won or lost tokens elsewhere in the meantime).
+
+The pool is bounded. Every suspended state is measured once (the pixels of
+the Surfaces it holds, see `estimate_bytes`), and when the total goes over
+`max_bytes` - or there are more than `max_entries` states - the table that
+was left the longest ago is evicted (LRU, "least recently used"). An evicted
+table simply starts fresh on the next visit, exactly like before.
+
+Usage:
+    pool = StatePool(max_bytes=48 * 1024 * 1024)
+    pool.suspend("roulette", roulette_state)    # when leaving the table
+    state = pool.resume("roulette")             # None if it isn't in the pool
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+
+def estimate_bytes(state, max_depth: int = 4) -> int:
+    """Rough memory cost of `state`: the pixel bytes of every Surface it reaches.
+
+    Looks inside dicts, lists/tuples and objects' attributes, up to
+    `max_depth` levels deep. Surfaces shared with the global caches (card
+    sprites, scaled images) are counted too, so this errs on the high side.
+    """
+    seen: set[int] = set()
+    total = 0
+    todo = [(state, 0)]
+    while todo:
+        value, depth = todo.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, pygame.Surface):
+            total += value.get_pitch() * value.get_height()
+            continue
+        if depth >= max_depth:
+            continue
+        if isinstance(value, dict):
+            children = value.values()
+        elif isinstance(value, (list, tuple)):
+            children = value
+        elif hasattr(value, "__dict__"):
+            children = vars(value).values()
+        else:
+            continue
+        todo.extend((child, depth + 1) for child in children)
+    return total
+
+
+class StatePool:
+    """Suspended mini-game states, least recently used evicted first."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entries: int = 6):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        # name -> (state, estimated bytes); the oldest entry comes first.
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def suspend(self, name: str, state: dict) -> None:
+        """Keep `state` for the next visit to `name` (empty states are dropped)."""
+        self.discard(name)
+        if not state:
+            return
+        cost = estimate_bytes(state)
+        if cost > self.max_bytes:
+            return  # would evict everything else and still not fit
+        self._entries[name] = (state, cost)
+        self._bytes += cost
+        while self._entries and (self._bytes > self.max_bytes or len(self._entries) > self.max_entries):
+            _, (_, old_cost) = self._entries.popitem(last=False)
+            self._bytes -= old_cost
+            self.evictions += 1
+
+    def resume(self, name: str) -> dict | None:
+        """Take the suspended state of `name` out of the pool (None if it isn't there)."""
+        entry = self._entries.pop(name, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._bytes -= entry[1]
+        self.hits += 1
+        return entry[0]
+
+    def discard(self, name: str) -> None:
+        entry = self._entries.pop(name, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def names(self) -> list[str]:
+        """Pooled scene names, least recently used first."""
+        return list(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)